@@ -0,0 +1 @@
+"""Micro-benchmarks for the sdata Python utilities."""
@@ -0,0 +1,74 @@
+"""Benchmark BOM explosion, requirement roll-ups and where-used on synthetic cable-harness trees."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from benchmarks.bench_lineage import Tokens
+from src.bom import BomGraph
+
+
+def synthetic_harness(positions: int, fanout: int, materials: int, seed: int = 0) -> BomGraph:
+    """A ``fanout``-ary assembly tree of ``positions`` nodes whose leaves each use one of ``materials`` parts."""
+    rng = np.random.default_rng(seed)
+    children = np.arange(1, positions, dtype=np.int64)
+    parents = (children - 1) // fanout
+    leaves = np.arange((positions - 2) // fanout + 1, positions, dtype=np.int64)
+    parts = positions + rng.integers(0, materials, len(leaves))
+    quantity = rng.integers(1, 5, len(children) + len(leaves)).astype(np.float64)
+    return BomGraph(
+        Tokens(positions + materials),
+        np.concatenate([parents, leaves]),
+        np.concatenate([children, parts]),
+        quantity,
+    )
+
+
+def chain(positions: int) -> BomGraph:
+    """One assembly nested ``positions`` levels deep (the recursion-limit case)."""
+    nodes = np.arange(positions, dtype=np.int64)
+    return BomGraph(Tokens(positions), nodes[:-1], nodes[1:])
+
+
+def timed(function) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="100000,1000000", help="Comma-separated numbers of positions")
+    parser.add_argument("--fanout", type=int, default=8, help="Components per assembly")
+    parser.add_argument("--materials", type=int, default=500, help="Distinct leaf parts shared by all branches")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv if argv is not None else sys.argv[1:])
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+
+    print(
+        f"{'positions':>10} {'shape':>6} {'build [s]':>10} {'explode [s]':>12} {'rows':>9}"
+        f" {'require [s]':>12} {'leaves':>7} {'where-used [s]':>15}"
+    )
+    for size in sizes:
+        for shape, make in (("tree", lambda: synthetic_harness(size, args.fanout, args.materials)),
+                            ("chain", lambda: chain(size))):
+            build, bom = timed(make)
+            explode, explosion = timed(lambda: bom.explode(0))
+            require, totals = timed(lambda: bom.requirements(0, 100).terminal())
+            where_used, _ = timed(lambda: bom.where_used(len(bom) - 1))
+            print(
+                f"{size:>10} {shape:>6} {build:>10.2f} {explode:>12.3f} {len(explosion):>9}"
+                f" {require:>12.3f} {len(totals):>7} {where_used:>15.3f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,65 @@
+"""Benchmark the energy/CO2 roll-up: full build, recompute and single-process updates on synthetic chains."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from benchmarks.bench_lineage import synthetic_chains
+from src.footprint import FootprintGraph
+
+UPDATES = 1000
+
+
+def synthetic_footprint(nodes: int, depth: int, seed: int = 0) -> FootprintGraph:
+    """Process chains of about ``nodes`` nodes; every node emits, outputs split equally."""
+    lineage = synthetic_chains(nodes, depth, seed)
+    rng = np.random.default_rng(seed)
+    counts = np.diff(lineage.down_ptr)
+    sources = np.repeat(np.arange(len(lineage), dtype=np.int64), counts)
+    targets = lineage.down_idx.astype(np.int64)
+    weights = 1.0 / counts[sources]
+    own = rng.random((2, len(lineage)))
+    return FootprintGraph(lineage.tokens, sources, targets, weights, own)
+
+
+def timed(function) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="100000,1000000", help="Comma-separated numbers of process nodes")
+    parser.add_argument("--depth", type=int, default=200, help="Steps per batch chain")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv if argv is not None else sys.argv[1:])
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    rng = np.random.default_rng(1)
+
+    print(f"{'nodes':>10} {'edges':>10} {'build [s]':>10} {'recompute [s]':>14} {'update [us]':>12} {'touched':>8}")
+    for size in sizes:
+        build, footprint = timed(lambda: synthetic_footprint(size, min(args.depth, size)))
+        recompute, _ = timed(footprint.recompute)
+        nodes = rng.integers(0, len(footprint), UPDATES).tolist()
+        values = rng.random(UPDATES).tolist()
+        seconds, touched = timed(lambda: sum(footprint.set_value(v, "co2", x) for v, x in zip(nodes, values)))
+        updated = footprint.totals.copy()
+        footprint.recompute()
+        assert np.allclose(updated, footprint.totals), "incremental totals drifted from a full roll-up"
+        print(
+            f"{len(footprint):>10} {len(footprint.sources):>10} {build:>10.2f} {recompute:>14.3f}"
+            f" {seconds / UPDATES * 1e6:>12.1f} {touched / UPDATES:>8.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,108 @@
+"""Benchmark lineage traversal on synthetic process chains with up to 10M flow edges.
+
+Up to ``--stream-max`` edges the chains are also written out as N-Triples and
+streamed through :class:`~src.lineage.LineageBuilder`, which measures ingest.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from src.lineage import SDATA, LineageBuilder, LineageGraph
+
+MERGE = 0.05
+
+
+class Tokens:
+    """Blank-node labels ``_:n<i>`` computed on access, so the benchmark does not hold millions of strings."""
+
+    def __init__(self, size: int):
+        self.size = size
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, idx: int) -> str:
+        if not 0 <= idx < self.size:
+            raise IndexError(idx)
+        return f"_:n{idx}"
+
+
+def synthetic_chains(edges: int, depth: int, seed: int = 0) -> LineageGraph:
+    """Batches of ``depth`` flow steps each; :data:`MERGE` of the steps also take a neighbour batch's output."""
+    rng = np.random.default_rng(seed)
+    batches = max(1, int(edges / (depth * (1 + MERGE))))
+    nodes = np.arange(batches * (depth + 1), dtype=np.int64).reshape(batches, depth + 1)
+    sources, targets = nodes[:, :-1].ravel(), nodes[:, 1:].ravel()
+    merge = rng.random(sources.size) < MERGE
+    other = (np.arange(sources.size) - depth * rng.integers(1, 4, sources.size)) % sources.size
+    sources = np.concatenate([sources, sources[other[merge]]])
+    targets = np.concatenate([targets, targets[merge]])
+    return LineageGraph(Tokens(nodes.size), sources, targets)
+
+
+def ntriples_lines(graph: LineageGraph):
+    """``sdata:hasOutput`` lines of every flow edge of ``graph``, generated lazily."""
+    predicate = f"<{SDATA.hasOutput}>"
+    sources = np.repeat(np.arange(len(graph)), np.diff(graph.down_ptr))
+    for source, target in zip(sources.tolist(), graph.down_idx.tolist()):
+        yield f"_:n{source} {predicate} _:n{target} .\n"
+
+
+def streamed_build(graph: LineageGraph) -> LineageGraph:
+    builder = LineageBuilder()
+    builder.add_ntriples(ntriples_lines(graph))
+    return builder.build()
+
+
+def timed(function) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1000000,10000000", help="Comma-separated numbers of flow edges")
+    parser.add_argument("--depth", type=int, default=200, help="Steps per batch chain (= size for one chain)")
+    parser.add_argument(
+        "--stream-max",
+        type=int,
+        default=1000000,
+        help="Largest size to also build by streaming N-Triples through LineageBuilder (0 disables)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv if argv is not None else sys.argv[1:])
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+
+    print(
+        f"{'edges':>10} {'depth':>6} {'build [s]':>10} {'stream [s]':>11} {'up [ms]':>9} {'up nodes':>9}"
+        f" {'down [ms]':>10} {'down nodes':>11}"
+    )
+    for size in sizes:
+        depth = min(args.depth, size)
+        build, graph = timed(lambda: synthetic_chains(size, depth))
+        stream_text = f"{'-':>11}"
+        if size <= args.stream_max:
+            stream, streamed = timed(lambda: streamed_build(graph))
+            assert streamed.edge_count == graph.edge_count, "streamed build lost flow edges"
+            stream_text = f"{stream:>11.2f}"
+        last = len(graph) - 1
+        up_time, up = timed(lambda: graph.upstream(last))
+        down_time, down = timed(lambda: graph.downstream(0))
+        print(
+            f"{graph.edge_count:>10} {depth:>6} {build:>10.2f} {stream_text} {up_time * 1000:>9.1f} {len(up):>9}"
+            f" {down_time * 1000:>10.1f} {len(down):>11}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,61 @@
+"""Benchmark cold (parse) vs. warm (cache) graph loading."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from src import loader
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_FILES = (
+    "min-v1.0.0.ttl",
+    "sdata-core.ttl",
+    "sdata-material-state.ttl",
+    "vendor/ontologies/qudt.ttl",
+)
+
+
+def _best_of(repeat: int, func) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("files", nargs="*", default=list(DEFAULT_FILES), help="Turtle files to load")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per measurement (best is reported)")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv if argv is not None else sys.argv[1:])
+    logging.getLogger("rdflib.term").setLevel(logging.CRITICAL)
+
+    print(f"{'file':<40} {'triples':>8} {'cold [ms]':>10} {'warm [ms]':>10} {'speedup':>8}")
+    total_cold = total_warm = 0.0
+    with tempfile.TemporaryDirectory(prefix="sdata-bench-") as tmp:
+        cache_dir = Path(tmp)
+        for name in args.files:
+            path = (ROOT / name) if not Path(name).is_absolute() else Path(name)
+            cold = _best_of(args.repeat, lambda: loader.load_graph(path, use_cache=False))
+            graph = loader.load_graph(path, cache_dir=cache_dir, use_cache=True)
+            warm = _best_of(args.repeat, lambda: loader.load_graph(path, cache_dir=cache_dir, use_cache=True))
+            total_cold += cold
+            total_warm += warm
+            print(f"{name:<40} {len(graph):>8} {cold * 1e3:>10.1f} {warm * 1e3:>10.1f} {cold / warm:>7.1f}x")
+
+    print(f"{'total':<40} {'':>8} {total_cold * 1e3:>10.1f} {total_warm * 1e3:>10.1f} {total_cold / total_warm:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,58 @@
+"""Benchmark material-state facet filtering and facet counts on synthetic entities."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from src.material_state import SMS, StateIndex, StateVocabulary
+
+AXES = (SMS.FormAxis, SMS.GradeAxis, SMS.OriginAxis, SMS.ComplianceAxis, SMS.MethodAxis)
+FILTER = (SMS["grade.Automotive"], SMS["form.Sheet"], SMS["method.Degradation"])
+
+
+def synthetic_index(vocabulary: StateVocabulary, size: int, seed: int = 0) -> StateIndex:
+    """One uniformly drawn value per entity on each of :data:`AXES`."""
+    rng = np.random.default_rng(seed)
+    codes = np.stack(
+        [rng.choice(np.flatnonzero(vocabulary.concept_axis == vocabulary.axes.index(axis)), size) for axis in AXES],
+        axis=1,
+    )
+    index = StateIndex(vocabulary)
+    index.add_codes(range(size), codes)
+    return index
+
+
+def timed(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="100000,1000000,10000000", help="Comma-separated numbers of entities")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv if argv is not None else sys.argv[1:])
+    vocabulary = StateVocabulary.load()
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+
+    print(f"{'entities':>10} {'build [s]':>10} {'match [ms]':>11} {'facets [ms]':>12} {'hits':>8}")
+    for size in sizes:
+        index = synthetic_index(vocabulary, size)
+        build = timed(lambda: (index.bits, index.columns))
+        match = timed(lambda: index.match(*FILTER))
+        facets = timed(lambda: index.facet_counts(*FILTER))
+        hits = index.facet_counts(*FILTER).total
+        print(f"{size:>10} {build:>10.2f} {match * 1000:>11.1f} {facets * 1000:>12.1f} {hits:>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,100 @@
+"""Benchmark the MIN/sdata materializer against a generic OWL-RL closure."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+from rdflib import Namespace, URIRef
+
+from src.materialize import Materializer, RuleSet
+
+MIN = Namespace("https://w3id.org/min#")
+EX = Namespace("https://example.org/bench/")
+CHAIN_GROUP = 16
+
+
+def synthetic_triples(individuals: int) -> list[tuple[URIRef, URIRef, URIRef]]:
+    """Process chains with agents, BOM links and data, five individuals per step.
+
+    Each step has an agent performing a process that turns an input into an
+    output and generates a data record describing the output. Outputs contain
+    their input and the previous output within groups of ``CHAIN_GROUP``
+    steps, which exercises the transitive ``min:hasComponent``.
+    """
+    triples: list[tuple[URIRef, URIRef, URIRef]] = []
+    for step in range(max(1, individuals // 5)):
+        agent, process = EX[f"agent{step}"], EX[f"process{step}"]
+        source, product, record = EX[f"input{step}"], EX[f"output{step}"], EX[f"data{step}"]
+        triples += [
+            (agent, MIN.performs, process),
+            (process, MIN.hasInput, source),
+            (process, MIN.hasOutput, product),
+            (process, MIN.generates, record),
+            (record, MIN.describes, product),
+            (product, MIN.hasComponent, source),
+        ]
+        if step % CHAIN_GROUP:
+            triples.append((product, MIN.hasComponent, EX[f"output{step - 1}"]))
+    return triples
+
+
+def run_materializer(rules: RuleSet, triples) -> tuple[float, int]:
+    start = time.perf_counter()
+    materializer = Materializer(rules)
+    materializer.add(triples)
+    inferred = materializer.saturate()
+    return time.perf_counter() - start, inferred
+
+
+def run_owlrl(triples) -> tuple[float, int] | None:
+    try:
+        import owlrl
+    except ImportError:
+        return None
+    from src import loader
+    from src.materialize import DEFAULT_SOURCES
+
+    graph = loader.load_merged(*DEFAULT_SOURCES)
+    for triple in triples:
+        graph.add(triple)
+    before = len(graph)
+    start = time.perf_counter()
+    owlrl.DeductiveClosure(owlrl.OWLRL_Semantics).expand(graph)
+    return time.perf_counter() - start, len(graph) - before
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes",
+        default="1000,10000,100000,1000000",
+        help="Comma-separated numbers of individuals",
+    )
+    parser.add_argument(
+        "--owlrl-max",
+        type=int,
+        default=1000,
+        help="Largest size to also run through owlrl (0 disables; owlrl must be installed)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv if argv is not None else sys.argv[1:])
+    rules = RuleSet.load()
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+
+    print(f"{'individuals':>12} {'asserted':>10} {'derived':>10} {'materializer [s]':>17} {'owlrl [s]':>10}")
+    for size in sizes:
+        triples = synthetic_triples(size)
+        seconds, inferred = run_materializer(rules, triples)
+        owl = run_owlrl(triples) if size <= args.owlrl_max else None
+        owl_text = f"{owl[0]:>10.2f}" if owl else f"{'-':>10}"
+        print(f"{size:>12} {len(triples):>10} {inferred:>10} {seconds:>17.2f} {owl_text}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
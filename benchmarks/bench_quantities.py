@@ -0,0 +1,65 @@
+"""Benchmark the bulk AQV writer and the columnar extractor on synthetic results."""
+
+from __future__ import annotations
+
+import argparse
+import io
+import sys
+import time
+
+import numpy as np
+
+from src.quantities import QuantityExtractor, write_quantities
+
+NAMES = np.array(["Rm", "Rp02", "AG", "A80"], dtype=object)
+SPECIMEN = "https://example.org/bench/specimen"
+MEGAPA = "http://qudt.org/vocab/unit/MegaPA"
+
+
+def synthetic_columns(size: int, seed: int = 0) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Four tensile results per specimen with normally distributed values."""
+    owners = np.array([f"{SPECIMEN}{row // len(NAMES)}" for row in range(size)], dtype=object)
+    names = np.resize(NAMES, size)
+    values = np.random.default_rng(seed).normal(300.0, 10.0, size)
+    return owners, names, values
+
+
+def run_writer(columns, format: str) -> tuple[float, str]:
+    out = io.StringIO()
+    start = time.perf_counter()
+    write_quantities(out, *columns, units=MEGAPA, symbols="MPa", format=format)
+    return time.perf_counter() - start, out.getvalue()
+
+
+def run_extractor(text: str) -> tuple[float, int]:
+    start = time.perf_counter()
+    extractor = QuantityExtractor()
+    extractor.add_ntriples(text.splitlines())
+    rows = len(extractor.table())
+    return time.perf_counter() - start, rows
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="Comma-separated numbers of AQVs")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv if argv is not None else sys.argv[1:])
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+
+    print(f"{'AQVs':>10} {'write nt [s]':>13} {'write ttl [s]':>14} {'AQVs/s (nt)':>12} {'extract [s]':>12}")
+    for size in sizes:
+        columns = synthetic_columns(size)
+        nt_seconds, text = run_writer(columns, "nt")
+        ttl_seconds, _ = run_writer(columns, "turtle")
+        extract_seconds, rows = run_extractor(text)
+        assert rows == size
+        rate = size / nt_seconds
+        print(f"{size:>10} {nt_seconds:>13.2f} {ttl_seconds:>14.2f} {rate:>12.0f} {extract_seconds:>12.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,69 @@
+"""Benchmark reachability labels: build time, query latency and appends on synthetic process chains."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+import numpy as np
+from rdflib import BNode
+
+from benchmarks.bench_lineage import synthetic_chains
+from src.reachability import ReachabilityIndex
+
+QUERIES = 10000
+APPENDS = 10000
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="100000,1000000", help="Comma-separated numbers of flow edges")
+    parser.add_argument("--depth", type=int, default=200, help="Steps per batch chain")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv if argv is not None else sys.argv[1:])
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    rng = np.random.default_rng(0)
+
+    print(
+        f"{'edges':>10} {'build [s]':>10} {'random [us]':>12} {'hits':>6}"
+        f" {'upstream [us]':>14} {'append [us]':>12}"
+    )
+    for size in sizes:
+        lineage = synthetic_chains(size, min(args.depth, size))
+        start = time.perf_counter()
+        index = ReachabilityIndex(lineage)
+        build = time.perf_counter() - start
+
+        pairs = rng.integers(0, len(lineage), (QUERIES, 2)).tolist()
+        start = time.perf_counter()
+        hits = sum(index.reaches(u, v) for u, v in pairs)
+        random_us = (time.perf_counter() - start) / QUERIES * 1e6
+
+        # Positive queries: a node against something a few steps upstream of it.
+        targets = rng.integers(0, len(lineage), QUERIES).tolist()
+        sources = [int(lineage.upstream(v, max_depth=8).nodes[-1]) for v in targets[:1000]]
+        start = time.perf_counter()
+        assert all(index.reaches(u, v) for u, v in zip(sources, targets))
+        upstream_us = (time.perf_counter() - start) / len(sources) * 1e6
+
+        tails = rng.integers(0, len(lineage), APPENDS).tolist()
+        index.index_of(lineage.node(0))  # build the token lookup outside the timing
+        start = time.perf_counter()
+        for tail in tails:
+            step, output = BNode(), BNode()
+            index.add_edge(lineage.node(tail), step)
+            index.add_edge(step, output)
+        append_us = (time.perf_counter() - start) / APPENDS * 1e6
+        print(
+            f"{lineage.edge_count:>10} {build:>10.2f} {random_us:>12.2f} {hits:>6}"
+            f" {upstream_us:>14.2f} {append_us:>12.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,89 @@
+"""Benchmark compiled SHACL checks against pyshacl on the scaled tensile example."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+
+from rdflib import BNode, Graph, Namespace
+from rdflib.term import Node
+
+from src import loader
+from src.shape_compiler import compile_shapes
+from src.validation import DEFAULT_SHAPES, ROOT, run_pyshacl
+
+EX_ZUG = Namespace("https://example.org/zugversuch/")
+EXAMPLE = ROOT / "examples" / "specimen_tensiontest_data.ttl"
+# Nodes that are repeated per specimen; everything else (material, coil,
+# machines, operators, specimen preparation) is shared.
+PER_SPECIMEN = (EX_ZUG.probe, EX_ZUG.zugversuch, EX_ZUG.ergebnis)
+
+
+def _specimen_part(example: Graph) -> tuple[set[Node], list[tuple[Node, Node, Node]]]:
+    nodes: set[Node] = set()
+    stack: list[Node] = list(PER_SPECIMEN)
+    while stack:
+        node = stack.pop()
+        if node in nodes:
+            continue
+        nodes.add(node)
+        stack.extend(o for o in example.objects(node) if isinstance(o, BNode))
+    return nodes, [t for t in example if t[0] in nodes]
+
+
+def scaled_example(specimens: int) -> Graph:
+    """The tensile example with ``specimens`` copies of the specimen, test and result."""
+    example = loader.load_graph(EXAMPLE)
+    nodes, template = _specimen_part(example)
+    graph = Graph()
+    graph.addN((s, p, o, graph) for s, p, o in example if s not in nodes)
+
+    for k in range(specimens):
+        renamed: dict[Node, Node] = {}
+        for node in nodes:
+            renamed[node] = BNode() if isinstance(node, BNode) else EX_ZUG[f"{node[len(EX_ZUG):]}_{k}"]
+        graph.addN((renamed[s], p, renamed.get(o, o), graph) for s, p, o in template)
+    return graph
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1000,10000,100000", help="Comma-separated numbers of specimens")
+    parser.add_argument(
+        "--pyshacl-max",
+        type=int,
+        default=10000,
+        help="Largest size to also validate with pyshacl (0 disables)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv if argv is not None else sys.argv[1:])
+    logging.getLogger("rdflib.term").setLevel(logging.CRITICAL)
+    shapes = loader.load_graph(DEFAULT_SHAPES)
+    compiled = compile_shapes(shapes)
+
+    print(f"{'specimens':>10} {'triples':>10} {'results':>8} {'compiled [s]':>13} {'pyshacl [s]':>12}")
+    for size in [int(s) for s in args.sizes.split(",") if s]:
+        graph = scaled_example(size)
+        start = time.perf_counter()
+        results = compiled.validate(graph)
+        compiled_seconds = time.perf_counter() - start
+
+        pyshacl_text = f"{'-':>12}"
+        if size <= args.pyshacl_max:
+            start = time.perf_counter()
+            reference = run_pyshacl(graph, shapes)
+            pyshacl_text = f"{time.perf_counter() - start:>12.2f}"
+            if len(reference) != len(results):
+                print(f"result count mismatch: compiled {len(results)}, pyshacl {len(reference)}", file=sys.stderr)
+                return 1
+        print(f"{size:>10} {len(graph):>10} {len(results):>8} {compiled_seconds:>13.3f} {pyshacl_text}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
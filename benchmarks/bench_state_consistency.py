@@ -0,0 +1,61 @@
+"""Benchmark the streaming sms:onAxis / sms:hasStateValue consistency check on synthetic N-Triples."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections.abc import Iterator
+
+import numpy as np
+from rdflib.namespace import RDF
+
+from src.material_state import SMS
+from src.ntriples import term_token
+from src.state_consistency import AxisValueChecker
+
+INVALID = 0.001
+
+
+def synthetic_lines(checker: AxisValueChecker, size: int, seed: int = 0) -> Iterator[str]:
+    """Three lines (type, axis, value) per blank-node assignment; :data:`INVALID` of the values are off-axis."""
+    rng = np.random.default_rng(seed)
+    axes = sorted(axis for axis, allowed in checker.allowed.items() if allowed)
+    concepts = {axis: sorted(checker.allowed[axis]) for axis in axes}
+    picks = rng.integers(0, len(axes), size)
+    draws = rng.random(size)
+    kind = f"{term_token(RDF.type)} {term_token(SMS.StateAssignment)} .\n"
+    on_axis, has_value = term_token(SMS.onAxis), term_token(SMS.hasStateValue)
+    for number in range(size):
+        axis = axes[picks[number]]
+        values = concepts[axes[picks[number] - 1]] if draws[number] < INVALID else concepts[axis]
+        yield f"_:a{number} {kind}"
+        yield f"_:a{number} {on_axis} {axis} .\n"
+        yield f"_:a{number} {has_value} {values[number % len(values)]} .\n"
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="100000,1000000,3000000", help="Comma-separated numbers of assignments")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv if argv is not None else sys.argv[1:])
+    template = AxisValueChecker.load()
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+
+    print(f"{'assignments':>12} {'lines':>10} {'check [s]':>10} {'values/s':>11} {'results':>8}")
+    for size in sizes:
+        lines = list(synthetic_lines(template, size))
+        checker = AxisValueChecker.load()
+        start = time.perf_counter()
+        checker.add_ntriples(lines)
+        seconds = time.perf_counter() - start
+        rate = checker.checked / seconds
+        print(f"{size:>12} {len(lines):>10} {seconds:>10.2f} {rate:>11.0f} {len(checker.results):>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
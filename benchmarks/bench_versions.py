@@ -0,0 +1,65 @@
+"""Benchmark passport version lookups: index build, point-in-time and latest-version queries."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from benchmarks.bench_lineage import Tokens
+from src.versions import VersionIndex
+
+QUERIES = 100000
+DAY = 86_400_000_000  # microseconds
+
+
+def synthetic_versions(passports: int, per_product: int, seed: int = 0) -> VersionIndex:
+    """``passports`` versions, ``per_product`` per product on random days, each superseding the previous one."""
+    rng = np.random.default_rng(seed)
+    products = max(1, passports // per_product)
+    target = np.repeat(np.arange(products, dtype=np.int64), per_product)
+    passport = products + np.arange(len(target), dtype=np.int64)
+    starts = rng.integers(0, 3650, len(target)) * DAY
+    newer = passport.reshape(products, per_product)[:, 1:].ravel()
+    older = passport.reshape(products, per_product)[:, :-1].ravel()
+    supersedes = zip(newer.tolist(), older.tolist())
+    return VersionIndex(Tokens(products + len(passport)), passport, target, starts, supersedes=supersedes)
+
+
+def timed(function) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="100000,1000000", help="Comma-separated numbers of passport versions")
+    parser.add_argument("--per-product", type=int, default=10, help="Versions per described product")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv if argv is not None else sys.argv[1:])
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    rng = np.random.default_rng(1)
+
+    print(f"{'versions':>10} {'build [s]':>10} {'at [us]':>9} {'latest [us]':>12} {'hits':>7}")
+    for size in sizes:
+        build, index = timed(lambda: synthetic_versions(size, args.per_product))
+        products = max(1, size // args.per_product)
+        targets = rng.integers(0, products, QUERIES).tolist()
+        moments = (rng.integers(0, 3650, QUERIES) * DAY).astype("datetime64[us]")
+        seconds, found = timed(lambda: [index.at(t, m) for t, m in zip(targets, moments)])
+        at_us = seconds / QUERIES * 1e6
+        seconds, _ = timed(lambda: [index.latest(t) for t in targets])
+        latest_us = seconds / QUERIES * 1e6
+        hits = sum(passport is not None for passport in found)
+        print(f"{len(index):>10} {build:>10.2f} {at_us:>9.2f} {latest_us:>12.2f} {hits:>7}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
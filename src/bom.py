@@ -0,0 +1,474 @@
+"""Bill-of-materials explosion, where-used and requirement roll-ups over arrays.
+
+A BOM is the ``min:hasComponent``/``sdata:hasComponent`` graph below a
+product (or below its ``sdata:BillOfMaterials`` node). Every position carries
+its quantity per unit of the assembly it is built into as an AQV,
+``sdata:hasQuantity [ sdata:name "quantity" ; qudt:numericValue 4 ]``;
+positions without one count once. A part used in several assemblies in
+different quantities gets one BOM entry per use: a leaf component that
+carries the quantity and is ``sdata:typifiedBy`` the part (the
+``ex:bom_entry_*`` nodes of ``sdata:BillOfMaterials``)::
+
+    ex:connector sdata:hasComponent ex:connector_pos_10 .
+    ex:connector_pos_10 sdata:typifiedBy ex:terminal ;
+        sdata:hasQuantity [ sdata:name "quantity" ; qudt:numericValue 2 ] .
+
+The entry's quantity then belongs to the edge connector → terminal, and two
+entries of one part in the same assembly add up. :class:`BomGraph` keeps the
+edges as the CSR arrays of a :class:`~src.lineage.LineageGraph` (assembly →
+component) plus one ``float64`` quantity per edge, and answers the three
+classic questions level by level over integer arrays instead of recursing::
+
+    bom = load_bom([Path("harness.nt")])
+    rows = bom.explode(EX.harness)                 # indented multi-level BOM
+    need = bom.requirements(EX.harness, 250)       # totals for 250 harnesses
+    need.terminal().as_dict()                      # {wire: 1250.0, terminal: 4000.0, ...}
+    bom.where_used(EX.terminal).as_dict()          # terminals per unit of every assembly using them
+
+:meth:`BomGraph.explode` lists one row per path (a shared sub-assembly appears
+under each parent); :meth:`BomGraph.requirements` and
+:meth:`BomGraph.where_used` add quantities along a topological order of the
+reachable sub-graph, so shared sub-assemblies are visited once however many
+paths lead to them. A ``hasComponent`` cycle is an error, not an endless loop;
+:meth:`BomGraph.explode` checks for one before listing any rows.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from rdflib import Graph, Literal, URIRef
+from rdflib.term import Node
+
+from src.lineage import MIN, SDATA, SCALAR_FRONTIER, LineageGraph, gather_edges, topological_levels
+from src.ntriples import TokenIds, load_paths, split_line, term_token
+from src.quantities import QuantityExtractor
+from src.shape_compiler import TripleIndex
+
+COMPONENT = (MIN.hasComponent, SDATA.hasComponent)
+# predicate -> True if the subject is the BOM entry (and the object the part it places).
+TYPIFIED = {MIN.typifiedBy: True, SDATA.typifiedBy: True, MIN.typifies: False, SDATA.typifies: False}
+QUANTITY = "quantity"
+
+
+@dataclass(frozen=True)
+class Explosion:
+    """Multi-level BOM below ``root``, one row per path, level by level.
+
+    ``parent`` is the row of the assembly a row is built into (-1 for the
+    root row), ``quantity`` the position quantity and ``total`` the quantity
+    per unit of ``root`` (the product of the quantities along the path).
+    """
+
+    bom: BomGraph
+    root: int
+    nodes: np.ndarray
+    parent: np.ndarray
+    level: np.ndarray
+    quantity: np.ndarray
+    total: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def iris(self) -> list[Node]:
+        return [self.bom.node(i) for i in self.nodes.tolist()]
+
+    def preorder(self) -> np.ndarray:
+        """Row order of an indented BOM: every assembly directly followed by its components."""
+        # Rows of one level are grouped by parent row, so each row's components form a contiguous slice.
+        counts = np.bincount(self.parent[1:], minlength=len(self))
+        first = np.zeros(len(self) + 1, dtype=np.int64)
+        np.cumsum(counts, out=first[1:])
+        first = (first + 1).tolist()
+        order = array("q")
+        stack = [0] if len(self) else []
+        while stack:
+            row = stack.pop()
+            order.append(row)
+            stack.extend(range(first[row + 1] - 1, first[row] - 1, -1))
+        return np.frombuffer(order, dtype=np.int64)
+
+    def indented(self) -> list[tuple[int, Node, float, float]]:
+        """``(level, node, quantity, total)`` per row in :meth:`preorder`."""
+        node = self.bom.node
+        return [
+            (int(self.level[row]), node(int(self.nodes[row])), float(self.quantity[row]), float(self.total[row]))
+            for row in self.preorder().tolist()
+        ]
+
+
+@dataclass(frozen=True)
+class Totals:
+    """Quantities of the nodes reached from ``root``, in topological order from ``root``.
+
+    For :meth:`BomGraph.requirements` a quantity is how much of a node goes
+    into the ordered amount of ``root``; for :meth:`BomGraph.where_used` it is
+    how much of ``root`` one unit of the node contains.
+    """
+
+    bom: BomGraph
+    root: int
+    direction: str  # "requirements" | "where-used"
+    nodes: np.ndarray
+    quantity: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def terminal(self) -> Totals:
+        """Only the ends of the walk: leaf materials for requirements, top-level assemblies for where-used."""
+        ptr = self.bom.edges.down_ptr if self.direction == "requirements" else self.bom.edges.up_ptr
+        keep = ptr[self.nodes + 1] == ptr[self.nodes]
+        return Totals(self.bom, self.root, self.direction, self.nodes[keep], self.quantity[keep])
+
+    def as_dict(self) -> dict[Node, float]:
+        node = self.bom.node
+        return {node(i): q for i, q in zip(self.nodes.tolist(), self.quantity.tolist())}
+
+
+def _accumulate(
+    size: int, start: int, amount: float, heads: np.ndarray, tails: np.ndarray, weight: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """``(order, value)``: push ``amount`` from ``start`` along ``heads → tails`` (times ``weight``).
+
+    The edges are those of a sub-graph reachable from ``start``; nodes are
+    released in Kahn order once all their incoming edges have been added, so
+    every node is expanded exactly once. Nodes never released lie on a cycle.
+    """
+    by_head = np.argsort(heads, kind="stable")
+    ptr = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(heads, minlength=size), out=ptr[1:])
+    indegree = np.bincount(tails, minlength=size)
+    value = np.zeros(size, dtype=np.float64)
+    value[start] = amount
+    ptr_view, edge_view = memoryview(ptr), memoryview(by_head)
+    tail_view, weight_view = memoryview(tails), memoryview(weight)
+    value_view, indegree_view = memoryview(value), memoryview(indegree)
+    order = array("q")
+    # An edge back into ``start`` closes a cycle: release nothing, so the caller sees unreleased nodes.
+    frontier: list[int] | np.ndarray = [] if indegree[start] else [start]
+    while len(frontier):
+        if len(frontier) <= SCALAR_FRONTIER:
+            following = []
+            for v in frontier if isinstance(frontier, list) else frontier.tolist():
+                order.append(v)
+                for e in edge_view[ptr_view[v] : ptr_view[v + 1]]:
+                    w = tail_view[e]
+                    value_view[w] += value_view[v] * weight_view[e]
+                    indegree_view[w] -= 1
+                    if indegree_view[w] == 0:
+                        following.append(w)
+            frontier = following
+            continue
+        frontier = np.asarray(frontier, dtype=np.int64)
+        order.frombytes(frontier.tobytes())
+        source, edge = gather_edges(ptr, by_head, frontier)
+        reached = tails[edge]
+        np.add.at(value, reached, value[source] * weight[edge])
+        reached = np.sort(reached)
+        if not len(reached):
+            break
+        starts = np.flatnonzero(np.concatenate(([True], reached[1:] != reached[:-1])))
+        targets = reached[starts]
+        indegree[targets] -= np.diff(np.append(starts, len(reached)))
+        frontier = targets[indegree[targets] == 0]
+    return np.frombuffer(order, dtype=np.int64), value
+
+
+class BomGraph:
+    """``hasComponent`` edges (assembly → component) as CSR arrays plus per-edge quantities."""
+
+    def __init__(self, tokens, assemblies, components, quantity=None, symbols: dict[int, str] | None = None):
+        """Build from N-Triples node ``tokens``, parallel edge endpoint ids and optional per-edge quantities.
+
+        ``quantity[e]`` is how many units of ``components[e]`` go into one unit
+        of ``assemblies[e]``; NaN (or no ``quantity`` at all) counts as 1 and
+        repeated edges add up. ``quantity`` afterwards holds one value per edge
+        of ``edges.down_idx``. ``symbols`` maps component ids to the
+        ``sdata:unitSymbol`` of their quantity.
+        """
+        self.edges = LineageGraph(tokens, assemblies, components)
+        size = len(tokens)
+        assemblies = np.asarray(assemblies, dtype=np.int64)
+        components = np.asarray(components, dtype=np.int64)
+        amounts = np.ones(len(assemblies)) if quantity is None else np.asarray(quantity, dtype=np.float64).copy()
+        amounts[np.isnan(amounts)] = 1.0
+        keep = assemblies != components
+        # CSR edges are sorted by (assembly, component), so an edge's position is a binary search away.
+        self._keys = np.repeat(np.arange(size, dtype=np.int64), np.diff(self.edges.down_ptr)) * size
+        self._keys += self.edges.down_idx
+        self.quantity = np.zeros(len(self._keys), dtype=np.float64)
+        np.add.at(self.quantity, np.searchsorted(self._keys, assemblies[keep] * size + components[keep]), amounts[keep])
+        self.symbols = dict(symbols or {})
+
+    @classmethod
+    def from_graph(cls, graph: Graph, quantity: str = QUANTITY) -> BomGraph:
+        builder = BomBuilder()
+        builder.add_graph(graph)
+        return builder.build(quantity)
+
+    def __len__(self) -> int:
+        return len(self.edges)
+
+    def index_of(self, node: Node | str | int) -> int | None:
+        """Node id of an rdflib term, N-Triples token or id (``None`` if absent)."""
+        return self.edges.index_of(node)
+
+    def node(self, idx: int) -> Node:
+        return self.edges.node(idx)
+
+    def _root(self, node: Node | str | int) -> int:
+        root = self.index_of(node)
+        if root is None:
+            raise KeyError(f"{node} has no hasComponent edges")
+        return root
+
+    def _weights(self, assemblies: np.ndarray, components: np.ndarray) -> np.ndarray:
+        """Quantities of the edges ``assemblies → components``."""
+        return self.quantity[np.searchsorted(self._keys, assemblies * len(self) + components)]
+
+    def components(self, node: Node | str | int) -> list[Node]:
+        """Direct components of ``node``."""
+        v = self._root(node)
+        return [self.node(w) for w in self.edges.down_idx[self.edges.down_ptr[v] : self.edges.down_ptr[v + 1]].tolist()]
+
+    def explode(self, node: Node | str | int, max_depth: int | None = None) -> Explosion:
+        """Every path below ``node`` (up to ``max_depth`` levels) with its extended quantity."""
+        root = self._root(node)
+        # Without this, a cycle would only show once the path count outgrew the graph.
+        walk = self.edges.downstream(root)
+        if (topological_levels(len(self), walk.sources, walk.targets)[walk.nodes] < 0).any():
+            raise ValueError(f"hasComponent cycle below {self.node(root)}")
+        ptr, idx = self.edges.down_ptr, self.edges.down_idx
+        ptr_view, idx_view, quantity_view = memoryview(ptr), memoryview(idx), memoryview(self.quantity)
+        nodes, parent, total = array("q", [root]), array("q", [-1]), array("d", [1.0])
+        edges = array("q", [-1])  # edge each row was reached through
+        edge_ids = None
+        bounds = [0, 1]  # rows of level l are bounds[l]:bounds[l + 1]
+        depth = 0
+        while bounds[-1] > bounds[-2] and (max_depth is None or depth < max_depth):
+            depth += 1
+            first, end = bounds[-2], bounds[-1]
+            if end - first <= SCALAR_FRONTIER:
+                for row in range(first, end):
+                    v, extended = nodes[row], total[row]
+                    for e in range(ptr_view[v], ptr_view[v + 1]):
+                        nodes.append(idx_view[e])
+                        parent.append(row)
+                        edges.append(e)
+                        total.append(extended * quantity_view[e])
+            else:
+                if edge_ids is None:
+                    edge_ids = np.arange(len(idx), dtype=np.int64)
+                frontier = np.frombuffer(nodes[first:end], dtype=np.int64)
+                counts = ptr[frontier + 1] - ptr[frontier]
+                _, reached = gather_edges(ptr, edge_ids, frontier)
+                # Frontier rows are numbered consecutively, so each row's components stay grouped.
+                extended = np.repeat(np.frombuffer(total[first:end], dtype=np.float64), counts)
+                nodes.frombytes(idx[reached].astype(np.int64).tobytes())
+                parent.frombytes(np.repeat(np.arange(first, end, dtype=np.int64), counts).tobytes())
+                edges.frombytes(reached.tobytes())
+                total.frombytes((extended * self.quantity[reached]).tobytes())
+            bounds.append(len(nodes))
+        nodes_array = np.frombuffer(nodes, dtype=np.int64)
+        quantity = self.quantity[np.frombuffer(edges, dtype=np.int64)]
+        quantity[0] = 1.0
+        return Explosion(
+            bom=self,
+            root=root,
+            nodes=nodes_array,
+            parent=np.frombuffer(parent, dtype=np.int64),
+            level=np.repeat(np.arange(len(bounds) - 1), np.diff(bounds)),
+            quantity=quantity,
+            total=np.frombuffer(total, dtype=np.float64),
+        )
+
+    def requirements(self, node: Node | str | int, quantity: float = 1.0) -> Totals:
+        """How much of every assembly and material below ``node`` goes into ``quantity`` units of it."""
+        root = self._root(node)
+        walk = self.edges.downstream(root)
+        order, value = _accumulate(
+            len(self), root, quantity, walk.sources, walk.targets, self._weights(walk.sources, walk.targets)
+        )
+        if len(order) < len(walk):
+            raise ValueError(f"hasComponent cycle below {self.node(root)}")
+        return Totals(self, root, "requirements", order, value[order])
+
+    def where_used(self, node: Node | str | int) -> Totals:
+        """Every assembly containing ``node`` (directly or not), with how much of ``node`` one unit holds."""
+        root = self._root(node)
+        walk = self.edges.upstream(root)
+        # Walk edges point assembly → component; the roll-up runs component → assembly.
+        order, value = _accumulate(
+            len(self), root, 1.0, walk.targets, walk.sources, self._weights(walk.sources, walk.targets)
+        )
+        if len(order) < len(walk):
+            raise ValueError(f"hasComponent cycle above {self.node(root)}")
+        return Totals(self, root, "where-used", order, value[order])
+
+
+def bom_edges(
+    size: int, assemblies, components, quantities: np.ndarray, parts: dict[int, int]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """``(assemblies, components, quantity, placed)`` per edge from raw ``hasComponent`` id pairs.
+
+    ``quantities`` holds the position quantity AQV of every node (NaN for
+    none) and ``parts`` maps a ``typifiedBy`` entry to its part. ``min:`` and
+    ``sdata:`` twins and a triple plus its inverse are one edge; a leaf
+    component with a quantity that is typified by a part is a BOM entry whose
+    edge is moved to the part. ``placed`` is the component as written (the
+    entry); an assembly with two entries of one part keeps both edges.
+    """
+    keys = np.sort(np.asarray(assemblies, dtype=np.int64) * size + np.asarray(components, dtype=np.int64))
+    if len(keys):
+        keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+    assemblies, placed = keys // size, keys % size
+    amounts = quantities[placed]
+    components = placed
+    if parts:
+        part = np.arange(size, dtype=np.int64)
+        part[list(parts)] = list(parts.values())
+        leaf = np.bincount(assemblies, minlength=size) == 0
+        entry = leaf[placed] & ~np.isnan(amounts) & (part[placed] != placed)
+        components = np.where(entry, part[placed], placed)
+    return assemblies, components, amounts, placed
+
+
+class BomBuilder:
+    """Collect ``hasComponent`` and ``typifiedBy`` edges and AQVs from triples, graphs or N-Triples lines."""
+
+    def __init__(self) -> None:
+        self._ids = TokenIds()
+        self._assemblies = array("q")
+        self._components = array("q")
+        self._parts: dict[int, int] = {}  # typified node -> its type (the first one wins)
+        self._quantities = QuantityExtractor()
+        self._component_tokens = {term_token(p) for p in COMPONENT}
+        self._typified_tokens = {term_token(p): entry for p, entry in TYPIFIED.items()}
+
+    def _put(self, subject: str, predicate: str, obj: str) -> None:
+        if predicate in self._component_tokens:
+            self._assemblies.append(self._ids[subject])
+            self._components.append(self._ids[obj])
+        else:
+            entry, part = (subject, obj) if self._typified_tokens[predicate] else (obj, subject)
+            self._parts.setdefault(self._ids[entry], self._ids[part])
+
+    def _edges(self, triples: Iterable[tuple[Node, Node, Node]]) -> Iterable[tuple[Node, Node, Node]]:
+        """Record the ``hasComponent`` and ``typifiedBy`` triples and pass every triple on (to the AQV extractor)."""
+        for triple in triples:
+            s, p, o = triple
+            if (p in COMPONENT or p in TYPIFIED) and not isinstance(o, Literal):
+                self._put(term_token(s), term_token(p), term_token(o))
+            yield triple
+
+    def add(self, triples: Iterable[tuple[Node, Node, Node]]) -> None:
+        self._quantities.add(self._edges(triples))
+
+    def add_graph(self, graph: Graph) -> None:
+        """Feed the ``hasComponent`` and AQV predicates of ``graph`` through its indexes."""
+        index = TripleIndex.from_graph(graph)
+        for predicate in (*COMPONENT, *TYPIFIED):
+            for _ in self._edges(index.triples(predicate)):
+                pass
+        self._quantities.add_graph(graph)
+
+    def add_ntriples(self, lines: Iterable[str]) -> None:
+        """Like :meth:`add` for N-Triples lines, without building rdflib nodes; one pass over ``lines``."""
+        predicates = self._component_tokens | set(self._typified_tokens)
+        put = self._put
+
+        def edges() -> Iterable[str]:
+            for number, line in enumerate(lines, 1):
+                if "hasComponent" in line or "typifie" in line:
+                    parts = split_line(line, number)
+                    if parts is not None and parts[1] in predicates and parts[2][0] != '"':
+                        put(parts[0], parts[1], parts[2][:-1].rstrip())
+                yield line
+
+        self._quantities.add_ntriples(edges())
+
+    def build(self, quantity: str = QUANTITY) -> BomGraph:
+        """A :class:`BomGraph` whose position quantities are the AQVs named ``quantity``.
+
+        A component's AQV is the quantity of every edge into it. A leaf
+        component with such an AQV that is typified by a part is a BOM entry:
+        its edge is moved to the part.
+        """
+        size = len(self._ids)
+        values = np.full(size, np.nan)
+        symbols: dict[int, str] = {}
+        table = self._quantities.table()
+        if quantity in table.names:
+            rows = np.flatnonzero(table.name == table.names.index(quantity))
+            owners, numbers = table.column(quantity)
+            if len(np.unique(owners)) != len(owners):
+                raise ValueError(f"some positions have several AQVs named {quantity!r}")
+            for owner, number, symbol in zip(owners.tolist(), numbers.tolist(), table.symbol[rows].tolist()):
+                idx = self._ids.get(term_token(table.owners[owner]))
+                if idx is not None:
+                    values[idx] = number
+                    if symbol >= 0:
+                        symbols[idx] = table.symbols[symbol]
+        assemblies, components, amounts, placed = bom_edges(
+            size, self._assemblies, self._components, values, self._parts
+        )
+        moved = placed != components
+        for entry, part in zip(placed[moved].tolist(), components[moved].tolist()):
+            if entry in symbols:
+                symbols.setdefault(part, symbols[entry])
+        return BomGraph(tuple(self._ids), assemblies, components, amounts, symbols)
+
+
+def load_bom(paths: Iterable[Path], quantity: str = QUANTITY) -> BomGraph:
+    """Build from RDF files; N-Triples files are streamed line by line."""
+    return load_paths(BomBuilder(), paths).build(quantity)
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Explode a bill of materials or list where a part is used.")
+    parser.add_argument("node", help="IRI of a product, assembly or BOM (of a part with --where-used)")
+    parser.add_argument("data", type=Path, nargs="+", help="Data graph(s); .nt files are streamed")
+    parser.add_argument("--quantity", default=QUANTITY, help="sdata:name of the position quantity AQV")
+    parser.add_argument("--amount", type=float, default=1.0, help="Units of the product to plan for")
+    parser.add_argument("--where-used", action="store_true", help="List the assemblies containing the node")
+    parser.add_argument("--leaves", action="store_true", help="Print aggregated leaf materials, not the tree")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv if argv is not None else sys.argv[1:])
+    bom = load_bom(args.data, args.quantity)
+    start = time.perf_counter()
+    try:
+        if args.where_used:
+            rows = bom.where_used(URIRef(args.node))
+        elif args.leaves:
+            rows = bom.requirements(URIRef(args.node), args.amount).terminal()
+        else:
+            explosion = bom.explode(URIRef(args.node))
+    except (KeyError, ValueError) as exc:
+        print(exc.args[0], file=sys.stderr)
+        return 2
+    seconds = time.perf_counter() - start
+    if args.where_used or args.leaves:
+        for idx, quantity in zip(rows.nodes.tolist(), rows.quantity.tolist()):
+            print(f"{quantity:>14g} {bom.symbols.get(idx, ''):<6} {bom.node(idx)}")
+        print(f"{len(rows)} node(s) in {seconds * 1000:.2f} ms")
+        return 0
+    for level, node, _, total in explosion.indented():
+        print(f"{'  ' * level}{node}  × {total * args.amount:g}")
+    print(f"{len(explosion)} position(s) in {seconds * 1000:.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
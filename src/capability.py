@@ -0,0 +1,328 @@
+"""Batch process-capability indices (Cp/Cpk/Pp/Ppk) over AttributeQuantityValues.
+
+All ``sdata:AttributeQuantityValue`` s sharing an ``sdata:name`` form one
+group. A group's specification limits are the ``sdata:IntervalDomain`` its
+members link through ``sdata:hasValueDomain``; its process model is the
+linked ``sdata:StatisticalDomain``, if any. The sheet-thickness example,
+``t ~ N(1.2, 0.033²)`` against ``[1.1, 1.3]``, yields ``Cpk = 1.0``.
+
+* ``Pp``/``Ppk`` use the observed values (mean and sample standard
+  deviation of the group's ``qudt:numericValue`` s).
+* ``Cp``/``Cpk`` use the process model with the ISO 22514 percentile method
+  (``X0.5`` and the ±3σ-equivalent quantiles), which reduces to the textbook
+  ``(USL - μ) / 3σ`` for a normal model and also covers truncated and
+  non-normal models. Groups without a model fall back to the observed values,
+  so ``Cpk == Ppk``.
+
+:class:`CapabilityEngine` streams triples: it keeps one slot number per AQV
+and appends values, group ids and domain links to flat ``array`` buffers, and
+only the small domain descriptions are collected into a graph. Indices for
+all groups are then computed in a few vectorised NumPy passes. N-Triples
+dumps are read line by line, so the data graph never has to be built::
+
+    python -m src.capability dump.nt
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import sys
+from array import array
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from rdflib import Graph, Literal, URIRef
+from rdflib.namespace import RDF
+from rdflib.term import Node
+
+from src.domains.base import SDATA
+from src.domains.interval import Interval, load_intervals
+from src.domains.statistical import Distribution, load_distributions
+from src.ntriples import load_paths, parse_term, read_ntriples, split_line, term_token
+from src.shape_compiler import TripleIndex
+
+QUDT_NUMERIC_VALUE = URIRef("http://qudt.org/schema/qudt/numericValue")
+
+DOMAIN_TYPES = frozenset(
+    SDATA[name]
+    for name in (
+        "IntervalDomain",
+        "NormalDomain",
+        "LogNormalDomain",
+        "UniformDomain",
+        "WeibullDomain",
+        "PoissonDomain",
+        "BinomialDomain",
+    )
+)
+# Parameters of the domain types above; their triples are kept in a side graph.
+DOMAIN_PREDICATES = frozenset(
+    SDATA[name]
+    for name in (
+        "minValue",
+        "maxValue",
+        "minInclusive",
+        "maxInclusive",
+        "centerValue",
+        "halfWidth",
+        "truncatedBy",
+        "mu",
+        "sigma",
+        "lowerBound",
+        "upperBound",
+        "shape",
+        "scale",
+        "lambda",
+        "trials",
+        "probability",
+    )
+)
+
+# Probabilities of a standard normal below -3σ and above +3σ.
+_LOW = 0.5 * math.erfc(3.0 / math.sqrt(2.0))
+_HIGH = 1.0 - _LOW
+
+
+@dataclass(frozen=True)
+class Capability:
+    """Capability indices of one ``sdata:name`` group (NaN where undefined)."""
+
+    name: str
+    count: int
+    mean: float
+    std: float
+    lower: float
+    upper: float
+    cp: float
+    cpk: float
+    pp: float
+    ppk: float
+    spec: Node | None = None
+    model: Node | None = None
+
+
+def _indices(lower, upper, center, below, above) -> tuple[np.ndarray, np.ndarray]:
+    """``(C, Ck)`` from the spread ``below``/``above`` the center (arrays)."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        c = (upper - lower) / (below + above)
+        ck = np.minimum((upper - center) / above, (center - lower) / below)
+    return np.where(np.isfinite(c), c, np.nan), np.where(np.isinf(ck) & (ck > 0), np.nan, ck)
+
+
+class CapabilityEngine:
+    """Accumulate AQV triples; :meth:`results` computes the indices per group."""
+
+    def __init__(self) -> None:
+        self.domains = Graph()
+        # Keyed by the subject's N-Triples token: rdflib nodes hash in Python.
+        self._slots: dict[str, int] = {}
+        self._groups: dict[str, int] = {}
+        self._group = array("q")
+        self._value = array("d")
+        self._link_slot = array("q")
+        self._link_domain = array("q")
+        self._domain_ids: dict[Node, int] = {}
+
+    def _slot(self, token: str) -> int:
+        slot = self._slots.get(token)
+        if slot is None:
+            slot = self._slots[token] = len(self._group)
+            self._group.append(-1)
+            self._value.append(math.nan)
+        return slot
+
+    def add(self, triples: Iterable[tuple[Node, Node, Node]]) -> None:
+        """Consume triples in any order; irrelevant ones are skipped."""
+        for s, p, o in triples:
+            if p == QUDT_NUMERIC_VALUE:
+                if isinstance(o, Literal):
+                    try:
+                        self._value[self._slot(term_token(s))] = float(o)
+                    except ValueError:
+                        pass
+            elif p == SDATA.name:
+                self._group[self._slot(term_token(s))] = self._groups.setdefault(str(o), len(self._groups))
+            elif p == SDATA.hasValueDomain:
+                self._link_slot.append(self._slot(term_token(s)))
+                self._link_domain.append(self._domain_ids.setdefault(o, len(self._domain_ids)))
+            elif p in DOMAIN_PREDICATES or (p == RDF.type and o in DOMAIN_TYPES):
+                self.domains.add((s, p, o))
+
+    def add_ntriples(self, lines: Iterable[str]) -> None:
+        """Like :meth:`add` for N-Triples lines, without building literal nodes.
+
+        Numeric values are parsed straight from their lexical form and names
+        are memoised, which is several times faster than going through
+        :func:`~src.ntriples.read_ntriples` for AQV-heavy dumps.
+        """
+        numeric, name, link = (f"<{p}>" for p in (QUDT_NUMERIC_VALUE, SDATA.name, SDATA.hasValueDomain))
+        names: dict[str, int] = {}
+        domains: dict[str, int] = {}
+        other: list[str] = []
+        for number, line in enumerate(lines, 1):
+            parts = split_line(line, number)
+            if parts is None:
+                continue
+            subject, predicate, rest = parts
+            if predicate == numeric:
+                if rest[0] == '"':
+                    try:
+                        self._value[self._slot(subject)] = float(rest[1 : rest.index('"', 1)])
+                    except ValueError:
+                        pass
+            elif predicate == name:
+                token = rest[:-1].rstrip()
+                group = names.get(token)
+                if group is None:
+                    group = names[token] = self._groups.setdefault(str(parse_term(token)), len(self._groups))
+                self._group[self._slot(subject)] = group
+            elif predicate == link:
+                token = rest[:-1].rstrip()
+                domain = domains.get(token)
+                if domain is None:
+                    domain = domains[token] = self._domain_ids.setdefault(parse_term(token), len(self._domain_ids))
+                self._link_slot.append(self._slot(subject))
+                self._link_domain.append(domain)
+            else:
+                other.append(line)
+                if len(other) >= 10_000:
+                    self.add(read_ntriples(other))
+                    other.clear()
+        self.add(read_ntriples(other))
+
+    def add_graph(self, graph: Graph) -> None:
+        """Feed only the relevant triples of ``graph`` through its indexes."""
+        index = TripleIndex.from_graph(graph)
+        for predicate in (SDATA.name, QUDT_NUMERIC_VALUE, SDATA.hasValueDomain, *DOMAIN_PREDICATES):
+            self.add(index.triples(predicate))
+        for type_ in DOMAIN_TYPES:
+            self.add(graph.triples((None, RDF.type, type_)))
+
+    def _linked(self, group: np.ndarray) -> dict[int, set[Node]]:
+        """Domains linked by the members of each group."""
+        nodes = list(self._domain_ids)
+        link_group = group[np.array(self._link_slot, dtype=np.int64)]
+        link_domain = np.array(self._link_domain, dtype=np.int64)
+        keep = link_group >= 0
+        pairs = np.unique(link_group[keep] * max(len(nodes), 1) + link_domain[keep])
+        linked: dict[int, set[Node]] = {}
+        for idx, domain in zip(*np.divmod(pairs, max(len(nodes), 1))):
+            linked.setdefault(int(idx), set()).add(nodes[domain])
+        return linked
+
+    def results(
+        self,
+        specs: Mapping[str, Interval] | None = None,
+        models: Mapping[str, Distribution] | None = None,
+    ) -> list[Capability]:
+        """Indices for every group, sorted by name.
+
+        ``specs``/``models`` supply or override the limits and the process
+        model of a group by name.
+        """
+        specs, models = dict(specs or {}), dict(models or {})
+        names = sorted(self._groups, key=self._groups.get)
+        n_groups = len(names)
+
+        group = np.array(self._group, dtype=np.int64)
+        value = np.array(self._value, dtype=np.float64)
+        valid = (group >= 0) & ~np.isnan(value)
+        g, v = group[valid], value[valid]
+        count = np.bincount(g, minlength=n_groups)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = np.bincount(g, weights=v, minlength=n_groups) / count
+            deviation = v - mean[g]
+            std = np.sqrt(np.bincount(g, weights=deviation * deviation, minlength=n_groups) / (count - 1))
+
+        intervals = load_intervals(self.domains)
+        distributions = load_distributions(self.domains)
+        spec_iri: list[Node | None] = [None] * n_groups
+        model_iri: list[Node | None] = [None] * n_groups
+        for idx, domains in self._linked(group).items():
+            name = names[idx]
+            for chosen, table, kind in (
+                (specs, intervals, "IntervalDomains"),
+                (models, distributions, "StatisticalDomains"),
+            ):
+                found = sorted((d for d in domains if d in table), key=str)
+                if name in chosen or not found:
+                    continue
+                if len(found) > 1:
+                    raise ValueError(f"AQVs named {name!r} link {len(found)} {kind}: {', '.join(found)}")
+                chosen[name] = table[found[0]]
+
+        lower = np.full(n_groups, -np.inf)
+        upper = np.full(n_groups, np.inf)
+        # Process model quantiles X(low), X0.5, X(high); observed ±3s without a model.
+        low, center, high = mean - 3 * std, mean.copy(), mean + 3 * std
+        for idx, name in enumerate(names):
+            if (spec := specs.get(name)) is not None:
+                lower[idx], upper[idx], spec_iri[idx] = spec.lower, spec.upper, spec.iri
+            if (model := models.get(name)) is not None:
+                low[idx], center[idx], high[idx] = model.ppf([_LOW, 0.5, _HIGH])
+                model_iri[idx] = model.iri
+
+        has_spec = np.isfinite(lower) | np.isfinite(upper)
+        lower = np.where(has_spec, lower, np.nan)
+        upper = np.where(has_spec, upper, np.nan)
+        pp, ppk = _indices(lower, upper, mean, 3 * std, 3 * std)
+        cp, cpk = _indices(lower, upper, center, center - low, high - center)
+
+        return sorted(
+            (
+                Capability(
+                    name=name,
+                    count=int(count[idx]),
+                    mean=float(mean[idx]),
+                    std=float(std[idx]),
+                    lower=float(lower[idx]),
+                    upper=float(upper[idx]),
+                    cp=float(cp[idx]),
+                    cpk=float(cpk[idx]),
+                    pp=float(pp[idx]),
+                    ppk=float(ppk[idx]),
+                    spec=spec_iri[idx],
+                    model=model_iri[idx],
+                )
+                for idx, name in enumerate(names)
+            ),
+            key=lambda c: c.name,
+        )
+
+
+def capability(graph: Graph, **kwargs) -> list[Capability]:
+    """Capability indices for every ``sdata:name`` group of ``graph``."""
+    engine = CapabilityEngine()
+    engine.add_graph(graph)
+    return engine.results(**kwargs)
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compute Cp/Cpk/Pp/Ppk per sdata:name group.")
+    parser.add_argument("data", type=Path, nargs="+", help="RDF data files (N-Triples files are streamed)")
+    parser.add_argument("--all", action="store_true", help="Also list groups without specification limits")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv if argv is not None else sys.argv[1:])
+    engine = load_paths(CapabilityEngine(), args.data)
+
+    print(
+        f"{'name':<20} {'n':>8} {'mean':>12} {'std':>10} {'LSL':>10} {'USL':>10}"
+        f" {'Cp':>6} {'Cpk':>6} {'Pp':>6} {'Ppk':>6}"
+    )
+    for c in engine.results():
+        if args.all or c.spec is not None:
+            print(
+                f"{c.name:<20} {c.count:>8} {c.mean:>12.6g} {c.std:>10.4g} {c.lower:>10.4g} {c.upper:>10.4g}"
+                f" {c.cp:>6.2f} {c.cpk:>6.2f} {c.pp:>6.2f} {c.ppk:>6.2f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,3 @@
+"""Executable value domains (``sdata-vd-*.ttl``) evaluated over NumPy arrays."""
+
+__all__: list[str] = []
@@ -0,0 +1,47 @@
+"""Shared helpers for reading value-domain parameters from RDF."""
+
+from __future__ import annotations
+
+from rdflib import Graph, Literal, Namespace
+from rdflib.term import Node
+
+SDATA = Namespace("https://w3id.org/sdata/core/")
+
+
+def _single(graph: Graph, node: Node, prop: Node) -> Literal | None:
+    values = list(graph.objects(node, prop))
+    if len(values) > 1:
+        raise ValueError(f"{node} has {len(values)} values for {prop}, expected at most one")
+    if values and not isinstance(values[0], Literal):
+        raise ValueError(f"{node} {prop} must be a literal, got {values[0]!r}")
+    return values[0] if values else None
+
+
+def number(graph: Graph, node: Node, prop: Node, default: float | None = None) -> float | None:
+    """Read a numeric literal (``"INF"``/``"-INF"`` map to infinities)."""
+    value = _single(graph, node, prop)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"{node} {prop} is not numeric: {value!r}") from exc
+
+
+def required_number(graph: Graph, node: Node, prop: Node) -> float:
+    value = number(graph, node, prop)
+    if value is None:
+        raise ValueError(f"{node} is missing {prop}")
+    return value
+
+
+def flag(graph: Graph, node: Node, prop: Node, default: bool) -> bool:
+    value = _single(graph, node, prop)
+    if value is None:
+        return default
+    python = value.toPython()
+    if isinstance(python, bool):
+        return python
+    if str(value).lower() in ("true", "1", "false", "0"):
+        return str(value).lower() in ("true", "1")
+    raise ValueError(f"{node} {prop} is not a boolean: {value!r}")
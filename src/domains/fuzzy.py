@@ -0,0 +1,286 @@
+"""Vectorised fuzzy membership functions for ``sdata-vd-fuzzy.ttl``.
+
+Each ``sdata:FuzzyDomain`` subclass maps to a frozen dataclass whose
+:meth:`~FuzzyNumber.membership` evaluates μ(x) for a whole NumPy array and
+whose :meth:`~FuzzyNumber.alpha_cut` returns the α-cut bounds, vectorised
+over α as well. The sheet-thickness example's soft tolerance::
+
+    fuzzy = load_fuzzy(graph)[ex.dom_thickness_fuzzy]   # Trap(1.05, 1.15, 1.25, 1.35)
+    fuzzy.membership(1.28)                               # 0.7
+
+L-R numbers use linear reference functions unless ``sdata:fuzzyLeftFunction``
+/ ``sdata:fuzzyRightFunction`` name one of :data:`REFERENCE_FUNCTIONS`. An
+``sdata:truncatedBy`` IntervalDomain zeroes μ outside the interval and clips
+the α-cuts.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+from rdflib import Graph, Literal
+from rdflib.namespace import RDF
+from rdflib.term import Node
+
+from src.domains.base import SDATA, number, required_number
+from src.domains.interval import Interval
+
+# name -> (L(u) for u >= 0, inverse L⁻¹(α) for α in (0, 1])
+REFERENCE_FUNCTIONS: dict[str, tuple[Callable[[np.ndarray], np.ndarray], Callable[[np.ndarray], np.ndarray]]] = {
+    "linear": (lambda u: np.maximum(0.0, 1.0 - u), lambda a: 1.0 - a),
+    "quadratic": (lambda u: np.maximum(0.0, 1.0 - u * u), lambda a: np.sqrt(1.0 - a)),
+    "exponential": (lambda u: np.exp(-u), lambda a: -np.log(a)),
+    "gaussian": (lambda u: np.exp(-0.5 * u * u), lambda a: np.sqrt(-2.0 * np.log(a))),
+    "rational": (lambda u: 1.0 / (1.0 + u * u), lambda a: np.sqrt(1.0 / a - 1.0)),
+}
+
+
+def _ramp_up(x: np.ndarray, foot: float, shoulder: float) -> np.ndarray:
+    if shoulder > foot:
+        return (x - foot) / (shoulder - foot)
+    return np.where(x >= foot, 1.0, 0.0)
+
+
+def _ramp_down(x: np.ndarray, shoulder: float, foot: float) -> np.ndarray:
+    if foot > shoulder:
+        return (foot - x) / (foot - shoulder)
+    return np.where(x <= foot, 1.0, 0.0)
+
+
+def _alphas(alpha) -> np.ndarray:
+    a = np.asarray(alpha, dtype=np.float64)
+    if np.any((a < 0) | (a > 1) | np.isnan(a)):
+        raise ValueError("alpha levels must lie in [0, 1]")
+    return a
+
+
+@dataclass(frozen=True)
+class FuzzyNumber(ABC):
+    """Base class: subclasses implement :meth:`_membership` and :meth:`_cut`."""
+
+    iri: Node | None = None
+    alpha_level: float | None = None
+    truncation: Interval | None = None
+
+    @abstractmethod
+    def _membership(self, x: np.ndarray) -> np.ndarray:
+        """μ(x) before clipping, NaN handling and truncation."""
+
+    @abstractmethod
+    def _cut(self, alpha: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Untruncated α-cut bounds for every α in ``alpha``."""
+
+    def membership(self, values) -> np.ndarray:
+        """μ(x) in [0, 1] for every element of ``values`` (NaN maps to 0)."""
+        x = np.asarray(values, dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            mu = np.clip(self._membership(x), 0.0, 1.0)
+        mu = np.where(np.isnan(x), 0.0, mu)
+        if self.truncation is not None:
+            mu = np.where(self.truncation.contains(x), mu, 0.0)
+        return mu
+
+    def alpha_cut(self, alpha=None) -> tuple[np.ndarray, np.ndarray]:
+        """Lower and upper bounds of the α-cut(s) ``{x : μ(x) ≥ α}``.
+
+        ``alpha`` defaults to the domain's ``sdata:alphaLevel`` (or 1, the
+        core). α = 0 yields the closure of the support. Cuts that lie outside
+        the truncation interval are empty and get NaN bounds.
+        """
+        if alpha is None:
+            alpha = 1.0 if self.alpha_level is None else self.alpha_level
+        a = _alphas(alpha)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            lower, upper = self._cut(a)
+        lower = np.asarray(lower, dtype=np.float64)
+        upper = np.asarray(upper, dtype=np.float64)
+        if self.truncation is not None:
+            lower = np.maximum(lower, self.truncation.lower)
+            upper = np.minimum(upper, self.truncation.upper)
+            empty = lower > upper
+            lower = np.where(empty, np.nan, lower)
+            upper = np.where(empty, np.nan, upper)
+        return lower, upper
+
+    def alpha_cut_interval(self, alpha: float | None = None) -> Interval | None:
+        """The α-cut as an :class:`Interval`, ``None`` if it is empty."""
+        lower, upper = self.alpha_cut(alpha)
+        if np.isnan(lower) or np.isnan(upper):
+            return None
+        return Interval(float(lower), float(upper), iri=self.iri)
+
+    @property
+    def support(self) -> tuple[float, float]:
+        """Closure of the support; ``(nan, nan)`` if the truncation excludes all of it."""
+        lower, upper = self.alpha_cut(0.0)
+        return float(lower), float(upper)
+
+    @property
+    def core(self) -> tuple[float, float]:
+        lower, upper = self.alpha_cut(1.0)
+        return float(lower), float(upper)
+
+    @classmethod
+    def from_graph(cls, graph: Graph, node: Node) -> FuzzyNumber:
+        """Build the fuzzy number for ``node`` from its asserted subclass."""
+        builders = [builder for type_ in graph.objects(node, RDF.type) if (builder := _BUILDERS.get(type_))]
+        if len(builders) != 1:
+            raise ValueError(f"{node} must have exactly one concrete sdata:FuzzyDomain type")
+        common = {
+            "iri": node,
+            "alpha_level": number(graph, node, SDATA.alphaLevel),
+            "truncation": _truncation(graph, node),
+        }
+        if common["alpha_level"] is not None and not 0.0 <= common["alpha_level"] <= 1.0:
+            raise ValueError(f"{node} sdata:alphaLevel must lie in [0, 1]")
+        return builders[0](graph, node, common)
+
+
+def _truncation(graph: Graph, node: Node) -> Interval | None:
+    bound = graph.value(node, SDATA.truncatedBy)
+    return Interval.from_graph(graph, bound) if bound is not None else None
+
+
+@dataclass(frozen=True)
+class TrapezoidalFuzzy(FuzzyNumber):
+    """Trap(a, b, c, d): support [a, d], core [b, c]."""
+
+    left: float = 0.0
+    core_left: float = 0.0
+    core_right: float = 0.0
+    right: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not self.left <= self.core_left <= self.core_right <= self.right:
+            raise ValueError(f"{self.iri}: fuzzy points must satisfy a ≤ b ≤ c ≤ d")
+
+    def _membership(self, x: np.ndarray) -> np.ndarray:
+        up = _ramp_up(x, self.left, self.core_left)
+        down = _ramp_down(x, self.core_right, self.right)
+        return np.minimum(np.minimum(up, down), 1.0)
+
+    def _cut(self, alpha: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        lower = self.left + alpha * (self.core_left - self.left)
+        upper = self.right - alpha * (self.right - self.core_right)
+        return lower, upper
+
+
+@dataclass(frozen=True)
+class TriangularFuzzy(TrapezoidalFuzzy):
+    """T(a, m, b): a trapezoid whose core is the single peak m."""
+
+    @classmethod
+    def of(cls, left: float, peak: float, right: float, **kwargs) -> TriangularFuzzy:
+        return cls(left=left, core_left=peak, core_right=peak, right=right, **kwargs)
+
+    @property
+    def peak(self) -> float:
+        return self.core_left
+
+
+@dataclass(frozen=True)
+class GaussianFuzzy(FuzzyNumber):
+    """G(c, σ): μ(x) = exp(-(x - c)² / (2σ²)), unbounded support."""
+
+    center: float = 0.0
+    width: float = 1.0
+
+    def __post_init__(self) -> None:
+        if not self.width > 0:
+            raise ValueError(f"{self.iri}: sdata:fuzzyWidth must be positive")
+
+    def _membership(self, x: np.ndarray) -> np.ndarray:
+        z = (x - self.center) / self.width
+        return np.exp(-0.5 * z * z)
+
+    def _cut(self, alpha: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        half = self.width * np.sqrt(-2.0 * np.log(alpha))
+        return self.center - half, self.center + half
+
+
+@dataclass(frozen=True)
+class LRFuzzy(FuzzyNumber):
+    """LR(c, αL, αR) with reference functions L and R (linear by default)."""
+
+    center: float = 0.0
+    spread_left: float = 0.0
+    spread_right: float = 0.0
+    left_function: str = "linear"
+    right_function: str = "linear"
+
+    def __post_init__(self) -> None:
+        if self.spread_left < 0 or self.spread_right < 0:
+            raise ValueError(f"{self.iri}: spreads must be non-negative")
+        for name in (self.left_function, self.right_function):
+            if name not in REFERENCE_FUNCTIONS:
+                raise ValueError(f"{self.iri}: unknown reference function {name!r}")
+
+    @staticmethod
+    def _side(distance: np.ndarray, spread: float, function: str) -> np.ndarray:
+        shape, _ = REFERENCE_FUNCTIONS[function]
+        if spread == 0:
+            return np.where(distance <= 0, 1.0, 0.0)
+        return shape(np.maximum(distance, 0.0) / spread)
+
+    def _membership(self, x: np.ndarray) -> np.ndarray:
+        left = self._side(self.center - x, self.spread_left, self.left_function)
+        right = self._side(x - self.center, self.spread_right, self.right_function)
+        return np.where(x < self.center, left, right)
+
+    def _cut(self, alpha: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # L⁻¹(0) is 1 for compact reference functions and +∞ otherwise.
+        lower = np.full_like(alpha, self.center)
+        upper = np.full_like(alpha, self.center)
+        if self.spread_left > 0:
+            lower = lower - self.spread_left * REFERENCE_FUNCTIONS[self.left_function][1](alpha)
+        if self.spread_right > 0:
+            upper = upper + self.spread_right * REFERENCE_FUNCTIONS[self.right_function][1](alpha)
+        return lower, upper
+
+
+def _function_name(graph: Graph, node: Node, prop: Node) -> str:
+    value = graph.value(node, prop)
+    if value is None:
+        return "linear"
+    name = str(value).rsplit("/", 1)[-1].rsplit("#", 1)[-1] if not isinstance(value, Literal) else str(value)
+    return name.lower()
+
+
+_BUILDERS: dict[Node, Callable[[Graph, Node, dict], FuzzyNumber]] = {
+    SDATA.TriangularFuzzyDomain: lambda g, n, common: TriangularFuzzy.of(
+        required_number(g, n, SDATA.fuzzyLeft),
+        required_number(g, n, SDATA.fuzzyPeak),
+        required_number(g, n, SDATA.fuzzyRight),
+        **common,
+    ),
+    SDATA.TrapezoidalFuzzyDomain: lambda g, n, common: TrapezoidalFuzzy(
+        left=required_number(g, n, SDATA.fuzzyLeft),
+        core_left=required_number(g, n, SDATA.fuzzyCoreLeft),
+        core_right=required_number(g, n, SDATA.fuzzyCoreRight),
+        right=required_number(g, n, SDATA.fuzzyRight),
+        **common,
+    ),
+    SDATA.GaussianFuzzyDomain: lambda g, n, common: GaussianFuzzy(
+        center=required_number(g, n, SDATA.fuzzyCenter),
+        width=required_number(g, n, SDATA.fuzzyWidth),
+        **common,
+    ),
+    SDATA.LRFuzzyDomain: lambda g, n, common: LRFuzzy(
+        center=required_number(g, n, SDATA.fuzzyCenter),
+        spread_left=required_number(g, n, SDATA.fuzzySpreadLeft),
+        spread_right=required_number(g, n, SDATA.fuzzySpreadRight),
+        left_function=_function_name(g, n, SDATA.fuzzyLeftFunction),
+        right_function=_function_name(g, n, SDATA.fuzzyRightFunction),
+        **common,
+    ),
+}
+
+
+def load_fuzzy(graph: Graph) -> dict[Node, FuzzyNumber]:
+    """Read every concrete ``sdata:FuzzyDomain`` instance of ``graph``."""
+    nodes = {node for cls in _BUILDERS for node in graph.subjects(RDF.type, cls)}
+    return {node: FuzzyNumber.from_graph(graph, node) for node in nodes}
+
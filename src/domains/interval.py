@@ -0,0 +1,147 @@
+"""Vectorised membership tests for ``sdata:IntervalDomain`` (``sdata-vd-interval.ttl``).
+
+An :class:`Interval` is read from RDF once (explicit ``minValue``/``maxValue``
+or the symmetric ``centerValue ± halfWidth`` form, with ``minInclusive``/
+``maxInclusive`` defaulting to closed bounds) and then tests whole NumPy
+arrays with two comparisons. :class:`IntervalTable` stores many intervals as
+parallel bound arrays so a batch of readings, each pointing at its own
+domain, is checked in a single vectorised pass::
+
+    table = IntervalTable.from_graph(graph)
+    ok = table.contains(values, table.indices(domain_iris))
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+from rdflib import Graph
+from rdflib.namespace import RDF
+from rdflib.term import Node
+
+from src.domains.base import SDATA, flag, number
+
+
+@dataclass(frozen=True)
+class Interval:
+    """A real interval with open or closed bounds (closed by default)."""
+
+    lower: float
+    upper: float
+    lower_inclusive: bool = True
+    upper_inclusive: bool = True
+    iri: Node | None = None
+
+    def __post_init__(self) -> None:
+        if math.isnan(self.lower) or math.isnan(self.upper):
+            raise ValueError(f"interval {self.iri} has a NaN bound")
+        if self.lower > self.upper:
+            raise ValueError(f"interval {self.iri} has lower bound {self.lower} > upper bound {self.upper}")
+
+    @classmethod
+    def symmetric(cls, center: float, half_width: float, **kwargs) -> Interval:
+        if half_width < 0:
+            raise ValueError(f"half width must be non-negative, got {half_width}")
+        return cls(center - half_width, center + half_width, **kwargs)
+
+    @classmethod
+    def from_graph(cls, graph: Graph, node: Node) -> Interval:
+        """Read the ``sdata:IntervalDomain`` ``node``.
+
+        Explicit bounds take precedence; ``centerValue``/``halfWidth`` fill in
+        missing ones and must agree with explicit ones.
+        """
+        lower = number(graph, node, SDATA.minValue)
+        upper = number(graph, node, SDATA.maxValue)
+        center = number(graph, node, SDATA.centerValue)
+        half_width = number(graph, node, SDATA.halfWidth)
+        if (center is None) != (half_width is None):
+            raise ValueError(f"{node} needs both sdata:centerValue and sdata:halfWidth")
+        if center is not None and half_width is not None:
+            if half_width < 0:
+                raise ValueError(f"{node} has negative sdata:halfWidth {half_width}")
+            for name, given, derived in (
+                ("minValue", lower, center - half_width),
+                ("maxValue", upper, center + half_width),
+            ):
+                if given is not None and not math.isclose(given, derived, rel_tol=1e-9, abs_tol=1e-12):
+                    raise ValueError(f"{node} sdata:{name} {given} disagrees with center ± half width ({derived})")
+            lower = center - half_width if lower is None else lower
+            upper = center + half_width if upper is None else upper
+        if lower is None or upper is None:
+            raise ValueError(f"{node} needs sdata:minValue and sdata:maxValue (or centerValue and halfWidth)")
+        return cls(
+            lower,
+            upper,
+            lower_inclusive=flag(graph, node, SDATA.minInclusive, True),
+            upper_inclusive=flag(graph, node, SDATA.maxInclusive, True),
+            iri=node,
+        )
+
+    @property
+    def center(self) -> float:
+        return (self.lower + self.upper) / 2
+
+    @property
+    def half_width(self) -> float:
+        return (self.upper - self.lower) / 2
+
+    def contains(self, values) -> np.ndarray:
+        """Boolean membership of every element of ``values`` (NaN is never inside)."""
+        x = np.asarray(values, dtype=np.float64)
+        above = x >= self.lower if self.lower_inclusive else x > self.lower
+        below = x <= self.upper if self.upper_inclusive else x < self.upper
+        return above & below
+
+    def __contains__(self, value: object) -> bool:
+        return bool(self.contains(value))
+
+    def __str__(self) -> str:
+        left = "[" if self.lower_inclusive else "("
+        right = "]" if self.upper_inclusive else ")"
+        return f"{left}{self.lower:g}, {self.upper:g}{right}"
+
+
+def load_intervals(graph: Graph) -> dict[Node, Interval]:
+    """Read every ``sdata:IntervalDomain`` instance of ``graph``."""
+    return {node: Interval.from_graph(graph, node) for node in graph.subjects(RDF.type, SDATA.IntervalDomain)}
+
+
+class IntervalTable:
+    """Many intervals as parallel arrays for mixed-domain batch checks."""
+
+    def __init__(self, intervals: Sequence[Interval]):
+        self.intervals = tuple(intervals)
+        self.lower = np.array([i.lower for i in self.intervals], dtype=np.float64)
+        self.upper = np.array([i.upper for i in self.intervals], dtype=np.float64)
+        self.lower_inclusive = np.array([i.lower_inclusive for i in self.intervals], dtype=bool)
+        self.upper_inclusive = np.array([i.upper_inclusive for i in self.intervals], dtype=bool)
+        self._ids = {i.iri: idx for idx, i in enumerate(self.intervals) if i.iri is not None}
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> IntervalTable:
+        intervals = load_intervals(graph)
+        return cls([intervals[node] for node in sorted(intervals, key=str)])
+
+    def __len__(self) -> int:
+        return len(self.intervals)
+
+    def index_of(self, iri: Node) -> int:
+        return self._ids[iri]
+
+    def indices(self, iris: Iterable[Node]) -> np.ndarray:
+        """Row numbers for ``iris`` (``KeyError`` for unknown domains)."""
+        ids = self._ids
+        return np.fromiter((ids[iri] for iri in iris), dtype=np.intp)
+
+    def contains(self, values, which) -> np.ndarray:
+        """Membership of ``values[k]`` in interval ``which[k]`` (broadcasting)."""
+        x = np.asarray(values, dtype=np.float64)
+        idx = np.asarray(which, dtype=np.intp)
+        lower, upper = self.lower[idx], self.upper[idx]
+        above = np.where(self.lower_inclusive[idx], x >= lower, x > lower)
+        below = np.where(self.upper_inclusive[idx], x <= upper, x < upper)
+        return above & below
@@ -0,0 +1,234 @@
+"""Canonicalise ``sdata:*`` facade terms and their ``min:*`` equivalents.
+
+``sdata-core.ttl`` re-exports every MIN relation as an ``sdata:`` facade via
+``owl:equivalentProperty``. Instance data may use either spelling, which
+forces downstream SPARQL into ``UNION`` patterns. :class:`FacadeMap` collects
+the equivalence groups once into a flat ``term -> canonical term`` table;
+:func:`normalize_ntriples` then rewrites an N-Triples stream line by line with
+one dictionary lookup per triple, without building an rdflib graph.
+
+Class facades (``sdata:Object``, ``sdata:Agent``, ...) are declared with
+``rdfs:subClassOf`` rather than equivalence and are therefore *not*
+rewritten; only ``owl:equivalentClass`` links between named classes are.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TextIO
+
+from rdflib import Graph, URIRef
+from rdflib.namespace import OWL, RDF
+from rdflib.term import Node
+
+from src import loader
+
+ROOT = Path(__file__).resolve().parent.parent
+SDATA_BASE = "https://w3id.org/sdata/core/"
+MIN_BASE = "https://w3id.org/min#"
+DEFAULT_SOURCES = (ROOT / "sdata-core.ttl",)
+PREFERRED_BASES = {"sdata": SDATA_BASE, "min": MIN_BASE}
+
+OWL_EQUIVALENT_ANNOTATION_PROPERTY = URIRef(f"{OWL}equivalentAnnotationProperty")
+_PROPERTY_EQUIVALENCES = (OWL.equivalentProperty, OWL_EQUIVALENT_ANNOTATION_PROPERTY)
+_RDF_TYPE_TOKEN = f"<{RDF.type}>"
+
+
+def _groups(pairs: Iterable[tuple[URIRef, URIRef]]) -> list[set[URIRef]]:
+    parent: dict[URIRef, URIRef] = {}
+
+    def find(term: URIRef) -> URIRef:
+        root = term
+        while parent.setdefault(root, root) != root:
+            root = parent[root]
+        while parent[term] != root:
+            parent[term], term = root, parent[term]
+        return root
+
+    for left, right in pairs:
+        a, b = find(left), find(right)
+        if a != b:
+            parent[b] = a
+
+    groups: dict[URIRef, set[URIRef]] = {}
+    for term in parent:
+        groups.setdefault(find(term), set()).add(term)
+    return list(groups.values())
+
+
+def _canonical(group: set[URIRef], preferred_base: str) -> URIRef:
+    preferred = sorted(str(t) for t in group if str(t).startswith(preferred_base))
+    return URIRef(preferred[0] if preferred else min(str(t) for t in group))
+
+
+@dataclass(frozen=True)
+class FacadeMap:
+    """Lookup tables mapping every facade/equivalent term to its canonical IRI.
+
+    Only non-identity entries are stored, so a missing key means "keep as is".
+    """
+
+    properties: dict[URIRef, URIRef] = field(default_factory=dict)
+    classes: dict[URIRef, URIRef] = field(default_factory=dict)
+
+    @classmethod
+    def from_graph(cls, graph: Graph, prefer: str = "sdata") -> FacadeMap:
+        """Build the tables from the equivalence axioms in ``graph``.
+
+        ``prefer`` selects the namespace of the canonical IRI (``"sdata"`` or
+        ``"min"``); a group without a term in that namespace falls back to its
+        lexicographically smallest IRI.
+        """
+        if prefer not in PREFERRED_BASES:
+            raise ValueError(f"prefer must be one of {sorted(PREFERRED_BASES)}, got {prefer!r}")
+        base = PREFERRED_BASES[prefer]
+
+        property_pairs = [
+            (s, o)
+            for predicate in _PROPERTY_EQUIVALENCES
+            for s, o in graph.subject_objects(predicate)
+            if isinstance(s, URIRef) and isinstance(o, URIRef)
+        ]
+        class_pairs = [
+            (s, o)
+            for s, o in graph.subject_objects(OWL.equivalentClass)
+            if isinstance(s, URIRef) and isinstance(o, URIRef)
+        ]
+
+        def table(pairs: list[tuple[URIRef, URIRef]]) -> dict[URIRef, URIRef]:
+            mapping: dict[URIRef, URIRef] = {}
+            for group in _groups(pairs):
+                target = _canonical(group, base)
+                mapping.update({term: target for term in group if term != target})
+            return mapping
+
+        return cls(properties=table(property_pairs), classes=table(class_pairs))
+
+    @classmethod
+    def load(
+        cls,
+        paths: Iterable[Path] = DEFAULT_SOURCES,
+        prefer: str = "sdata",
+        *,
+        cache_dir: Path | None = None,
+        use_cache: bool | None = None,
+    ) -> FacadeMap:
+        paths = tuple(Path(p) for p in paths)
+
+        def build() -> FacadeMap:
+            graph = loader.load_merged(*paths, cache_dir=cache_dir, use_cache=use_cache)
+            return cls.from_graph(graph, prefer=prefer)
+
+        return loader.cached_artifact(
+            f"facade-map-{prefer}", paths, build, cache_dir=cache_dir, use_cache=use_cache
+        )
+
+    def canonical(self, term: Node) -> Node:
+        return self.properties.get(term, self.classes.get(term, term))  # type: ignore[arg-type]
+
+    def normalize_triple(self, triple: tuple[Node, Node, Node]) -> tuple[Node, Node, Node]:
+        s, p, o = triple
+        p = self.properties.get(p, p)  # type: ignore[arg-type]
+        if p == RDF.type:
+            o = self.classes.get(o, o)  # type: ignore[arg-type]
+        return s, p, o
+
+    def ntriples_tables(self) -> tuple[dict[str, str], dict[str, str]]:
+        """Return the tables keyed by N-Triples tokens (``<iri>``)."""
+        return (
+            {f"<{k}>": f"<{v}>" for k, v in self.properties.items()},
+            {f"<{k}>": f"<{v}>" for k, v in self.classes.items()},
+        )
+
+
+def normalize_triples(
+    triples: Iterable[tuple[Node, Node, Node]], facades: FacadeMap
+) -> Iterator[tuple[Node, Node, Node]]:
+    for triple in triples:
+        yield facades.normalize_triple(triple)
+
+
+def normalize_graph(graph: Graph, facades: FacadeMap) -> Graph:
+    """Return a copy of ``graph`` with all facade terms canonicalised."""
+    result = Graph()
+    for prefix, ns in graph.namespaces():
+        result.bind(prefix, ns, override=False)
+    result.addN((s, p, o, result) for s, p, o in normalize_triples(graph, facades))
+    return result
+
+
+def normalize_ntriples(source: TextIO, target: TextIO, facades: FacadeMap) -> tuple[int, int]:
+    """Stream N-Triples from ``source`` to ``target`` with canonical terms.
+
+    Each line is split into subject, predicate and remainder at the first two
+    whitespace runs (N-Triples forbids whitespace inside IRIs and blank node
+    labels), so literals are never parsed. Comments and blank lines are copied
+    unchanged. Returns ``(lines, rewritten)``.
+    """
+    properties, classes = facades.ntriples_tables()
+    lines = rewritten = 0
+    write = target.write
+    for line in source:
+        lines += 1
+        stripped = line.lstrip()
+        if not stripped or stripped[0] == "#":
+            write(line)
+            continue
+        parts = stripped.split(None, 2)
+        if len(parts) < 3:
+            write(line)
+            continue
+        subject, predicate, rest = parts
+        new_predicate = properties.get(predicate, predicate)
+        new_rest = rest
+        if new_predicate == _RDF_TYPE_TOKEN and rest[0] == "<":
+            end = rest.find(">") + 1
+            new_obj = classes.get(rest[:end])
+            if new_obj is not None:
+                new_rest = new_obj + rest[end:]
+        if new_predicate is predicate and new_rest is rest:
+            write(line)
+            continue
+        rewritten += 1
+        write(f"{subject} {new_predicate} {new_rest}")
+    return lines, rewritten
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Canonicalise sdata/MIN facade terms in an N-Triples file.")
+    parser.add_argument("--input", default="-", help="Input N-Triples file ('-' for stdin)")
+    parser.add_argument("--output", default="-", help="Output N-Triples file ('-' for stdout)")
+    parser.add_argument("--prefer", choices=sorted(PREFERRED_BASES), default="sdata")
+    parser.add_argument(
+        "--ontology",
+        action="append",
+        type=Path,
+        help="Ontology file(s) declaring the equivalences (default: sdata-core.ttl)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv if argv is not None else sys.argv[1:])
+    facades = FacadeMap.load(args.ontology or DEFAULT_SOURCES, prefer=args.prefer)
+
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    target = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        lines, rewritten = normalize_ntriples(source, target, facades)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+
+    print(f"Rewrote {rewritten} of {lines} lines", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,402 @@
+"""Energy and CO2 roll-up along process chains and BOMs, with incremental updates.
+
+Following ``docs/modeling/energie-co2-bilanz.md``, a process step carries its
+own energy and emissions as AQVs, on the process itself or on a report it
+points to with ``sdata:hasData``
+(``sdata:hasQuantity [ sdata:name "co2" ; qudt:numericValue 12.5 ]``).
+Data a process ``generates`` (or that is ``generatedBy``/``producedBy`` it)
+is folded into the process the same way, so it takes no share of the
+process's total away from the material outputs.
+:class:`FootprintGraph` adds them up in flow direction (see
+:data:`src.lineage.FLOW`) and up ``hasComponent`` trees, so every node ends
+up with the cumulative footprint of everything that went into it:
+
+* a node passes its total on to its flow successors in equal shares, so a
+  process with two outputs splits its footprint instead of counting it twice;
+* a component passes its total on to its assembly times its position
+  quantity, read exactly as :mod:`src.bom` reads it (the AQV named
+  ``quantity``; a ``sdata:typifiedBy`` BOM entry places its part), unless the
+  assembly is also downstream of it in the flow graph (the part is an input
+  of the process that makes the assembly): its footprint then already
+  arrives along the flow and the ``hasComponent`` edge is not counted again.
+
+Only nodes inside a system boundary are counted when one is given. The
+boundary is an ``sdata:Boundary`` whose ``sdata:bounds`` (or the members'
+``sdata:hasBoundary``) lists the processes and materials in scope, for
+example a cradle-to-gate study typified by a ``sdata:BoundaryType``::
+
+    footprint = FootprintGraph.from_graph(graph, boundary=EX.cradle_to_gate)
+    footprint.total(EX.harness, "co2")              # kg CO2 up to the factory gate
+    footprint.set_value(EX.rolling_001, "co2", 9.8)  # only rolling_001's descendants are updated
+
+Nodes are ranked once into topological levels. The full roll-up then
+computes one level at a time with NumPy gathers and segment sums and keeps
+every node's total. Changing one process only pushes the difference through
+its descendants in level order. A flow or ``hasComponent`` cycle is an
+error, because a cycle has no finite cumulative total.
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import sys
+import time
+from array import array
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+import numpy as np
+from rdflib import Graph, Literal, URIRef
+from rdflib.term import Node
+
+from src.bom import COMPONENT, QUANTITY, TYPIFIED, bom_edges
+from src.lineage import FLOW, MIN, SDATA, SCALAR_FRONTIER, LineageGraph, topological_levels
+from src.ntriples import TokenIds, TokenNodes, load_paths, split_line, term_token
+from src.quantities import QuantityExtractor, QuantityTable
+from src.reachability import ReachabilityIndex
+from src.shape_compiler import TripleIndex
+from src.units import UnitTable, convert_quantities
+
+INDICATORS = ("energy", "co2")
+# predicate -> True if the subject is the process (and the object its data). Data is folded into its
+# process instead of taking a share of the flow.
+HAS_DATA: dict[URIRef, bool] = {SDATA.hasData: True}
+for _ns in (MIN, SDATA):
+    HAS_DATA.update({_ns.generates: True, _ns.generatedBy: False, _ns.producedBy: False})
+del _ns
+BOUNDS = (MIN.bounds, SDATA.bounds)
+HAS_BOUNDARY = (MIN.hasBoundary, SDATA.hasBoundary)
+
+
+class FootprintGraph(TokenNodes):
+    """Cumulative indicator totals over a weighted DAG, kept up to date on single-value changes."""
+
+    def __init__(self, tokens: Sequence[str], sources, targets, weights, own, names: Sequence[str] = INDICATORS):
+        """Build from node ``tokens``, parallel edge arrays and ``own`` values of shape ``(len(names), nodes)``.
+
+        An edge passes ``weight`` times the total of its source on to its target.
+        """
+        self.tokens = tokens
+        self.names = tuple(names)
+        size = len(tokens)
+        self.sources = np.asarray(sources, dtype=np.int64)
+        self.targets = np.asarray(targets, dtype=np.int64)
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.own = np.array(own, dtype=np.float64).reshape(len(self.names), size)
+        self.levels = topological_levels(size, self.sources, self.targets)
+        if np.any(self.levels < 0):
+            raise ValueError(f"{int(np.sum(self.levels < 0))} node(s) lie on or below a flow/hasComponent cycle")
+
+        # Out-edges per node for incremental updates.
+        self._by_source = np.argsort(self.sources, kind="stable")
+        self._ptr = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.sources, minlength=size), out=self._ptr[1:])
+        # Edges grouped by the level of their target, then by target, for the level-by-level roll-up.
+        self._by_level = np.lexsort((self.targets, self.levels[self.targets]))
+        edge_levels = self.levels[self.targets[self._by_level]]
+        self._level_ptr = np.searchsorted(edge_levels, np.arange(int(self.levels.max(initial=0)) + 2))
+        self.totals = self.own.copy()
+        self.recompute()
+
+    @classmethod
+    def from_graph(
+        cls,
+        graph: Graph,
+        names: Sequence[str] = INDICATORS,
+        boundary: Node | None = None,
+        units: dict[str, str | URIRef] | None = None,
+    ) -> FootprintGraph:
+        builder = FootprintBuilder()
+        builder.add_graph(graph)
+        return builder.build(names, boundary=boundary, units=units)
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def _locate(self, node: Node | str | int, name: str) -> tuple[int, int]:
+        v = self.index_of(node)
+        if v is None:
+            raise KeyError(f"{node} is not part of the footprint graph")
+        if name not in self.names:
+            raise KeyError(f"no indicator named {name!r}")
+        return v, self.names.index(name)
+
+    def total(self, node: Node | str | int, name: str) -> float:
+        """Cumulative ``name`` of ``node``: its own value plus its share of everything upstream."""
+        v, row = self._locate(node, name)
+        return float(self.totals[row, v])
+
+    def own_value(self, node: Node | str | int, name: str) -> float:
+        v, row = self._locate(node, name)
+        return float(self.own[row, v])
+
+    def as_dict(self, name: str) -> dict[Node, float]:
+        """Totals of ``name`` for every node with a non-zero total."""
+        if name not in self.names:
+            raise KeyError(f"no indicator named {name!r}")
+        row = self.totals[self.names.index(name)]
+        return {self.node(i): float(row[i]) for i in np.flatnonzero(row).tolist()}
+
+    def recompute(self) -> None:
+        """Roll all totals up from the ``own`` values, one topological level at a time."""
+        totals = self.totals
+        totals[:] = self.own
+        rows = [memoryview(row) for row in totals]
+        sources, targets, weights = self.sources, self.targets, self.weights
+        source_view, target_view, weight_view = memoryview(sources), memoryview(targets), memoryview(weights)
+        level_ptr = self._level_ptr.tolist()
+        for level in range(1, len(level_ptr) - 1):
+            edges = self._by_level[level_ptr[level] : level_ptr[level + 1]]
+            if len(edges) <= SCALAR_FRONTIER:
+                for e in edges.tolist():
+                    s, t, w = source_view[e], target_view[e], weight_view[e]
+                    for row in rows:
+                        row[t] += w * row[s]
+                continue
+            heads = targets[edges]
+            starts = np.flatnonzero(np.concatenate(([True], heads[1:] != heads[:-1])))
+            # Every source lies on an earlier level, so its total is final.
+            shares = totals[:, sources[edges]] * weights[edges]
+            totals[:, heads[starts]] += np.add.reduceat(shares, starts, axis=1)
+
+    def set_value(self, node: Node | str | int, name: str, value: float) -> int:
+        """Replace ``node``'s own ``name`` and update the totals of its descendants only.
+
+        Returns the number of totals that changed.
+        """
+        v, row = self._locate(node, name)
+        delta = value - self.own[row, v]
+        self.own[row, v] = value
+        if delta == 0:
+            return 0
+        totals = memoryview(self.totals[row])
+        ptr, by_source, levels = self._ptr, self._by_source, self.levels
+        targets, weights = self.targets, self.weights
+        # Pop in level order: all of a node's parents sit on earlier levels, so its delta is complete.
+        pending = {v: float(delta)}
+        heap = [(int(levels[v]), v)]
+        updated = 0
+        while heap:
+            _, u = heapq.heappop(heap)
+            change = pending.pop(u)
+            totals[u] += change
+            updated += 1
+            for e in by_source[ptr[u] : ptr[u + 1]].tolist():
+                w = int(targets[e])
+                if w in pending:
+                    pending[w] += change * weights[e]
+                else:
+                    pending[w] = change * weights[e]
+                    heapq.heappush(heap, (int(levels[w]), w))
+        return updated
+
+
+class FootprintBuilder:
+    """Collect flow, ``hasComponent``, ``typifiedBy``, ``hasData`` and boundary edges plus AQVs in any order."""
+
+    def __init__(self) -> None:
+        self._ids = TokenIds()
+        self._sources = array("q")  # flow edges
+        self._targets = array("q")
+        self._assemblies = array("q")  # raw hasComponent pairs, resolved by bom_edges
+        self._components = array("q")
+        self._parts: dict[int, int] = {}  # typifiedBy entry -> part (the first one wins)
+        self._reports: list[tuple[int, int]] = []  # (process, data) of hasData and generates
+        self._members: dict[str, list[int]] = {}  # boundary token -> member ids
+        self._quantities = QuantityExtractor()
+        self._predicates = {term_token(p): ("flow", forward) for p, forward in FLOW.items()}
+        self._predicates.update({term_token(p): ("component", True) for p in COMPONENT})
+        self._predicates.update({term_token(p): ("typified", entry) for p, entry in TYPIFIED.items()})
+        self._predicates.update({term_token(p): ("data", forward) for p, forward in HAS_DATA.items()})
+        self._predicates.update({term_token(p): ("boundary", True) for p in BOUNDS})
+        self._predicates.update({term_token(p): ("boundary", False) for p in HAS_BOUNDARY})
+
+    def _put(self, subject: str, predicate: str, obj: str) -> None:
+        kind, forward = self._predicates[predicate]
+        if kind == "boundary":
+            boundary, member = (subject, obj) if forward else (obj, subject)
+            self._members.setdefault(boundary, []).append(self._ids[member])
+        elif kind == "data":
+            process, data = (subject, obj) if forward else (obj, subject)
+            self._reports.append((self._ids[process], self._ids[data]))
+        elif kind == "component":
+            self._assemblies.append(self._ids[subject])
+            self._components.append(self._ids[obj])
+        elif kind == "typified":
+            entry, part = (subject, obj) if forward else (obj, subject)
+            self._parts.setdefault(self._ids[entry], self._ids[part])
+        else:
+            # Flow runs subject -> object when forward.
+            s, o = self._ids[subject], self._ids[obj]
+            self._sources.append(s if forward else o)
+            self._targets.append(o if forward else s)
+
+    def _edges(self, triples: Iterable[tuple[Node, Node, Node]]) -> Iterable[tuple[Node, Node, Node]]:
+        """Record the structural triples and pass every triple on (to the AQV extractor)."""
+        predicates = self._predicates
+        for triple in triples:
+            s, p, o = triple
+            if not isinstance(o, Literal):
+                token = term_token(p)
+                if token in predicates:
+                    self._put(term_token(s), token, term_token(o))
+            yield triple
+
+    def add(self, triples: Iterable[tuple[Node, Node, Node]]) -> None:
+        self._quantities.add(self._edges(triples))
+
+    def add_graph(self, graph: Graph) -> None:
+        """Feed the structural and AQV predicates of ``graph`` through its indexes."""
+        index = TripleIndex.from_graph(graph)
+        for predicate in dict.fromkeys((*FLOW, *COMPONENT, *TYPIFIED, *HAS_DATA, *BOUNDS, *HAS_BOUNDARY)):
+            for _ in self._edges(index.triples(predicate)):
+                pass
+        self._quantities.add_graph(graph)
+
+    def add_ntriples(self, lines: Iterable[str]) -> None:
+        """Like :meth:`add` for N-Triples lines, without building rdflib nodes; one pass over ``lines``."""
+        predicates = self._predicates
+        put = self._put
+
+        def edges() -> Iterable[str]:
+            for number, line in enumerate(lines, 1):
+                parts = split_line(line, number)
+                if parts is not None:
+                    subject, predicate, rest = parts
+                    if predicate in predicates and rest[0] != '"':
+                        put(subject, predicate, rest[:-1].rstrip())
+                yield line
+
+        self._quantities.add_ntriples(edges())
+
+    def _values(
+        self, table: QuantityTable, name: str, units: dict[str, str | URIRef] | None, unit_table: UnitTable | None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """``(node ids, values)`` of the AQVs called ``name``, converted when ``units`` names a target."""
+        if name not in table.names:
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+        owners, values = table.column(name)
+        if units and name in units:
+            values = convert_quantities(table, {name: units[name]}, unit_table)[name]
+        values = np.asarray(values, dtype=np.float64)
+        if np.isnan(values).any():
+            raise ValueError(f"some AQVs named {name!r} have no number or no unit convertible to the target")
+        codes = np.array([self._ids[term_token(owner)] for owner in table.owners], dtype=np.int64)
+        return codes[owners], values
+
+    def build(
+        self,
+        names: Sequence[str] = INDICATORS,
+        boundary: Node | None = None,
+        units: dict[str, str | URIRef] | None = None,
+        quantity: str = QUANTITY,
+        unit_table: UnitTable | None = None,
+    ) -> FootprintGraph:
+        """A :class:`FootprintGraph` for the indicators ``names`` within ``boundary`` (everything if ``None``).
+
+        ``units`` maps indicator names to a target unit (IRI or symbol) when
+        the AQVs mix units (looked up in ``unit_table``, by default
+        :meth:`UnitTable.load`); unconverted values are summed as they are.
+        """
+        table = self._quantities.table()
+        columns = [self._values(table, name, units, unit_table) for name in names]
+        positions, amounts = self._values(table, quantity, None, None)
+        size = len(self._ids)
+        own = np.zeros((len(names), size))
+        for row, (nodes, values) in zip(own, columns):
+            np.add.at(row, nodes, values)
+        position = np.full(size, np.nan)
+        position[positions] = amounts
+
+        # Flow edges run as recorded; a component flows into its assembly times its position quantity.
+        flow_sources = np.frombuffer(self._sources, dtype=np.int64)
+        flow_targets = np.frombuffer(self._targets, dtype=np.int64)
+        assemblies, components, quantities, _ = bom_edges(
+            size, self._assemblies, self._components, position, self._parts
+        )
+        sources = np.concatenate([flow_sources, components])
+        targets = np.concatenate([flow_targets, assemblies])
+        weights = np.concatenate([np.ones(len(flow_sources)), np.where(np.isnan(quantities), 1.0, quantities)])
+        flow = np.arange(len(sources)) < len(flow_sources)
+        keep = sources != targets
+        # Reports and generated data count for the process that has them and leave the flow graph.
+        if self._reports:
+            processes, reports = np.unique(np.array(self._reports, dtype=np.int64), axis=0).T
+            np.add.at(own, (slice(None), processes), own[:, reports])
+            own[:, reports] = 0.0
+            folded = np.zeros(size, dtype=bool)
+            folded[reports] = True
+            keep &= ~folded[sources] & ~folded[targets]
+        if boundary is not None:
+            inside = np.zeros(size, dtype=bool)
+            inside[self._members.get(term_token(boundary), [])] = True
+            if not inside.any():
+                raise KeyError(f"{boundary} bounds no nodes")
+            if self._reports:
+                inside[reports] |= inside[processes]
+            own[:, ~inside] = 0.0
+            keep &= inside[sources] & inside[targets]
+        sources, targets, weights, flow = sources[keep], targets[keep], weights[keep], flow[keep]
+
+        # Drop duplicate flow edges (a triple and its inverse, min: and sdata: twins); the component
+        # edges are distinct after bom_edges except for several entries of one part, which add up.
+        keys = sources * size + targets
+        flow_keys = np.unique(keys[flow])
+        component_keys, slots = np.unique(keys[~flow], return_inverse=True)
+        component_weights = np.bincount(slots, weights=weights[~flow], minlength=len(component_keys))
+        # A component edge next to a flow edge between the same nodes is counted along the flow.
+        alone = ~np.isin(component_keys, flow_keys)
+        component_keys, component_weights = component_keys[alone], component_weights[alone]
+        if len(component_keys) and len(flow_keys):
+            # A part that is also an input of the process making its assembly reaches it along the flow already.
+            reach = ReachabilityIndex(LineageGraph(tuple(self._ids), flow_keys // size, flow_keys % size))
+            parallel = [reach.reaches(int(s), int(t)) for s, t in zip(component_keys // size, component_keys % size)]
+            alone = ~np.array(parallel, dtype=bool)
+            component_keys, component_weights = component_keys[alone], component_weights[alone]
+        flow_sources = flow_keys // size
+        shares = np.bincount(flow_sources, minlength=size)
+        keys = np.concatenate([flow_keys, component_keys])
+        weights = np.concatenate([1.0 / shares[flow_sources], component_weights])
+        sources, targets = keys // size, keys % size
+        return FootprintGraph(tuple(self._ids), sources, targets, weights, own, names)
+
+
+def load_footprint(
+    paths: Iterable[Path],
+    names: Sequence[str] = INDICATORS,
+    boundary: Node | None = None,
+    units: dict[str, str | URIRef] | None = None,
+) -> FootprintGraph:
+    """Build from RDF files; N-Triples files are streamed line by line."""
+    return load_paths(FootprintBuilder(), paths).build(names, boundary=boundary, units=units)
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Roll energy/CO2 AQVs up process chains and BOMs.")
+    parser.add_argument("node", help="IRI of the product, material or process to report")
+    parser.add_argument("data", type=Path, nargs="+", help="Data graph(s); .nt files are streamed")
+    parser.add_argument("--indicator", action="append", dest="names", help="AQV name to sum (repeatable)")
+    parser.add_argument("--boundary", help="IRI of the sdata:Boundary whose sdata:bounds are in scope")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv if argv is not None else sys.argv[1:])
+    names = tuple(args.names or INDICATORS)
+    start = time.perf_counter()
+    try:
+        footprint = load_footprint(args.data, names, URIRef(args.boundary) if args.boundary else None)
+        totals = {name: footprint.total(URIRef(args.node), name) for name in names}
+    except (KeyError, ValueError) as exc:
+        print(exc.args[0], file=sys.stderr)
+        return 2
+    seconds = time.perf_counter() - start
+    for name, total in totals.items():
+        print(f"{name:>10} {total:>14g}")
+    print(f"{len(footprint)} node(s) rolled up in {seconds:.3f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -11,6 +11,8 @@ from pathlib import Path
 from rdflib import Graph, Literal, URIRef
 from rdflib.namespace import OWL, RDF, RDFS
 
+from src import loader
+
 MIN_PREFIX = "https://w3id.org/min"
 SDATA_PREFIX = "https://w3id.org/sdata/core/"
 MIN_ONTOLOGY_IRI = "https://w3id.org/min"
@@ -95,11 +97,9 @@ def load_graphs(min_path: Path, core_path: Path) -> tuple[Graph, Graph, Graph]:
         if not path.exists():
             raise FileNotFoundError(f"{label} not found: {path}")
 
-    min_graph = Graph()
-    min_graph.parse(min_path, format="turtle")
+    min_graph = loader.load_graph(min_path)
 
-    core_graph = Graph()
-    core_graph.parse(core_path, format="turtle")
+    core_graph = loader.load_graph(core_path)
 
     merged = Graph()
     merged += min_graph
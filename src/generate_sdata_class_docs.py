@@ -12,6 +12,8 @@ import zipfile
 from rdflib import Graph, Literal, RDF, RDFS, URIRef
 from rdflib.namespace import OWL
 
+from src import loader
+
 SDATA_BASE = "https://w3id.org/sdata/core/"
 MIN_BASE = "https://w3id.org/min#"
 
@@ -657,8 +659,7 @@ def main() -> int:
     if not args.core.exists():
         raise FileNotFoundError(f"Core ontology not found: {args.core}")
 
-    graph = Graph()
-    graph.parse(args.core, format="turtle")
+    graph = loader.load_graph(args.core)
     infos, version = build_class_infos(graph)
     overrides = _load_class_doc_overrides(args.out_dir / "sdata-class-docs.zip")
 
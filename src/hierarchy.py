@@ -0,0 +1,193 @@
+"""Precomputed transitive ``rdfs:subClassOf`` closure for MIN + sdata classes.
+
+:class:`ClassHierarchy` assigns every named class a dense integer id and stores
+the reflexive-transitive ancestor and descendant sets as Python ``int``
+bitsets. ``is_subclass`` is a single bit test; ``ancestors``/``descendants``
+decode a bitset in O(k) and memoise the result. The index is picklable and
+:meth:`ClassHierarchy.load` persists it next to the cached graphs via
+:func:`src.loader.cached_artifact`, so startup only pays for unpickling.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from pathlib import Path
+
+from rdflib import Graph, URIRef
+from rdflib.namespace import OWL, RDF, RDFS
+
+from src import loader
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_SOURCES = (ROOT / "min-v1.0.0.ttl", ROOT / "sdata-core.ttl")
+
+
+def _bits(mask: int) -> Iterable[int]:
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class ClassHierarchy:
+    """Transitive subclass index over the named classes of an ontology graph.
+
+    All queries are reflexive: a class is its own subclass, ancestor and
+    descendant unless ``include_self=False`` is passed. Unknown classes are
+    treated as isolated (they only relate to themselves).
+    """
+
+    def __init__(self, classes: Iterable[URIRef], edges: Iterable[tuple[URIRef, URIRef]]):
+        """Build the index from ``(child, parent)`` edges between ``classes``."""
+        self._classes: tuple[URIRef, ...] = tuple(sorted(set(classes), key=str))
+        self._ids: dict[URIRef, int] = {cls: idx for idx, cls in enumerate(self._classes)}
+
+        parents: list[set[int]] = [set() for _ in self._classes]
+        for child, parent in edges:
+            c = self._ids.get(child)
+            p = self._ids.get(parent)
+            if c is not None and p is not None and c != p:
+                parents[c].add(p)
+        self._parents: tuple[tuple[int, ...], ...] = tuple(tuple(sorted(p)) for p in parents)
+        children: list[list[int]] = [[] for _ in self._classes]
+        for child, child_parents in enumerate(self._parents):
+            for parent in child_parents:
+                children[parent].append(child)
+        self._children: tuple[tuple[int, ...], ...] = tuple(tuple(c) for c in children)
+
+        self._ancestors: list[int] = [0] * len(self._classes)
+        for idx in range(len(self._classes)):
+            mask = 1 << idx
+            stack = list(self._parents[idx])
+            while stack:
+                node = stack.pop()
+                bit = 1 << node
+                if mask & bit:
+                    continue
+                mask |= bit
+                stack.extend(self._parents[node])
+            self._ancestors[idx] = mask
+
+        self._descendants: list[int] = [0] * len(self._classes)
+        for idx, mask in enumerate(self._ancestors):
+            bit = 1 << idx
+            for ancestor in _bits(mask):
+                self._descendants[ancestor] |= bit
+
+        self._decoded: dict[tuple[str, int], frozenset[URIRef]] = {}
+
+    # ── construction ────────────────────────────────────────────────────────
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> ClassHierarchy:
+        """Index all named classes of ``graph``.
+
+        Classes are the ``owl:Class``/``rdfs:Class`` subjects plus every IRI
+        on either side of ``rdfs:subClassOf``. ``owl:equivalentClass`` between
+        named classes is indexed as mutual subclassing.
+        """
+        classes: set[URIRef] = set()
+        for class_type in (OWL.Class, RDFS.Class):
+            classes.update(c for c in graph.subjects(RDF.type, class_type) if isinstance(c, URIRef))
+
+        edges: list[tuple[URIRef, URIRef]] = []
+        for child, parent in graph.subject_objects(RDFS.subClassOf):
+            if isinstance(child, URIRef) and isinstance(parent, URIRef):
+                classes.update((child, parent))
+                edges.append((child, parent))
+        for left, right in graph.subject_objects(OWL.equivalentClass):
+            if isinstance(left, URIRef) and isinstance(right, URIRef):
+                classes.update((left, right))
+                edges.extend(((left, right), (right, left)))
+        return cls(classes, edges)
+
+    @classmethod
+    def load(
+        cls,
+        paths: Iterable[Path] = DEFAULT_SOURCES,
+        *,
+        cache_dir: Path | None = None,
+        use_cache: bool | None = None,
+    ) -> ClassHierarchy:
+        """Build (or reload from cache) the hierarchy of the merged ``paths``."""
+        paths = tuple(Path(p) for p in paths)
+
+        def build() -> ClassHierarchy:
+            graph = loader.load_merged(*paths, cache_dir=cache_dir, use_cache=use_cache)
+            return cls.from_graph(graph)
+
+        return loader.cached_artifact(
+            "class-hierarchy", paths, build, cache_dir=cache_dir, use_cache=use_cache
+        )
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_decoded"] = {}
+        return state
+
+    # ── queries ─────────────────────────────────────────────────────────────
+
+    @property
+    def classes(self) -> tuple[URIRef, ...]:
+        return self._classes
+
+    def __len__(self) -> int:
+        return len(self._classes)
+
+    def __contains__(self, cls: object) -> bool:
+        return cls in self._ids
+
+    def index_of(self, cls: URIRef) -> int | None:
+        return self._ids.get(cls)
+
+    def is_subclass(self, sub: URIRef, sup: URIRef) -> bool:
+        """Return ``True`` if ``sub`` is (reflexively) a subclass of ``sup``."""
+        if sub == sup:
+            return True
+        s = self._ids.get(sub)
+        p = self._ids.get(sup)
+        if s is None or p is None:
+            return False
+        return bool((self._ancestors[s] >> p) & 1)
+
+    def ancestor_mask(self, cls: URIRef) -> int:
+        idx = self._ids.get(cls)
+        return self._ancestors[idx] if idx is not None else 0
+
+    def descendant_mask(self, cls: URIRef) -> int:
+        idx = self._ids.get(cls)
+        return self._descendants[idx] if idx is not None else 0
+
+    def classes_in(self, mask: int) -> frozenset[URIRef]:
+        return frozenset(self._classes[idx] for idx in _bits(mask))
+
+    def _decode(self, kind: str, cls: URIRef, masks: list[int]) -> frozenset[URIRef]:
+        idx = self._ids.get(cls)
+        if idx is None:
+            return frozenset((cls,))
+        key = (kind, idx)
+        found = self._decoded.get(key)
+        if found is None:
+            found = self.classes_in(masks[idx])
+            self._decoded[key] = found
+        return found
+
+    def ancestors(self, cls: URIRef, *, include_self: bool = True) -> frozenset[URIRef]:
+        found = self._decode("anc", cls, self._ancestors)
+        return found if include_self else found - {cls}
+
+    def descendants(self, cls: URIRef, *, include_self: bool = True) -> frozenset[URIRef]:
+        found = self._decode("desc", cls, self._descendants)
+        return found if include_self else found - {cls}
+
+    def parents(self, cls: URIRef) -> tuple[URIRef, ...]:
+        idx = self._ids.get(cls)
+        if idx is None:
+            return ()
+        return tuple(self._classes[p] for p in self._parents[idx])
+
+    def children(self, cls: URIRef) -> tuple[URIRef, ...]:
+        idx = self._ids.get(cls)
+        if idx is None:
+            return ()
+        return tuple(self._classes[c] for c in self._children[idx])
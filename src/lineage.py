@@ -0,0 +1,338 @@
+"""Upstream/downstream provenance traversal over CSR adjacency arrays.
+
+The process relations of ``min:``/``sdata:`` (``hasInput``, ``hasOutput``,
+``generates``, ``resultOf``, ``producedBy``, ``derivedFrom`` and their
+inverses) are normalised to one flow direction, *from* what goes in *to* what
+comes out, so the tensile example reads
+``:coil → :probenfertigung → :probe → :zugversuch → :ergebnis``.
+:class:`LineageGraph` numbers the nodes once and stores the edges twice as
+compressed sparse rows (``ptr``/``idx`` NumPy arrays, one copy per direction).
+A traversal is then a breadth-first walk over integer arrays with a visited
+bitmap (so cycles terminate) instead of one rdflib lookup per hop::
+
+    lineage = LineageGraph.from_graph(graph)
+    up = lineage.upstream(EX_ZUG.ergebnis)             # ergebnis ← zugversuch ← probe ← ...
+    up.iris()                                          # every node of the provenance DAG
+    lineage.downstream(EX_ZUG.coil, max_depth=2).iris()  # coil, probenfertigung, probe
+
+Small frontiers (deep chains) are expanded one node at a time, large ones
+(wide batch fan-out) with vectorised gathers. Node identity is the N-Triples
+token, so :func:`load_lineage` can stream ``.nt`` dumps with millions of
+edges without building rdflib nodes; terms are parsed only for results.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from array import array
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from rdflib import Graph, Literal, Namespace, URIRef
+from rdflib.term import Node
+
+from src.ntriples import TokenIds, TokenNodes, load_paths, term_token, token_triples
+from src.shape_compiler import TripleIndex
+
+MIN = Namespace("https://w3id.org/min#")
+SDATA = Namespace("https://w3id.org/sdata/core/")
+
+# predicate -> True if the subject is upstream of the object (flow runs s -> o),
+# False if the object is upstream (flow runs o -> s).
+FLOW: dict[URIRef, bool] = {}
+for _ns in (MIN, SDATA):
+    FLOW.update(
+        {
+            _ns.hasOutput: True,
+            _ns.generates: True,
+            _ns.undergoes: True,
+            _ns.hasInput: False,
+            _ns.resultOf: False,
+            _ns.generatedBy: False,
+            _ns.producedBy: False,
+            _ns.derivedFrom: False,
+        }
+    )
+del _ns
+
+# Frontiers up to this size are expanded in Python; larger ones with NumPy gathers.
+SCALAR_FRONTIER = 64
+
+
+def _distinct(values: np.ndarray) -> np.ndarray:
+    """Sorted distinct ``values``; a sort plus neighbour compare beats ``np.unique`` on large int arrays."""
+    values = np.sort(values)
+    return values[np.concatenate(([True], values[1:] != values[:-1]))] if len(values) else values
+
+
+def _csr(size: int, keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """CSR ``(ptr, idx)`` of the deduplicated edges ``row * size + column`` in ``keys``."""
+    keys = _distinct(keys)
+    rows, columns = np.divmod(keys, size)
+    ptr = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=size), out=ptr[1:])
+    return ptr, columns.astype(np.int32 if size < 2**31 else np.int64)
+
+
+def gather_edges(ptr: np.ndarray, idx: np.ndarray, frontier: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """``(source, neighbour)`` pairs for every edge leaving ``frontier``."""
+    starts, counts = ptr[frontier], ptr[frontier + 1] - ptr[frontier]
+    total = int(counts.sum())
+    offsets = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)
+    return np.repeat(frontier, counts), idx[offsets]
+
+
+def topological_levels(size: int, sources: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """Longest-path level of every node of the DAG ``sources → targets`` (Kahn's algorithm).
+
+    Nodes never released lie on or below a cycle and get level -1.
+    """
+    by_source = np.argsort(sources, kind="stable")
+    ptr = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=size), out=ptr[1:])
+    indegree = np.bincount(targets, minlength=size)
+    levels = np.full(size, -1, dtype=np.int64)
+    ptr_view, edge_view, target_view = memoryview(ptr), memoryview(by_source), memoryview(targets)
+    indegree_view, levels_view = memoryview(indegree), memoryview(levels)
+    frontier: list[int] | np.ndarray = np.flatnonzero(indegree == 0)
+    level = 0
+    while len(frontier):
+        if len(frontier) <= SCALAR_FRONTIER:
+            following = []
+            for v in frontier if isinstance(frontier, list) else frontier.tolist():
+                levels_view[v] = level
+                for e in edge_view[ptr_view[v] : ptr_view[v + 1]]:
+                    w = target_view[e]
+                    indegree_view[w] -= 1
+                    if indegree_view[w] == 0:
+                        following.append(w)
+            frontier = following
+        else:
+            frontier = np.asarray(frontier, dtype=np.int64)
+            levels[frontier] = level
+            _, edge = gather_edges(ptr, by_source, frontier)
+            reached = np.sort(targets[edge])
+            if not len(reached):
+                break
+            starts = np.flatnonzero(np.concatenate(([True], reached[1:] != reached[:-1])))
+            heads = reached[starts]
+            indegree[heads] -= np.diff(np.append(starts, len(reached)))
+            frontier = heads[indegree[heads] == 0]
+        level += 1
+    return levels
+
+
+@dataclass(frozen=True)
+class Lineage:
+    """The nodes reached from ``root`` with their hop distance and the edges between them.
+
+    ``sources``/``targets`` always point in flow direction (upstream → downstream).
+    """
+
+    graph: LineageGraph
+    root: int
+    direction: str  # "upstream" | "downstream"
+    nodes: np.ndarray
+    depth: np.ndarray
+    sources: np.ndarray
+    targets: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, node: object) -> bool:
+        idx = self.graph.index_of(node)  # type: ignore[arg-type]
+        return idx is not None and bool(np.any(self.nodes == idx))
+
+    def iris(self) -> list[Node]:
+        """Reached nodes in breadth-first order, ``root`` first."""
+        return [self.graph.node(i) for i in self.nodes.tolist()]
+
+    def at_depth(self, depth: int) -> list[Node]:
+        return [self.graph.node(i) for i in self.nodes[self.depth == depth].tolist()]
+
+    def edges(self) -> list[tuple[Node, Node]]:
+        node = self.graph.node
+        return [(node(s), node(t)) for s, t in zip(self.sources.tolist(), self.targets.tolist())]
+
+
+class LineageGraph(TokenNodes):
+    """Flow edges between numbered nodes, as CSR arrays in both directions."""
+
+    def __init__(self, tokens: Sequence[str], sources, targets):
+        """Build from N-Triples node ``tokens`` and parallel edge endpoint ids."""
+        self.tokens = tokens
+        size = len(tokens)
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        keep = sources != targets
+        sources, targets = sources[keep], targets[keep]
+        # Sorting row-major keys groups edges by row and makes duplicates adjacent.
+        self.down_ptr, self.down_idx = _csr(size, sources * size + targets)
+        self.up_ptr, self.up_idx = _csr(size, targets * size + sources)
+        self.edge_count = len(self.down_idx)
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> LineageGraph:
+        builder = LineageBuilder()
+        builder.add_graph(graph)
+        return builder.build()
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def upstream(self, node: Node | str | int, max_depth: int | None = None) -> Lineage:
+        """Everything ``node`` was made or derived from, up to ``max_depth`` hops."""
+        return self._walk(node, max_depth, upstream=True)
+
+    def downstream(self, node: Node | str | int, max_depth: int | None = None) -> Lineage:
+        """Everything made or derived from ``node``, up to ``max_depth`` hops."""
+        return self._walk(node, max_depth, upstream=False)
+
+    def _walk(self, node: Node | str | int, max_depth: int | None, upstream: bool) -> Lineage:
+        root = self.index_of(node)
+        if root is None:
+            raise KeyError(f"{node} has no lineage edges")
+        ptr, idx = (self.up_ptr, self.up_idx) if upstream else (self.down_ptr, self.down_idx)
+        ptr_view, idx_view = memoryview(ptr), memoryview(idx)
+        seen = bytearray(len(self.tokens))
+        seen_array = np.frombuffer(seen, dtype=np.uint8)
+        seen[root] = 1
+        order, depths = array("q", [root]), array("q", [0])
+        heads, tails = array("q"), array("q")
+        frontier: list[int] | np.ndarray = [root]
+        depth = 0
+        while len(frontier) and (max_depth is None or depth < max_depth):
+            v = int(frontier[0])
+            if len(frontier) == 1 and ptr_view[v + 1] - ptr_view[v] == 1:
+                # Unbranched stretch of a chain: follow single successors without frontier bookkeeping.
+                while ptr_view[v + 1] - ptr_view[v] == 1 and (max_depth is None or depth < max_depth):
+                    w = idx_view[ptr_view[v]]
+                    heads.append(v)
+                    tails.append(w)
+                    depth += 1
+                    if seen[w]:
+                        v = -1
+                        break
+                    seen[w] = 1
+                    order.append(w)
+                    depths.append(depth)
+                    v = w
+                frontier = [v] if v >= 0 else []
+                continue
+            depth += 1
+            if len(frontier) <= SCALAR_FRONTIER:
+                following = []
+                for v in frontier if isinstance(frontier, list) else frontier.tolist():
+                    for w in idx_view[ptr_view[v] : ptr_view[v + 1]]:
+                        heads.append(v)
+                        tails.append(w)
+                        if not seen[w]:
+                            seen[w] = 1
+                            following.append(w)
+                order.extend(following)
+                depths.extend([depth] * len(following))
+                frontier = following
+            else:
+                frontier = np.asarray(frontier, dtype=np.int64)
+                source, reached = gather_edges(ptr, idx, frontier)
+                heads.frombytes(source.astype(np.int64).tobytes())
+                tails.frombytes(reached.astype(np.int64).tobytes())
+                fresh = _distinct(reached[seen_array[reached] == 0])
+                seen_array[fresh] = 1
+                order.frombytes(fresh.astype(np.int64).tobytes())
+                depths.extend([depth] * len(fresh))
+                frontier = fresh
+        heads_array, tails_array = np.frombuffer(heads, dtype=np.int64), np.frombuffer(tails, dtype=np.int64)
+        if upstream:
+            heads_array, tails_array = tails_array, heads_array
+        return Lineage(
+            graph=self,
+            root=root,
+            direction="upstream" if upstream else "downstream",
+            nodes=np.frombuffer(order, dtype=np.int64),
+            depth=np.frombuffer(depths, dtype=np.int64),
+            sources=heads_array,
+            targets=tails_array,
+        )
+
+
+class LineageBuilder:
+    """Collect flow edges from triples, graphs or N-Triples lines in any order."""
+
+    def __init__(self) -> None:
+        self._ids = TokenIds()
+        self._sources = array("q")
+        self._targets = array("q")
+
+    def _put(self, subject: str, forward: bool, obj: str) -> None:
+        s, o = self._ids[subject], self._ids[obj]
+        self._sources.append(s if forward else o)
+        self._targets.append(o if forward else s)
+
+    def add(self, triples: Iterable[tuple[Node, Node, Node]]) -> None:
+        for s, p, o in triples:
+            forward = FLOW.get(p)  # type: ignore[call-overload]
+            if forward is not None and not isinstance(o, Literal):
+                self._put(term_token(s), forward, term_token(o))
+
+    def add_graph(self, graph: Graph) -> None:
+        """Feed only the flow predicates of ``graph`` through its indexes."""
+        index = TripleIndex.from_graph(graph)
+        for predicate in FLOW:
+            self.add(index.triples(predicate))
+
+    def add_ntriples(self, lines: Iterable[str]) -> None:
+        """Like :meth:`add` for N-Triples lines, without building rdflib nodes."""
+        flow = {term_token(p): forward for p, forward in FLOW.items()}
+        put = self._put
+        for subject, predicate, obj in token_triples(lines):
+            forward = flow.get(predicate)
+            if forward is not None and obj[0] != '"':
+                put(subject, forward, obj)
+
+    def build(self) -> LineageGraph:
+        return LineageGraph(
+            tuple(self._ids),
+            np.frombuffer(self._sources, dtype=np.int64),
+            np.frombuffer(self._targets, dtype=np.int64),
+        )
+
+
+def load_lineage(paths: Iterable[Path]) -> LineageGraph:
+    """Build from RDF files; N-Triples files are streamed line by line."""
+    return load_paths(LineageBuilder(), paths).build()
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Print the upstream or downstream lineage of a node.")
+    parser.add_argument("node", help="IRI of a material, product, process or data node")
+    parser.add_argument("data", type=Path, nargs="+", help="Data graph(s); .nt files are streamed")
+    parser.add_argument("--downstream", action="store_true", help="Follow the flow forward instead of back")
+    parser.add_argument("--max-depth", type=int, default=None)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv if argv is not None else sys.argv[1:])
+    lineage = load_lineage(args.data)
+    start = time.perf_counter()
+    try:
+        walk = lineage.downstream if args.downstream else lineage.upstream
+        result = walk(URIRef(args.node), args.max_depth)
+    except KeyError as exc:
+        print(exc.args[0], file=sys.stderr)
+        return 2
+    seconds = time.perf_counter() - start
+    for node, depth in zip(result.iris(), result.depth.tolist()):
+        print(f"{depth:>4} {node}")
+    print(f"{len(result)} node(s), {len(result.sources)} edge(s) in {seconds * 1000:.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,311 @@
+"""Shared ontology loader with an on-disk cache of parsed graphs.
+
+Parsing Turtle is the dominant cost of every script in this repository. The
+loader parses a file once, stores the result in a compact binary form (a term
+table plus a packed ``uint32`` triple array) and reloads it from the cache on
+subsequent runs. Cache entries are keyed by the SHA-256 of the file content,
+the parser format, the rdflib version and the cache format version, so edits
+to a ``.ttl`` file or an rdflib upgrade invalidate them automatically.
+
+Environment variables:
+
+- ``SDATA_CACHE_DIR``: cache directory (default: ``$XDG_CACHE_HOME/sdata-ontology``
+  or ``~/.cache/sdata-ontology``)
+- ``SDATA_NO_CACHE``: set to ``1`` to bypass the cache entirely
+"""
+
+from __future__ import annotations
+
+import array
+import datetime
+import decimal
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+import rdflib
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.namespace import XSD
+
+CACHE_FORMAT_VERSION = 1
+CACHE_DIR_ENV = "SDATA_CACHE_DIR"
+NO_CACHE_ENV = "SDATA_NO_CACHE"
+
+_MAGIC = b"SDGC"
+_TERM_URI = 0
+_TERM_BNODE = 1
+_TERM_LITERAL = 2
+
+# Python values that survive pickling unchanged; literals carrying any other
+# value type (e.g. parsed rdf:HTML fragments) are rebuilt via ``Literal()``.
+_PLAIN_VALUE_TYPES = (
+    type(None),
+    str,
+    bool,
+    int,
+    float,
+    decimal.Decimal,
+    datetime.date,
+    datetime.datetime,
+    datetime.time,
+)
+_LITERAL_SLOTS = ("_language", "_datatype", "_value", "_ill_typed")
+_RAW_LITERALS = all(
+    hasattr(Literal("1", datatype=XSD.integer), slot) for slot in _LITERAL_SLOTS
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def default_cache_dir() -> Path:
+    explicit = os.environ.get(CACHE_DIR_ENV)
+    if explicit:
+        return Path(explicit)
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg) if xdg else Path.home() / ".cache"
+    return base / "sdata-ontology"
+
+
+def cache_enabled() -> bool:
+    return os.environ.get(NO_CACHE_ENV, "").strip().lower() not in {"1", "true", "yes"}
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def module_digest(module: str) -> str:
+    """SHA-256 of the source file of ``module`` (empty if it has none, e.g. ``__main__`` in a REPL)."""
+    source = getattr(sys.modules.get(module), "__file__", None)
+    return file_digest(Path(source)) if source else ""
+
+
+def cache_key(paths: tuple[Path, ...] | list[Path], *parts: str) -> str:
+    """Return a cache key for content derived from ``paths``.
+
+    The key covers the content of every input file, the rdflib version, the
+    cache format version and any extra ``parts`` (e.g. a parser format or the
+    name of a derived artifact).
+    """
+    digest = hashlib.sha256()
+    digest.update(f"v{CACHE_FORMAT_VERSION}|rdflib-{rdflib.__version__}".encode())
+    for part in parts:
+        digest.update(b"|" + part.encode())
+    for path in paths:
+        digest.update(b"|" + file_digest(Path(path)).encode())
+    return digest.hexdigest()
+
+
+def encode_graph(graph: Graph) -> bytes:
+    """Serialize ``graph`` into the compact binary cache format."""
+    term_ids: dict[Any, int] = {}
+    terms: list[tuple] = []
+    triples = array.array("I")
+
+    def term_id(term) -> int:
+        idx = term_ids.get(term)
+        if idx is None:
+            idx = len(terms)
+            term_ids[term] = idx
+            if isinstance(term, Literal):
+                datatype = str(term.datatype) if term.datatype is not None else None
+                value = term.value
+                if type(value) in _PLAIN_VALUE_TYPES:
+                    terms.append((_TERM_LITERAL, str(term), term.language, datatype, value, term.ill_typed))
+                else:
+                    terms.append((_TERM_LITERAL, str(term), term.language, datatype))
+            elif isinstance(term, BNode):
+                terms.append((_TERM_BNODE, str(term)))
+            else:
+                terms.append((_TERM_URI, str(term)))
+        return idx
+
+    for s, p, o in graph:
+        triples.append(term_id(s))
+        triples.append(term_id(p))
+        triples.append(term_id(o))
+
+    payload = {
+        "terms": terms,
+        "triples": triples.tobytes(),
+        "itemsize": triples.itemsize,
+        "namespaces": [(prefix, str(ns)) for prefix, ns in graph.namespaces()],
+    }
+    return _MAGIC + pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _decode_literal(entry: tuple) -> Literal:
+    if len(entry) == 4 or not _RAW_LITERALS:
+        return Literal(entry[1], lang=entry[2], datatype=entry[3])
+    # Skip lexical-to-value conversion: the stored value came from a Literal
+    # that rdflib itself constructed for the same rdflib version.
+    literal = str.__new__(Literal, entry[1])
+    literal._language = entry[2]
+    literal._datatype = URIRef(entry[3]) if entry[3] is not None else None
+    literal._value = entry[4]
+    literal._ill_typed = entry[5]
+    return literal
+
+
+def decode_graph(data: bytes) -> Graph:
+    """Rebuild a graph from bytes produced by :func:`encode_graph`."""
+    if not data.startswith(_MAGIC):
+        raise ValueError("Not an sdata graph cache entry")
+    payload = pickle.loads(data[len(_MAGIC):])
+
+    triples = array.array("I")
+    if triples.itemsize != payload["itemsize"]:
+        raise ValueError("Graph cache entry was written on an incompatible platform")
+    triples.frombytes(payload["triples"])
+
+    terms: list[Any] = []
+    for entry in payload["terms"]:
+        kind = entry[0]
+        if kind == _TERM_URI:
+            terms.append(URIRef(entry[1]))
+        elif kind == _TERM_BNODE:
+            terms.append(BNode(entry[1]))
+        else:
+            terms.append(_decode_literal(entry))
+
+    graph = Graph()
+    for prefix, ns in payload["namespaces"]:
+        graph.bind(prefix, ns, override=True, replace=True)
+    graph.addN(
+        (terms[triples[i]], terms[triples[i + 1]], terms[triples[i + 2]], graph)
+        for i in range(0, len(triples), 3)
+    )
+    return graph
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _parse(path: Path, format: str) -> Graph:
+    graph = Graph()
+    graph.parse(path, format=format)
+    return graph
+
+
+def load_graph(
+    path: Path,
+    *,
+    format: str = "turtle",
+    cache_dir: Path | None = None,
+    use_cache: bool | None = None,
+) -> Graph:
+    """Parse ``path`` into a graph, reusing a cached parse when available."""
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"RDF file not found: {path}")
+
+    if use_cache is None:
+        use_cache = cache_enabled()
+    if not use_cache:
+        return _parse(path, format)
+
+    entry = (cache_dir or default_cache_dir()) / "graphs" / f"{cache_key([path], format)}.bin"
+    if entry.exists():
+        try:
+            return decode_graph(entry.read_bytes())
+        except Exception as exc:  # corrupt or foreign entry: fall back to parsing
+            logger.warning("Ignoring unreadable graph cache entry %s: %s", entry, exc)
+
+    graph = _parse(path, format)
+    try:
+        _write_atomic(entry, encode_graph(graph))
+    except OSError as exc:
+        logger.warning("Could not write graph cache entry %s: %s", entry, exc)
+    return graph
+
+
+def load_graphs(*paths: Path, **kwargs: Any) -> tuple[Graph, ...]:
+    return tuple(load_graph(path, **kwargs) for path in paths)
+
+
+def merge_graphs(*graphs: Graph) -> Graph:
+    merged = Graph()
+    for graph in graphs:
+        for prefix, ns in graph.namespaces():
+            merged.bind(prefix, ns, override=False)
+        merged += graph
+    return merged
+
+
+def load_merged(*paths: Path, **kwargs: Any) -> Graph:
+    return merge_graphs(*load_graphs(*paths, **kwargs))
+
+
+def cached_artifact(
+    name: str,
+    paths: tuple[Path, ...] | list[Path],
+    build: Callable[[], T],
+    *,
+    cache_dir: Path | None = None,
+    use_cache: bool | None = None,
+) -> T:
+    """Return ``build()``, memoised on disk next to the cached graphs.
+
+    Derived indexes (class hierarchies, vocabularies, ...) use this to persist
+    their state under the same content-hash key as the source files. The key
+    also covers the source of the module defining ``build`` (where the
+    artifact's class lives), so they are recomputed when one of ``paths`` or
+    that code changes. ``build`` must return a picklable object.
+    """
+    if use_cache is None:
+        use_cache = cache_enabled()
+    if not use_cache:
+        return build()
+
+    paths = [Path(p) for p in paths]
+    key = cache_key(paths, name, module_digest(build.__module__))
+    entry = (cache_dir or default_cache_dir()) / "artifacts" / f"{name}-{key}.pkl"
+    if entry.exists():
+        try:
+            return pickle.loads(entry.read_bytes())
+        except Exception as exc:
+            logger.warning("Ignoring unreadable artifact cache entry %s: %s", entry, exc)
+
+    value = build()
+    try:
+        _write_atomic(entry, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError as exc:
+        logger.warning("Could not write artifact cache entry %s: %s", entry, exc)
+    return value
+
+
+def clear_cache(cache_dir: Path | None = None) -> int:
+    """Delete all cache entries and return the number of removed files."""
+    root = cache_dir or default_cache_dir()
+    removed = 0
+    for sub in ("graphs", "artifacts"):
+        folder = root / sub
+        if not folder.is_dir():
+            continue
+        for entry in folder.iterdir():
+            if entry.is_file():
+                entry.unlink()
+                removed += 1
+    return removed
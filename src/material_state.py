@@ -0,0 +1,365 @@
+"""Bitmask index of ``sms:hasStateAssignment`` values for faceted filtering.
+
+:class:`StateVocabulary` numbers the SKOS concepts of every state axis's
+scheme (``sms:hasConceptScheme``) and stores, per concept, the reflexive
+``skos:broader`` closure as a fixed-width row of ``uint64`` words.
+:class:`StateIndex` ORs those rows into one bitmask per entity, so an entity
+assigned ``sms:method.Corrosion`` also carries the bits of
+``method.Degradation`` and ``method.Transformative``. A facet query is then a
+few vectorised ``&``/``!=`` operations over the entity × word matrix instead
+of a join over assignment blank nodes::
+
+    index = StateIndex.from_graph(graph)
+    hits = index.select(SMS["form.Sheet"], SMS["grade.Automotive"], SMS["compliance.REACH"],
+                        SMS["origin.Virgin"])
+
+Concepts on the same axis are alternatives (OR), different axes must all
+match (AND). Assigned values outside the vocabulary are counted in
+:attr:`StateIndex.unknown` and otherwise ignored.
+
+For facet counts the index also keeps the transposed, concept-major layout
+(:attr:`StateIndex.columns`, one entity bitmap per concept);
+:meth:`StateIndex.facet_counts` ANDs it with the selection and popcounts
+every concept of every axis in one pass::
+
+    facets = index.facet_counts(SMS["grade.Automotive"])
+    facets.axis(SMS.FormAxis)      # {form.Sheet: 812, form.Coil: 97, ...}
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from rdflib import Graph, Namespace, URIRef
+from rdflib.term import Node
+
+from src import loader
+from src.shape_compiler import TripleIndex
+from src.skos import SkosIndex, transitive_closure
+
+SMS = Namespace("https://w3id.org/sdata/material-state/")
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_SOURCES = (ROOT / "sdata-material-state.ttl",)
+WORD = 64
+CHUNK = 1 << 20
+_BYTE_BITS = np.array([bin(byte).count("1") for byte in range(256)], dtype=np.uint8)
+
+
+def _popcount(words: np.ndarray) -> int:
+    """Set bits in the contiguous ``uint64`` array ``words``.
+
+    ``np.bitwise_count`` only exists from NumPy 2.0; older versions count the
+    bits of every byte through a lookup table.
+    """
+    if hasattr(np, "bitwise_count"):
+        return int(np.bitwise_count(words).sum())
+    return int(_BYTE_BITS[words.view(np.uint8)].sum(dtype=np.int64))
+
+
+def _words(mask: int, width: int) -> list[int]:
+    return [(mask >> (WORD * word)) & 0xFFFFFFFFFFFFFFFF for word in range(width)]
+
+
+class StateVocabulary:
+    """The state axes' concepts with their ``skos:broader`` closure as bitmask rows."""
+
+    def __init__(
+        self,
+        axes: dict[URIRef, URIRef],
+        concepts: Iterable[tuple[URIRef, URIRef]],
+        broader: Iterable[tuple[URIRef, URIRef]],
+    ):
+        """Build from ``axis -> scheme``, ``(concept, scheme)`` and ``(child, parent)`` pairs."""
+        self.axes: tuple[URIRef, ...] = tuple(sorted(axes, key=str))
+        axis_of_scheme = {axes[axis]: idx for idx, axis in enumerate(self.axes)}
+        in_scheme = {concept: scheme for concept, scheme in concepts if scheme in axis_of_scheme}
+        self.concepts: tuple[URIRef, ...] = tuple(sorted(in_scheme, key=str))
+        self._ids = {concept: idx for idx, concept in enumerate(self.concepts)}
+        self.concept_axis = np.array([axis_of_scheme[in_scheme[c]] for c in self.concepts], dtype=np.int16)
+        self.width = max(1, -(-len(self.concepts) // WORD))
+
+        parents: list[list[int]] = [[] for _ in self.concepts]
+        for child, parent in broader:
+            c, p = self._ids.get(child), self._ids.get(parent)
+            if c is not None and p is not None and c != p:
+                parents[c].append(p)
+        self._parents = tuple(tuple(sorted(set(p))) for p in parents)
+
+        self._ancestors = transitive_closure(self._parents)
+        self.closure = np.array([_words(mask, self.width) for mask in self._ancestors], dtype=np.uint64).reshape(
+            len(self.concepts), self.width
+        )
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> StateVocabulary:
+        axes = {}
+        for axis, scheme in graph.subject_objects(SMS.hasConceptScheme):
+            if isinstance(axis, URIRef) and isinstance(scheme, URIRef) and axis != SMS.StateAxis:
+                axes[axis] = scheme
+        return cls.from_skos(SkosIndex.from_graph(graph), axes)
+
+    @classmethod
+    def from_skos(cls, skos: SkosIndex, axes: dict[URIRef, URIRef]) -> StateVocabulary:
+        """Restrict a :class:`~src.skos.SkosIndex` to the schemes of ``axes`` (``axis -> scheme``)."""
+        concepts = [(concept, scheme) for scheme in set(axes.values()) & set(skos.schemes)
+                    for concept in skos.members(scheme)]
+        return cls(axes, concepts, skos.broader_edges())
+
+    @classmethod
+    def load(
+        cls,
+        paths: Iterable[Path] = DEFAULT_SOURCES,
+        *,
+        cache_dir: Path | None = None,
+        use_cache: bool | None = None,
+    ) -> StateVocabulary:
+        """Build (or reload from cache) the vocabulary of the merged ``paths``."""
+        paths = tuple(Path(p) for p in paths)
+
+        def build() -> StateVocabulary:
+            graph = loader.load_merged(*paths, cache_dir=cache_dir, use_cache=use_cache)
+            return cls.from_graph(graph)
+
+        return loader.cached_artifact(
+            "material-state-vocabulary", paths, build, cache_dir=cache_dir, use_cache=use_cache
+        )
+
+    def __len__(self) -> int:
+        return len(self.concepts)
+
+    def __contains__(self, concept: object) -> bool:
+        return concept in self._ids
+
+    def index_of(self, concept: Node) -> int | None:
+        return self._ids.get(concept)
+
+    def axis_of(self, concept: Node) -> URIRef:
+        """The state axis whose scheme holds ``concept`` (``KeyError`` if unknown)."""
+        return self.axes[self.concept_axis[self._ids[concept]]]
+
+    def ancestors(self, concept: Node, include_self: bool = True) -> tuple[URIRef, ...]:
+        """``concept`` and everything it reaches via ``skos:broader``."""
+        idx = self._ids[concept]
+        mask = self._ancestors[idx] & ~(0 if include_self else 1 << idx)
+        return tuple(self.concepts[bit] for bit in range(len(self.concepts)) if mask >> bit & 1)
+
+    def query_masks(self, concepts: Iterable[Node]) -> np.ndarray:
+        """One ``(axes, width)`` row of concept bits per constrained axis."""
+        by_axis: dict[int, int] = {}
+        for concept in concepts:
+            if concept not in self._ids:
+                raise KeyError(f"{concept} is not a concept of any state axis scheme")
+            idx = self._ids[concept]
+            axis = int(self.concept_axis[idx])
+            by_axis[axis] = by_axis.get(axis, 0) | 1 << idx
+        rows = [_words(mask, self.width) for _, mask in sorted(by_axis.items())]
+        return np.array(rows, dtype=np.uint64).reshape(len(rows), self.width)
+
+
+class StateIndex:
+    """Entity × concept bitmask matrix over a :class:`StateVocabulary`."""
+
+    def __init__(self, vocabulary: StateVocabulary | None = None):
+        self.vocabulary = vocabulary or StateVocabulary.load()
+        self.entities: list[Node] = []
+        self._slots: dict[Node, int] = {}
+        self._entity = array("i")
+        self._concept = array("i")
+        self._bits: np.ndarray | None = None
+        self._columns: np.ndarray | None = None
+        self.unknown = 0
+
+    @classmethod
+    def from_graph(cls, graph: Graph, vocabulary: StateVocabulary | None = None) -> StateIndex:
+        """Index every ``sms:hasStateAssignment`` / ``sms:hasStateValue`` pair of ``graph``."""
+        index = cls(vocabulary)
+        triples = TripleIndex.from_graph(graph)
+        values: dict[Node, list[Node]] = {}
+        for assignment, _, value in triples.triples(SMS.hasStateValue):
+            values.setdefault(assignment, []).append(value)
+        index.add(
+            (entity, value)
+            for entity, _, assignment in triples.triples(SMS.hasStateAssignment)
+            for value in values.get(assignment, ())
+        )
+        return index
+
+    def add(self, pairs: Iterable[tuple[Node, Node]]) -> None:
+        """Register ``(entity, concept)`` state values."""
+        ids = self.vocabulary._ids
+        slots = self._slots
+        for entity, concept in pairs:
+            slot = slots.get(entity)
+            if slot is None:
+                slot = slots[entity] = len(self.entities)
+                self.entities.append(entity)
+            idx = ids.get(concept)
+            if idx is None:
+                self.unknown += 1
+                continue
+            self._entity.append(slot)
+            self._concept.append(idx)
+        self._bits = self._columns = None
+
+    def add_codes(self, entities: Sequence[Node], codes) -> None:
+        """Register a column block: ``codes[i]`` holds vocabulary concept ids of ``entities[i]``.
+
+        ``codes`` is an ``(entities, k)`` integer array (or one id per entity)
+        with ``-1`` for "no value"; ids index :attr:`StateVocabulary.concepts`.
+        """
+        codes = np.asarray(codes, dtype=np.int32).reshape(len(entities), -1)
+        if codes.size and (codes.max() >= len(self.vocabulary) or codes.min() < -1):
+            raise ValueError("concept ids must lie in [-1, number of concepts)")
+        slots = np.empty(len(entities), dtype=np.int32)
+        for row, entity in enumerate(entities):
+            slot = self._slots.get(entity)
+            if slot is None:
+                slot = self._slots[entity] = len(self.entities)
+                self.entities.append(entity)
+            slots[row] = slot
+        present = codes >= 0
+        self._entity.frombytes(np.broadcast_to(slots[:, None], codes.shape)[present].tobytes())
+        self._concept.frombytes(codes[present].tobytes())
+        self._bits = self._columns = None
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    @property
+    def bits(self) -> np.ndarray:
+        """``(entities, width)`` ``uint64`` matrix of closure-expanded state bits."""
+        if self._bits is None:
+            bits = np.zeros((len(self.entities), self.vocabulary.width), dtype=np.uint64)
+            entity = np.frombuffer(self._entity, dtype=np.int32)
+            concept = np.frombuffer(self._concept, dtype=np.int32)
+            if np.any(entity[1:] < entity[:-1]):
+                order = np.argsort(entity, kind="stable")
+                entity, concept = entity[order], concept[order]
+            # OR each entity's run of closure rows with reduceat, a bounded block of runs at a time.
+            starts = np.flatnonzero(np.diff(entity, prepend=-1))
+            runs_per_block = max(1, CHUNK * len(starts) // max(1, len(entity)))
+            for first in range(0, len(starts), runs_per_block):
+                block = starts[first : first + runs_per_block]
+                stop = starts[first + runs_per_block] if first + runs_per_block < len(starts) else len(entity)
+                rows = self.vocabulary.closure[concept[block[0] : stop]]
+                bits[entity[block]] = np.bitwise_or.reduceat(rows, block - block[0], axis=0)
+            self._bits = bits
+        return self._bits
+
+    @property
+    def columns(self) -> np.ndarray:
+        """``(concepts, ⌈entities / 64⌉)`` ``uint64`` bitmaps: the transpose of :attr:`bits`.
+
+        Bit ``e % 64`` of word ``e // 64`` in row ``c`` is set when entity
+        ``e`` carries concept ``c`` (directly or via ``skos:broader``).
+        """
+        if self._columns is None:
+            size = len(self.entities)
+            columns = np.zeros((len(self.vocabulary), -(-size // WORD) * 8), dtype=np.uint8)
+            # One contiguous byte plane per (word, byte) of the entity-major matrix, then
+            # each concept's bit is shifted out of its plane and packed 8 entities per byte.
+            planes = np.ascontiguousarray(self.bits.view(np.uint8).T)
+            scratch = np.empty(size, dtype=np.uint8)
+            for concept in range(len(self.vocabulary)):
+                np.right_shift(planes[concept // 8], concept % 8, out=scratch)
+                np.bitwise_and(scratch, 1, out=scratch)
+                columns[concept, : -(-size // 8)] = np.packbits(scratch, bitorder="little")
+            self._columns = columns.view(np.uint64)
+        return self._columns
+
+    def match(self, *concepts: Node) -> np.ndarray:
+        """Boolean mask of entities matching every axis constrained by ``concepts``."""
+        bits = self.bits
+        hit = np.ones(len(bits), dtype=bool)
+        for row in self.vocabulary.query_masks(concepts):
+            words = np.flatnonzero(row)
+            axis_hit = (bits[:, words[0]] & row[words[0]]) != 0
+            for word in words[1:]:
+                axis_hit |= (bits[:, word] & row[word]) != 0
+            hit &= axis_hit
+        return hit
+
+    def select(self, *concepts: Node) -> list[Node]:
+        """Entities matching :meth:`match`, in insertion order."""
+        return [self.entities[i] for i in np.flatnonzero(self.match(*concepts)).tolist()]
+
+    def values(self, entity: Node, include_broader: bool = False) -> tuple[URIRef, ...]:
+        """State concepts of ``entity`` (assigned only, or with their ancestors)."""
+        slot = self._slots[entity]
+        if include_broader:
+            row = self.bits[slot]
+            return tuple(
+                c for i, c in enumerate(self.vocabulary.concepts) if int(row[i // WORD]) >> (i % WORD) & 1
+            )
+        entity_ids = np.frombuffer(self._entity, dtype=np.int32)
+        concept_ids = np.frombuffer(self._concept, dtype=np.int32)[entity_ids == slot]
+        return tuple(self.vocabulary.concepts[i] for i in sorted(set(concept_ids.tolist())))
+
+    def facet_counts(self, *concepts: Node, exclude_own_axis: bool = True) -> Facets:
+        """Entity counts for every concept under the filter ``concepts``.
+
+        Counts roll up along ``skos:broader`` (an entity assigned
+        ``method.Corrosion`` counts towards ``method.Degradation`` too). With
+        ``exclude_own_axis`` an axis's own constraint is left out when counting
+        that axis, so the alternatives to the current selection keep their
+        counts, as in a multi-select facet sidebar. All concepts are counted
+        in one pass over :attr:`columns` with a vectorised popcount.
+        """
+        vocabulary = self.vocabulary
+        columns = self.columns
+        size = len(self.entities)
+        everything = np.full(columns.shape[1], np.uint64(0xFFFFFFFFFFFFFFFF))
+        if size % WORD:
+            everything[-1] = np.uint64((1 << (size % WORD)) - 1)
+
+        hits: dict[int, np.ndarray] = {}
+        for concept in concepts:
+            if concept not in vocabulary:
+                raise KeyError(f"{concept} is not a concept of any state axis scheme")
+            idx = vocabulary.index_of(concept)
+            axis = int(vocabulary.concept_axis[idx])
+            hits[axis] = hits[axis] | columns[idx] if axis in hits else columns[idx].copy()
+        selected = everything.copy()
+        for hit in hits.values():
+            selected &= hit
+
+        counts = np.zeros(len(vocabulary), dtype=np.int64)
+        for axis in range(len(vocabulary.axes)):
+            rows = np.flatnonzero(vocabulary.concept_axis == axis)
+            scope = selected
+            if exclude_own_axis and axis in hits:
+                scope = everything.copy()
+                for other, hit in hits.items():
+                    if other != axis:
+                        scope &= hit
+            for row in rows.tolist():
+                counts[row] = _popcount(columns[row] & scope)
+        return Facets(_popcount(selected), counts, vocabulary)
+
+
+@dataclass(frozen=True)
+class Facets:
+    """Result of :meth:`StateIndex.facet_counts`."""
+
+    total: int
+    counts: np.ndarray
+    vocabulary: StateVocabulary
+
+    def __getitem__(self, concept: Node) -> int:
+        return int(self.counts[self.vocabulary._ids[concept]])
+
+    def axis(self, axis: URIRef, nonzero: bool = False) -> dict[URIRef, int]:
+        """``{concept: count}`` for the concepts of ``axis``."""
+        which = self.vocabulary.axes.index(axis)
+        return {
+            concept: int(count)
+            for concept, count, on in zip(self.vocabulary.concepts, self.counts, self.vocabulary.concept_axis)
+            if on == which and (count or not nonzero)
+        }
+
+    def by_axis(self, nonzero: bool = True) -> dict[URIRef, dict[URIRef, int]]:
+        return {axis: self.axis(axis, nonzero) for axis in self.vocabulary.axes}
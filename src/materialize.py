@@ -0,0 +1,337 @@
+"""Forward-chaining materializer for the MIN/sdata property axioms.
+
+Instead of running a generic OWL-RL closure, the axioms that MIN and
+sdata-core actually use on object properties are compiled into specialised
+lookup tables (:class:`RuleSet`):
+
+- ``owl:SymmetricProperty``           (``min:nexusWith``)
+- ``owl:TransitiveProperty``          (``min:hasComponent``, ``min:entails``)
+- ``owl:inverseOf``                   (``describes``/``describedBy``, ...)
+- ``owl:propertyChainAxiom``          (``min:actsOn``, ``min:produces``)
+- ``rdfs:subPropertyOf`` and ``owl:equivalentProperty`` (optional)
+
+:class:`Materializer` keeps integer-encoded forward/reverse adjacency per
+property and saturates semi-naively: every newly derived fact is joined once
+against the facts known so far, so each rule firing only looks at the delta.
+Chains longer than two are binarised into internal helper properties, and
+equivalent properties are collapsed onto one representative during
+saturation and expanded back to every spelling on output.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from rdflib import Graph, Literal, URIRef
+from rdflib.collection import Collection
+from rdflib.namespace import OWL, RDF, RDFS
+from rdflib.term import Node
+
+from src import loader
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_SOURCES = (ROOT / "min-v1.0.0.ttl", ROOT / "sdata-core.ttl")
+
+
+@dataclass(frozen=True)
+class RuleSet:
+    """Property axioms compiled into per-property lookup tables.
+
+    Equivalent properties (``owl:equivalentProperty`` or mutual
+    ``rdfs:subPropertyOf``) share one representative id, so saturation works
+    on a single spelling and :attr:`aliases` expands results afterwards.
+    Helper properties introduced for long chains have ids ``>= len(properties)``
+    and never surface in results.
+    """
+
+    properties: tuple[URIRef, ...]
+    representative: tuple[int, ...]
+    aliases: dict[int, tuple[int, ...]]
+    helper_count: int
+    symmetric: frozenset[int]
+    transitive: frozenset[int]
+    inverses: dict[int, tuple[int, ...]]
+    superproperties: dict[int, tuple[int, ...]]
+    chain_left: dict[int, tuple[tuple[int, int], ...]]  # p1 -> ((p2, q), ...)
+    chain_right: dict[int, tuple[tuple[int, int], ...]]  # p2 -> ((p1, q), ...)
+
+    @classmethod
+    def from_graph(
+        cls,
+        graph: Graph,
+        *,
+        subproperties: bool = True,
+        equivalences: bool = True,
+    ) -> RuleSet:
+        ids: dict[URIRef, int] = {}
+        names: list[URIRef] = []
+
+        def pid(prop: URIRef) -> int:
+            idx = ids.get(prop)
+            if idx is None:
+                idx = len(names)
+                ids[prop] = idx
+                names.append(prop)
+            return idx
+
+        symmetric = {pid(p) for p in graph.subjects(RDF.type, OWL.SymmetricProperty) if isinstance(p, URIRef)}
+        transitive = {pid(p) for p in graph.subjects(RDF.type, OWL.TransitiveProperty) if isinstance(p, URIRef)}
+
+        inverse_pairs = [
+            (pid(p), pid(q))
+            for p, q in graph.subject_objects(OWL.inverseOf)
+            if isinstance(p, URIRef) and isinstance(q, URIRef)
+        ]
+
+        direct_supers: dict[int, set[int]] = {}
+        if subproperties:
+            for p, q in graph.subject_objects(RDFS.subPropertyOf):
+                if isinstance(p, URIRef) and isinstance(q, URIRef) and p != q:
+                    direct_supers.setdefault(pid(p), set()).add(pid(q))
+        if equivalences:
+            for p, q in graph.subject_objects(OWL.equivalentProperty):
+                if isinstance(p, URIRef) and isinstance(q, URIRef) and p != q:
+                    direct_supers.setdefault(pid(p), set()).add(pid(q))
+                    direct_supers.setdefault(pid(q), set()).add(pid(p))
+
+        raw_chains: list[tuple[list[int], int]] = []
+        for q, head in graph.subject_objects(OWL.propertyChainAxiom):
+            if not isinstance(q, URIRef):
+                continue
+            members = list(Collection(graph, head))
+            if len(members) < 2 or not all(isinstance(m, URIRef) for m in members):
+                continue  # inverse/anonymous chain members are not used by MIN/sdata
+            raw_chains.append(([pid(m) for m in members], pid(q)))
+
+        visible = len(names)
+        all_supers: list[set[int]] = []
+        for p in range(visible):
+            seen: set[int] = set()
+            stack = list(direct_supers.get(p, ()))
+            while stack:
+                q = stack.pop()
+                if q not in seen:
+                    seen.add(q)
+                    stack.extend(direct_supers.get(q, ()))
+            seen.discard(p)
+            all_supers.append(seen)
+
+        # Properties that are each other's superproperty are equivalent.
+        representative = list(range(visible))
+        for p in range(visible):
+            for q in all_supers[p]:
+                if p in all_supers[q]:
+                    representative[p] = min(representative[p], q)
+        aliases: dict[int, list[int]] = {}
+        for p, rep in enumerate(representative):
+            if p != rep:
+                aliases.setdefault(rep, [rep]).append(p)
+
+        def rep(p: int) -> int:
+            return representative[p] if p < visible else p
+
+        helper_count = 0
+        binary: list[tuple[int, int, int]] = []
+        for members, q in raw_chains:
+            left = rep(members[0])
+            for middle in members[1:-1]:
+                helper = visible + helper_count
+                helper_count += 1
+                binary.append((left, rep(middle), helper))
+                left = helper
+            binary.append((left, rep(members[-1]), rep(q)))
+
+        inverses: dict[int, set[int]] = {}
+        for p, q in inverse_pairs:
+            inverses.setdefault(rep(p), set()).add(rep(q))
+            inverses.setdefault(rep(q), set()).add(rep(p))
+
+        superproperties: dict[int, set[int]] = {}
+        for p in range(visible):
+            supers = {rep(q) for q in all_supers[p]} - {rep(p)}
+            if supers:
+                superproperties.setdefault(rep(p), set()).update(supers)
+
+        chain_left: dict[int, list[tuple[int, int]]] = {}
+        chain_right: dict[int, list[tuple[int, int]]] = {}
+        for p1, p2, q in binary:
+            chain_left.setdefault(p1, []).append((p2, q))
+            chain_right.setdefault(p2, []).append((p1, q))
+
+        return cls(
+            properties=tuple(names),
+            representative=tuple(representative),
+            aliases={p: tuple(sorted(v)) for p, v in aliases.items()},
+            helper_count=helper_count,
+            symmetric=frozenset(rep(p) for p in symmetric),
+            transitive=frozenset(rep(p) for p in transitive),
+            inverses={p: tuple(sorted(qs)) for p, qs in inverses.items()},
+            superproperties={p: tuple(sorted(qs)) for p, qs in superproperties.items()},
+            chain_left={p: tuple(v) for p, v in chain_left.items()},
+            chain_right={p: tuple(v) for p, v in chain_right.items()},
+        )
+
+    @classmethod
+    def load(
+        cls,
+        paths: Iterable[Path] = DEFAULT_SOURCES,
+        *,
+        subproperties: bool = True,
+        equivalences: bool = True,
+        cache_dir: Path | None = None,
+        use_cache: bool | None = None,
+    ) -> RuleSet:
+        paths = tuple(Path(p) for p in paths)
+
+        def build() -> RuleSet:
+            graph = loader.load_merged(*paths, cache_dir=cache_dir, use_cache=use_cache)
+            return cls.from_graph(graph, subproperties=subproperties, equivalences=equivalences)
+
+        name = f"ruleset-{'spo' if subproperties else 'nospo'}-{'eqp' if equivalences else 'noeqp'}"
+        return loader.cached_artifact(name, paths, build, cache_dir=cache_dir, use_cache=use_cache)
+
+    @property
+    def size(self) -> int:
+        return len(self.properties) + self.helper_count
+
+    def property_ids(self) -> dict[URIRef, int]:
+        """Map every rule property IRI to the id of its representative."""
+        return {prop: self.representative[idx] for idx, prop in enumerate(self.properties)}
+
+
+class Materializer:
+    """Semi-naive saturation of an instance graph under a :class:`RuleSet`."""
+
+    def __init__(self, rules: RuleSet):
+        self.rules = rules
+        self._pids = rules.property_ids()
+        self._spelling = {prop: idx for idx, prop in enumerate(rules.properties)}
+        self._node_ids: dict[Node, int] = {}
+        self._nodes: list[Node] = []
+        self._literals: set[int] = set()
+        self._fwd: list[dict[int, set[int]]] = [{} for _ in range(rules.size)]
+        self._rev: list[dict[int, set[int]]] = [{} for _ in range(rules.size)]
+        self._queue: list[tuple[int, int, int]] = []
+        self._asserted: set[tuple[int, int, int]] = set()
+
+    def _node(self, term: Node) -> int:
+        idx = self._node_ids.get(term)
+        if idx is None:
+            idx = len(self._nodes)
+            self._node_ids[term] = idx
+            self._nodes.append(term)
+            if isinstance(term, Literal):
+                self._literals.add(idx)
+        return idx
+
+    def _insert(self, p: int, s: int, o: int) -> bool:
+        objects = self._fwd[p].get(s)
+        if objects is None:
+            self._fwd[p][s] = {o}
+        elif o in objects:
+            return False
+        else:
+            objects.add(o)
+        subjects = self._rev[p].get(o)
+        if subjects is None:
+            self._rev[p][o] = {s}
+        else:
+            subjects.add(s)
+        self._queue.append((p, s, o))
+        return True
+
+    def add(self, triples: Iterable[tuple[Node, Node, Node]]) -> int:
+        """Assert ``triples``; those with predicates outside the rules are ignored."""
+        added = 0
+        pids, spelling, asserted = self._pids, self._spelling, self._asserted
+        for s, p, o in triples:
+            pid = pids.get(p)  # type: ignore[arg-type]
+            if pid is None:
+                continue
+            si, oi = self._node(s), self._node(o)
+            asserted.add((spelling[p], si, oi))  # type: ignore[index]
+            if self._insert(pid, si, oi):
+                added += 1
+        return added
+
+    def saturate(self) -> int:
+        """Derive all consequences of pending facts; return the number of new facts.
+
+        The count is over representative properties; equivalent spellings are
+        only expanded by :meth:`triples`.
+        """
+        rules = self.rules
+        fwd, rev, queue = self._fwd, self._rev, self._queue
+        literals = self._literals
+        supers = rules.superproperties
+        inverses = rules.inverses
+        symmetric = rules.symmetric
+        transitive = rules.transitive
+        chain_left = rules.chain_left
+        chain_right = rules.chain_right
+        insert = self._insert
+        visible = len(rules.properties)
+        derived = 0
+
+        while queue:
+            p, s, o = queue.pop()
+            new: list[tuple[int, int, int]] = []
+            for q in supers.get(p, ()):
+                new.append((q, s, o))
+            for q in inverses.get(p, ()):
+                new.append((q, o, s))
+            if p in symmetric:
+                new.append((p, o, s))
+            if p in transitive:
+                new.extend((p, x, o) for x in rev[p].get(s, ()))
+                new.extend((p, s, y) for y in fwd[p].get(o, ()))
+            for p2, q in chain_left.get(p, ()):
+                new.extend((q, s, y) for y in fwd[p2].get(o, ()))
+            for p1, q in chain_right.get(p, ()):
+                new.extend((q, x, o) for x in rev[p1].get(s, ()))
+            for q, x, y in new:
+                if x not in literals and insert(q, x, y) and q < visible:
+                    derived += 1
+        return derived
+
+    def triples(self) -> Iterator[tuple[Node, URIRef, Node]]:
+        """Yield all asserted and derived facts, in every equivalent spelling."""
+        names = self.rules.properties
+        aliases = self.rules.aliases
+        nodes = self._nodes
+        for p in range(len(names)):
+            spellings = [names[a] for a in aliases.get(p, (p,))]
+            for s, objects in self._fwd[p].items():
+                subject = nodes[s]
+                for o in objects:
+                    obj = nodes[o]
+                    for prop in spellings:
+                        yield subject, prop, obj
+
+    def inferred(self) -> Iterator[tuple[Node, URIRef, Node]]:
+        """Yield the facts of :meth:`triples` that were not asserted verbatim."""
+        spelling, asserted = self._spelling, self._asserted
+        node_ids = self._node_ids
+        for s, p, o in self.triples():
+            if (spelling[p], node_ids[s], node_ids[o]) not in asserted:
+                yield s, p, o
+
+    def __len__(self) -> int:
+        """Number of facts over representative properties."""
+        return sum(len(objs) for p in range(len(self.rules.properties)) for objs in self._fwd[p].values())
+
+
+def materialize(graph: Graph, rules: RuleSet | None = None) -> int:
+    """Add all consequences of ``rules`` to ``graph`` in place.
+
+    Without explicit ``rules`` the MIN + sdata-core rule set is used. Returns
+    the number of triples added.
+    """
+    materializer = Materializer(rules if rules is not None else RuleSet.load())
+    materializer.add(graph)
+    materializer.saturate()
+    before = len(graph)
+    graph.addN((s, p, o, graph) for s, p, o in materializer.inferred())
+    return len(graph) - before
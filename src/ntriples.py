@@ -0,0 +1,143 @@
+"""N-Triples terms and lines without rdflib's parser or a graph.
+
+The streaming builders (:mod:`src.lineage`, :mod:`src.quantities`,
+:mod:`src.bom`, ...) and the sharded validator read N-Triples dumps line by
+line and work on the raw tokens (``<iri>``, ``_:label``, ``"lexical"^^<dt>``)
+as long as they can, parsing a term into an rdflib node only when needed::
+
+    for subject, predicate, obj in token_triples(open("data.nt", encoding="utf-8")):
+        if predicate == term_token(SDATA.hasOutput):
+            output = parse_term(obj)
+
+A line that is not a triple raises ``ValueError`` naming its line number.
+The builders number tokens with :class:`TokenIds`, their results map nodes
+back through :class:`TokenNodes`, and :func:`load_paths` feeds them files.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Iterator, Sequence
+from numbers import Integral
+from pathlib import Path
+from typing import Protocol, TypeVar
+
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.plugins.parsers.ntriples import unquote
+from rdflib.term import Node
+
+from src import loader
+
+_LITERAL = re.compile(r'"([^"\\]*(?:\\.[^"\\]*)*)"(?:@([a-zA-Z]+(?:-[a-zA-Z0-9]+)*)|\^\^<([^>]+)>)?')
+
+
+def parse_term(token: str) -> Node:
+    """One N-Triples term (``<iri>``, ``_:label`` or a literal) as an rdflib node."""
+    if token[0] == "<":
+        iri = token[1:-1]
+        return URIRef(unquote(iri) if "\\" in iri else iri)
+    if token.startswith("_:"):
+        return BNode(token[2:])
+    match = _LITERAL.fullmatch(token)
+    if match is None:
+        raise ValueError(f"Invalid N-Triples term: {token}")
+    lexical, language, datatype = match.groups()
+    return Literal(unquote(lexical), lang=language, datatype=URIRef(datatype) if datatype else None)
+
+
+def term_token(node: Node) -> str:
+    """The N-Triples token of an IRI or blank node (inverse of :func:`parse_term`)."""
+    return f"_:{node}" if isinstance(node, BNode) else f"<{node}>"
+
+
+def token_of(node: Node | str) -> str:
+    """The token of ``node``; a plain ``str`` (not an rdflib term) is taken to be a token already."""
+    return node if isinstance(node, str) and not isinstance(node, Node) else term_token(node)
+
+
+def split_line(line: str, number: int) -> tuple[str, str, str] | None:
+    """``(subject, predicate, rest)`` of N-Triples line ``number``; ``None`` for blank and comment lines.
+
+    ``rest`` is the object token followed by the final ``.``.
+    """
+    stripped = line.strip()
+    if not stripped or stripped[0] == "#":
+        return None
+    parts = stripped.split(None, 2)
+    if len(parts) < 3 or not parts[2].endswith("."):
+        raise ValueError(f"Invalid N-Triples line {number}: {line!r}")
+    return parts[0], parts[1], parts[2]
+
+
+def token_triples(lines: Iterable[str]) -> Iterator[tuple[str, str, str]]:
+    """``(subject, predicate, object)`` tokens of every triple in ``lines``."""
+    for number, line in enumerate(lines, 1):
+        parts = split_line(line, number)
+        if parts is not None:
+            subject, predicate, rest = parts
+            yield subject, predicate, rest[:-1].rstrip()
+
+
+def read_ntriples(lines: Iterable[str]) -> Iterator[tuple[Node, Node, Node]]:
+    """Parse N-Triples ``lines`` into rdflib terms without a graph.
+
+    Blank nodes keep their labels (``_:b1`` becomes ``BNode("b1")``), so
+    results can be traced back to the input file. Terms are memoised per
+    call, since IRIs and short literals repeat heavily in instance data.
+    """
+    terms: dict[str, Node] = {}
+
+    def term(token: str) -> Node:
+        found = terms.get(token)
+        if found is None:
+            found = terms[token] = parse_term(token)
+        return found
+
+    for subject, predicate, obj in token_triples(lines):
+        yield term(subject), term(predicate), term(obj)
+
+
+class TokenIds(dict[str, int]):
+    """Dense ids of tokens in first-seen order: looking up an unknown token with ``ids[token]`` numbers it."""
+
+    def __missing__(self, token: str) -> int:
+        found = self[token] = len(self)
+        return found
+
+
+class TokenNodes:
+    """:meth:`index_of` and :meth:`node` for results whose node ids index the N-Triples ``tokens``."""
+
+    tokens: Sequence[str]
+    _ids: dict[str, int] | None = None
+
+    def index_of(self, node: Node | str | int) -> int | None:
+        """Node id of an rdflib term, N-Triples token or id (``None`` if absent)."""
+        if isinstance(node, Integral):
+            return int(node) if 0 <= node < len(self.tokens) else None
+        if self._ids is None:
+            self._ids = {token: idx for idx, token in enumerate(self.tokens)}
+        return self._ids.get(token_of(node))
+
+    def node(self, idx: int) -> Node:
+        return parse_term(self.tokens[idx])
+
+
+class Builder(Protocol):
+    def add_graph(self, graph: Graph) -> None: ...
+
+    def add_ntriples(self, lines: Iterable[str]) -> None: ...
+
+
+B = TypeVar("B", bound=Builder)
+
+
+def load_paths(builder: B, paths: Iterable[Path]) -> B:
+    """Feed RDF files to ``builder``; N-Triples files are streamed line by line, others go through the loader."""
+    for path in map(Path, paths):
+        if path.suffix == ".nt":
+            with path.open(encoding="utf-8") as source:
+                builder.add_ntriples(source)
+        else:
+            builder.add_graph(loader.load_graph(path))
+    return builder
@@ -0,0 +1,605 @@
+"""Columnar extraction of ``sdata:hasQuantity`` AttributeQuantityValues.
+
+:class:`QuantityExtractor` turns every AQV attached to a nexus through
+``sdata:hasQuantity`` into one row of a :class:`QuantityTable` with the
+columns ``owner``, ``name``, ``value``, ``unit`` (``qudt:unit``), ``symbol``
+(``sdata:unitSymbol``) and ``dtype``. Instead of walking the AQV blank nodes
+one by one, it scans the handful of predicates involved (or an N-Triples
+stream, line by line) once and joins them on the AQV's N-Triples token.
+Owners, names and units are dictionary-encoded as ``int32`` codes, values are
+a ``float64`` column, and only non-numeric lexical forms (``qudt:value`` of
+``str``/``timestamp``/``bool``/``uri`` attributes) are kept as text::
+
+    table = extract_quantities(graph)
+    owners, columns = table.pivot(["Rm", "Rp02", "AG"])   # owner × name
+
+``sdata:dtype`` picks the NumPy type of a name's column (``float64``,
+``int64``, ``bool``, ``datetime64[us]`` or ``object`` for ``str``/``uri``);
+AQVs without ``sdata:dtype`` count as ``float`` when they have a numeric
+value and as ``str`` otherwise. :meth:`QuantityTable.to_arrow` converts the
+long table to a ``pyarrow.Table`` when pyarrow is installed.
+
+:func:`write_quantities` goes the other way: it streams columns (NumPy arrays,
+lists or scalars) as N-Triples or Turtle without building a graph, naming each
+AQV with a deterministic skolem IRI instead of a blank node::
+
+    with open("results.nt", "w") as out:
+        write_quantities(out, specimens, "Rm", rm, units=UNIT.MegaPA, symbols="MPa")
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import re
+import sys
+from array import array
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TextIO
+
+import numpy as np
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.namespace import RDF
+from rdflib.term import Node
+
+from src.domains.base import SDATA
+from src.ntriples import load_paths, parse_term, term_token, token_triples
+from src.shape_compiler import TripleIndex
+
+QUDT = "http://qudt.org/schema/qudt/"
+QUDT_NUMERIC_VALUE = URIRef(QUDT + "numericValue")
+QUDT_VALUE = URIRef(QUDT + "value")
+QUDT_UNIT = URIRef(QUDT + "unit")
+XSD = "http://www.w3.org/2001/XMLSchema#"
+DEFAULT_GENID = "https://w3id.org/sdata/.well-known/genid/aqv-"
+
+DTYPES = ("str", "float", "int", "timestamp", "bool", "uri")
+_DTYPE_CODES = {name: code for code, name in enumerate(DTYPES)}
+_FLOAT, _STR = _DTYPE_CODES["float"], _DTYPE_CODES["str"]
+
+# Predicate -> column it fills ("text" is qudt:value, which keeps its lexical form).
+_KINDS = {
+    SDATA.hasQuantity: "owner",
+    SDATA.name: "name",
+    QUDT_NUMERIC_VALUE: "value",
+    QUDT_VALUE: "text",
+    QUDT_UNIT: "unit",
+    SDATA.unitSymbol: "symbol",
+    SDATA.dtype: "dtype",
+}
+_LITERAL_KINDS = frozenset({"name", "value", "text", "symbol", "dtype"})
+
+
+def _double(value: float) -> str:
+    """The ``xsd:double`` lexical form of ``value`` (``INF``, ``-INF`` and ``NaN``, not Python's ``inf``)."""
+    if value - value == 0:
+        return repr(value)
+    if value != value:
+        return "NaN"
+    return "INF" if value > 0 else "-INF"
+
+
+def _to_datetime64(text: str | None) -> np.datetime64:
+    if text is None:
+        return np.datetime64("NaT", "us")
+    moment = datetime.fromisoformat(text)
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return np.datetime64(moment, "us")
+
+
+def _typed(dtype: str, values: np.ndarray, texts: np.ndarray) -> np.ndarray:
+    """Convert one name's rows to the NumPy type of its ``sdata:dtype``."""
+    if dtype == "float":
+        return values
+    if dtype == "int":
+        return values.astype(np.int64) if not np.isnan(values).any() else values
+    if dtype == "bool":
+        flags = [
+            (t.lower() in ("true", "1")) if t is not None else (bool(v) if not np.isnan(v) else None)
+            for t, v in zip(texts, values)
+        ]
+        return np.array(flags, dtype=object if None in flags else bool)
+    if dtype == "timestamp":
+        return np.array([_to_datetime64(t) for t in texts], dtype="datetime64[us]")
+    return np.array(
+        [t if t is not None else (_double(float(v)) if not np.isnan(v) else None) for t, v in zip(texts, values)],
+        dtype=object,
+    )
+
+
+def _missing(dtype: str, size: int, complete: bool) -> np.ndarray:
+    """An empty pivot column; ``complete`` when every owner will get a value."""
+    if dtype == "float" or (dtype == "int" and not complete):
+        return np.full(size, np.nan)
+    if dtype == "timestamp":
+        return np.full(size, np.datetime64("NaT", "us"))
+    if complete and dtype in ("int", "bool"):
+        return np.zeros(size, dtype=np.int64 if dtype == "int" else bool)
+    return np.full(size, None, dtype=object)
+
+
+@dataclass(frozen=True)
+class QuantityTable:
+    """Long AQV table; ``owner``/``name``/``unit``/``symbol`` index the category tuples (-1 = missing)."""
+
+    owners: tuple[Node, ...]
+    names: tuple[str, ...]
+    units: tuple[Node, ...]
+    symbols: tuple[str, ...]
+    owner: np.ndarray
+    name: np.ndarray
+    unit: np.ndarray
+    symbol: np.ndarray
+    dtype: np.ndarray
+    value: np.ndarray
+    text: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.owner)
+
+    def dtype_of(self, name: str) -> str:
+        """The single ``sdata:dtype`` of the AQVs called ``name``."""
+        code = self.names.index(name)
+        found = np.unique(self.dtype[self.name == code])
+        if len(found) != 1:
+            raise ValueError(f"AQVs named {name!r} have dtypes {[DTYPES[c] for c in found]}, expected one")
+        return DTYPES[found[0]]
+
+    def column(self, name: str) -> tuple[np.ndarray, np.ndarray]:
+        """``(owner codes, typed values)`` of the AQVs called ``name``."""
+        rows = np.flatnonzero(self.name == self.names.index(name))
+        return self.owner[rows], _typed(self.dtype_of(name), self.value[rows], self.text[rows])
+
+    def pivot(self, names: Sequence[str] | None = None) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+        """Wide owner × name view: ``(owners, {name: column aligned with owners})``.
+
+        Owners without any of ``names`` are left out; missing cells are NaN,
+        NaT or ``None`` depending on the column type. An owner with two AQVs of
+        the same name is an error.
+        """
+        names = list(self.names if names is None else names)
+        codes = [self.names.index(name) for name in names]
+        selected = np.isin(self.name, codes)
+        owner_codes = np.unique(self.owner[selected])
+        position = np.full(len(self.owners), -1, dtype=np.int64)
+        position[owner_codes] = np.arange(len(owner_codes))
+
+        columns: dict[str, np.ndarray] = {}
+        for name in names:
+            owners, values = self.column(name)
+            if len(np.unique(owners)) != len(owners):
+                raise ValueError(f"some owners have several AQVs named {name!r}")
+            dtype = self.dtype_of(name)
+            column = _missing(dtype, len(owner_codes), complete=len(owners) == len(owner_codes))
+            column[position[owners]] = values
+            columns[name] = column
+        return np.array([self.owners[code] for code in owner_codes], dtype=object), columns
+
+    def to_arrow(self):
+        """The long table as a ``pyarrow.Table`` with dictionary-encoded columns."""
+        try:
+            import pyarrow as pa
+        except ImportError as exc:
+            raise RuntimeError("pyarrow is required for Arrow export. Install it first.") from exc
+
+        def categorical(codes: np.ndarray, categories: Sequence) -> pa.DictionaryArray:
+            indices = pa.array(codes.astype(np.int32), mask=codes < 0)
+            return pa.DictionaryArray.from_arrays(indices, pa.array([str(c) for c in categories], pa.string()))
+
+        return pa.table(
+            {
+                "owner": categorical(self.owner, self.owners),
+                "name": categorical(self.name, self.names),
+                "value": pa.array(self.value, from_pandas=True),
+                "text": pa.array(self.text.tolist(), pa.string()),
+                "unit": categorical(self.unit, self.units),
+                "symbol": categorical(self.symbol, self.symbols),
+                "dtype": categorical(self.dtype.astype(np.int32), DTYPES),
+            }
+        )
+
+
+class _Codes(dict):
+    """Category -> code in first-seen order."""
+
+    def code(self, key) -> int:
+        found = self.get(key)
+        if found is None:
+            found = self[key] = len(self)
+        return found
+
+
+class QuantityExtractor:
+    """Accumulate AQV triples in any order; :meth:`table` builds the columns."""
+
+    def __init__(self) -> None:
+        self._slots: dict[str, int] = {}
+        self._owners = _Codes()
+        self._names = _Codes()
+        self._units = _Codes()
+        self._symbols = _Codes()
+        self._owner = array("q")
+        self._name = array("q")
+        self._unit = array("q")
+        self._symbol = array("q")
+        self._dtype = array("b")
+        self._value = array("d")
+        self._text: dict[int, str] = {}
+
+    def _slot(self, token: str) -> int:
+        slot = self._slots.get(token)
+        if slot is None:
+            slot = self._slots[token] = len(self._owner)
+            for column in (self._owner, self._name, self._unit, self._symbol, self._dtype):
+                column.append(-1)
+            self._value.append(np.nan)
+        return slot
+
+    def _put(self, kind: str, subject: str, obj: str) -> None:
+        """Record one triple; ``obj`` is a token for IRIs and a lexical form for literals."""
+        if kind == "owner":
+            self._owner[self._slot(obj)] = self._owners.code(subject)
+        elif kind == "name":
+            self._name[self._slot(subject)] = self._names.code(obj)
+        elif kind == "unit":
+            self._unit[self._slot(subject)] = self._units.code(obj)
+        elif kind == "symbol":
+            self._symbol[self._slot(subject)] = self._symbols.code(obj)
+        elif kind == "dtype":
+            code = _DTYPE_CODES.get(obj)
+            if code is None:
+                raise ValueError(f"unknown sdata:dtype {obj!r}, expected one of {', '.join(DTYPES)}")
+            self._dtype[self._slot(subject)] = code
+        else:
+            slot = self._slot(subject)
+            # qudt:value keeps its lexical form: "007" may be a str attribute.
+            if kind == "text":
+                self._text[slot] = obj
+            try:
+                self._value[slot] = float(obj)
+            except ValueError:
+                self._text[slot] = obj
+
+    def add(self, triples: Iterable[tuple[Node, Node, Node]]) -> None:
+        """Consume triples in any order; irrelevant ones are skipped."""
+        for s, p, o in triples:
+            kind = _KINDS.get(p)
+            if kind is None:
+                continue
+            if kind in _LITERAL_KINDS:
+                if isinstance(o, Literal):
+                    self._put(kind, term_token(s), str(o))
+            else:
+                self._put(kind, term_token(s), term_token(o))
+
+    def add_graph(self, graph: Graph) -> None:
+        """Feed only the relevant predicates of ``graph`` through its indexes."""
+        index = TripleIndex.from_graph(graph)
+        for predicate in _KINDS:
+            self.add(index.triples(predicate))
+
+    def add_ntriples(self, lines: Iterable[str]) -> None:
+        """Like :meth:`add` for N-Triples lines, without building rdflib nodes."""
+        kinds = {f"<{p}>": kind for p, kind in _KINDS.items()}
+        literals: dict[str, str] = {}
+        put = self._put
+
+        for subject, predicate, obj in token_triples(lines):
+            kind = kinds.get(predicate)
+            if kind is None:
+                continue
+            if kind in _LITERAL_KINDS:
+                if obj[0] != '"':
+                    continue
+                lexical = literals.get(obj)
+                if lexical is None:
+                    lexical = obj[1 : obj.rfind('"')]
+                    if "\\" in lexical:
+                        lexical = str(parse_term(obj))
+                    # Names, symbols and dtypes repeat; values mostly do not.
+                    if kind not in ("value", "text"):
+                        literals[obj] = lexical
+                put(kind, subject, lexical)
+            else:
+                put(kind, subject, obj)
+
+    def table(self) -> QuantityTable:
+        """Rows for the AQVs attached to an owner, in first-seen order."""
+        owner = np.array(self._owner, dtype=np.int32)
+        rows = np.flatnonzero(owner >= 0)
+        dtype = np.array(self._dtype, dtype=np.int8)[rows]
+        value = np.array(self._value, dtype=np.float64)[rows]
+        text = np.full(len(rows), None, dtype=object)
+        row_of = np.full(len(owner), -1, dtype=np.int64)
+        row_of[rows] = np.arange(len(rows))
+        for slot, lexical in self._text.items():
+            if row_of[slot] >= 0:
+                text[row_of[slot]] = lexical
+        dtype = np.where(dtype >= 0, dtype, np.where(np.isnan(value), _STR, _FLOAT)).astype(np.int8)
+        return QuantityTable(
+            owners=tuple(parse_term(token) for token in self._owners),
+            names=tuple(self._names),
+            units=tuple(parse_term(token) for token in self._units),
+            symbols=tuple(self._symbols),
+            owner=owner[rows],
+            name=np.array(self._name, dtype=np.int32)[rows],
+            unit=np.array(self._unit, dtype=np.int32)[rows],
+            symbol=np.array(self._symbol, dtype=np.int32)[rows],
+            dtype=dtype,
+            value=value,
+            text=text,
+        )
+
+
+def extract_quantities(graph: Graph) -> QuantityTable:
+    """All ``sdata:hasQuantity`` AQVs of ``graph`` as a :class:`QuantityTable`."""
+    extractor = QuantityExtractor()
+    extractor.add_graph(graph)
+    return extractor.table()
+
+
+def load_quantities(paths: Iterable[Path]) -> QuantityTable:
+    """Extract from RDF files; N-Triples files are streamed line by line."""
+    return load_paths(QuantityExtractor(), paths).table()
+
+
+# sdata:dtype -> (value predicate, literal datatype or None for a plain string)
+_WRITE_AS = {
+    "float": (QUDT_NUMERIC_VALUE, XSD + "double"),
+    "int": (QUDT_NUMERIC_VALUE, XSD + "integer"),
+    "bool": (QUDT_VALUE, XSD + "boolean"),
+    "timestamp": (QUDT_VALUE, XSD + "dateTime"),
+    "uri": (QUDT_VALUE, XSD + "anyURI"),
+    "str": (QUDT_VALUE, None),
+}
+_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"})
+_PREFIXES = {"sdata": str(SDATA), "qudt": QUDT, "xsd": XSD, "rdf": str(RDF)}
+# Characters an N-Triples/Turtle IRIREF cannot hold unescaped.
+_BAD_IRI = re.compile(r'[\x00-\x20<>"{}|^`\\]')
+
+
+def _quoted(text) -> str:
+    return '"' + str(text).translate(_ESCAPES) + '"'
+
+
+def _iri(value, prefixed: bool = False) -> str:
+    if isinstance(value, BNode):
+        return term_token(value)
+    value = str(value)
+    bad = _BAD_IRI.search(value)
+    if bad:
+        raise ValueError(f"{value!r} is not a valid IRI: it contains {bad.group()!r}")
+    if prefixed:
+        for prefix, namespace in _PREFIXES.items():
+            local = value[len(namespace):]
+            if value.startswith(namespace) and local.isidentifier():
+                return f"{prefix}:{local}"
+    return f"<{value}>"
+
+
+def _broadcast(values, size: int) -> list:
+    """``values`` as a list of ``size`` entries (scalars and ``None`` are repeated)."""
+    if values is None or isinstance(values, (str, Node)) or np.ndim(values) == 0:
+        return [values] * size
+    if len(values) != size:
+        raise ValueError(f"column has {len(values)} entries, expected {size}")
+    return values.tolist() if isinstance(values, np.ndarray) else list(values)
+
+
+def _encoded(column: list, encode) -> list:
+    """Apply ``encode`` once per distinct entry of ``column`` (``None`` stays ``None``)."""
+    lookup = {value: encode(value) for value in set(column) if value is not None}
+    lookup[None] = None
+    return [lookup[value] for value in column]
+
+
+def _lexical(value, dtype: str) -> str | None:
+    if value is None or value != value:  # None or NaN/NaT
+        return None
+    if dtype == "float":
+        return _double(float(value))
+    if dtype == "int":
+        return str(int(value))
+    if dtype == "bool":
+        return "true" if value in (True, 1, "true", "1") else "false"
+    if dtype == "timestamp" and isinstance(value, (np.datetime64, datetime)):
+        return str(np.datetime64(value, "us"))
+    return str(value)
+
+
+def skolem_iri(owner: str, name: str, ordinal: int = 0, base: str = DEFAULT_GENID, source: str = "") -> str:
+    """Deterministic IRI of the ``ordinal``-th AQV called ``name`` of the IRI ``owner`` in ``source``."""
+    key = f"{owner}\x00{name}\x00{ordinal}" + (f"\x00{source}" if source else "")
+    return base + hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+
+def _skolem_tokens(keys: list[str], base: str) -> list[str]:
+    """``<iri>`` tokens of :func:`skolem_iri` for a batch of ``owner\\x00name\\x00ordinal[\\x00source]`` keys."""
+    blake2b = hashlib.blake2b
+    return [f"<{base}{blake2b(key.encode(), digest_size=16).hexdigest()}>" for key in keys]
+
+
+def _value_tails(values: list, dtypes: list[str], value_tail, float_tail: tuple[str, str]) -> list[str]:
+    """``value_tail`` of every row; all-``float`` chunks are written between the halves of ``float_tail``."""
+    if dtypes.count("float") < len(dtypes):
+        return list(map(value_tail, values, dtypes))
+    head, foot = float_tail
+    return ["" if value is None or value != value else head + _double(float(value)) + foot for value in values]
+
+
+def write_quantities(
+    out: TextIO,
+    owners,
+    names,
+    values,
+    *,
+    units=None,
+    symbols=None,
+    dtypes="float",
+    format: str = "nt",
+    base: str = DEFAULT_GENID,
+    source: str = "",
+    chunk_size: int = 65_536,
+) -> int:
+    """Write AQVs attached via ``sdata:hasQuantity`` to ``out``; return how many.
+
+    The inverse of :class:`QuantityExtractor`. Every argument is a NumPy array
+    or sequence of one length, or a scalar repeated for every row: ``owners``
+    are IRIs (strings or nodes), ``units`` QUDT unit IRIs, ``symbols``
+    ``sdata:unitSymbol`` strings and ``dtypes`` ``sdata:dtype`` names. ``None``
+    and NaN entries are left out, rows without owner or name are skipped.
+    ``float``/``int`` values become ``qudt:numericValue``, everything else a
+    typed ``qudt:value``. Owner and unit IRIs containing spaces or other
+    characters N-Triples does not allow raise :class:`ValueError`.
+
+    Instead of blank nodes each AQV is named by :func:`skolem_iri` of its
+    owner, its name and how many AQVs of that owner and name precede it in
+    this call, so the same input always produces the same triples. The count
+    restarts with every call: files that are merged and hold AQVs of the
+    same owner and name need distinct ``source`` keys (a file name or batch
+    id, mixed into the IRI), otherwise their AQVs share IRIs and are taken as
+    the same AQV. ``format`` is ``"nt"`` or ``"turtle"``; output goes to
+    ``out`` every ``chunk_size`` rows without building a graph.
+    """
+    if format not in ("nt", "turtle"):
+        raise ValueError(f"unsupported format {format!r}, expected 'nt' or 'turtle'")
+    turtle = format == "turtle"
+    size = max((len(c) for c in (owners, names, values) if np.ndim(c) and not isinstance(c, str)), default=1)
+    owners, names, values, units, symbols, dtypes = (
+        _broadcast(column, size) for column in (owners, names, values, units, symbols, dtypes)
+    )
+    unknown = set(dtypes) - set(_WRITE_AS) - {None}
+    if unknown:
+        raise ValueError(f"unknown sdata:dtype {sorted(map(str, unknown))}, expected one of {', '.join(DTYPES)}")
+
+    iri = (lambda value: _iri(value, prefixed=True)) if turtle else _iri
+    if turtle:
+        out.write("".join(f"@prefix {prefix}: <{namespace}> .\n" for prefix, namespace in _PREFIXES.items()) + "\n")
+
+        def tail(predicate: str, obj: str) -> str:
+            return f" ;\n    {predicate} {obj}"
+    else:
+
+        def tail(predicate: str, obj: str) -> str:
+            return f" {predicate} {obj} .\n"
+
+    has_quantity, aqv_class = iri(SDATA.hasQuantity), iri(SDATA.AttributeQuantityValue)
+    type_tail = f" a {aqv_class}" if turtle else tail(iri(RDF.type), aqv_class)
+    name_p, symbol_p, unit_p, dtype_p = (iri(node) for node in (SDATA.name, SDATA.unitSymbol, QUDT_UNIT, SDATA.dtype))
+    value_as = {
+        dtype: (iri(predicate), f"^^{iri(datatype)}" if datatype else "", dtype in ("float", "int", "bool"))
+        for dtype, (predicate, datatype) in _WRITE_AS.items()
+    }
+
+    def value_tail(value, dtype: str) -> str:
+        lexical = _lexical(value, dtype)
+        if lexical is None:
+            return ""
+        predicate, suffix, numeric = value_as[dtype]
+        return tail(predicate, f'"{lexical}"{suffix}' if numeric else _quoted(lexical) + suffix)
+
+    float_tail = tuple(value_tail(0.0, "float").split("0.0", 1))
+
+    ordinals: dict[tuple[str, str], int] = {}
+    written = 0
+    for start in range(0, size, chunk_size):
+        stop = min(start + chunk_size, size)
+        owner_column = owners[start:stop]
+        name_column = names[start:stop]
+        dtype_column = [dtype or "float" for dtype in dtypes[start:stop]]
+        rows = zip(
+            owner_column,
+            _encoded(owner_column, iri),
+            name_column,
+            _encoded(name_column, lambda name: tail(name_p, _quoted(name))),
+            _value_tails(values[start:stop], dtype_column, value_tail, float_tail),
+            _encoded(symbols[start:stop], lambda symbol: tail(symbol_p, _quoted(symbol))),
+            _encoded(units[start:stop], lambda unit: tail(unit_p, iri(unit))),
+            _encoded(dtype_column, lambda dtype: tail(dtype_p, _quoted(dtype))),
+        )
+        rows = [row for row in rows if row[1] is not None and row[2] is not None]
+        keys = []
+        suffix = f"\x00{source}" if source else ""
+        for row in rows:
+            key = row[1], row[2]
+            ordinal = ordinals.get(key, 0)
+            ordinals[key] = ordinal + 1
+            keys.append(f"{row[0]}\x00{row[2]}\x00{ordinal}{suffix}")
+        rows = zip(_skolem_tokens(keys, base), rows)
+        if turtle:
+            lines = [
+                f"{owner} {has_quantity} {aqv} .\n{aqv}{type_tail}{name_tail}{value}{symbol or ''}{unit or ''}"
+                f"{dtype} .\n\n"
+                for aqv, (_, owner, _, name_tail, value, symbol, unit, dtype) in rows
+            ]
+        else:
+            lines = [
+                f"{owner} {has_quantity} {aqv} .\n{aqv}{type_tail}{aqv}{name_tail}"
+                f"{aqv if value else ''}{value}{aqv if symbol else ''}{symbol or ''}"
+                f"{aqv if unit else ''}{unit or ''}{aqv}{dtype}"
+                for aqv, (_, owner, _, name_tail, value, symbol, unit, dtype) in rows
+            ]
+        out.write("".join(lines))
+        written += len(lines)
+    return written
+
+
+def write_table(out: TextIO, table: QuantityTable, **kwargs) -> int:
+    """Write a :class:`QuantityTable` back out with :func:`write_quantities`."""
+
+    def decode(codes: np.ndarray, categories: tuple) -> list:
+        return [categories[code] if code >= 0 else None for code in codes.tolist()]
+
+    dtypes = [DTYPES[code] for code in table.dtype.tolist()]
+    values = [
+        text if text is not None and dtype not in ("float", "int") else value
+        for text, value, dtype in zip(table.text.tolist(), table.value.tolist(), dtypes)
+    ]
+    return write_quantities(
+        out,
+        decode(table.owner, table.owners),
+        decode(table.name, table.names),
+        values,
+        units=decode(table.unit, table.units),
+        symbols=decode(table.symbol, table.symbols),
+        dtypes=dtypes,
+        **kwargs,
+    )
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Extract sdata:hasQuantity AQVs as a table.")
+    parser.add_argument("data", type=Path, nargs="+", help="RDF data files (N-Triples files are streamed)")
+    parser.add_argument("--wide", action="store_true", help="Print the owner × name pivot instead of the long table")
+    parser.add_argument("--names", help="Comma-separated names for --wide (default: all)")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv if argv is not None else sys.argv[1:])
+    table = load_quantities(args.data)
+    if args.wide:
+        owners, columns = table.pivot(args.names.split(",") if args.names else None)
+        print("\t".join(["owner", *columns]))
+        for row, owner in enumerate(owners):
+            print("\t".join([str(owner), *(str(column[row]) for column in columns.values())]))
+        return 0
+
+    print("owner\tname\tvalue\tunit\tdtype")
+    for row in range(len(table)):
+        value = table.text[row] if table.text[row] is not None else _double(float(table.value[row]))
+        unit = table.units[table.unit[row]] if table.unit[row] >= 0 else ""
+        symbol = f" ({table.symbols[table.symbol[row]]})" if table.symbol[row] >= 0 else ""
+        print(
+            f"{table.owners[table.owner[row]]}\t{table.names[table.name[row]]}\t{value}\t{unit}{symbol}"
+            f"\t{DTYPES[table.dtype[row]]}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
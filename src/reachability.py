@@ -0,0 +1,267 @@
+"""Precomputed reachability labels for chain-of-custody queries.
+
+"Did material from supplier X end up in product Y?" asks whether Y is
+downstream of X in the flow graph of :mod:`src.lineage`. Walking the graph
+for every such check is wasteful: most answers are "no", and those can be
+decided from labels alone. :class:`ReachabilityIndex` gives every node, for
+each of three topological orders (by level and two depth-first
+post-orders), an interval ``[low, high]`` where ``high`` is
+the node's rank and ``low`` the smallest rank among its ancestors (interval
+labels in the style of GRAIL). If ``u`` reaches ``v`` then ``u``'s interval lies
+inside ``v``'s in every order, so a failed containment test is an exact
+"no" in a few array reads; otherwise a depth-first search runs that skips
+every node whose interval is not inside ``v``'s::
+
+    index = ReachabilityIndex.from_graph(graph)
+    index.reaches(EX_ZUG.coil, EX_ZUG.ergebnis)        # True
+    index.reaches_any(lots_of_supplier_x, product_y)   # any lot upstream of the product?
+
+Appending process steps keeps the labels valid without a rebuild:
+:meth:`ReachabilityIndex.add` gives a new node the next rank and only widens
+the intervals of the new edges' targets and, if needed, their descendants.
+Nodes on cycles get an interval spanning everything, which is always sound.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable
+from pathlib import Path
+
+import numpy as np
+from rdflib import Graph, Literal
+from rdflib.term import Node
+
+from src.lineage import FLOW, LineageGraph, gather_edges, load_lineage
+from src.ntriples import token_of
+
+UNBOUNDED = 2**62
+
+# Levels up to this size are labelled in Python; larger ones with NumPy.
+SCALAR_LEVEL = 64
+
+
+def _level_label(lineage: LineageGraph) -> tuple[np.ndarray, np.ndarray]:
+    """``(low, high)`` from a level-synchronous topological sort (Kahn's algorithm).
+
+    Nodes of level ``l`` (longest path from a source) are ranked after all
+    earlier levels. Nodes never released are on (or downstream of) a cycle
+    and keep the unbounded interval ``[-1, UNBOUNDED]``.
+    """
+    size = len(lineage)
+    down_ptr, down_idx, up_ptr, up_idx = lineage.down_ptr, lineage.down_idx, lineage.up_ptr, lineage.up_idx
+    indegree = np.diff(up_ptr)
+    low = np.full(size, -1, dtype=np.int64)
+    high = np.full(size, UNBOUNDED, dtype=np.int64)
+    low_view = memoryview(low)
+    up_ptr_view, up_idx_view = memoryview(up_ptr), memoryview(up_idx)
+    down_ptr_view, down_idx_view = memoryview(down_ptr), memoryview(down_idx)
+    indegree_view = memoryview(indegree)
+
+    frontier = np.flatnonzero(indegree == 0)
+    offset = 0
+    while len(frontier):
+        high[frontier] = offset + np.arange(len(frontier), dtype=np.int64)
+        offset += len(frontier)
+        if len(frontier) <= SCALAR_LEVEL:
+            following = []
+            for v in frontier.tolist():
+                best = int(high[v])
+                for u in up_idx_view[up_ptr_view[v] : up_ptr_view[v + 1]]:
+                    if low_view[u] < best:
+                        best = low_view[u]
+                low_view[v] = best
+                for w in down_idx_view[down_ptr_view[v] : down_ptr_view[v + 1]]:
+                    indegree_view[w] -= 1
+                    if indegree_view[w] == 0:
+                        following.append(w)
+            frontier = np.array(following, dtype=np.int64)
+            continue
+        low[frontier] = high[frontier]
+        child, parent = gather_edges(up_ptr, up_idx, frontier)
+        if len(child):
+            # child is grouped by frontier position, so a segmented min gives each node's parent minimum.
+            starts = np.flatnonzero(np.concatenate(([True], child[1:] != child[:-1])))
+            heads = child[starts]
+            low[heads] = np.minimum(low[heads], np.minimum.reduceat(low[parent], starts))
+        _, reached = gather_edges(down_ptr, down_idx, frontier)
+        reached = np.sort(reached)
+        if len(reached):
+            starts = np.flatnonzero(np.concatenate(([True], reached[1:] != reached[:-1])))
+            targets = reached[starts]
+            indegree[targets] -= np.diff(np.append(starts, len(reached)))
+            frontier = targets[indegree[targets] == 0]
+        else:
+            frontier = reached
+    return low, high
+
+
+def _postorder_label(lineage: LineageGraph, released: np.ndarray, descending: bool) -> tuple[np.ndarray, np.ndarray]:
+    """``(low, high)`` from a depth-first post-order over the parents of the ``released`` (acyclic) nodes.
+
+    A node finishes after all of its ancestors, so its rank bounds theirs;
+    ``descending`` visits roots and parents in reverse id order for a second,
+    independent labelling.
+    """
+    size = len(lineage)
+    ptr, idx = memoryview(lineage.up_ptr), memoryview(lineage.up_idx)
+    low = np.full(size, -1, dtype=np.int64)
+    high = np.full(size, UNBOUNDED, dtype=np.int64)
+    low_view, high_view = memoryview(low), memoryview(high)
+    visited = bytearray(released == 0)  # unreleased nodes count as visited and are never entered
+    roots = np.flatnonzero(released)
+    rank = 0
+    for root in (roots[::-1] if descending else roots).tolist():
+        if visited[root]:
+            continue
+        visited[root] = 1
+        stack, cursor = [root], [0]
+        while stack:
+            v = stack[-1]
+            start, end = ptr[v], ptr[v + 1]
+            i = cursor[-1]
+            if i < end - start:
+                cursor[-1] = i + 1
+                w = idx[end - 1 - i] if descending else idx[start + i]
+                if not visited[w]:
+                    visited[w] = 1
+                    stack.append(w)
+                    cursor.append(0)
+                continue
+            stack.pop()
+            cursor.pop()
+            best = rank
+            for u in idx[start:end]:
+                if low_view[u] < best:
+                    best = low_view[u]
+            low_view[v], high_view[v] = best, rank
+            rank += 1
+    return low, high
+
+
+def _labels(lineage: LineageGraph) -> tuple[np.ndarray, np.ndarray]:
+    """``(low, high)`` arrays of shape ``(3, n)``: level order plus two depth-first post-orders."""
+    level_low, level_high = _level_label(lineage)
+    released = level_high != UNBOUNDED
+    labels = [(level_low, level_high)] + [_postorder_label(lineage, released, d) for d in (False, True)]
+    return np.stack([low for low, _ in labels]), np.stack([high for _, high in labels])
+
+
+class ReachabilityIndex:
+    """Interval labels over a flow graph plus a pruned search for the rest; supports appends."""
+
+    def __init__(self, lineage: LineageGraph):
+        self.lineage = lineage
+        self._ptr, self._idx = memoryview(lineage.down_ptr), memoryview(lineage.down_idx)
+        self._base = len(lineage)
+        self._added: dict[str, int] = {}
+        self._extra: dict[int, list[int]] = {}
+        low, high = _labels(lineage)
+        self._low = [array("q", row.tobytes()) for row in low]
+        self._high = [array("q", row.tobytes()) for row in high]
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> ReachabilityIndex:
+        return cls(LineageGraph.from_graph(graph))
+
+    @classmethod
+    def from_paths(cls, paths: Iterable[Path]) -> ReachabilityIndex:
+        """Build from RDF files; N-Triples files are streamed line by line."""
+        return cls(load_lineage(paths))
+
+    def __len__(self) -> int:
+        return self._base + len(self._added)
+
+    def index_of(self, node: Node | str | int) -> int | None:
+        """Node id of an rdflib term, N-Triples token or id (``None`` if absent)."""
+        if isinstance(node, (int, np.integer)):
+            return int(node) if 0 <= node < len(self) else None
+        found = self.lineage.index_of(node)
+        if found is None and self._added:
+            found = self._added.get(token_of(node))
+        return found
+
+    def _children(self, v: int) -> Iterable[int]:
+        if v < self._base:
+            yield from self._idx[self._ptr[v] : self._ptr[v + 1]]
+        yield from self._extra.get(v, ())
+
+    def _inside(self, u: int, v: int) -> bool:
+        """Whether ``u``'s intervals lie inside ``v``'s in every order (necessary for ``u`` ⇝ ``v``)."""
+        for low, high in zip(self._low, self._high):
+            if low[u] < low[v] or high[u] > high[v]:
+                return False
+        return True
+
+    def _search(self, sources: Iterable[int], v: int) -> bool:
+        stack = [u for u in sources if self._inside(u, v)]
+        seen = set(stack)
+        while stack:
+            for w in self._children(stack.pop()):
+                if w == v:
+                    return True
+                if w not in seen:
+                    seen.add(w)
+                    if self._inside(w, v):
+                        stack.append(w)
+        return False
+
+    def reaches(self, source: Node | int, target: Node | int) -> bool:
+        """Whether ``target`` is ``source`` or downstream of it."""
+        u, v = self.index_of(source), self.index_of(target)
+        if u is None or v is None:
+            return source == target
+        return u == v or self._search((u,), v)
+
+    def reaches_any(self, sources: Iterable[Node], target: Node) -> bool:
+        """Whether ``target`` is downstream of (or one of) ``sources``."""
+        sources = list(sources)
+        v = self.index_of(target)
+        if v is None:
+            return target in sources
+        ids = {idx for idx in map(self.index_of, sources) if idx is not None}
+        return v in ids or self._search(ids, v)
+
+    # ── appends ─────────────────────────────────────────────────────────────
+
+    def _id(self, node: Node) -> int:
+        found = self.index_of(node)
+        if found is None:
+            found = self._added[token_of(node)] = len(self)
+            for low, high in zip(self._low, self._high):
+                low.append(found)  # the next rank: above every existing node
+                high.append(found)
+        return found
+
+    def _link(self, u: int, v: int) -> None:
+        if v in self._children(u) or u == v:
+            return
+        self._extra.setdefault(u, []).append(v)
+        # Restore low[v] <= low[u] and high[v] >= high[u] along every edge below the new one.
+        queue = [(u, v)]
+        while queue:
+            parent, child = queue.pop()
+            changed = False
+            for low, high in zip(self._low, self._high):
+                if low[parent] < low[child]:
+                    low[child] = low[parent]
+                    changed = True
+                if high[parent] > high[child]:
+                    high[child] = high[parent]
+                    changed = True
+            if changed:
+                queue.extend((child, grandchild) for grandchild in self._children(child))
+
+    def add_edge(self, source: Node, target: Node) -> None:
+        """Record that ``target`` is made or derived from ``source`` (flow direction)."""
+        self._link(self._id(source), self._id(target))
+
+    def add(self, triples: Iterable[tuple[Node, Node, Node]]) -> None:
+        """Append the flow triples (``hasInput``, ``hasOutput``, ...) of new process steps."""
+        for s, p, o in triples:
+            forward = FLOW.get(p)  # type: ignore[call-overload]
+            if forward is not None and not isinstance(o, Literal):
+                if forward:
+                    self.add_edge(s, o)
+                else:
+                    self.add_edge(o, s)
@@ -0,0 +1,410 @@
+"""Compile simple SHACL shapes into native Python check functions.
+
+The core shapes only use focus-node targets plus ``sh:minCount``,
+``sh:maxCount``, ``sh:datatype``, ``sh:nodeKind`` and ``sh:minLength`` on
+predicate paths. :func:`compile_shapes` turns each such node shape into a
+:class:`CompiledShape`: a target selector built from rdflib index lookups
+(``graph.subjects(p)``, ``graph.subjects(rdf:type, C)``) and one closure per
+constraint that inspects the values of ``graph.objects(focus, path)``. Node
+shapes using anything else are left to pyshacl, so
+:meth:`CompiledShapes.validate` always reports the same results as a full
+pyshacl run (up to message wording).
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.namespace import RDF, RDFS, SH, XSD
+from rdflib.term import Node
+
+from src import loader
+from src.validation import DEFAULT_SHAPES, ValidationResult, run_pyshacl
+
+# Values -> results for one focus node; the values are those of the path.
+Check = Callable[[Node, list[Node]], list[ValidationResult]]
+
+_SHAPE_KEYS = frozenset(
+    {RDF.type, RDFS.label, RDFS.comment, SH.targetClass, SH.targetSubjectsOf, SH.targetNode, SH.property}
+)
+_PROPERTY_KEYS = frozenset(
+    {
+        SH.path,
+        SH.minCount,
+        SH.maxCount,
+        SH.datatype,
+        SH.nodeKind,
+        SH.minLength,
+        SH.severity,
+        SH.message,
+        SH.name,
+        SH.description,
+        RDFS.label,
+        RDFS.comment,
+    }
+)
+_NODE_KINDS: dict[URIRef, tuple[type, ...]] = {
+    SH.IRI: (URIRef,),
+    SH.BlankNode: (BNode,),
+    SH.Literal: (Literal,),
+    SH.BlankNodeOrIRI: (BNode, URIRef),
+    SH.BlankNodeOrLiteral: (BNode, Literal),
+    SH.IRIOrLiteral: (URIRef, Literal),
+}
+
+
+class _Unsupported(Exception):
+    pass
+
+
+def _single(shapes: Graph, node: Node, predicate: URIRef) -> Node | None:
+    values = list(shapes.objects(node, predicate))
+    if len(values) > 1:
+        raise _Unsupported
+    return values[0] if values else None
+
+
+@dataclass(frozen=True)
+class CompiledProperty:
+    shape: Node
+    path: URIRef
+    checks: tuple[Check, ...]
+
+
+class TripleIndex:
+    """``subjects``/``objects`` lookups from per-predicate dictionaries.
+
+    ``graph.objects`` pays rdflib's per-call context bookkeeping, which
+    dominates validation. The first ``objects`` lookup of a predicate instead
+    reads it once, through the public ``graph.triples((None, p, None))``, into
+    a subject → objects dictionary; the object → subjects direction is only
+    built (by inverting it) when needed. One-off ``subjects`` and ``triples``
+    calls on predicates not read yet go straight to the graph.
+    :meth:`from_triples` fills the dictionaries for all predicates up front,
+    without any graph.
+    """
+
+    def __init__(self, graph: Graph | None = None):
+        self._graph = graph
+        self._forward: dict[Node, dict[Node, dict[Node, int]]] = {}  # p -> s -> {o}
+        self._backward: dict[Node, dict[Node, dict[Node, int]]] = {}  # p -> o -> {s}
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> TripleIndex:
+        return cls(graph)
+
+    @classmethod
+    def from_triples(cls, triples: Iterable[tuple[Node, Node, Node]]) -> TripleIndex:
+        index = cls()
+        forward, backward = index._forward, index._backward
+        for s, p, o in triples:
+            forward.setdefault(p, {}).setdefault(s, {})[o] = 1
+            backward.setdefault(p, {}).setdefault(o, {})[s] = 1
+        return index
+
+    def _read(self, predicate: Node, by_subject: bool) -> dict[Node, dict[Node, int]]:
+        """Index the ``predicate`` triples one way round, inverting the other direction if it is already read."""
+        index: dict[Node, dict[Node, int]] = {}
+        other = (self._backward if by_subject else self._forward).get(predicate)
+        if other is not None:
+            for key, values in other.items():
+                for value in values:
+                    index.setdefault(value, {})[key] = 1
+        elif self._graph is not None:
+            triples = self._graph.triples((None, predicate, None))
+            pairs = ((s, o) for s, _, o in triples) if by_subject else ((o, s) for s, _, o in triples)
+            for key, value in pairs:
+                index.setdefault(key, {})[value] = 1
+        (self._forward if by_subject else self._backward)[predicate] = index
+        return index
+
+    def _by_subject(self, predicate: Node) -> dict[Node, dict[Node, int]]:
+        found = self._forward.get(predicate)
+        return found if found is not None else self._read(predicate, True)
+
+    def _by_object(self, predicate: Node) -> dict[Node, dict[Node, int]]:
+        found = self._backward.get(predicate)
+        return found if found is not None else self._read(predicate, False)
+
+    def graph(self) -> Graph:
+        """The indexed triples as a graph (built on demand for :meth:`from_triples`)."""
+        if self._graph is None:
+            graph = Graph()
+            graph.addN(
+                (s, p, o, graph)
+                for p, by_subject in self._forward.items()
+                for s, objects in by_subject.items()
+                for o in objects
+            )
+            self._graph = graph
+        return self._graph
+
+    def objects(self, subject: Node, predicate: URIRef) -> list[Node]:
+        return list(self._by_subject(predicate).get(subject, ()))
+
+    def _unread(self, predicate: Node) -> bool:
+        """Whether ``predicate`` is only in the graph so far, so a one-off lookup needs no dictionaries."""
+        return self._graph is not None and predicate not in self._forward and predicate not in self._backward
+
+    def subjects(self, predicate: URIRef, obj: Node | None = None) -> set[Node]:
+        if self._unread(predicate):
+            return set(self._graph.subjects(predicate, obj))  # type: ignore[union-attr]
+        by_object = self._by_object(predicate)
+        if obj is not None:
+            return set(by_object.get(obj, ()))
+        return {s for subjects in by_object.values() for s in subjects}
+
+    def triples(self, predicate: URIRef) -> Iterator[tuple[Node, Node, Node]]:
+        """Every ``(s, predicate, o)`` triple."""
+        if self._unread(predicate):
+            yield from self._graph.triples((None, predicate, None))  # type: ignore[union-attr]
+            return
+        for s, objects in self._by_subject(predicate).items():
+            for o in objects:
+                yield s, predicate, o
+
+    def with_subclasses(self, classes: Iterable[URIRef]) -> set[Node]:
+        found: set[Node] = set()
+        stack: list[Node] = list(classes)
+        while stack:
+            cls = stack.pop()
+            if cls not in found:
+                found.add(cls)
+                stack.extend(self.subjects(RDFS.subClassOf, cls))
+        return found
+
+
+@dataclass(frozen=True)
+class CompiledShape:
+    shape: Node
+    target_classes: tuple[URIRef, ...]
+    target_subjects_of: tuple[URIRef, ...]
+    target_nodes: tuple[Node, ...]
+    properties: tuple[CompiledProperty, ...]
+
+    def focus_nodes(self, index: TripleIndex) -> set[Node]:
+        nodes: set[Node] = set(self.target_nodes)
+        for predicate in self.target_subjects_of:
+            nodes.update(index.subjects(predicate))
+        for cls in index.with_subclasses(self.target_classes):
+            nodes.update(index.subjects(RDF.type, cls))
+        return nodes
+
+    def check(self, index: TripleIndex, focus: Node) -> list[ValidationResult]:
+        results: list[ValidationResult] = []
+        for prop in self.properties:
+            values = index.objects(focus, prop.path)
+            for check in prop.checks:
+                found = check(focus, values)
+                if found:
+                    results.extend(found)
+        return results
+
+
+def _compile_property(shapes: Graph, prop: Node) -> CompiledProperty:
+    if any(p not in _PROPERTY_KEYS for p in shapes.predicates(prop)):
+        raise _Unsupported
+    path = _single(shapes, prop, SH.path)
+    if not isinstance(path, URIRef):
+        raise _Unsupported
+    severity = _single(shapes, prop, SH.severity) or SH.Violation
+    custom = _single(shapes, prop, SH.message)
+    qname = shapes.namespace_manager.normalizeUri
+    path_name = qname(path)
+
+    def result(focus: Node, component: URIRef, value: Node | None, message: str) -> ValidationResult:
+        return ValidationResult(
+            focus_node=focus,
+            source_shape=prop,
+            constraint_component=component,
+            result_path=path,
+            value=value,
+            severity=severity,  # type: ignore[arg-type]
+            message=str(custom) if custom is not None else message,
+        )
+
+    checks: list[Check] = []
+
+    min_count = _single(shapes, prop, SH.minCount)
+    if min_count is not None:
+        low = int(min_count)
+
+        def check_min_count(focus: Node, values: list[Node]) -> list[ValidationResult]:
+            if len(values) >= low:
+                return []
+            message = f"Less than {low} values on {focus.n3()}->{path_name}"
+            return [result(focus, SH.MinCountConstraintComponent, None, message)]
+
+        checks.append(check_min_count)
+
+    max_count = _single(shapes, prop, SH.maxCount)
+    if max_count is not None:
+        high = int(max_count)
+
+        def check_max_count(focus: Node, values: list[Node]) -> list[ValidationResult]:
+            if len(values) <= high:
+                return []
+            message = f"More than {high} values on {focus.n3()}->{path_name}"
+            return [result(focus, SH.MaxCountConstraintComponent, None, message)]
+
+        checks.append(check_max_count)
+
+    datatype = _single(shapes, prop, SH.datatype)
+    if datatype is not None:
+        datatype_message = f"Value is not Literal with datatype {qname(datatype)}"
+
+        def datatype_ok(value: Node) -> bool:
+            if not isinstance(value, Literal) or value.ill_typed:
+                return False
+            actual = value.datatype or (RDF.langString if value.language else XSD.string)
+            return actual == datatype
+
+        def check_datatype(focus: Node, values: list[Node]) -> list[ValidationResult]:
+            return [
+                result(focus, SH.DatatypeConstraintComponent, v, datatype_message)
+                for v in values
+                if not datatype_ok(v)
+            ]
+
+        checks.append(check_datatype)
+
+    node_kind = _single(shapes, prop, SH.nodeKind)
+    if node_kind is not None:
+        kinds = _NODE_KINDS.get(node_kind)  # type: ignore[arg-type]
+        if kinds is None:
+            raise _Unsupported
+        kind_message = f"Value is not of Node Kind {qname(node_kind)}"
+
+        def check_node_kind(focus: Node, values: list[Node]) -> list[ValidationResult]:
+            return [
+                result(focus, SH.NodeKindConstraintComponent, v, kind_message)
+                for v in values
+                if not isinstance(v, kinds)
+            ]
+
+        checks.append(check_node_kind)
+
+    min_length = _single(shapes, prop, SH.minLength)
+    if min_length is not None:
+        shortest = int(min_length)
+        length_message = f"String length not >= {shortest}"
+
+        def check_min_length(focus: Node, values: list[Node]) -> list[ValidationResult]:
+            return [
+                result(focus, SH.MinLengthConstraintComponent, v, length_message)
+                for v in values
+                if isinstance(v, BNode) or len(str(v)) < shortest
+            ]
+
+        checks.append(check_min_length)
+
+    return CompiledProperty(shape=prop, path=path, checks=tuple(checks))
+
+
+def compile_shape(shapes: Graph, shape: Node) -> CompiledShape | None:
+    """Compile ``shape`` or return ``None`` if it uses unsupported constructs."""
+    if any(p not in _SHAPE_KEYS for p in shapes.predicates(shape)):
+        return None
+    try:
+        properties = tuple(_compile_property(shapes, prop) for prop in shapes.objects(shape, SH.property))
+    except _Unsupported:
+        return None
+
+    def iris(predicate: URIRef) -> tuple[URIRef, ...]:
+        return tuple(sorted(o for o in shapes.objects(shape, predicate) if isinstance(o, URIRef)))
+
+    return CompiledShape(
+        shape=shape,
+        target_classes=iris(SH.targetClass),
+        target_subjects_of=iris(SH.targetSubjectsOf),
+        target_nodes=tuple(shapes.objects(shape, SH.targetNode)),
+        properties=properties,
+    )
+
+
+@dataclass(frozen=True)
+class CompiledShapes:
+    """Compiled node shapes plus the ones that still need pyshacl."""
+
+    shapes: Graph
+    compiled: tuple[CompiledShape, ...]
+    fallback: tuple[Node, ...]
+
+    def validate(
+        self, data: Graph | TripleIndex, focus_nodes: Iterable[Node] | None = None
+    ) -> list[ValidationResult]:
+        """Validate ``data``; with ``focus_nodes``, only those nodes are checked.
+
+        Restricting focus nodes applies to compiled shapes only; fallback
+        shapes are always validated by pyshacl over the whole graph.
+        """
+        only = set(focus_nodes) if focus_nodes is not None else None
+        index = data if isinstance(data, TripleIndex) else TripleIndex.from_graph(data)
+        results: list[ValidationResult] = []
+        for shape in self.compiled:
+            targets = shape.focus_nodes(index)
+            if only is not None:
+                targets &= only
+            for focus in targets:
+                results.extend(shape.check(index, focus))
+        if self.fallback:
+            results.extend(self._fallback(index.graph()))
+        return results
+
+    def _fallback(self, graph: Graph) -> list[ValidationResult]:
+        sources = set(self.fallback)
+        for shape in self.fallback:
+            sources.update(self.shapes.objects(shape, SH.property))
+        return [r for r in run_pyshacl(graph, self.shapes) if r.source_shape in sources]
+
+
+def compile_shapes(shapes: Graph) -> CompiledShapes:
+    compiled: list[CompiledShape] = []
+    fallback: list[Node] = []
+    node_shapes = set(shapes.subjects(RDF.type, SH.NodeShape))
+    for target in (SH.targetClass, SH.targetSubjectsOf, SH.targetObjectsOf, SH.targetNode):
+        node_shapes.update(shapes.subjects(target, None))
+    for shape in sorted(node_shapes, key=str):
+        if (shape, SH.deactivated, Literal(True)) in shapes:
+            continue
+        result = compile_shape(shapes, shape)
+        if result is None:
+            fallback.append(shape)
+        else:
+            compiled.append(result)
+    return CompiledShapes(shapes=shapes, compiled=tuple(compiled), fallback=tuple(fallback))
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Validate a data graph with compiled SHACL shapes.")
+    parser.add_argument("data", type=Path, nargs="+", help="Turtle data graph(s)")
+    parser.add_argument("--shapes", type=Path, default=DEFAULT_SHAPES)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv if argv is not None else sys.argv[1:])
+    compiled = compile_shapes(loader.load_graph(args.shapes))
+    graph = loader.load_merged(*args.data)
+
+    start = time.perf_counter()
+    results = compiled.validate(graph)
+    seconds = time.perf_counter() - start
+
+    for result in sorted(results, key=lambda r: (str(r.focus_node), str(r.result_path))):
+        print(f"  ✗ {result.focus_node} {result.result_path}: {result.message}")
+    print(
+        f"{len(compiled.compiled)} compiled / {len(compiled.fallback)} pyshacl shape(s),"
+        f" {len(graph)} triples, {len(results)} result(s) in {seconds:.3f} s"
+    )
+    return 1 if results else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,222 @@
+"""Sharded, multi-process SHACL validation of large N-Triples dumps.
+
+The core shapes only read a focus node's own outgoing triples (see
+:class:`~src.validation.ShapeIndex`), so the data can be split by subject:
+:func:`partition_ntriples` streams the input once and appends every line to
+``shard-<crc32(subject) % n>.nt``. ``rdfs:subClassOf`` lines, which
+``sh:targetClass`` needs everywhere, go to a shared file that every shard
+loads as well. Each worker reads one shard straight into a
+:class:`~src.shape_compiler.TripleIndex` (rdflib's N-Triples parser and
+store are the bottleneck at this scale), validates it with the compiled
+shapes (pyshacl for the rest) and returns its results, so a worker never
+holds more than one shard in memory.
+
+Blank nodes are reported under their N-Triples labels and results are sorted
+before being written, so the merged ``sh:ValidationReport`` does not depend
+on the number of shards or workers.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import zlib
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from pathlib import Path
+from typing import TextIO
+
+from rdflib import Graph
+from rdflib.namespace import RDFS, SH
+
+from src import loader
+from src.ntriples import read_ntriples, split_line
+from src.shape_compiler import TripleIndex, compile_shapes
+from src.validation import DEFAULT_SHAPES, ShapeIndex, ValidationResult, report_graph
+
+SHARD_BYTES = 64 * 1024 * 1024
+_SUBCLASS_TOKEN = f"<{RDFS.subClassOf}>"
+
+_worker_shapes: Graph | None = None
+
+
+def shard_of(token: str, shards: int) -> int:
+    """Stable shard number of an N-Triples subject token such as ``<iri>``."""
+    return zlib.crc32(token.encode("utf-8")) % shards
+
+
+def _relabel(token: str, prefix: str) -> str:
+    return f"_:{prefix}{token[2:]}" if prefix and token.startswith("_:") else token
+
+
+def partition_ntriples(
+    sources: Iterable[TextIO], directory: Path, shards: int
+) -> tuple[list[Path], Path, int]:
+    """Split N-Triples ``sources`` into ``shards`` files by subject hash.
+
+    Blank node labels are file-scoped in N-Triples, so with several sources
+    the labels of the second and later ones get an ``f<i>_`` prefix. Returns
+    ``(shard paths, shared path, triples)``.
+    """
+    paths = [directory / f"shard-{i}.nt" for i in range(shards)]
+    shared_path = directory / "shared.nt"
+    outputs = [path.open("w", encoding="utf-8") for path in paths]
+    triples = 0
+    try:
+        with shared_path.open("w", encoding="utf-8") as shared:
+            for number, source in enumerate(sources):
+                prefix = f"f{number}_" if number else ""
+                for line_number, line in enumerate(source, 1):
+                    parts = split_line(line, line_number)
+                    if parts is None:
+                        continue
+                    subject, predicate, rest = parts
+                    if prefix:
+                        subject = _relabel(subject, prefix)
+                        rest = _relabel(rest, prefix)
+                    line = f"{subject} {predicate} {rest}\n"
+                    triples += 1
+                    if predicate == _SUBCLASS_TOKEN:
+                        shared.write(line)
+                    else:
+                        outputs[shard_of(subject, shards)].write(line)
+    finally:
+        for output in outputs:
+            output.close()
+    return paths, shared_path, triples
+
+
+def _init_worker(shape_triples: tuple, namespaces: tuple) -> None:
+    global _worker_shapes
+    shapes = Graph()
+    for prefix, namespace in namespaces:
+        shapes.bind(prefix, namespace)
+    shapes.addN((s, p, o, shapes) for s, p, o in shape_triples)
+    _worker_shapes = shapes
+
+
+def _validate_shard(number: int, shards: int, shard: Path, shared: Path) -> list[ValidationResult]:
+    assert _worker_shapes is not None, "worker not initialised"
+    shapes = Graph()
+    for prefix, namespace in _worker_shapes.namespaces():
+        shapes.bind(prefix, namespace)
+    # sh:targetNode focus nodes are validated by the shard owning their IRI only.
+    shapes.addN(
+        (s, p, o, shapes)
+        for s, p, o in _worker_shapes
+        if p != SH.targetNode or shard_of(o.n3(), shards) == number
+    )
+
+    with shared.open(encoding="utf-8") as first, shard.open(encoding="utf-8") as second:
+        index = TripleIndex.from_triples(read_ntriples(chain(first, second)))
+    return compile_shapes(shapes).validate(index)
+
+
+def sort_key(result: ValidationResult) -> tuple[str, ...]:
+    return tuple(
+        term.n3() if term is not None else ""
+        for term in (
+            result.focus_node,
+            result.result_path,
+            result.constraint_component,
+            result.value,
+            result.source_shape,
+        )
+    )
+
+
+def validate_sharded(
+    paths: Iterable[Path],
+    shapes: Graph,
+    *,
+    jobs: int = 1,
+    shards: int | None = None,
+    work_dir: Path | None = None,
+) -> list[ValidationResult]:
+    """Validate N-Triples ``paths`` shard by shard; return sorted results.
+
+    Non-N-Triples inputs are converted through :func:`src.loader.load_graph`
+    first, which holds that one file in memory. ``shards`` defaults to one
+    per ``SHARD_BYTES`` of input, but at least ``jobs``.
+    """
+    index = ShapeIndex.from_graph(shapes)
+    if not index.local or index.object_targets:
+        raise ValueError("sharded validation needs shapes that only read the focus node's own triples")
+
+    paths = [Path(p) for p in paths]
+    with tempfile.TemporaryDirectory(dir=work_dir, prefix="sdata-shards-") as tmp:
+        directory = Path(tmp)
+        inputs = []
+        for number, path in enumerate(paths):
+            if path.suffix == ".nt":
+                inputs.append(path)
+                continue
+            converted = directory / f"input-{number}.nt"
+            loader.load_graph(path).serialize(converted, format="nt", encoding="utf-8")
+            inputs.append(converted)
+
+        if shards is None:
+            total = sum(path.stat().st_size for path in inputs)
+            shards = max(jobs, math.ceil(total / SHARD_BYTES), 1)
+        sources = [path.open(encoding="utf-8") for path in inputs]
+        try:
+            shard_paths, shared, _ = partition_ntriples(sources, directory, shards)
+        finally:
+            for source in sources:
+                source.close()
+
+        initargs = (tuple(shapes), tuple(shapes.namespaces()))
+        tasks = [(number, shards, path, shared) for number, path in enumerate(shard_paths)]
+        if jobs <= 1:
+            _init_worker(*initargs)
+            per_shard = [_validate_shard(*task) for task in tasks]
+        else:
+            # Spawned workers: forking a process that already runs threads can deadlock.
+            spawn = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(
+                max_workers=jobs, mp_context=spawn, initializer=_init_worker, initargs=initargs
+            ) as pool:
+                per_shard = list(pool.map(_validate_shard, *zip(*tasks)))
+
+    merged = dict.fromkeys(result for results in per_shard for result in results)
+    return sorted(merged, key=sort_key)
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Validate large N-Triples dumps in parallel shards.")
+    parser.add_argument("data", type=Path, nargs="+", help="N-Triples (or other RDF) data files")
+    parser.add_argument("--shapes", type=Path, default=DEFAULT_SHAPES)
+    parser.add_argument("-j", "--jobs", type=int, default=0, help="Worker processes (0 = one per CPU core)")
+    parser.add_argument("--shards", type=int, help=f"Number of shards (default: one per {SHARD_BYTES >> 20} MiB)")
+    parser.add_argument("--report", default="-", help="Write the Turtle validation report here ('-' for stdout)")
+    parser.add_argument("--work-dir", type=Path, help="Directory for temporary shard files")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv if argv is not None else sys.argv[1:])
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    start = time.perf_counter()
+    results = validate_sharded(
+        args.data, loader.load_graph(args.shapes), jobs=jobs, shards=args.shards, work_dir=args.work_dir
+    )
+    seconds = time.perf_counter() - start
+
+    report = report_graph(results, label="report").serialize(format="turtle")
+    if args.report == "-":
+        sys.stdout.write(report)
+    else:
+        Path(args.report).write_text(report, encoding="utf-8")
+    print(f"{len(results)} result(s) in {seconds:.2f} s ({jobs} job{'s' if jobs != 1 else ''})", file=sys.stderr)
+    return 1 if results else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
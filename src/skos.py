@@ -0,0 +1,271 @@
+"""Precomputed SKOS vocabulary index for the sdata concept schemes.
+
+:class:`SkosIndex` scans a vocabulary graph once for ``skos:ConceptScheme``,
+``skos:inScheme``/``skos:hasTopConcept``, ``skos:broader``/``skos:narrower``,
+``skos:Collection`` members and labels, numbers the concepts and keeps the
+reflexive-transitive broader and narrower closures as Python ``int`` bitsets
+(as :class:`~src.hierarchy.ClassHierarchy` does for classes). Scheme
+membership, ``skos:broader*`` tests, depths and labels are then dictionary
+lookups and bit tests. :meth:`SkosIndex.load` persists the index next to the
+cached graphs, so plotting and runtime checks of ``sms:hasStateValue`` only
+pay for unpickling::
+
+    skos = SkosIndex.load()                         # material state + R-strategies
+    skos.in_scheme(SMS["method.Corrosion"], SMS["method-values"])      # True
+    skos.is_broader(SMS["method.Degradation"], SMS["method.Corrosion"])  # True
+    skos.label(SMS["origin.Virgin"], "de")          # "Primär"
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+from rdflib import Graph, Literal, URIRef
+from rdflib.namespace import RDF, RDFS, SKOS
+from rdflib.term import Node
+
+from src import loader
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_SOURCES = (ROOT / "sdata-material-state.ttl", ROOT / "sdata-r-strategies.ttl")
+
+
+def _bits(mask: int) -> Iterable[int]:
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def transitive_closure(edges: Sequence[Sequence[int]]) -> tuple[int, ...]:
+    """Reflexive closure of ``edges`` (node -> successor ids) as one ``int`` bitset per node."""
+    closure: list[int | None] = [None] * len(edges)
+    for start in range(len(edges)):
+        # Iterative post-order walk; nodes already on the path break cycles.
+        stack, on_path = [start], {start}
+        while stack:
+            node = stack[-1]
+            pending = [n for n in edges[node] if closure[n] is None and n not in on_path]
+            if pending:
+                on_path.update(pending)
+                stack.extend(pending)
+                continue
+            stack.pop()
+            if closure[node] is None:
+                mask = 1 << node
+                for n in edges[node]:
+                    mask |= closure[n] or 1 << n
+                closure[node] = mask
+    return tuple(closure)  # type: ignore[arg-type]
+
+
+def local_name(iri: Node) -> str:
+    text = str(iri)
+    return text.rsplit("#", 1)[1] if "#" in text else text.rsplit("/", 1)[-1]
+
+
+class SkosIndex:
+    """Concept schemes, collections and ``skos:broader`` closures of a vocabulary.
+
+    Closure queries are reflexive unless ``include_self=False`` is passed;
+    unknown concepts raise ``KeyError``.
+    """
+
+    def __init__(
+        self,
+        schemes: dict[URIRef, Iterable[URIRef]],
+        top_concepts: dict[URIRef, Iterable[URIRef]],
+        broader: Iterable[tuple[URIRef, URIRef]],
+        collections: dict[URIRef, Iterable[URIRef]] | None = None,
+        labels: dict[URIRef, Iterable[tuple[str, str]]] | None = None,
+        concepts: Iterable[URIRef] = (),
+    ):
+        """Build from ``scheme -> concepts``, ``scheme -> top concepts``, ``(child, parent)`` edges,
+        ``collection -> members``, ``node -> (language, label)`` pairs and extra scheme-less concepts."""
+        top_concepts = {scheme: tuple(sorted(set(top), key=str)) for scheme, top in top_concepts.items()}
+        members = {scheme: set(concepts) | set(top_concepts.get(scheme, ())) for scheme, concepts in schemes.items()}
+        for scheme, top in top_concepts.items():
+            members.setdefault(scheme, set()).update(top)
+        self.schemes: tuple[URIRef, ...] = tuple(sorted(members, key=str))
+        self._top = {scheme: top_concepts.get(scheme, ()) for scheme in self.schemes}
+
+        edges = [(child, parent) for child, parent in broader if child != parent]
+        concepts = set(concepts).union(*members.values()) | {node for edge in edges for node in edge}
+        self.concepts: tuple[URIRef, ...] = tuple(sorted(concepts, key=str))
+        self._ids = {concept: idx for idx, concept in enumerate(self.concepts)}
+        self._scheme_members = {
+            scheme: sum(1 << self._ids[concept] for concept in members[scheme]) for scheme in self.schemes
+        }
+
+        parents: list[set[int]] = [set() for _ in self.concepts]
+        for child, parent in edges:
+            parents[self._ids[child]].add(self._ids[parent])
+        self._parents = tuple(tuple(sorted(p)) for p in parents)
+        children: list[list[int]] = [[] for _ in self.concepts]
+        for child, child_parents in enumerate(self._parents):
+            for parent in child_parents:
+                children[parent].append(child)
+        self._children = tuple(tuple(c) for c in children)
+        self._ancestors = transitive_closure(self._parents)
+        self._descendants = transitive_closure(self._children)
+
+        # Depth: shortest skos:broader distance to a concept without broader concepts.
+        depth = [0 if not p else -1 for p in self._parents]
+        frontier = [idx for idx, d in enumerate(depth) if d == 0]
+        while frontier:
+            following = []
+            for idx in frontier:
+                for child in self._children[idx]:
+                    if depth[child] < 0:
+                        depth[child] = depth[idx] + 1
+                        following.append(child)
+            frontier = following
+        self._depth = tuple(depth)
+
+        self.collections: dict[URIRef, tuple[URIRef, ...]] = {
+            collection: tuple(sorted(set(items), key=str)) for collection, items in (collections or {}).items()
+        }
+        self._labels: dict[URIRef, tuple[tuple[str, str], ...]] = {
+            node: tuple(sorted(set(pairs))) for node, pairs in (labels or {}).items()
+        }
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> SkosIndex:
+        """Index every SKOS scheme, collection and concept of ``graph``."""
+        schemes: dict[URIRef, set[URIRef]] = {
+            s: set() for s in graph.subjects(RDF.type, SKOS.ConceptScheme) if isinstance(s, URIRef)
+        }
+        for concept, scheme in graph.subject_objects(SKOS.inScheme):
+            if isinstance(concept, URIRef) and isinstance(scheme, URIRef):
+                schemes.setdefault(scheme, set()).add(concept)
+        top: dict[URIRef, set[URIRef]] = {}
+        for scheme, concept in graph.subject_objects(SKOS.hasTopConcept):
+            if isinstance(scheme, URIRef) and isinstance(concept, URIRef):
+                top.setdefault(scheme, set()).add(concept)
+        for concept, scheme in graph.subject_objects(SKOS.topConceptOf):
+            if isinstance(scheme, URIRef) and isinstance(concept, URIRef):
+                top.setdefault(scheme, set()).add(concept)
+        broader = {
+            (child, parent)
+            for child, parent in graph.subject_objects(SKOS.broader)
+            if isinstance(child, URIRef) and isinstance(parent, URIRef)
+        }
+        broader |= {
+            (child, parent)
+            for parent, child in graph.subject_objects(SKOS.narrower)
+            if isinstance(child, URIRef) and isinstance(parent, URIRef)
+        }
+        collections: dict[URIRef, set[URIRef]] = {
+            c: set() for c in graph.subjects(RDF.type, SKOS.Collection) if isinstance(c, URIRef)
+        }
+        for collection, member in graph.subject_objects(SKOS.member):
+            if isinstance(collection, URIRef) and isinstance(member, URIRef):
+                collections.setdefault(collection, set()).add(member)
+
+        typed = {c for c in graph.subjects(RDF.type, SKOS.Concept) if isinstance(c, URIRef)}
+        index = cls(schemes, top, broader, collections, concepts=typed)
+        nodes = set(index.schemes) | set(index.concepts) | set(index.collections)
+        labels: dict[URIRef, list[tuple[str, str]]] = {}
+        for prop in (SKOS.prefLabel, RDFS.label):
+            for node, label in graph.subject_objects(prop):
+                if node in nodes and isinstance(label, Literal):
+                    labels.setdefault(node, []).append(((label.language or "").lower(), str(label)))
+        index._labels = {node: tuple(sorted(set(pairs))) for node, pairs in labels.items()}
+        return index
+
+    @classmethod
+    def load(
+        cls,
+        paths: Iterable[Path] = DEFAULT_SOURCES,
+        *,
+        cache_dir: Path | None = None,
+        use_cache: bool | None = None,
+    ) -> SkosIndex:
+        """Build (or reload from cache) the index of the merged ``paths``."""
+        paths = tuple(Path(p) for p in paths)
+
+        def build() -> SkosIndex:
+            graph = loader.load_merged(*paths, cache_dir=cache_dir, use_cache=use_cache)
+            return cls.from_graph(graph)
+
+        return loader.cached_artifact("skos-index", paths, build, cache_dir=cache_dir, use_cache=use_cache)
+
+    # ── queries ─────────────────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return len(self.concepts)
+
+    def __contains__(self, concept: object) -> bool:
+        return concept in self._ids
+
+    def index_of(self, concept: Node) -> int | None:
+        return self._ids.get(concept)
+
+    def _decode(self, mask: int) -> tuple[URIRef, ...]:
+        return tuple(self.concepts[idx] for idx in _bits(mask))
+
+    def members(self, scheme: URIRef) -> tuple[URIRef, ...]:
+        """Concepts ``skos:inScheme`` (or top concepts of) ``scheme``."""
+        return self._decode(self._scheme_members[scheme])
+
+    def top_concepts(self, scheme: URIRef) -> tuple[URIRef, ...]:
+        return self._top[scheme]
+
+    def schemes_of(self, concept: Node) -> tuple[URIRef, ...]:
+        bit = 1 << self._ids[concept]
+        return tuple(scheme for scheme in self.schemes if self._scheme_members[scheme] & bit)
+
+    def in_scheme(self, concept: Node, scheme: URIRef) -> bool:
+        idx = self._ids.get(concept)
+        return idx is not None and bool(self._scheme_members.get(scheme, 0) >> idx & 1)
+
+    def scheme_mask(self, scheme: URIRef) -> int:
+        """Bitset of the concept ids in ``scheme`` (0 for unknown schemes)."""
+        return self._scheme_members.get(scheme, 0)
+
+    def ancestor_mask(self, concept: Node) -> int:
+        """Reflexive ``skos:broader*`` closure of ``concept`` as a bitset of concept ids."""
+        return self._ancestors[self._ids[concept]]
+
+    def broader(self, concept: Node, *, transitive: bool = True, include_self: bool = False) -> tuple[URIRef, ...]:
+        idx = self._ids[concept]
+        if not transitive:
+            return tuple(self.concepts[p] for p in self._parents[idx])
+        return self._decode(self._ancestors[idx] & ~(0 if include_self else 1 << idx))
+
+    def narrower(self, concept: Node, *, transitive: bool = True, include_self: bool = False) -> tuple[URIRef, ...]:
+        idx = self._ids[concept]
+        if not transitive:
+            return tuple(self.concepts[c] for c in sorted(self._children[idx]))
+        return self._decode(self._descendants[idx] & ~(0 if include_self else 1 << idx))
+
+    def is_broader(self, ancestor: Node, concept: Node) -> bool:
+        """Whether ``concept`` reaches ``ancestor`` via ``skos:broader*`` (reflexive)."""
+        a, c = self._ids.get(ancestor), self._ids.get(concept)
+        return a is not None and c is not None and bool(self._ancestors[c] >> a & 1)
+
+    def depth(self, concept: Node) -> int:
+        """``skos:broader`` steps to the nearest concept without broader concepts (-1 on pure cycles)."""
+        return self._depth[self._ids[concept]]
+
+    def broader_edges(self) -> Iterable[tuple[URIRef, URIRef]]:
+        """Direct ``(child, parent)`` pairs."""
+        for child, parents in enumerate(self._parents):
+            for parent in parents:
+                yield self.concepts[child], self.concepts[parent]
+
+    def labels(self, node: Node) -> dict[str, tuple[str, ...]]:
+        """``skos:prefLabel``/``rdfs:label`` texts by language tag (``""`` for none)."""
+        found: dict[str, list[str]] = {}
+        for lang, text in self._labels.get(node, ()):
+            found.setdefault(lang, []).append(text)
+        return {lang: tuple(texts) for lang, texts in found.items()}
+
+    def label(self, node: Node, lang: str = "en") -> str:
+        """Preferred label: ``lang`` first, then untagged, then any; else the local name."""
+        pairs = self._labels.get(node)
+        if not pairs:
+            return local_name(node)
+        lang = lang.lower()
+        return min(pairs, key=lambda pair: (0 if pair[0] == lang else 1 if not pair[0] else 2, pair[1]))[1]
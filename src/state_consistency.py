@@ -0,0 +1,202 @@
+"""Streaming check that ``sms:hasStateValue`` fits the axis of its assignment.
+
+``StateAssignmentShape`` only constrains cardinality and node kind. The value
+of an ``sms:StateAssignment`` must also be a concept of the scheme its
+``sms:onAxis`` axis names via ``sms:hasConceptScheme``; expressing that as a
+SPARQL constraint would make pyshacl join every assignment with the
+vocabulary. :class:`AxisValueChecker` instead precomputes one set of allowed
+N-Triples tokens per axis (from the cached :class:`~src.skos.SkosIndex`) and
+checks each ``(assignment, value)`` pair with a dictionary and a set lookup
+while the triples stream past::
+
+    checker = AxisValueChecker.load()
+    with open("dump.nt", encoding="utf-8") as lines:
+        checker.add_ntriples(lines)
+    report = report_graph(checker.results)     # an sh:ValidationReport
+
+Values are checked as soon as their assignment's axis is known; values seen
+before it wait in a small buffer. An assignment with several ``sms:onAxis``
+values is checked against the first one only (the others are already an
+``sh:maxCount`` violation of ``StateAssignmentShape``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from rdflib import Graph, Namespace, URIRef
+from rdflib.namespace import SH
+from rdflib.term import Node
+
+from src import loader
+from src.ntriples import load_paths, parse_term, split_line, term_token
+from src.shape_compiler import TripleIndex
+from src.skos import SkosIndex
+from src.validation import ValidationResult, report_graph
+
+SMS = Namespace("https://w3id.org/sdata/material-state/")
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_SOURCES = (ROOT / "sdata-material-state.ttl",)
+SOURCE_SHAPE = URIRef("https://w3id.org/sdata/shapes/StateAssignmentShape")
+
+_ON_AXIS = term_token(SMS.onAxis)
+_HAS_VALUE = term_token(SMS.hasStateValue)
+
+
+class AxisValueChecker:
+    """Allowed ``sms:hasStateValue`` concepts per state axis, checked in one pass."""
+
+    def __init__(self, allowed: dict[URIRef, Iterable[URIRef]], schemes: dict[URIRef, URIRef] | None = None):
+        """Build from ``axis -> allowed concepts`` (and ``axis -> scheme`` for messages)."""
+        self.allowed: dict[str, frozenset[str]] = {
+            term_token(axis): frozenset(map(term_token, concepts)) for axis, concepts in allowed.items()
+        }
+        self.schemes = dict(schemes or {})
+        self.results: list[ValidationResult] = []
+        self.checked = 0
+        self._axis: dict[str, str] = {}
+        self._pending: dict[str, list[str]] = {}
+
+    @classmethod
+    def from_skos(cls, skos: SkosIndex, axes: dict[URIRef, URIRef]) -> AxisValueChecker:
+        """Allow, per ``axis -> scheme``, the members of the scheme in ``skos`` (none if unknown)."""
+        allowed = {axis: skos.members(scheme) if scheme in skos.schemes else () for axis, scheme in axes.items()}
+        return cls(allowed, axes)
+
+    @classmethod
+    def from_graph(cls, graph: Graph, skos: SkosIndex | None = None) -> AxisValueChecker:
+        """Axes are the subjects of ``sms:hasConceptScheme`` in ``graph`` (custom axes included)."""
+        axes = {
+            axis: scheme
+            for axis, scheme in graph.subject_objects(SMS.hasConceptScheme)
+            if isinstance(axis, URIRef) and isinstance(scheme, URIRef) and axis != SMS.StateAxis
+        }
+        return cls.from_skos(skos or SkosIndex.from_graph(graph), axes)
+
+    @classmethod
+    def load(
+        cls,
+        paths: Iterable[Path] = DEFAULT_SOURCES,
+        *,
+        cache_dir: Path | None = None,
+        use_cache: bool | None = None,
+    ) -> AxisValueChecker:
+        """Build (or reload from cache) a checker for the axes of the merged ``paths``."""
+        paths = tuple(Path(p) for p in paths)
+
+        def build() -> AxisValueChecker:
+            graph = loader.load_merged(*paths, cache_dir=cache_dir, use_cache=use_cache)
+            return cls.from_graph(graph, SkosIndex.load(paths, cache_dir=cache_dir, use_cache=use_cache))
+
+        return loader.cached_artifact("state-axis-values", paths, build, cache_dir=cache_dir, use_cache=use_cache)
+
+    # ── streaming ───────────────────────────────────────────────────────────
+
+    def _on_axis(self, assignment: str, axis: str) -> None:
+        if assignment in self._axis:
+            return
+        self._axis[assignment] = axis
+        allowed = self.allowed.get(axis)
+        if allowed is None:
+            self._report(assignment, SMS.onAxis, axis, f"{axis[1:-1]} is not a state axis with sms:hasConceptScheme")
+        for value in self._pending.pop(assignment, ()):
+            self._value(assignment, value, axis, allowed)
+
+    def _value(self, assignment: str, value: str, axis: str, allowed: frozenset[str] | None) -> None:
+        self.checked += 1
+        if allowed is not None and value not in allowed:
+            scheme = self.schemes.get(URIRef(axis[1:-1]))
+            self._report(
+                assignment, SMS.hasStateValue, value, f"{value[1:-1]} is not a concept of {scheme} ({axis[1:-1]})"
+            )
+
+    def _report(self, assignment: str, path: URIRef, value: str, message: str) -> None:
+        self.results.append(
+            ValidationResult(
+                focus_node=parse_term(assignment),
+                source_shape=SOURCE_SHAPE,
+                constraint_component=SH.InConstraintComponent,
+                result_path=path,
+                value=parse_term(value),
+                message=message,
+            )
+        )
+
+    def _put(self, assignment: str, predicate: str, obj: str) -> None:
+        if predicate == _ON_AXIS:
+            self._on_axis(assignment, obj)
+            return
+        axis = self._axis.get(assignment)
+        if axis is None:
+            self._pending.setdefault(assignment, []).append(obj)
+        else:
+            self._value(assignment, obj, axis, self.allowed.get(axis))
+
+    def add(self, triples: Iterable[tuple[Node, Node, Node]]) -> None:
+        """Consume triples in any order; only ``sms:onAxis``/``sms:hasStateValue`` are read."""
+        for s, p, o in triples:
+            if p == SMS.onAxis or p == SMS.hasStateValue:
+                self._put(term_token(s), term_token(p), term_token(o))
+
+    def add_graph(self, graph: Graph) -> None:
+        """Feed the two predicates of ``graph`` through its indexes, axes first."""
+        index = TripleIndex.from_graph(graph)
+        self.add(index.triples(SMS.onAxis))
+        self.add(index.triples(SMS.hasStateValue))
+
+    def add_ntriples(self, lines: Iterable[str]) -> None:
+        """Like :meth:`add` for N-Triples lines, without building rdflib nodes."""
+        on_axis, has_value = _ON_AXIS, _HAS_VALUE
+        put = self._put
+        for number, line in enumerate(lines, 1):
+            if on_axis not in line and has_value not in line:
+                continue
+            parts = split_line(line, number)
+            if parts is None:
+                continue
+            subject, predicate, rest = parts
+            if predicate == on_axis or predicate == has_value:
+                put(subject, predicate, rest[:-1].rstrip())
+
+    @property
+    def unchecked(self) -> int:
+        """Values whose assignment has no ``sms:onAxis`` (yet); ``sh:minCount`` covers those."""
+        return sum(map(len, self._pending.values()))
+
+
+def check_paths(paths: Iterable[Path], checker: AxisValueChecker | None = None) -> AxisValueChecker:
+    """Check RDF files; N-Triples files are streamed line by line."""
+    return load_paths(checker or AxisValueChecker.load(), paths)
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Check sms:hasStateValue against the scheme of sms:onAxis.")
+    parser.add_argument("data", type=Path, nargs="+", help="Data graph(s); .nt files are streamed")
+    parser.add_argument("--vocabulary", type=Path, nargs="+", default=list(DEFAULT_SOURCES),
+                        help="Ontologies defining the axes and their concept schemes")
+    parser.add_argument("--report", type=Path, help="Write an sh:ValidationReport (Turtle) here")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv if argv is not None else sys.argv[1:])
+    checker = AxisValueChecker.load(args.vocabulary)
+
+    start = time.perf_counter()
+    check_paths(args.data, checker)
+    seconds = time.perf_counter() - start
+
+    for result in checker.results:
+        print(f"  ✗ {result.focus_node}: {result.message}")
+    if args.report:
+        report_graph(checker.results).serialize(args.report, format="turtle")
+    print(f"{checker.checked} value(s) checked, {len(checker.results)} result(s) in {seconds:.3f} s")
+    return 1 if checker.results else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,122 @@
+"""Instance-by-type index that honours the class hierarchy.
+
+:class:`TypeIndex` materialises ``rdf:type`` assertions of an instance graph
+along the transitive closure of a :class:`~src.hierarchy.ClassHierarchy`: an
+individual typed ``sdata:Material`` is registered under ``sdata:Material``,
+``sdata:Object``, ``min:Object``, ... once, at insertion time. Querying all
+instances of a class including its subclasses is then a single dictionary
+lookup. Per-class reference counts keep removals exact when an individual
+reaches the same ancestor through several asserted types.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Set
+from typing import Any
+
+from rdflib import Graph, URIRef
+from rdflib.namespace import RDF
+from rdflib.term import Node
+
+from src.hierarchy import ClassHierarchy
+
+_EMPTY: Set[Node] = frozenset()
+
+
+class TypeIndex:
+    """Incrementally maintained ``class -> instances`` index with inheritance."""
+
+    def __init__(self, hierarchy: ClassHierarchy):
+        self.hierarchy = hierarchy
+        self._direct: dict[Node, set[URIRef]] = {}
+        self._members: dict[URIRef, dict[Node, int]] = {}
+
+    @classmethod
+    def from_graph(cls, graph: Graph, hierarchy: ClassHierarchy | None = None) -> TypeIndex:
+        """Index every ``rdf:type`` triple of ``graph``.
+
+        Without an explicit ``hierarchy`` the default MIN + sdata-core
+        hierarchy is loaded (from cache when available).
+        """
+        index = cls(hierarchy if hierarchy is not None else ClassHierarchy.load())
+        for instance, type_ in graph.subject_objects(RDF.type):
+            index.add(instance, type_)
+        return index
+
+    # ── updates ─────────────────────────────────────────────────────────────
+
+    def add(self, instance: Node, type_: Any) -> bool:
+        """Record ``instance rdf:type type_``; return ``False`` if already known."""
+        if not isinstance(type_, URIRef):
+            return False
+        types = self._direct.setdefault(instance, set())
+        if type_ in types:
+            return False
+        types.add(type_)
+        for cls in self.hierarchy.ancestors(type_):
+            members = self._members.setdefault(cls, {})
+            members[instance] = members.get(instance, 0) + 1
+        return True
+
+    def remove(self, instance: Node, type_: Any) -> bool:
+        """Retract ``instance rdf:type type_``; return ``False`` if it was absent."""
+        types = self._direct.get(instance)
+        if not types or type_ not in types:
+            return False
+        types.discard(type_)
+        if not types:
+            del self._direct[instance]
+        for cls in self.hierarchy.ancestors(type_):
+            members = self._members[cls]
+            remaining = members[instance] - 1
+            if remaining:
+                members[instance] = remaining
+            else:
+                del members[instance]
+                if not members:
+                    del self._members[cls]
+        return True
+
+    def add_triples(self, triples: Iterable[tuple[Node, Node, Node]]) -> int:
+        """Index the ``rdf:type`` triples among ``triples``; return how many were new."""
+        added = 0
+        for s, p, o in triples:
+            if p == RDF.type and self.add(s, o):
+                added += 1
+        return added
+
+    def remove_triples(self, triples: Iterable[tuple[Node, Node, Node]]) -> int:
+        removed = 0
+        for s, p, o in triples:
+            if p == RDF.type and self.remove(s, o):
+                removed += 1
+        return removed
+
+    # ── queries ─────────────────────────────────────────────────────────────
+
+    def instances_of(self, cls: URIRef) -> Set[Node]:
+        """Return all instances of ``cls`` or any of its subclasses.
+
+        The result is a live, read-only view; copy it before mutating the index
+        while iterating.
+        """
+        members = self._members.get(cls)
+        return members.keys() if members is not None else _EMPTY
+
+    def count(self, cls: URIRef) -> int:
+        members = self._members.get(cls)
+        return len(members) if members is not None else 0
+
+    def types_of(self, instance: Node) -> Set[URIRef]:
+        """Return the asserted (direct) types of ``instance``."""
+        return frozenset(self._direct.get(instance, ()))
+
+    def is_instance(self, instance: Node, cls: URIRef) -> bool:
+        members = self._members.get(cls)
+        return members is not None and instance in members
+
+    def __len__(self) -> int:
+        return len(self._direct)
+
+    def __contains__(self, instance: object) -> bool:
+        return instance in self._direct
@@ -0,0 +1,234 @@
+"""Vectorised unit conversion for AQV values from the QUDT unit vocabulary.
+
+:class:`UnitTable` reads every QUDT unit with a ``qudt:conversionMultiplier``
+once into parallel NumPy arrays (multiplier, offset, dimension-vector code)
+and persists itself next to the cached graphs, so later processes only
+unpickle it. Converting a column is then a gather and one fused
+multiply-add, whether the whole column shares one unit or every row has its
+own::
+
+    units = UnitTable.load()
+    units.convert([1.5, 2.0], "mm", "m")                 # [0.0015, 0.002]
+    units.convert(values, row_units, unit_iri)           # one (kPa, MPa, psi, ...) unit per row
+
+Two units are compatible when they share a ``qudt:hasDimensionVector``; affine
+units (°C, °F) go through their ``qudt:conversionOffset``. Units may be given
+as IRIs or as symbols (``qudt:symbol``, ``qudt:ucumCode`` or one of
+:data:`SYMBOL_ALIASES`), which is how :func:`convert_quantities` falls back to
+``sdata:unitSymbol`` for AQVs without ``qudt:unit``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from collections.abc import Iterable
+from pathlib import Path
+
+import numpy as np
+from rdflib import Graph, Literal, URIRef
+
+from src import loader
+from src.quantities import QuantityTable
+
+ROOT = Path(__file__).resolve().parent.parent
+# The vendored qudt.ttl is the QUDT schema without unit individuals; qudt-units.ttl
+# is an excerpt of the QUDT unit vocabulary. Pass the full upstream unit.ttl to cover more.
+DEFAULT_SOURCES = (ROOT / "vendor" / "ontologies" / "qudt-units.ttl",)
+
+QUDT = "http://qudt.org/schema/qudt/"
+UNIT = "http://qudt.org/vocab/unit/"
+QUDT_MULTIPLIER = URIRef(QUDT + "conversionMultiplier")
+QUDT_OFFSET = URIRef(QUDT + "conversionOffset")
+QUDT_DIMENSION = URIRef(QUDT + "hasDimensionVector")
+QUDT_SYMBOL = URIRef(QUDT + "symbol")
+QUDT_UCUM = URIRef(QUDT + "ucumCode")
+
+# Spellings found in sdata:unitSymbol that are neither a QUDT symbol nor UCUM.
+SYMBOL_ALIASES = {
+    "-": URIRef(UNIT + "UNITLESS"),
+    "1": URIRef(UNIT + "UNITLESS"),
+    "1/s": URIRef(UNIT + "PER-SEC"),
+    "1/min": URIRef(UNIT + "PER-MIN"),
+    "N/mm2": URIRef(UNIT + "N-PER-MilliM2"),
+    "um": URIRef(UNIT + "MicroM"),
+    "µm": URIRef(UNIT + "MicroM"),
+    "degC": URIRef(UNIT + "DEG_C"),
+    "kWh": URIRef(UNIT + "KiloW-HR"),
+}
+
+
+class UnitTable:
+    """QUDT units as parallel conversion arrays, addressable by IRI or symbol."""
+
+    def __init__(
+        self,
+        units: Iterable[tuple[URIRef, float, float, URIRef | None]],
+        symbols: dict[str, URIRef] | None = None,
+    ):
+        """Build the table from ``(iri, multiplier, offset, dimension vector)`` rows."""
+        rows = sorted(units, key=lambda row: str(row[0]))
+        self.units: tuple[URIRef, ...] = tuple(row[0] for row in rows)
+        self._ids = {unit: idx for idx, unit in enumerate(self.units)}
+        self.multiplier = np.array([row[1] for row in rows], dtype=np.float64)
+        self.offset = np.array([row[2] for row in rows], dtype=np.float64)
+        dimensions = sorted({str(row[3]) for row in rows if row[3] is not None})
+        self.dimensions: tuple[str, ...] = tuple(dimensions)
+        codes = {dimension: code for code, dimension in enumerate(dimensions)}
+        self.dimension = np.array([codes.get(str(row[3]), -1) for row in rows], dtype=np.int32)
+        self.symbols = {symbol: unit for symbol, unit in (symbols or {}).items() if unit in self._ids}
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> UnitTable:
+        """Read every subject with a numeric ``qudt:conversionMultiplier``."""
+        units = []
+        symbols: dict[str, URIRef] = {}
+        for unit, multiplier in graph.subject_objects(QUDT_MULTIPLIER):
+            if not isinstance(unit, URIRef) or not isinstance(multiplier, Literal):
+                continue
+            offset = graph.value(unit, QUDT_OFFSET)
+            units.append((unit, float(multiplier), float(offset) if offset is not None else 0.0,
+                          graph.value(unit, QUDT_DIMENSION)))
+            for prop in (QUDT_UCUM, QUDT_SYMBOL):  # symbols win over UCUM codes on clashes
+                for symbol in graph.objects(unit, prop):
+                    symbols[str(symbol)] = unit
+        for symbol, unit in SYMBOL_ALIASES.items():
+            symbols.setdefault(symbol, unit)
+        return cls(units, symbols)
+
+    @classmethod
+    def load(
+        cls,
+        paths: Iterable[Path] = DEFAULT_SOURCES,
+        *,
+        cache_dir: Path | None = None,
+        use_cache: bool | None = None,
+    ) -> UnitTable:
+        """Build (or reload from cache) the unit table of the merged ``paths``."""
+        paths = tuple(Path(p) for p in paths)
+
+        def build() -> UnitTable:
+            graph = loader.load_merged(*paths, cache_dir=cache_dir, use_cache=use_cache)
+            return cls.from_graph(graph)
+
+        return loader.cached_artifact("qudt-units", paths, build, cache_dir=cache_dir, use_cache=use_cache)
+
+    def __len__(self) -> int:
+        return len(self.units)
+
+    def __contains__(self, unit: object) -> bool:
+        return unit in self._ids or unit in self.symbols
+
+    def resolve(self, unit) -> URIRef:
+        """The unit IRI for an IRI or symbol (``KeyError`` if unknown)."""
+        if unit in self._ids:
+            return unit
+        key = str(unit)
+        if URIRef(key) in self._ids:
+            return URIRef(key)
+        if key in self.symbols:
+            return self.symbols[key]
+        raise KeyError(f"unknown unit {unit!r}")
+
+    def indices(self, units) -> np.ndarray:
+        """Row numbers for a unit or a sequence of units (``-1`` for ``None``)."""
+        if units is None or isinstance(units, str) or np.ndim(units) == 0:
+            return np.intp(-1 if units is None else self._ids[self.resolve(units)])
+        column = units.tolist() if isinstance(units, np.ndarray) else list(units)
+        lookup = {unit: self._ids[self.resolve(unit)] for unit in set(column) if unit is not None}
+        lookup[None] = -1
+        return np.fromiter((lookup[unit] for unit in column), dtype=np.intp, count=len(column))
+
+    def compatible(self, source, target) -> bool:
+        """Whether ``source`` and ``target`` share a dimension vector."""
+        a, b = self.dimension[self.indices(source)], self.dimension[self.indices(target)]
+        return bool(a == b and a >= 0)
+
+    def factors(self, sources, target) -> tuple[np.ndarray, np.ndarray]:
+        """``(scale, shift)`` with ``converted = value * scale + shift`` per source unit."""
+        return self.row_factors(np.asarray(self.indices(sources)), target)
+
+    def row_factors(self, rows: np.ndarray, target) -> tuple[np.ndarray, np.ndarray]:
+        """Like :meth:`factors` for source unit row numbers, e.g. from :meth:`row_units` (``-1`` for none)."""
+        goal = self.indices(target)
+        known = rows >= 0
+        rows = np.where(known, rows, goal)
+        dimension = self.dimension[goal]
+        bad = known & (rows != goal) & ((self.dimension[rows] != dimension) | (dimension < 0))
+        if bad.any():
+            names = ", ".join(str(self.units[row]) for row in np.unique(rows[bad]).tolist())
+            raise ValueError(f"cannot convert {names} to {self.units[goal]}: dimension vectors differ")
+        scale = self.multiplier[rows] / self.multiplier[goal]
+        shift = self.offset[rows] * scale - self.offset[goal]
+        return np.where(known, scale, np.nan), np.where(known, shift, np.nan)
+
+    def convert(self, values, sources, target) -> np.ndarray:
+        """Convert ``values`` from ``sources`` (one unit or one per value) to ``target``.
+
+        Values without a source unit (``None``) become NaN; incompatible units
+        raise ``ValueError``.
+        """
+        scale, shift = self.factors(sources, target)
+        return np.asarray(values, dtype=np.float64) * scale + shift
+
+    def row_units(self, table: QuantityTable) -> np.ndarray:
+        """Unit row number of every AQV of ``table`` (``qudt:unit``, else ``sdata:unitSymbol``, else -1)."""
+        # Resolve each distinct (unit, symbol) code pair once, then gather.
+        keys = table.unit.astype(np.int64) * (len(table.symbols) + 1) + (table.symbol + 1)
+        pairs, inverse = np.unique(keys, return_inverse=True)
+        resolved = []
+        for key in pairs.tolist():
+            unit, symbol = divmod(key, len(table.symbols) + 1)
+            if unit >= 0:
+                resolved.append(self.indices(table.units[unit]))
+            else:
+                resolved.append(self.indices(table.symbols[symbol - 1] if symbol else None))
+        return np.array(resolved, dtype=np.intp)[inverse.ravel()]
+
+
+def convert_quantities(
+    table: QuantityTable,
+    targets: dict[str, str | URIRef],
+    units: UnitTable | None = None,
+) -> dict[str, np.ndarray]:
+    """Convert the ``value`` column of each named quantity to its target unit.
+
+    Each AQV's unit is its ``qudt:unit``, falling back to ``sdata:unitSymbol``;
+    rows with neither come out as NaN. Returns ``{name: values}`` with the
+    rows of each name in table order.
+    """
+    units = units or UnitTable.load()
+    sources = units.row_units(table)
+    converted = {}
+    for name, target in targets.items():
+        if name not in table.names:
+            raise KeyError(f"no quantity named {name!r}")
+        rows = table.name == table.names.index(name)
+        scale, shift = units.row_factors(sources[rows], target)
+        converted[name] = table.value[rows] * scale + shift
+    return converted
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Convert values between QUDT units.")
+    parser.add_argument("source", help="Source unit (QUDT IRI or symbol, e.g. MPa)")
+    parser.add_argument("target", help="Target unit (QUDT IRI or symbol, e.g. psi)")
+    parser.add_argument("values", type=float, nargs="+", help="Values to convert")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv if argv is not None else sys.argv[1:])
+    units = UnitTable.load()
+    try:
+        converted = units.convert(args.values, args.source, args.target)
+    except (KeyError, ValueError) as exc:
+        print(exc, file=sys.stderr)
+        return 2
+    for value, result in zip(args.values, converted.tolist()):
+        print(f"{value:g} {args.source} = {result:.10g} {args.target}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,306 @@
+"""Incremental SHACL validation against ``shapes/sdata-core-shapes.ttl``.
+
+The core shapes only constrain a focus node's *own* outgoing triples
+(``sh:minCount``/``sh:datatype``/``sh:nodeKind``/... on predicate paths), so a
+triple delta can only change the verdict for the subjects it touches.
+:class:`IncrementalValidator` keeps the data graph and the current results
+indexed by focus node; :meth:`~IncrementalValidator.apply` updates the graph,
+derives the affected focus nodes from the predicates the shapes look at and
+re-runs pyshacl on just their outgoing triples.
+
+Shapes that reach beyond the focus node (``sh:class``, ``sh:node``, complex
+paths, SPARQL, ...) make every delta fall back to a full revalidation, so the
+results are always those of a full pyshacl run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.namespace import RDF, RDFS, SH
+from rdflib.term import Node
+
+from src import loader
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_SHAPES = ROOT / "shapes" / "sdata-core-shapes.ttl"
+
+# Property-shape parameters that only inspect the focus node's value nodes.
+_LOCAL_PARAMETERS = frozenset(
+    {
+        SH.path,
+        SH.minCount,
+        SH.maxCount,
+        SH.datatype,
+        SH.nodeKind,
+        SH.minLength,
+        SH.maxLength,
+        SH.pattern,
+        SH.flags,
+        SH.languageIn,
+        SH.uniqueLang,
+        SH["in"],
+        SH.hasValue,
+        SH.minInclusive,
+        SH.maxInclusive,
+        SH.minExclusive,
+        SH.maxExclusive,
+        SH.equals,
+        SH.disjoint,
+        SH.lessThan,
+        SH.lessThanOrEquals,
+        SH.name,
+        SH.description,
+        SH.message,
+        SH.severity,
+        SH.order,
+        SH.group,
+        SH.deactivated,
+        RDF.type,
+        RDFS.label,
+        RDFS.comment,
+    }
+)
+_NODE_LEVEL = frozenset(
+    {SH.targetClass, SH.targetNode, SH.targetSubjectsOf, SH.targetObjectsOf, SH.property}
+)
+
+
+@dataclass(frozen=True)
+class ValidationResult:
+    """One ``sh:ValidationResult`` in a graph-independent form."""
+
+    focus_node: Node
+    source_shape: Node
+    constraint_component: URIRef
+    result_path: Node | None = None
+    value: Node | None = None
+    severity: URIRef = SH.Violation
+    message: str | None = None
+
+    def add_to(self, graph: Graph, report: Node, node: BNode | None = None) -> BNode:
+        node = node if node is not None else BNode()
+        graph.add((report, SH.result, node))
+        graph.add((node, RDF.type, SH.ValidationResult))
+        graph.add((node, SH.focusNode, self.focus_node))
+        graph.add((node, SH.sourceShape, self.source_shape))
+        graph.add((node, SH.sourceConstraintComponent, self.constraint_component))
+        graph.add((node, SH.resultSeverity, self.severity))
+        if self.result_path is not None:
+            graph.add((node, SH.resultPath, self.result_path))
+        if self.value is not None:
+            graph.add((node, SH.value, self.value))
+        if self.message is not None:
+            graph.add((node, SH.resultMessage, Literal(self.message)))
+        return node
+
+
+def results_from_report(report: Graph) -> list[ValidationResult]:
+    """Read the ``sh:result`` entries of a pyshacl report graph."""
+    results = []
+    for node in report.objects(None, SH.result):
+        messages = sorted(str(m) for m in report.objects(node, SH.resultMessage))
+        results.append(
+            ValidationResult(
+                focus_node=report.value(node, SH.focusNode),
+                source_shape=report.value(node, SH.sourceShape),
+                constraint_component=report.value(node, SH.sourceConstraintComponent),
+                result_path=report.value(node, SH.resultPath),
+                value=report.value(node, SH.value),
+                severity=report.value(node, SH.resultSeverity) or SH.Violation,
+                message=messages[0] if messages else None,
+            )
+        )
+    return results
+
+
+def report_graph(results: Iterable[ValidationResult], *, label: str | None = None) -> Graph:
+    """Build an ``sh:ValidationReport`` graph from ``results``.
+
+    With ``label`` the report and result blank nodes are named
+    ``label``, ``label-0``, ``label-1``, ... in the order of ``results``.
+    """
+    graph = Graph()
+    graph.bind("sh", SH)
+    report = BNode(label) if label else BNode()
+    results = list(results)
+    graph.add((report, RDF.type, SH.ValidationReport))
+    graph.add((report, SH.conforms, Literal(not results)))
+    for i, result in enumerate(results):
+        result.add_to(graph, report, BNode(f"{label}-{i}") if label else None)
+    return graph
+
+
+def run_pyshacl(data: Graph, shapes: Graph) -> list[ValidationResult]:
+    try:
+        import pyshacl
+    except ImportError as exc:
+        raise RuntimeError("pyshacl is required for SHACL validation. Install dev dependencies first.") from exc
+    _, report, _ = pyshacl.validate(data, shacl_graph=shapes, inference="none")
+    return results_from_report(report)
+
+
+@dataclass(frozen=True)
+class ShapeIndex:
+    """Which predicates select focus nodes and which ones the shapes read."""
+
+    subject_targets: frozenset[URIRef]
+    object_targets: frozenset[URIRef]
+    target_classes: frozenset[URIRef]
+    target_nodes: frozenset[Node]
+    path_predicates: frozenset[URIRef]
+    local: bool
+
+    @classmethod
+    def from_graph(cls, shapes: Graph) -> ShapeIndex:
+        def iris(predicate: URIRef) -> frozenset:
+            return frozenset(o for o in shapes.objects(None, predicate) if isinstance(o, URIRef))
+
+        local = True
+        paths: set[URIRef] = set()
+        for shape in set(shapes.subjects(RDF.type, SH.NodeShape)):
+            for p in shapes.predicates(shape):
+                if p not in _NODE_LEVEL and p not in _LOCAL_PARAMETERS:
+                    local = False
+            for prop in shapes.objects(shape, SH.property):
+                for p in shapes.predicates(prop):
+                    if p not in _LOCAL_PARAMETERS:
+                        local = False
+                path = shapes.value(prop, SH.path)
+                if isinstance(path, URIRef):
+                    paths.add(path)
+                else:
+                    local = False
+        for p in (SH.equals, SH.disjoint, SH.lessThan, SH.lessThanOrEquals):
+            paths.update(iris(p))
+
+        return cls(
+            subject_targets=iris(SH.targetSubjectsOf),
+            object_targets=iris(SH.targetObjectsOf),
+            target_classes=iris(SH.targetClass),
+            target_nodes=frozenset(shapes.objects(None, SH.targetNode)),
+            path_predicates=frozenset(paths),
+            local=local,
+        )
+
+    def affected(self, triples: Iterable[tuple[Node, Node, Node]]) -> set[Node] | None:
+        """Return the focus nodes a delta can affect, or ``None`` if all can."""
+        relevant = self.subject_targets | self.path_predicates
+        nodes: set[Node] = set()
+        for s, p, o in triples:
+            if p == RDFS.subClassOf and self.target_classes:
+                return None
+            if p in relevant or p == RDF.type:
+                nodes.add(s)
+            if p in self.object_targets:
+                nodes.add(o)
+        return nodes
+
+
+class IncrementalValidator:
+    """Keep SHACL results of a mutable data graph up to date per delta."""
+
+    def __init__(self, data: Graph, shapes: Graph):
+        self.data = data
+        self.shapes = shapes
+        self.index = ShapeIndex.from_graph(shapes)
+        self._results: dict[Node, list[ValidationResult]] = {}
+        self.revalidate()
+
+    @classmethod
+    def load(cls, data: Graph, shapes_path: Path = DEFAULT_SHAPES) -> IncrementalValidator:
+        return cls(data, loader.load_graph(shapes_path))
+
+    def revalidate(self) -> None:
+        """Validate the whole data graph from scratch."""
+        self._results = {}
+        self._store(run_pyshacl(self.data, self.shapes))
+
+    def _store(self, results: Iterable[ValidationResult]) -> None:
+        for result in results:
+            self._results.setdefault(result.focus_node, []).append(result)
+
+    def _subgraph(self, nodes: set[Node]) -> Graph:
+        sub = Graph()
+        data = self.data
+        sub.addN((s, p, o, sub) for node in nodes for s, p, o in data.triples((node, None, None)))
+        if self.index.target_classes:
+            sub.addN((s, p, o, sub) for s, p, o in data.triples((None, RDFS.subClassOf, None)))
+        for p in self.index.object_targets:
+            sub.addN((s, p, o, sub) for s, _, o in data.triples((None, p, None)) if o in nodes)
+        return sub
+
+    def apply(
+        self,
+        added: Iterable[tuple[Node, Node, Node]] = (),
+        removed: Iterable[tuple[Node, Node, Node]] = (),
+    ) -> frozenset[Node]:
+        """Apply a triple delta and re-check the affected focus nodes.
+
+        Returns the focus nodes that were re-checked (all previously reported
+        and newly targeted nodes after a full revalidation).
+        """
+        added, removed = list(added), list(removed)
+        for triple in removed:
+            self.data.remove(triple)
+        self.data.addN((s, p, o, self.data) for s, p, o in added)
+
+        nodes = self.index.affected(added + removed) if self.index.local else None
+        if nodes is None:
+            self.revalidate()
+            return frozenset(self._results)
+        if not nodes:
+            return frozenset()
+
+        for node in nodes:
+            self._results.pop(node, None)
+        self._store(r for r in run_pyshacl(self._subgraph(nodes), self.shapes) if r.focus_node in nodes)
+        return frozenset(nodes)
+
+    @property
+    def conforms(self) -> bool:
+        return not self._results
+
+    def results(self) -> list[ValidationResult]:
+        return [r for results in self._results.values() for r in results]
+
+    def results_for(self, node: Node) -> list[ValidationResult]:
+        return list(self._results.get(node, ()))
+
+    def report(self) -> Graph:
+        return report_graph(self.results())
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Validate a data graph, then apply triple deltas incrementally.")
+    parser.add_argument("data", type=Path, help="Turtle data graph")
+    parser.add_argument("--shapes", type=Path, default=DEFAULT_SHAPES)
+    parser.add_argument("--add", type=Path, action="append", default=[], help="Turtle file with triples to add")
+    parser.add_argument("--remove", type=Path, action="append", default=[], help="Turtle file with triples to remove")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv if argv is not None else sys.argv[1:])
+    validator = IncrementalValidator.load(loader.load_graph(args.data), args.shapes)
+    print(f"Initial: {len(validator.results())} result(s)")
+
+    added = [t for path in args.add for t in loader.load_graph(path)]
+    removed = [t for path in args.remove for t in loader.load_graph(path)]
+    if added or removed:
+        checked = validator.apply(added=added, removed=removed)
+        print(f"Delta: +{len(added)} / -{len(removed)} triples, re-checked {len(checked)} focus node(s)")
+
+    for result in sorted(validator.results(), key=lambda r: (str(r.focus_node), str(r.result_path))):
+        print(f"  ✗ {result.focus_node} {result.result_path}: {result.message}")
+    print("Conforms" if validator.conforms else f"Does not conform ({len(validator.results())} result(s))")
+    return 0 if validator.conforms else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
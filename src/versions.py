@@ -0,0 +1,351 @@
+"""Point-in-time lookup of product passport versions and checks of their chains.
+
+``docs/modeling/dpp-versionierung.md`` versions a passport by issuing a new
+``sdata:ProductPassport`` that ``sdata:describes`` the same product,
+``sdata:supersedes`` its predecessor and carries ``sdata:validFrom``.
+"Which version was valid for product P at time T" therefore needs every
+version of P ordered by time. :class:`VersionIndex` keeps, per described
+node, the ``(validFrom, passport)`` pairs sorted in two flat arrays (one CSR
+segment per product), so both questions are a binary search::
+
+    index = VersionIndex.from_graph(graph)
+    index.at(EX.product_001, "2026-02-15T00:00:00Z")   # ex:dpp_v1
+    index.latest(EX.product_001)                       # ex:dpp_v2
+    index.forks, index.cycles                          # broken supersedes chains
+
+A version whose ``sdata:validUntil`` or ``sdata:revokedAt`` has passed is not
+returned, even if no later version exists yet. Timestamps without a time
+zone count as UTC. Data that ``sdata:describes`` something but has no
+``sdata:validFrom`` is not a version; if it takes part in a ``supersedes``
+chain it is listed in :attr:`VersionIndex.undated`; a ``validFrom``,
+``validUntil`` or ``revokedAt`` that is not a valid timestamp is skipped and
+listed in :attr:`VersionIndex.malformed`. The supersedes graph is
+checked once at build time. A *fork* is a version superseded by more than
+one passport, and a *cycle* is a passport that (transitively) supersedes
+itself.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from array import array
+from collections.abc import Iterable, Sequence
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+from rdflib import Graph, Literal, URIRef
+from rdflib.term import Node
+
+from src.lineage import MIN, SDATA, topological_levels
+from src.ntriples import TokenIds, TokenNodes, load_paths, parse_term, term_token, token_triples
+from src.shape_compiler import TripleIndex
+
+DESCRIBES = (MIN.describes, SDATA.describes)
+# predicate -> True if the subject is the newer version.
+SUPERSEDES = {SDATA.supersedes: True, SDATA.supersededBy: False}
+# predicate -> column of the timestamp it sets.
+INSTANTS = {SDATA.validFrom: "start", SDATA.validUntil: "end", SDATA.revokedAt: "end"}
+
+NEVER = np.iinfo(np.int64).max
+
+
+def instant(value: datetime | np.datetime64 | str) -> int:
+    """Microseconds since the epoch (UTC) of a datetime, ``datetime64`` or ISO 8601 string."""
+    if isinstance(value, np.datetime64):
+        return int(value.astype("datetime64[us]").astype(np.int64))
+    moment = datetime.fromisoformat(value) if isinstance(value, str) else value
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(np.datetime64(moment.astimezone(timezone.utc).replace(tzinfo=None), "us").astype(np.int64))
+
+
+def _distinct_pairs(size: int, pairs: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Columns of the distinct ``pairs``, sorted by the first column."""
+    keys = np.sort(pairs[:, 0] * size + pairs[:, 1])
+    if len(keys):
+        keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+    return keys // size, keys % size
+
+
+def _cycles(successors: dict[int, list[int]]) -> list[list[int]]:
+    """One node list per back edge found by an iterative depth-first search."""
+    state: dict[int, int] = {}  # 1 = on the current path, 2 = done
+    found = []
+    for root in successors:
+        if root in state:
+            continue
+        state[root] = 1
+        path, cursor = [root], [0]
+        while path:
+            v = path[-1]
+            following = successors.get(v, ())
+            if cursor[-1] < len(following):
+                w = following[cursor[-1]]
+                cursor[-1] += 1
+                if w not in state:
+                    state[w] = 1
+                    path.append(w)
+                    cursor.append(0)
+                elif state[w] == 1:
+                    found.append(path[path.index(w) :])
+                continue
+            state[v] = 2
+            path.pop()
+            cursor.pop()
+    return found
+
+
+class VersionIndex(TokenNodes):
+    """Passport versions per described node, sorted by ``sdata:validFrom``."""
+
+    def __init__(
+        self,
+        tokens: Sequence[str],
+        passports,
+        targets,
+        starts,
+        ends=None,
+        supersedes: Iterable[tuple[int, int]] = (),
+        labels: dict[int, str] | None = None,
+        malformed: Iterable[tuple[int, str]] = (),
+    ):
+        """Build from node ``tokens`` and parallel ``(passport, target, validFrom)`` id/instant arrays.
+
+        ``ends`` holds, per node id, the instant a version stops being valid
+        (:data:`NEVER` if it does not); ``supersedes`` are ``(newer, older)``
+        id pairs, ``labels`` the ``sdata:hasVersion`` strings and ``malformed``
+        the ``(node id, lexical form)`` of timestamps that could not be read.
+        Repeated ``(passport, target)`` entries (``min:describes`` and
+        ``sdata:describes`` twins) are kept once.
+        """
+        self.tokens = tokens
+        size = len(tokens)
+        passports = np.asarray(passports, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        starts = np.asarray(starts, dtype=np.int64)
+        order = np.lexsort((passports, starts, targets))
+        passports, targets, starts = passports[order], targets[order], starts[order]
+        if len(order):
+            # A passport has one start, so repeated (passport, target) entries are adjacent.
+            first = np.concatenate(([True], (passports[1:] != passports[:-1]) | (targets[1:] != targets[:-1])))
+            passports, targets, starts = passports[first], targets[first], starts[first]
+        self.passport, self.start = passports, starts
+        self.ptr = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(targets, minlength=size), out=self.ptr[1:])
+        self.end = np.full(size, NEVER, dtype=np.int64) if ends is None else np.asarray(ends, dtype=np.int64)
+        self.labels = dict(labels or {})
+
+        pairs = np.array(list(supersedes), dtype=np.int64).reshape(-1, 2)
+        loops = pairs[pairs[:, 0] == pairs[:, 1], 0]
+        newer, older = _distinct_pairs(size, pairs[pairs[:, 0] != pairs[:, 1]])
+        # Predecessors per version, as CSR rows sorted by the newer passport.
+        self._older_ptr = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(newer, minlength=size), out=self._older_ptr[1:])
+        self._older = older
+        node = self.node
+
+        successors = newer[np.argsort(older, kind="stable")]
+        successor_ptr = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(older, minlength=size), out=successor_ptr[1:])
+        self.forks: dict[Node, tuple[Node, ...]] = {
+            node(v): tuple(map(node, successors[successor_ptr[v] : successor_ptr[v + 1]].tolist()))
+            for v in np.flatnonzero(np.diff(successor_ptr) > 1).tolist()
+        }
+        # Only nodes that Kahn's algorithm cannot release can lie on a cycle; search those alone.
+        stuck = topological_levels(size, newer, older) < 0
+        inside = stuck[newer] & stuck[older]
+        candidates: dict[int, list[int]] = {}
+        for n, o in zip(newer[inside].tolist(), older[inside].tolist()):
+            candidates.setdefault(n, []).append(o)
+        self.cycles: list[tuple[Node, ...]] = [(node(v),) for v in loops.tolist()]
+        self.cycles += [tuple(map(node, cycle)) for cycle in _cycles(candidates)]
+
+        chained = np.zeros(size, dtype=bool)
+        chained[newer] = chained[older] = True
+        chained[loops] = True
+        chained[self.passport] = False
+        self.undated: tuple[Node, ...] = tuple(node(v) for v in np.flatnonzero(chained).tolist())
+        self.malformed: tuple[tuple[Node, str], ...] = tuple((node(v), lexical) for v, lexical in malformed)
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> VersionIndex:
+        builder = VersionBuilder()
+        builder.add_graph(graph)
+        return builder.build()
+
+    def __len__(self) -> int:
+        """Number of ``(target, version)`` entries."""
+        return len(self.passport)
+
+    def _segment(self, target: Node | str | int) -> tuple[int, int]:
+        v = self.index_of(target)
+        if v is None:
+            raise KeyError(f"{target} is not described by any dated passport")
+        return int(self.ptr[v]), int(self.ptr[v + 1])
+
+    def versions(self, target: Node | str | int) -> list[tuple[np.datetime64, Node]]:
+        """``(validFrom, passport)`` of every version of ``target``, oldest first."""
+        first, end = self._segment(target)
+        return [
+            (np.datetime64(start, "us"), self.node(p))
+            for start, p in zip(self.start[first:end].tolist(), self.passport[first:end].tolist())
+        ]
+
+    def at(self, target: Node | str | int, when: datetime | np.datetime64 | str) -> Node | None:
+        """The version of ``target`` valid at ``when`` (``None`` before the first one or after its end)."""
+        first, end = self._segment(target)
+        moment = instant(when)
+        # Last version that started at or before ``moment``; ties go to the larger node id.
+        row = first + int(np.searchsorted(self.start[first:end], moment, side="right")) - 1
+        if row < first:
+            return None
+        passport = int(self.passport[row])
+        return None if self.end[passport] <= moment else self.node(passport)
+
+    def latest(self, target: Node | str | int) -> Node | None:
+        """The version of ``target`` with the latest ``sdata:validFrom`` (``None`` once it has ended)."""
+        first, end = self._segment(target)
+        if end == first:
+            return None
+        passport = int(self.passport[end - 1])
+        return None if self.end[passport] <= instant(datetime.now(timezone.utc)) else self.node(passport)
+
+    def label(self, passport: Node | str | int) -> str | None:
+        """The ``sdata:hasVersion`` string of ``passport``."""
+        v = self.index_of(passport)
+        return None if v is None else self.labels.get(v)
+
+    def chain(self, passport: Node | str | int) -> list[Node]:
+        """``passport`` and the versions it supersedes, newest first (first predecessor only; stops at cycles)."""
+        v = self.index_of(passport)
+        if v is None:
+            raise KeyError(f"{passport} is not a known passport")
+        ptr, older = self._older_ptr, self._older
+        seen, order = {v}, [v]
+        while ptr[v + 1] > ptr[v]:
+            v = int(older[ptr[v]])
+            if v in seen:
+                break
+            seen.add(v)
+            order.append(v)
+        return [self.node(idx) for idx in order]
+
+
+class VersionBuilder:
+    """Collect ``describes``, ``supersedes`` and validity triples in any order."""
+
+    def __init__(self) -> None:
+        self._ids = TokenIds()
+        self._describes: list[tuple[int, int]] = []
+        self._supersedes: list[tuple[int, int]] = []
+        self._starts: dict[int, int] = {}
+        self._ends: dict[int, int] = {}
+        self._labels: dict[int, str] = {}
+        self._malformed: list[tuple[int, str]] = []
+        self._describes_tokens = {term_token(p) for p in DESCRIBES}
+        self._supersedes_tokens = {term_token(p): newer for p, newer in SUPERSEDES.items()}
+        self._instant_tokens = {term_token(p): column for p, column in INSTANTS.items()}
+        self._version_token = term_token(SDATA.hasVersion)
+
+    def _put(self, subject: str, predicate: str, obj: str) -> None:
+        """Record one triple; ``obj`` is a token for IRIs and a lexical form for literals."""
+        if predicate in self._describes_tokens:
+            self._describes.append((self._ids[subject], self._ids[obj]))
+        elif predicate in self._supersedes_tokens:
+            s, o = self._ids[subject], self._ids[obj]
+            self._supersedes.append((s, o) if self._supersedes_tokens[predicate] else (o, s))
+        elif predicate == self._version_token:
+            self._labels[self._ids[subject]] = obj
+        else:
+            column = self._starts if self._instant_tokens[predicate] == "start" else self._ends
+            v = self._ids[subject]
+            try:
+                moment = instant(obj)
+            except ValueError:
+                self._malformed.append((v, obj))
+                return
+            # Several starts: the earliest counts; several ends (validUntil, revokedAt): the earliest, too.
+            column[v] = min(moment, column.get(v, moment))
+
+    def _literal(self, predicate: str) -> bool:
+        return predicate == self._version_token or predicate in self._instant_tokens
+
+    def add(self, triples: Iterable[tuple[Node, Node, Node]]) -> None:
+        for s, p, o in triples:
+            predicate = term_token(p)
+            if self._literal(predicate):
+                if isinstance(o, Literal):
+                    self._put(term_token(s), predicate, str(o))
+            elif predicate in self._describes_tokens or predicate in self._supersedes_tokens:
+                if not isinstance(o, Literal):
+                    self._put(term_token(s), predicate, term_token(o))
+
+    def add_graph(self, graph: Graph) -> None:
+        """Feed only the relevant predicates of ``graph`` through its indexes."""
+        index = TripleIndex.from_graph(graph)
+        for predicate in (*DESCRIBES, *SUPERSEDES, *INSTANTS, SDATA.hasVersion):
+            self.add(index.triples(predicate))
+
+    def add_ntriples(self, lines: Iterable[str]) -> None:
+        """Like :meth:`add` for N-Triples lines, without building rdflib nodes."""
+        for subject, predicate, obj in token_triples(lines):
+            if self._literal(predicate):
+                if obj[0] == '"':
+                    self._put(subject, predicate, str(parse_term(obj)))
+            elif predicate in self._describes_tokens or predicate in self._supersedes_tokens:
+                if obj[0] != '"':
+                    self._put(subject, predicate, obj)
+
+    def build(self) -> VersionIndex:
+        starts = self._starts
+        entries = [(p, t, starts[p]) for p, t in self._describes if p in starts]
+        ends = np.full(len(self._ids), NEVER, dtype=np.int64)
+        for v, moment in self._ends.items():
+            ends[v] = moment
+        passports, targets, moments = (array("q", column) for column in zip(*entries)) if entries else ((), (), ())
+        return VersionIndex(
+            tuple(self._ids), passports, targets, moments, ends, self._supersedes, self._labels, self._malformed
+        )
+
+
+def load_versions(paths: Iterable[Path]) -> VersionIndex:
+    """Build from RDF files; N-Triples files are streamed line by line."""
+    return load_paths(VersionBuilder(), paths).build()
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Resolve passport versions and check supersedes chains.")
+    parser.add_argument("data", type=Path, nargs="+", help="Data graph(s); .nt files are streamed")
+    parser.add_argument("--target", help="IRI of a described product; prints its versions")
+    parser.add_argument("--at", help="ISO 8601 instant; prints the version valid then")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv if argv is not None else sys.argv[1:])
+    index = load_versions(args.data)
+    if args.target:
+        target = URIRef(args.target)
+        try:
+            if args.at:
+                print(index.at(target, args.at))
+            else:
+                for start, passport in index.versions(target):
+                    print(f"{start}  {index.label(passport) or '':<8} {passport}")
+        except KeyError as exc:
+            print(exc.args[0], file=sys.stderr)
+            return 2
+    for older, newer in index.forks.items():
+        print(f"  ✗ fork: {older} is superseded by {', '.join(map(str, newer))}")
+    for cycle in index.cycles:
+        print(f"  ✗ cycle: {' → '.join(map(str, cycle))}")
+    for passport, lexical in index.malformed:
+        print(f"  ! skipped malformed timestamp {lexical!r} of {passport}", file=sys.stderr)
+    print(f"{len(index)} version(s), {len(index.forks)} fork(s), {len(index.cycles)} cycle(s)")
+    return 1 if index.forks or index.cycles else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -11,6 +11,8 @@ from pathlib import Path
 from rdflib import Graph, Literal, Namespace, RDF, RDFS, URIRef
 from rdflib.namespace import OWL, SKOS
 
+from src import loader
+
 SDATA = Namespace("https://w3id.org/sdata/core/")
 SAGENTS = Namespace("https://w3id.org/sdata/vocab/agents/")
 SDATA_AGENT = SDATA.Agent
@@ -64,9 +66,8 @@ def load_graph(core_path: Path, agents_path: Path) -> Graph:
     if not agents_path.exists():
         raise FileNotFoundError(f"Agents ontology not found: {agents_path}")
 
-    graph = Graph()
-    graph.parse(core_path, format="turtle")
-    graph.parse(agents_path, format="turtle")
+    graph = loader.load_graph(core_path)
+    graph += loader.load_graph(agents_path)
     return graph
 
 
@@ -11,6 +11,8 @@ from pathlib import Path
 from rdflib import Graph, Literal, Namespace, RDF, RDFS, URIRef
 from rdflib.namespace import OWL
 
+from src import loader
+
 SDATA = Namespace("https://w3id.org/sdata/core/")
 MIN_PREFIX = "https://w3id.org/min#"
 
@@ -39,12 +41,11 @@ def load_graph(core_path: Path, alignment_path: Path | None = None) -> Graph:
     if not core_path.exists():
         raise FileNotFoundError(f"Core ontology not found: {core_path}")
 
-    graph = Graph()
-    graph.parse(core_path, format="turtle")
+    graph = loader.load_graph(core_path)
     if alignment_path:
         if not alignment_path.exists():
             raise FileNotFoundError(f"Alignment ontology not found: {alignment_path}")
-        graph.parse(alignment_path, format="turtle")
+        graph += loader.load_graph(alignment_path)
     return graph
 
 
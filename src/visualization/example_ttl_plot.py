@@ -8,12 +8,13 @@ from pathlib import Path
 
 from rdflib import BNode, Graph, Literal, RDF, URIRef
 
+from src import loader
+
 
 def load_graph(ttl_path: Path) -> Graph:
     if not ttl_path.exists():
         raise FileNotFoundError(f"TTL file not found: {ttl_path}")
-    graph = Graph()
-    graph.parse(ttl_path, format="turtle")
+    graph = loader.load_graph(ttl_path)
     return graph
 
 
@@ -10,6 +10,8 @@ from pathlib import Path
 from rdflib import Graph, Literal, Namespace, RDF, RDFS, URIRef
 from rdflib.namespace import OWL
 
+from src import loader
+
 SDATA = Namespace("https://w3id.org/sdata/core/")
 SLC = Namespace("https://w3id.org/sdata/lifecycle#")
 
@@ -53,8 +55,7 @@ class LifecycleModel:
 def load_graph(lifecycle_path: Path) -> Graph:
     if not lifecycle_path.exists():
         raise FileNotFoundError(f"Lifecycle ontology not found: {lifecycle_path}")
-    graph = Graph()
-    graph.parse(lifecycle_path, format="turtle")
+    graph = loader.load_graph(lifecycle_path)
     return graph
 
 
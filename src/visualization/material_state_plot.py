@@ -11,6 +11,9 @@ from pathlib import Path
 from rdflib import Graph, Literal, Namespace, RDF, RDFS, URIRef
 from rdflib.namespace import OWL, SKOS
 
+from src import loader
+from src.skos import SkosIndex
+
 SMS = Namespace("https://w3id.org/sdata/material-state/")
 
 
@@ -37,8 +40,7 @@ class Model:
 def load_graph(state_path: Path) -> Graph:
     if not state_path.exists():
         raise FileNotFoundError(f"Material-state ontology not found: {state_path}")
-    graph = Graph()
-    graph.parse(state_path, format="turtle")
+    graph = loader.load_graph(state_path)
     return graph
 
 
@@ -67,7 +69,9 @@ def _is_sms_uri(iri: URIRef) -> bool:
     return str(iri).startswith(str(SMS))
 
 
-def extract_model(graph: Graph) -> Model:
+def extract_model(graph: Graph, skos: SkosIndex | None = None) -> Model:
+    """Build the plot model; scheme members, top concepts and broader edges come from ``skos``."""
+    skos = skos or SkosIndex.from_graph(graph)
     nodes: dict[URIRef, str] = {}
     edges: set[Edge] = set()
 
@@ -85,11 +89,7 @@ def extract_model(graph: Graph) -> Model:
         if (axis, RDFS.subClassOf, state_axis) in graph and state_axis in nodes:
             edges.add(Edge(parent=state_axis, child=axis, kind="subclass"))
 
-    schemes = {
-        scheme
-        for scheme in graph.subjects(RDF.type, SKOS.ConceptScheme)
-        if isinstance(scheme, URIRef) and _is_sms_uri(scheme)
-    }
+    schemes = {scheme for scheme in skos.schemes if _is_sms_uri(scheme)}
     for scheme in schemes:
         nodes[scheme] = "scheme"
 
@@ -98,31 +98,25 @@ def extract_model(graph: Graph) -> Model:
             if isinstance(scheme, URIRef) and scheme in schemes:
                 edges.add(Edge(parent=axis, child=scheme, kind="scheme"))
 
-    concepts: set[URIRef] = set()
-    for scheme in schemes:
-        scheme_concepts = {
-            concept
-            for concept in graph.subjects(SKOS.inScheme, scheme)
-            if isinstance(concept, URIRef) and _is_sms_uri(concept)
-        }
-        concepts |= scheme_concepts
-
+    concepts = {concept for scheme in schemes for concept in skos.members(scheme) if _is_sms_uri(concept)}
     for concept in concepts:
         nodes[concept] = "concept"
 
     for scheme in schemes:
-        for concept in graph.objects(scheme, SKOS.hasTopConcept):
-            if isinstance(concept, URIRef) and concept in concepts:
+        for concept in skos.top_concepts(scheme):
+            if concept in concepts:
                 edges.add(Edge(parent=scheme, child=concept, kind="top"))
 
-    for concept in concepts:
-        for parent in graph.objects(concept, SKOS.broader):
-            if isinstance(parent, URIRef) and parent in concepts:
-                edges.add(Edge(parent=parent, child=concept, kind="broader"))
+    for concept, parent in skos.broader_edges():
+        if concept in concepts and parent in concepts:
+            edges.add(Edge(parent=parent, child=concept, kind="broader"))
+
+    def label(iri: URIRef) -> str:
+        return skos.label(iri) if skos.labels(iri) else _best_label(graph, iri)
 
     return Model(
         nodes=tuple(
-            Node(iri=iri, label=_best_label(graph, iri), kind=kind)
+            Node(iri=iri, label=label(iri), kind=kind)
             for iri, kind in sorted(nodes.items(), key=lambda item: str(item[0]))
         ),
         edges=tuple(sorted(edges, key=lambda e: (str(e.parent), str(e.child), e.kind))),
@@ -230,7 +224,7 @@ def main(argv: list[str] | None = None) -> int:
 
     try:
         graph = load_graph(args.material_state)
-        model = extract_model(graph)
+        model = extract_model(graph, SkosIndex.load((args.material_state,)))
         if not model.nodes:
             print("No nodes found for visualization.", file=sys.stderr)
             return 4
@@ -13,6 +13,8 @@ from textwrap import dedent
 from rdflib import Graph, Literal, RDF, RDFS, URIRef
 from rdflib.namespace import OWL
 
+from src import loader
+
 MIN_PREFIX = "https://w3id.org/min"
 SDATA_CORE_PREFIX = "https://w3id.org/sdata/core/"
 
@@ -79,11 +81,9 @@ def load_graphs(min_path: Path, core_path: Path) -> tuple[Graph, Graph, Graph]:
         if not path.exists():
             raise FileNotFoundError(f"{label} not found: {path}")
 
-    min_graph = Graph()
-    min_graph.parse(min_path, format="turtle")
+    min_graph = loader.load_graph(min_path)
 
-    core_graph = Graph()
-    core_graph.parse(core_path, format="turtle")
+    core_graph = loader.load_graph(core_path)
 
     merged = Graph()
     merged += min_graph
@@ -11,6 +11,9 @@ from pathlib import Path
 from rdflib import Graph, Literal, RDF, RDFS, URIRef
 from rdflib.namespace import OWL
 
+from src import loader
+from src.hierarchy import ClassHierarchy
+
 MIN_PREFIX = "https://w3id.org/min"
 SDATA_CORE_PREFIX = "https://w3id.org/sdata/core/"
 MIN_ENTITY = "https://w3id.org/min#Entity"
@@ -55,25 +58,15 @@ class Model:
     edges: tuple[Edge, ...]
 
 
-def _children_index(model: Model) -> dict[str, set[str]]:
-    children: dict[str, set[str]] = {}
-    for edge in model.edges:
-        parent = str(edge.parent)
-        child = str(edge.child)
-        children.setdefault(parent, set()).add(child)
-    return children
+def _hierarchy(model: Model) -> ClassHierarchy:
+    return ClassHierarchy(
+        (node.iri for node in model.nodes),
+        ((edge.child, edge.parent) for edge in model.edges),
+    )
 
 
-def _descendants(start: str, children: dict[str, set[str]]) -> set[str]:
-    seen: set[str] = set()
-    stack = list(children.get(start, set()))
-    while stack:
-        node = stack.pop()
-        if node in seen:
-            continue
-        seen.add(node)
-        stack.extend(children.get(node, set()))
-    return seen
+def _descendants(start: str, hierarchy: ClassHierarchy) -> set[str]:
+    return {str(iri) for iri in hierarchy.descendants(URIRef(start), include_self=False)}
 
 
 def _local_name(iri: str) -> str:
@@ -125,11 +118,9 @@ def load_graphs(min_path: Path, core_path: Path) -> tuple[Graph, Graph, Graph]:
         if not path.exists():
             raise FileNotFoundError(f"{label} not found: {path}")
 
-    min_graph = Graph()
-    min_graph.parse(min_path, format="turtle")
+    min_graph = loader.load_graph(min_path)
 
-    core_graph = Graph()
-    core_graph.parse(core_path, format="turtle")
+    core_graph = loader.load_graph(core_path)
 
     merged = Graph()
     merged += min_graph
@@ -213,12 +204,12 @@ def build_agraph(model: Model):
         graph.add_node(str(node.iri), label=node.label, **style_map[node.kind])
 
     node_ids = {str(node.iri) for node in model.nodes}
-    children = _children_index(model)
+    hierarchy = _hierarchy(model)
     kind_by_id = {str(node.iri): node.kind for node in model.nodes}
 
     # Cluster each MIN class under Nexus/Forma together with all reachable sdata children.
-    nexus_desc = _descendants(MIN_NEXUS, children) if MIN_NEXUS in node_ids else set()
-    forma_desc = _descendants(MIN_FORMA, children) if MIN_FORMA in node_ids else set()
+    nexus_desc = _descendants(MIN_NEXUS, hierarchy) if MIN_NEXUS in node_ids else set()
+    forma_desc = _descendants(MIN_FORMA, hierarchy) if MIN_FORMA in node_ids else set()
     branch_min_classes = sorted(
         iri
         for iri in (nexus_desc | forma_desc)
@@ -227,7 +218,7 @@ def build_agraph(model: Model):
     for min_class in branch_min_classes:
         sdata_children = sorted(
             iri
-            for iri in _descendants(min_class, children)
+            for iri in _descendants(min_class, hierarchy)
             if iri in node_ids and kind_by_id.get(iri) == "sdata"
         )
         members = [min_class] + sdata_children
@@ -11,6 +11,8 @@ from pathlib import Path
 from rdflib import Graph, Literal, RDF, RDFS, URIRef
 from rdflib.namespace import OWL, SKOS
 
+from src import loader
+
 SDATA_SLASH = "https://w3id.org/sdata/core/"
 SDATA_HASH = "https://w3id.org/sdata/core#"
 PROCESS = URIRef(SDATA_SLASH + "Process")
@@ -112,11 +114,9 @@ def load_graphs(core_path: Path, processtypes_path: Path) -> tuple[Graph, Graph,
         if not path.exists():
             raise FileNotFoundError(f"{label} not found: {path}")
 
-    core_graph = Graph()
-    core_graph.parse(core_path, format="turtle")
+    core_graph = loader.load_graph(core_path)
 
-    proc_graph = Graph()
-    proc_graph.parse(processtypes_path, format="turtle")
+    proc_graph = loader.load_graph(processtypes_path)
 
     merged = Graph()
     merged += core_graph
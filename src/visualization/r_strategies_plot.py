@@ -10,6 +10,9 @@ from pathlib import Path
 from rdflib import Graph, Literal, Namespace, RDF, RDFS, URIRef
 from rdflib.namespace import SKOS
 
+from src import loader
+from src.skos import SkosIndex
+
 SDATA = Namespace("https://w3id.org/sdata/core/")
 SR = Namespace("https://w3id.org/sdata/r-strategies/")
 ENERGY_LEVEL = URIRef("https://w3id.org/sdata/r-strategies/EnergyLevel")
@@ -43,8 +46,7 @@ class Model:
 def load_graph(strategies_path: Path) -> Graph:
     if not strategies_path.exists():
         raise FileNotFoundError(f"R-strategies ontology not found: {strategies_path}")
-    graph = Graph()
-    graph.parse(strategies_path, format="turtle")
+    graph = loader.load_graph(strategies_path)
     return graph
 
 
@@ -69,78 +71,49 @@ def _best_label(graph: Graph, iri: URIRef) -> str:
     return str(sorted(labels, key=score)[0])
 
 
-def extract_model(graph: Graph) -> Model:
+def extract_model(graph: Graph, skos: SkosIndex | None = None) -> Model:
+    """Build the plot model; schemes, top concepts, collections and labels come from ``skos``."""
+    skos = skos or SkosIndex.from_graph(graph)
     nodes: dict[URIRef, Node] = {}
     edges: set[Edge] = set()
 
-    schemes = [
-        s
-        for s in graph.subjects(RDF.type, SKOS.ConceptScheme)
-        if isinstance(s, URIRef) and str(s).startswith(str(SR))
-    ]
+    def label(iri: URIRef) -> str:
+        return skos.label(iri) if skos.labels(iri) else _best_label(graph, iri)
+
+    def concept_node(concept: URIRef) -> Node:
+        rank_values = [o for o in graph.objects(concept, CIRCULARITY_RANK) if isinstance(o, Literal)]
+        rank_num = int(rank_values[0]) if rank_values else None
+        rank_suffix = f" [rank {rank_num}]" if rank_num is not None else ""
+        return Node(iri=concept, label=f"{label(concept)}{rank_suffix}", kind="concept", rank=rank_num)
+
+    schemes = [s for s in skos.schemes if str(s).startswith(str(SR))]
     if not schemes:
         # fallback to known default
         schemes = [SR.RStrategyScheme]
 
     for scheme in schemes:
-        nodes[scheme] = Node(iri=scheme, label=_best_label(graph, scheme), kind="scheme")
-
-        top_concepts = [
-            c for c in graph.objects(scheme, SKOS.hasTopConcept) if isinstance(c, URIRef)
-        ]
-        for concept in top_concepts:
-            rank_values = [o for o in graph.objects(concept, CIRCULARITY_RANK) if isinstance(o, Literal)]
-            rank_num = int(rank_values[0]) if rank_values else None
-            rank_suffix = ""
-            if rank_num is not None:
-                rank_suffix = f" [rank {rank_num}]"
-            label = f"{_best_label(graph, concept)}{rank_suffix}"
-            nodes[concept] = Node(iri=concept, label=label, kind="concept", rank=rank_num)
+        nodes[scheme] = Node(iri=scheme, label=label(scheme), kind="scheme")
+        for concept in skos.top_concepts(scheme) if scheme in skos.schemes else ():
+            nodes[concept] = concept_node(concept)
             edges.add(Edge(source=scheme, target=concept, label="top concept", kind="top"))
 
-    collections = [
-        c
-        for c in graph.subjects(RDF.type, SKOS.Collection)
-        if isinstance(c, URIRef) and str(c).startswith(str(SR))
-    ]
+    collections = [c for c in skos.collections if str(c).startswith(str(SR))]
     for coll in collections:
-        nodes[coll] = Node(iri=coll, label=_best_label(graph, coll), kind="collection")
-        for member in graph.objects(coll, SKOS.member):
-            if not isinstance(member, URIRef):
-                continue
+        nodes[coll] = Node(iri=coll, label=label(coll), kind="collection")
+        for member in skos.collections[coll]:
             if member not in nodes:
-                rank_values = [o for o in graph.objects(member, CIRCULARITY_RANK) if isinstance(o, Literal)]
-                rank_num = int(rank_values[0]) if rank_values else None
-                rank_suffix = f" [rank {rank_num}]" if rank_num is not None else ""
-                nodes[member] = Node(
-                    iri=member,
-                    label=f"{_best_label(graph, member)}{rank_suffix}",
-                    kind="concept",
-                    rank=rank_num,
-                )
+                nodes[member] = concept_node(member)
             edges.add(Edge(source=coll, target=member, label="member", kind="member"))
 
-    concepts = [
-        c
-        for c in graph.subjects(RDF.type, SKOS.Concept)
-        if isinstance(c, URIRef) and str(c).startswith(str(SR))
-    ]
+    concepts = [c for c in skos.concepts if str(c).startswith(str(SR)) and (c, RDF.type, SKOS.Concept) in graph]
     for concept in concepts:
         if concept not in nodes:
-            rank_values = [o for o in graph.objects(concept, CIRCULARITY_RANK) if isinstance(o, Literal)]
-            rank_num = int(rank_values[0]) if rank_values else None
-            rank_suffix = f" [rank {rank_num}]" if rank_num is not None else ""
-            nodes[concept] = Node(
-                iri=concept,
-                label=f"{_best_label(graph, concept)}{rank_suffix}",
-                kind="concept",
-                rank=rank_num,
-            )
+            nodes[concept] = concept_node(concept)
         for verb in graph.objects(concept, MAPS_TO_VERB):
             if not isinstance(verb, URIRef):
                 continue
             if verb not in nodes:
-                nodes[verb] = Node(iri=verb, label=_best_label(graph, verb), kind="verb")
+                nodes[verb] = Node(iri=verb, label=label(verb), kind="verb")
             edges.add(Edge(source=concept, target=verb, label="mapsToVerb", kind="maps"))
 
     # Synthetic grouping node for the terminal energy level (R9).
@@ -344,7 +317,7 @@ def main(argv: list[str] | None = None) -> int:
 
     try:
         graph = load_graph(args.strategies)
-        model = extract_model(graph)
+        model = extract_model(graph, SkosIndex.load((args.strategies,)))
         if not model.nodes:
             print("No R-strategy nodes found for visualization.", file=sys.stderr)
             return 4
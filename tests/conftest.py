@@ -0,0 +1,17 @@
+import os
+
+import pytest
+
+from src import loader
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _isolated_cache(tmp_path_factory):
+    """Keep cache entries written by the tests out of the user's ``~/.cache/sdata-ontology``."""
+    previous = os.environ.get(loader.CACHE_DIR_ENV)
+    os.environ[loader.CACHE_DIR_ENV] = str(tmp_path_factory.mktemp("sdata-cache"))
+    yield
+    if previous is None:
+        del os.environ[loader.CACHE_DIR_ENV]
+    else:
+        os.environ[loader.CACHE_DIR_ENV] = previous
@@ -0,0 +1,92 @@
+import pytest
+from rdflib import BNode, Graph, Literal, Namespace
+from rdflib.namespace import XSD
+
+from src.bom import BomBuilder, BomGraph
+from src.lineage import MIN, SDATA
+from src.quantities import QUDT_NUMERIC_VALUE
+
+EX = Namespace("https://example.org/")
+
+
+def _position(graph: Graph, assembly, component, quantity=None, predicate=SDATA.hasComponent) -> None:
+    graph.add((assembly, predicate, component))
+    if quantity is not None:
+        aqv = BNode()
+        graph.add((component, SDATA.hasQuantity, aqv))
+        graph.add((aqv, SDATA.name, Literal("quantity")))
+        graph.add((aqv, QUDT_NUMERIC_VALUE, Literal(quantity, datatype=XSD.double)))
+
+
+def _harness() -> Graph:
+    # harness ─┬─ 2 × branch ─┬─ 3 m wire
+    #          │              └─ 4 × terminal
+    #          ├─ 1 × connector ── 2 × terminal    (terminal is shared, through a BOM entry)
+    #          └─ clip (no quantity: counts once)
+    graph = Graph()
+    graph.add((EX.bom, SDATA.describes, EX.harness))
+    _position(graph, EX.harness, EX.branch, 2)
+    _position(graph, EX.harness, EX.connector, 1, predicate=MIN.hasComponent)
+    _position(graph, EX.harness, EX.clip)
+    _position(graph, EX.branch, EX.wire, 3)
+    _position(graph, EX.branch, EX.terminal, 4)
+    _position(graph, EX.connector, EX.connector_pos_10, 2)
+    graph.add((EX.connector_pos_10, SDATA.typifiedBy, EX.terminal))
+    return graph
+
+
+def test_explosion_requirements_and_where_used():
+    bom = BomGraph.from_graph(_harness())
+
+    explosion = bom.explode(EX.harness)
+    assert len(explosion) == 7  # the shared terminal appears under both parents
+    rows = explosion.indented()
+    assert rows[0][:2] == (0, EX.harness)
+    branch = [node for _, node, _, _ in rows].index(EX.branch)
+    assert {node for _, node, _, _ in rows[branch + 1 : branch + 3]} == {EX.wire, EX.terminal}
+    assert {(node, total) for level, node, _, total in rows if level == 2} == {
+        (EX.wire, 6.0),
+        (EX.terminal, 8.0),
+        (EX.terminal, 2.0),
+    }
+
+    leaves = bom.requirements(EX.harness, 10).terminal().as_dict()
+    assert leaves == {EX.wire: 60.0, EX.terminal: 100.0, EX.clip: 10.0}
+    assert bom.requirements(EX.harness).as_dict()[EX.branch] == 2.0
+
+    used = bom.where_used(EX.terminal).as_dict()
+    assert used == {EX.terminal: 1.0, EX.branch: 4.0, EX.connector: 2.0, EX.harness: 10.0}
+    assert bom.where_used(EX.terminal).terminal().as_dict() == {EX.harness: 10.0}
+    assert set(bom.explode(EX.harness, max_depth=1).iris()) == {EX.harness, EX.branch, EX.connector, EX.clip}
+
+
+def test_cycles_are_errors():
+    graph = _harness()
+    graph.add((EX.wire, MIN.hasComponent, EX.harness))
+    graph.add((EX.a, SDATA.hasComponent, EX.b))
+    graph.add((EX.b, SDATA.hasComponent, EX.a))
+    bom = BomGraph.from_graph(graph)
+    for query in (bom.explode, bom.requirements, bom.where_used):
+        with pytest.raises(ValueError, match="cycle"):
+            query(EX.branch)
+    with pytest.raises(ValueError, match="cycle"):
+        bom.explode(EX.a)  # found before expanding any level
+    with pytest.raises(KeyError):
+        bom.explode(EX.nothing)
+
+
+def test_ntriples_stream_and_wide_levels():
+    graph = Graph()
+    for branch in range(200):
+        _position(graph, EX.harness, EX[f"branch{branch}"], 2)
+        for wire in range(5):
+            _position(graph, EX[f"branch{branch}"], EX[f"wire{wire}"], 0.5 if branch == 0 else None)
+    builder = BomBuilder()
+    builder.add_ntriples(graph.serialize(format="nt").splitlines())
+    streamed = builder.build()
+
+    assert len(streamed.explode(EX.harness)) == 1 + 200 + 200 * 5
+    leaves = streamed.requirements(EX.harness).terminal().as_dict()
+    assert leaves == {EX[f"wire{wire}"]: 200.0 for wire in range(5)}
+    assert streamed.where_used(EX.wire0).as_dict()[EX.harness] == 200.0
+    assert streamed.requirements(EX.harness).as_dict() == BomGraph.from_graph(graph).requirements(EX.harness).as_dict()
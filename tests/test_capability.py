@@ -0,0 +1,92 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from rdflib import BNode, Graph, Literal, Namespace, RDF
+from rdflib.namespace import XSD
+
+from src import loader
+from src.capability import QUDT_NUMERIC_VALUE, CapabilityEngine, capability
+from src.domains.base import SDATA
+from src.domains.interval import Interval
+from src.domains.statistical import Normal
+
+ROOT = Path(__file__).resolve().parent.parent
+EX = Namespace("https://example.org/")
+EX_TT = Namespace("https://example.org/tensile-test/")
+
+
+def _measurements(graph, name, values, domains=()):
+    for value in values:
+        aqv = BNode()
+        graph.add((aqv, RDF.type, SDATA.AttributeQuantityValue))
+        graph.add((aqv, SDATA.name, Literal(name)))
+        graph.add((aqv, QUDT_NUMERIC_VALUE, Literal(float(value), datatype=XSD.double)))
+        for domain in domains:
+            graph.add((aqv, SDATA.hasValueDomain, domain))
+    return graph
+
+
+def _interval(graph, node, lower, upper):
+    graph.add((node, RDF.type, SDATA.IntervalDomain))
+    graph.add((node, SDATA.minValue, Literal(lower, datatype=XSD.double)))
+    graph.add((node, SDATA.maxValue, Literal(upper, datatype=XSD.double)))
+
+
+def test_sheet_thickness_cpk_from_example():
+    graph = loader.load_graph(ROOT / "examples" / "AttributeQuantityValue_sheetthickness.ttl", use_cache=False)
+    graph.add((EX_TT.attr_thickness, SDATA.hasValueDomain, EX_TT.dom_thickness_interval))
+    graph.add((EX_TT.attr_thickness, SDATA.hasValueDomain, EX_TT.dom_thickness_normal))
+    [t] = capability(graph)
+
+    assert (t.name, t.count, t.lower, t.upper) == ("t", 1, 1.1, 1.3)
+    assert (t.spec, t.model) == (EX_TT.dom_thickness_interval, EX_TT.dom_thickness_normal)
+    assert t.cp == pytest.approx(0.2 / (6 * 0.033))
+    assert t.cpk == pytest.approx(0.1 / (3 * 0.033))
+    assert round(t.cpk, 1) == 1.0
+    assert np.isnan(t.ppk)  # a single value has no sample spread
+
+
+def test_groups_from_graph_and_ntriples_agree():
+    rng = np.random.default_rng(0)
+    graph = Graph()
+    _interval(graph, EX.t_spec, 1.1, 1.3)
+    upper_only = EX.rm_spec
+    graph.add((upper_only, RDF.type, SDATA.IntervalDomain))
+    graph.add((upper_only, SDATA.minValue, Literal("-INF", datatype=XSD.double)))
+    graph.add((upper_only, SDATA.maxValue, Literal(340.0, datatype=XSD.double)))
+    thickness = rng.normal(1.21, 0.02, 500)
+    strength = rng.normal(300.0, 10.0, 300)
+    _measurements(graph, "t", thickness, [EX.t_spec])
+    _measurements(graph, "Rm", strength, [upper_only])
+    _measurements(graph, "b0", [20.0, 20.1])
+
+    by_name = {c.name: c for c in capability(graph)}
+    t = by_name["t"]
+    assert t.count == 500 and t.mean == pytest.approx(thickness.mean())
+    assert t.ppk == pytest.approx(min(1.3 - thickness.mean(), thickness.mean() - 1.1) / (3 * thickness.std(ddof=1)))
+    assert t.cpk == pytest.approx(t.ppk)  # no process model: Cpk falls back to the observed values
+    assert np.isnan(by_name["Rm"].pp)
+    assert by_name["Rm"].ppk == pytest.approx((340.0 - strength.mean()) / (3 * strength.std(ddof=1)))
+    assert np.isnan(by_name["b0"].cpk) and by_name["b0"].spec is None
+
+    engine = CapabilityEngine()
+    engine.add_ntriples(graph.serialize(format="nt").splitlines())
+    streamed = engine.results()
+    assert [(c.name, c.count, c.spec) for c in streamed] == [(c.name, c.count, c.spec) for c in capability(graph)]
+    assert [c.ppk for c in streamed] == pytest.approx([c.ppk for c in capability(graph)], nan_ok=True)
+
+    model = Normal(mu=1.2, sigma=0.02)
+    [overridden] = [c for c in capability(graph, models={"t": model}) if c.name == "t"]
+    assert overridden.cpk == pytest.approx(0.1 / 0.06)
+
+
+def test_conflicting_spec_limits_are_rejected():
+    graph = Graph()
+    _interval(graph, EX.a, 0.0, 1.0)
+    _interval(graph, EX.b, 0.0, 2.0)
+    _measurements(graph, "x", [0.5], [EX.a])
+    _measurements(graph, "x", [0.6], [EX.b])
+    with pytest.raises(ValueError, match="2 IntervalDomains"):
+        capability(graph)
+    assert capability(graph, specs={"x": Interval(0.0, 1.5)})[0].upper == 1.5
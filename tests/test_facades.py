@@ -0,0 +1,65 @@
+import io
+from pathlib import Path
+
+from rdflib import Graph, Namespace, RDF
+from rdflib.namespace import OWL
+
+from src import loader
+from src.facades import FacadeMap, normalize_graph, normalize_ntriples
+
+ROOT = Path(__file__).resolve().parent.parent
+MIN = Namespace("https://w3id.org/min#")
+SDATA = Namespace("https://w3id.org/sdata/core/")
+EX = Namespace("https://example.org/")
+EX_ZUG = Namespace("https://example.org/zugversuch/")
+
+
+def _facades(prefer="sdata"):
+    return FacadeMap.from_graph(loader.load_graph(ROOT / "sdata-core.ttl", use_cache=False), prefer=prefer)
+
+
+def test_all_core_facade_properties_are_mapped():
+    facades = _facades()
+    assert len(facades.properties) == 52
+    assert facades.properties[MIN.hasInput] == SDATA.hasInput
+    assert SDATA.hasInput not in facades.properties
+    assert _facades("min").properties[SDATA.hasInput] == MIN.hasInput
+
+
+def test_normalize_graph_merges_mixed_styles():
+    example = loader.load_graph(ROOT / "examples" / "specimen_tensiontest_data.ttl", use_cache=False)
+    normalized = normalize_graph(example, _facades())
+    assert len(normalized) == len(example)
+    assert not list(normalized.triples((None, MIN.hasInput, None)))
+    assert (EX_ZUG.probenfertigung, SDATA.hasInput, EX_ZUG.coil) in normalized
+    assert (EX_ZUG.zugversuch, SDATA.generates, EX_ZUG.ergebnis) in normalized
+
+
+def test_normalize_ntriples_streams_lines():
+    graph = Graph()
+    graph.add((EX.a, OWL.equivalentClass, EX.b))
+    graph.add((EX.p, OWL.equivalentProperty, MIN.hasInput))
+    graph.add((SDATA.hasInput, OWL.equivalentProperty, MIN.hasInput))
+    facades = FacadeMap.from_graph(graph)
+    assert facades.properties[EX.p] == SDATA.hasInput
+    assert facades.classes == {EX.b: EX.a}
+
+    source = io.StringIO(
+        "# header\n"
+        f"<{EX.s}> <{MIN.hasInput}> <{EX.o}> .\n"
+        f"_:b1 <{EX.p}> \"x y <z>\"@en .\n"
+        f"<{EX.s}> <{RDF.type}> <{EX.b}> .\n"
+        f"<{EX.s}> <{EX.keep}> \"1\" .\n"
+        "\n"
+    )
+    target = io.StringIO()
+    lines, rewritten = normalize_ntriples(source, target, facades)
+    assert (lines, rewritten) == (6, 3)
+
+    out = target.getvalue().splitlines()
+    assert out[0] == "# header"
+    assert out[1] == f"<{EX.s}> <{SDATA.hasInput}> <{EX.o}> ."
+    assert out[2] == f"_:b1 <{SDATA.hasInput}> \"x y <z>\"@en ."
+    assert out[3] == f"<{EX.s}> <{RDF.type}> <{EX.a}> ."
+    assert out[4] == f"<{EX.s}> <{EX.keep}> \"1\" ."
+    Graph().parse(data=target.getvalue(), format="nt")
@@ -0,0 +1,142 @@
+from pathlib import Path
+
+import pytest
+from rdflib import BNode, Graph, Literal, Namespace
+from rdflib.namespace import RDF, XSD
+
+from src import loader
+from src.bom import BomGraph
+from src.footprint import FootprintBuilder, FootprintGraph
+from src.lineage import SDATA
+from src.quantities import QUDT_NUMERIC_VALUE, QUDT_UNIT
+from src.units import UnitTable
+
+EX = Namespace("https://example.org/")
+UNIT = Namespace("http://qudt.org/vocab/unit/")
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _aqv(graph: Graph, owner, name: str, value: float, unit=None) -> None:
+    aqv = BNode()
+    graph.add((owner, SDATA.hasQuantity, aqv))
+    graph.add((aqv, SDATA.name, Literal(name)))
+    graph.add((aqv, QUDT_NUMERIC_VALUE, Literal(value, datatype=XSD.double)))
+    if unit is not None:
+        graph.add((aqv, QUDT_UNIT, unit))
+
+
+def _harness() -> Graph:
+    # ore → smelt → copper → draw → {wire, scrap};  sheet → stamp → terminal
+    # harness ← 3 × wire + 4 × terminal
+    graph = Graph()
+    graph.add((EX.smelt, SDATA.hasInput, EX.ore))
+    graph.add((EX.smelt, SDATA.hasOutput, EX.copper))
+    graph.add((EX.smelt, SDATA.hasData, EX.report))
+    graph.add((EX.report, SDATA.producedBy, EX.smelt))  # the report is folded into smelt, not an output
+    _aqv(graph, EX.report, "co2", 10.0)
+    _aqv(graph, EX.report, "energy", 20.0, UNIT["KiloW-HR"])
+    graph.add((EX.draw, SDATA.hasInput, EX.copper))
+    graph.add((EX.draw, SDATA.hasOutput, EX.wire))
+    graph.add((EX.scrap, SDATA.resultOf, EX.draw))
+    graph.add((EX.draw, SDATA.hasOutput, EX.scrap))  # duplicate of the inverse above
+    _aqv(graph, EX.draw, "co2", 4.0)
+    _aqv(graph, EX.draw, "energy", 36.0, UNIT.MegaJ)
+    graph.add((EX.stamp, SDATA.hasInput, EX.sheet))
+    graph.add((EX.terminal, SDATA.resultOf, EX.stamp))
+    _aqv(graph, EX.sheet, "co2", 2.0)
+    _aqv(graph, EX.stamp, "co2", 1.0)
+    graph.add((EX.harness, SDATA.hasComponent, EX.wire))
+    graph.add((EX.harness, SDATA.hasComponent, EX.terminal))
+    _aqv(graph, EX.wire, "quantity", 3.0)
+    _aqv(graph, EX.terminal, "quantity", 4.0)
+    _aqv(graph, EX.harness, "co2", 0.5)
+    return graph
+
+
+def test_rollup_splits_outputs_and_multiplies_positions():
+    footprint = FootprintGraph.from_graph(_harness())
+    assert footprint.total(EX.copper, "co2") == 10.0
+    assert footprint.total(EX.wire, "co2") == footprint.total(EX.scrap, "co2") == 7.0
+    assert footprint.total(EX.terminal, "co2") == 3.0
+    assert footprint.total(EX.harness, "co2") == 0.5 + 3 * 7.0 + 4 * 3.0
+    assert EX.report not in footprint.as_dict("co2")
+
+    assert footprint.set_value(EX.smelt, "co2", 12.0) == 6  # smelt, copper, draw, wire, scrap, harness
+    assert footprint.total(EX.harness, "co2") == 0.5 + 3 * 8.0 + 4 * 3.0
+    assert footprint.total(EX.terminal, "co2") == 3.0
+    updated = footprint.totals.copy()
+    footprint.recompute()
+    assert footprint.totals == pytest.approx(updated)
+    with pytest.raises(KeyError):
+        footprint.total(EX.harness, "water")
+
+
+def test_boundary_and_cycles():
+    graph = _harness()
+    graph.add((EX.gate, RDF.type, SDATA.Boundary))
+    for member in (EX.draw, EX.wire, EX.scrap, EX.stamp, EX.terminal, EX.harness):
+        graph.add((EX.gate, SDATA.bounds, member))
+    graph.add((EX.sheet, SDATA.hasBoundary, EX.gate))
+    footprint = FootprintGraph.from_graph(graph, boundary=EX.gate)
+    assert footprint.total(EX.harness, "co2") == 0.5 + 3 * 2.0 + 4 * 3.0  # smelting lies outside
+    with pytest.raises(KeyError, match="bounds no nodes"):
+        FootprintGraph.from_graph(graph, boundary=EX.nowhere)
+
+    graph.add((EX.ore, SDATA.derivedFrom, EX.scrap))  # recycling loop without a cut-off
+    with pytest.raises(ValueError, match="cycle"):
+        FootprintGraph.from_graph(graph)
+
+
+def test_ntriples_stream_with_unit_conversion(tmp_path):
+    builder = FootprintBuilder()
+    builder.add_ntriples(_harness().serialize(format="nt").splitlines())
+    units = UnitTable.load(cache_dir=tmp_path, use_cache=True)
+    footprint = builder.build(units={"energy": UNIT["KiloW-HR"]}, unit_table=units)
+    assert footprint.total(EX.draw, "energy") == pytest.approx(30.0)  # 20 kWh + 36 MJ
+    assert footprint.total(EX.harness, "energy") == pytest.approx(3 * 15.0)
+    assert footprint.as_dict("co2") == FootprintGraph.from_graph(_harness()).as_dict("co2")
+
+
+def test_component_that_is_also_a_process_input_counts_once():
+    graph = Graph()
+    graph.add((EX.rolling, SDATA.hasOutput, EX.part))
+    graph.add((EX.assembly, SDATA.hasInput, EX.part))
+    graph.add((EX.assembly, SDATA.hasOutput, EX.asm))
+    graph.add((EX.asm, SDATA.hasComponent, EX.part))
+    graph.add((EX.bracket, SDATA.resultOf, EX.rolling))
+    graph.add((EX.asm, SDATA.hasComponent, EX.bracket))  # not an input of assembly: counted as a component
+    _aqv(graph, EX.rolling, "co2", 10.0)
+    _aqv(graph, EX.assembly, "co2", 1.0)
+    footprint = FootprintGraph.from_graph(graph)
+    assert footprint.total(EX.part, "co2") == footprint.total(EX.bracket, "co2") == 5.0
+    assert footprint.total(EX.asm, "co2") == 5.0 + 1.0 + 5.0
+
+
+def test_bom_entries_place_their_part():
+    graph = Graph()
+    graph.add((EX.stamp, SDATA.hasOutput, EX.terminal))
+    _aqv(graph, EX.stamp, "co2", 3.0)
+    for position, count in ((EX.pos10, 4.0), (EX.pos20, 2.0)):
+        graph.add((EX.harness, SDATA.hasComponent, position))
+        graph.add((position, SDATA.typifiedBy, EX.terminal))
+        _aqv(graph, position, "quantity", count)
+    footprint = FootprintGraph.from_graph(graph)
+    assert footprint.total(EX.harness, "co2") == (4 + 2) * 3.0
+    assert BomGraph.from_graph(graph).requirements(EX.harness).as_dict()[EX.terminal] == 6.0
+
+
+def test_generated_data_takes_no_share():
+    graph = Graph()
+    graph.add((EX.proc, SDATA.hasOutput, EX.prod))
+    graph.add((EX.proc, SDATA.generates, EX.log))
+    _aqv(graph, EX.proc, "co2", 10.0)
+    assert FootprintGraph.from_graph(graph).as_dict("co2") == {EX.proc: 10.0, EX.prod: 10.0}
+
+    # :probenfertigung outputs :probe and generates :fertigung_data; :ergebnis is producedBy :zugversuch
+    zug = Namespace("https://example.org/zugversuch/")
+    graph = loader.load_graph(ROOT / "examples" / "specimen_tensiontest_data.ttl", use_cache=False)
+    _aqv(graph, zug.probenfertigung, "co2", 10.0)
+    footprint = FootprintGraph.from_graph(graph)
+    assert footprint.total(zug.probe, "co2") == footprint.total(zug.zugversuch, "co2") == 10.0
+    assert zug.fertigung_data not in footprint.as_dict("co2")
+    assert zug.ergebnis not in footprint.as_dict("co2")
@@ -0,0 +1,93 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from rdflib import Graph, Literal, Namespace, RDF
+from rdflib.namespace import XSD
+
+from src import loader
+from src.domains.base import SDATA
+from src.domains.fuzzy import FuzzyNumber, GaussianFuzzy, LRFuzzy, TriangularFuzzy, load_fuzzy
+from src.domains.interval import Interval
+
+ROOT = Path(__file__).resolve().parent.parent
+EX = Namespace("https://example.org/")
+EX_TT = Namespace("https://example.org/tensile-test/")
+
+
+def _domain(graph, node, cls, **values):
+    graph.add((node, RDF.type, cls))
+    for name, value in values.items():
+        graph.add((node, SDATA[name], Literal(value, datatype=XSD.double)))
+
+
+def test_sheet_thickness_trapezoid_from_example():
+    graph = loader.load_graph(ROOT / "examples" / "AttributeQuantityValue_sheetthickness.ttl", use_cache=False)
+    fuzzy = load_fuzzy(graph)[EX_TT.dom_thickness_fuzzy]
+    assert fuzzy.membership(1.28) == pytest.approx(0.7)
+    assert fuzzy.membership([1.0, 1.1, 1.2, 1.35, np.nan]) == pytest.approx([0.0, 0.5, 1.0, 0.0, 0.0])
+    assert fuzzy.support == pytest.approx((1.05, 1.35))
+    assert fuzzy.core == pytest.approx((1.15, 1.25))
+    lower, upper = fuzzy.alpha_cut([0.0, 0.5, 1.0])
+    assert lower == pytest.approx([1.05, 1.1, 1.15])
+    assert upper == pytest.approx([1.35, 1.3, 1.25])
+
+
+def test_triangular_gaussian_and_lr_shapes():
+    triangle = TriangularFuzzy.of(0.0, 1.0, 3.0)
+    assert triangle.membership([0.5, 1.0, 2.0]) == pytest.approx([0.5, 1.0, 0.5])
+
+    gaussian = GaussianFuzzy(center=10.0, width=2.0)
+    lower, upper = gaussian.alpha_cut(np.exp(-0.5))
+    assert (float(lower), float(upper)) == pytest.approx((8.0, 12.0))
+    assert gaussian.support == (-np.inf, np.inf)
+
+    lr = LRFuzzy(center=1.0, spread_left=0.5, spread_right=2.0, right_function="rational")
+    assert lr.membership([0.5, 0.75, 1.0, 3.0]) == pytest.approx([0.0, 0.5, 1.0, 0.5])
+    lower, upper = lr.alpha_cut([0.0, 0.5])
+    assert lower == pytest.approx([0.5, 0.75])
+    assert upper.tolist()[0] == np.inf and upper[1] == pytest.approx(3.0)
+
+    with pytest.raises(ValueError):
+        LRFuzzy(center=0.0, spread_left=1.0, spread_right=1.0, left_function="cubic")
+    with pytest.raises(ValueError, match="alpha"):
+        triangle.alpha_cut(1.5)
+    with pytest.raises(TypeError):
+        FuzzyNumber()  # abstract
+
+
+def test_truncation_can_empty_an_alpha_cut():
+    triangle = TriangularFuzzy.of(0.0, 1.0, 2.0, truncation=Interval(1.5, 3.0))
+    lower, upper = triangle.alpha_cut([0.0, 0.5, 0.9])
+    assert lower[:2] == pytest.approx([1.5, 1.5]) and upper[:2] == pytest.approx([2.0, 1.5])
+    assert np.isnan(lower[2]) and np.isnan(upper[2])  # [0.9, 1.1] lies left of the truncation
+    assert triangle.alpha_cut_interval(0.9) is None
+    assert triangle.alpha_cut_interval(0.5) == Interval(1.5, 1.5)
+
+    outside = TriangularFuzzy.of(0.0, 1.0, 2.0, truncation=Interval(5.0, 6.0))
+    assert np.isnan(outside.support).all()
+
+
+def test_alpha_level_and_truncation_from_graph():
+    graph = Graph()
+    _domain(graph, EX.bound, SDATA.IntervalDomain, minValue=0.0, maxValue=11.0)
+    _domain(graph, EX.gauss, SDATA.GaussianFuzzyDomain, fuzzyCenter=10.0, fuzzyWidth=2.0, alphaLevel=0.5)
+    graph.add((EX.gauss, SDATA.truncatedBy, EX.bound))
+    _domain(graph, EX.lr, SDATA.LRFuzzyDomain, fuzzyCenter=0.0, fuzzySpreadLeft=1.0, fuzzySpreadRight=1.0)
+    graph.add((EX.lr, SDATA.fuzzyRightFunction, Literal("gaussian")))
+    domains = load_fuzzy(graph)
+
+    gauss = domains[EX.gauss]
+    assert gauss.membership([9.0, 12.0]) == pytest.approx([np.exp(-0.125), 0.0])
+    lower, upper = gauss.alpha_cut()
+    assert float(lower) == pytest.approx(10.0 - 2.0 * np.sqrt(2.0 * np.log(2.0)))
+    assert float(upper) == 11.0
+    assert gauss.support == (0.0, 11.0)
+
+    assert domains[EX.lr].right_function == "gaussian"
+    assert domains[EX.lr].membership(1.0) == pytest.approx(np.exp(-0.5))
+
+    _domain(graph, EX.bad, SDATA.TrapezoidalFuzzyDomain, fuzzyLeft=2.0, fuzzyCoreLeft=1.0, fuzzyCoreRight=3.0)
+    graph.add((EX.bad, SDATA.fuzzyRight, Literal(4.0)))
+    with pytest.raises(ValueError):
+        load_fuzzy(graph)
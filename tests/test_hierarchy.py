@@ -0,0 +1,69 @@
+import pickle
+from pathlib import Path
+
+from rdflib import Graph, Namespace, RDFS, URIRef
+
+from src import loader
+from src.hierarchy import ClassHierarchy
+
+ROOT = Path(__file__).resolve().parent.parent
+MIN = Namespace("https://w3id.org/min#")
+SDATA = Namespace("https://w3id.org/sdata/core/")
+EX = Namespace("https://example.org/")
+
+
+def _hierarchy(tmp_path):
+    return ClassHierarchy.load(
+        (ROOT / "min-v1.0.0.ttl", ROOT / "sdata-core.ttl"), cache_dir=tmp_path, use_cache=True
+    )
+
+
+def _naive_ancestors(graph: Graph, cls: URIRef) -> set[URIRef]:
+    seen = {cls}
+    stack = [cls]
+    while stack:
+        for parent in graph.objects(stack.pop(), RDFS.subClassOf):
+            if isinstance(parent, URIRef) and parent not in seen:
+                seen.add(parent)
+                stack.append(parent)
+    return seen
+
+
+def test_subclass_queries(tmp_path):
+    hierarchy = _hierarchy(tmp_path)
+    assert hierarchy.is_subclass(SDATA.Material, MIN.Object)
+    assert hierarchy.is_subclass(SDATA.Person, MIN.Agent)
+    assert hierarchy.is_subclass(SDATA.Material, SDATA.Material)
+    assert not hierarchy.is_subclass(MIN.Object, SDATA.Material)
+    assert {SDATA.Object, MIN.Object} <= hierarchy.ancestors(SDATA.Material)
+    assert SDATA.Material in hierarchy.descendants(MIN.Object)
+    assert MIN.Object not in hierarchy.descendants(MIN.Object, include_self=False)
+    assert SDATA.Object in hierarchy.parents(SDATA.Material)
+    assert SDATA.Material in hierarchy.children(SDATA.Object)
+
+
+def test_matches_naive_closure():
+    graph = loader.load_merged(ROOT / "min-v1.0.0.ttl", ROOT / "sdata-core.ttl", use_cache=False)
+    hierarchy = ClassHierarchy.from_graph(graph)
+    for cls in hierarchy.classes:
+        assert hierarchy.ancestors(cls) >= _naive_ancestors(graph, cls)
+
+
+def test_cycles_and_unknown_classes():
+    hierarchy = ClassHierarchy(
+        [EX.A, EX.B, EX.C],
+        [(EX.A, EX.B), (EX.B, EX.A), (EX.C, EX.A)],
+    )
+    assert hierarchy.is_subclass(EX.A, EX.B) and hierarchy.is_subclass(EX.B, EX.A)
+    assert hierarchy.descendants(EX.B) == {EX.A, EX.B, EX.C}
+    assert hierarchy.ancestors(EX.Unknown) == {EX.Unknown}
+    assert not hierarchy.is_subclass(EX.Unknown, EX.A)
+
+
+def test_persisted_alongside_graph_cache(tmp_path):
+    first = _hierarchy(tmp_path)
+    assert list((tmp_path / "artifacts").glob("class-hierarchy-*.pkl"))
+    second = _hierarchy(tmp_path)
+    assert second.classes == first.classes
+    restored = pickle.loads(pickle.dumps(first))
+    assert restored.descendants(MIN.Agent) == first.descendants(MIN.Agent)
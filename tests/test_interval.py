@@ -0,0 +1,65 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from rdflib import Graph, Literal, Namespace, RDF
+from rdflib.namespace import XSD
+
+from src import loader
+from src.domains.base import SDATA
+from src.domains.interval import Interval, IntervalTable, load_intervals
+
+ROOT = Path(__file__).resolve().parent.parent
+EX = Namespace("https://example.org/")
+EX_TT = Namespace("https://example.org/tensile-test/")
+
+
+def _domain(graph, node, **values):
+    graph.add((node, RDF.type, SDATA.IntervalDomain))
+    for name, value in values.items():
+        if isinstance(value, bool):
+            graph.add((node, SDATA[name], Literal(value, datatype=XSD.boolean)))
+        else:
+            graph.add((node, SDATA[name], Literal(value, datatype=XSD.double)))
+
+
+def test_sheet_thickness_interval_from_example():
+    graph = loader.load_graph(ROOT / "examples" / "AttributeQuantityValue_sheetthickness.ttl", use_cache=False)
+    interval = load_intervals(graph)[EX_TT.dom_thickness_interval]
+    assert str(interval) == "[1.1, 1.3]"
+    assert 1.18 in interval
+    assert interval.contains([1.1, 1.18, 1.3, 1.31, np.nan]).tolist() == [True, True, True, False, False]
+
+
+def test_bounds_and_symmetric_form():
+    graph = Graph()
+    _domain(graph, EX.open_closed, minValue=1.1, minInclusive=False, maxValue=1.3)
+    _domain(graph, EX.closed_open, minValue=1.1, maxValue=1.3, maxInclusive=False)
+    _domain(graph, EX.symmetric, centerValue=4.0, halfWidth=1.5)
+    graph.add((EX.non_negative, RDF.type, SDATA.IntervalDomain))
+    graph.add((EX.non_negative, SDATA.minValue, Literal("0.0", datatype=XSD.double)))
+    graph.add((EX.non_negative, SDATA.maxValue, Literal("INF", datatype=XSD.double)))
+    intervals = load_intervals(graph)
+
+    assert intervals[EX.open_closed].contains([1.1, 1.3]).tolist() == [False, True]
+    assert intervals[EX.closed_open].contains([1.1, 1.3]).tolist() == [True, False]
+    assert (intervals[EX.symmetric].lower, intervals[EX.symmetric].upper) == (2.5, 5.5)
+    assert intervals[EX.non_negative].contains([-1e-9, 0.0, 1e300]).tolist() == [False, True, True]
+
+    _domain(graph, EX.inconsistent, centerValue=4.0, halfWidth=1.5, minValue=2.0)
+    with pytest.raises(ValueError, match="disagrees"):
+        load_intervals(graph)
+
+
+def test_table_checks_mixed_domains_in_one_pass():
+    table = IntervalTable(
+        [
+            Interval(1.1, 1.3, iri=EX.a),
+            Interval(1.1, 1.3, lower_inclusive=False, upper_inclusive=False, iri=EX.b),
+        ]
+    )
+    values = np.array([1.1, 1.1, 1.2, 1.3])
+    which = table.indices([EX.a, EX.b, EX.b, EX.a])
+    assert table.contains(values, which).tolist() == [True, False, True, True]
+    with pytest.raises(KeyError):
+        table.indices([EX.unknown])
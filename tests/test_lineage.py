@@ -0,0 +1,62 @@
+from pathlib import Path
+
+from rdflib import Graph, Namespace
+
+from src import loader
+from src.lineage import MIN, SDATA, LineageBuilder, LineageGraph
+
+ROOT = Path(__file__).resolve().parent.parent
+EX = Namespace("https://example.org/")
+EX_ZUG = Namespace("https://example.org/zugversuch/")
+
+
+def _example() -> LineageGraph:
+    graph = loader.load_graph(ROOT / "examples" / "specimen_tensiontest_data.ttl", use_cache=False)
+    return LineageGraph.from_graph(graph)
+
+
+def test_tensile_example_chain():
+    lineage = _example()
+    up = lineage.upstream(EX_ZUG.ergebnis)
+    assert up.iris() == [EX_ZUG.ergebnis, EX_ZUG.zugversuch, EX_ZUG.probe, EX_ZUG.probenfertigung, EX_ZUG.coil]
+    assert up.depth.tolist() == [0, 1, 2, 3, 4]
+    assert (EX_ZUG.probe, EX_ZUG.zugversuch) in up.edges()
+
+    down = lineage.downstream(EX_ZUG.coil, max_depth=2)
+    assert set(down.iris()) == {EX_ZUG.coil, EX_ZUG.probenfertigung, EX_ZUG.probe, EX_ZUG.fertigung_data}
+    assert down.at_depth(2) and EX_ZUG.ergebnis not in down
+    assert EX_ZUG.ergebnis in lineage.downstream(EX_ZUG.coil)
+
+
+def test_cycles_and_diamonds_terminate():
+    graph = Graph()
+    graph.add((EX.p1, MIN.hasInput, EX.a))
+    graph.add((EX.p1, MIN.hasOutput, EX.b))
+    graph.add((EX.c, SDATA.derivedFrom, EX.b))
+    graph.add((EX.d, SDATA.derivedFrom, EX.b))
+    graph.add((EX.e, SDATA.derivedFrom, EX.c))
+    graph.add((EX.e, SDATA.derivedFrom, EX.d))
+    graph.add((EX.a, SDATA.derivedFrom, EX.e))  # closes a cycle back to the start
+    lineage = LineageGraph.from_graph(graph)
+
+    down = lineage.downstream(EX.a)
+    assert set(down.iris()) == {EX.a, EX.p1, EX.b, EX.c, EX.d, EX.e}
+    assert len(down.sources) == lineage.edge_count == 7  # the diamond and the back edge are kept
+    assert lineage.upstream(EX.e, max_depth=1).at_depth(1) == [EX.c, EX.d]
+    assert len(lineage.upstream(EX.e, max_depth=0)) == 1
+
+
+def test_ntriples_stream_and_wide_frontiers():
+    graph = Graph()
+    for batch in range(300):
+        graph.add((EX[f"mix{batch}"], MIN.hasInput, EX[f"lot{batch}"]))
+        graph.add((EX[f"mix{batch}"], MIN.hasOutput, EX[f"blend{batch}"]))
+        graph.add((EX.final, MIN.hasInput, EX[f"blend{batch}"]))
+    builder = LineageBuilder()
+    builder.add_ntriples(graph.serialize(format="nt").splitlines())
+    streamed = builder.build()
+
+    up = streamed.upstream(EX.final)
+    assert len(up) == 1 + 3 * 300
+    assert set(up.at_depth(3)) == {EX[f"lot{batch}"] for batch in range(300)}
+    assert set(up.iris()) == set(LineageGraph.from_graph(graph).upstream(EX.final).iris())
@@ -0,0 +1,79 @@
+from pathlib import Path
+
+from rdflib import Graph, Literal, Namespace, URIRef
+from rdflib.compare import to_isomorphic
+
+from src import loader
+
+ROOT = Path(__file__).resolve().parent.parent
+SDATA = Namespace("https://w3id.org/sdata/core/")
+
+
+def _parse(path: Path) -> Graph:
+    graph = Graph()
+    graph.parse(path, format="turtle")
+    return graph
+
+
+def test_encode_decode_roundtrip_is_isomorphic():
+    source = _parse(ROOT / "examples" / "AttributeQuantityValue_sheetthickness.ttl")
+    restored = loader.decode_graph(loader.encode_graph(source))
+    assert len(restored) == len(source)
+    assert to_isomorphic(restored) == to_isomorphic(source)
+    assert dict(restored.namespaces())["sdata"] == URIRef(str(SDATA))
+
+
+def test_load_graph_writes_and_reuses_cache(tmp_path):
+    path = ROOT / "sdata-core.ttl"
+    first = loader.load_graph(path, cache_dir=tmp_path, use_cache=True)
+    entries = list((tmp_path / "graphs").glob("*.bin"))
+    assert len(entries) == 1
+
+    second = loader.load_graph(path, cache_dir=tmp_path, use_cache=True)
+    assert to_isomorphic(first) == to_isomorphic(second)
+    assert to_isomorphic(second) == to_isomorphic(_parse(path))
+
+
+def test_cache_key_changes_with_content(tmp_path):
+    ttl = tmp_path / "tiny.ttl"
+    ttl.write_text('<urn:a> <urn:p> "x" .\n', encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+    assert (URIRef("urn:a"), URIRef("urn:p"), Literal("x")) in loader.load_graph(
+        ttl, cache_dir=cache_dir, use_cache=True
+    )
+
+    ttl.write_text('<urn:a> <urn:p> "y" .\n', encoding="utf-8")
+    reloaded = loader.load_graph(ttl, cache_dir=cache_dir, use_cache=True)
+    assert (URIRef("urn:a"), URIRef("urn:p"), Literal("y")) in reloaded
+    assert len(list((cache_dir / "graphs").glob("*.bin"))) == 2
+
+
+def test_corrupt_cache_entry_falls_back_to_parse(tmp_path):
+    path = ROOT / "examples" / "specimen_tensiontest_data.ttl"
+    loader.load_graph(path, cache_dir=tmp_path, use_cache=True)
+    (entry,) = (tmp_path / "graphs").glob("*.bin")
+    entry.write_bytes(b"garbage")
+    assert len(loader.load_graph(path, cache_dir=tmp_path, use_cache=True)) == len(_parse(path))
+
+
+def test_cached_artifact_builds_once(tmp_path):
+    calls: list[int] = []
+
+    def build():
+        calls.append(1)
+        return {"answer": 42}
+
+    paths = [ROOT / "sdata-core.ttl"]
+    assert loader.cached_artifact("demo", paths, build, cache_dir=tmp_path, use_cache=True) == {"answer": 42}
+    assert loader.cached_artifact("demo", paths, build, cache_dir=tmp_path, use_cache=True) == {"answer": 42}
+    assert len(calls) == 1
+    assert loader.clear_cache(tmp_path) == 1
+
+
+def test_cached_artifact_key_covers_the_building_module(tmp_path, monkeypatch):
+    paths = [ROOT / "sdata-core.ttl"]
+    loader.cached_artifact("demo", paths, lambda: 1, cache_dir=tmp_path, use_cache=True)
+    # Same inputs, but the code that builds the artifact changed.
+    monkeypatch.setattr(loader, "module_digest", lambda module: "edited")
+    assert loader.cached_artifact("demo", paths, lambda: 2, cache_dir=tmp_path, use_cache=True) == 2
+    assert len(list((tmp_path / "artifacts").glob("demo-*.pkl"))) == 2
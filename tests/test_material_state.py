@@ -0,0 +1,107 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from rdflib import BNode, Graph, Namespace
+
+from src import loader, material_state
+from src.material_state import SMS, StateIndex, StateVocabulary
+
+ROOT = Path(__file__).resolve().parent.parent
+EX = Namespace("https://example.org/")
+EX_ZUG = Namespace("https://example.org/zugversuch/")
+
+
+def _vocabulary(tmp_path):
+    return StateVocabulary.load(cache_dir=tmp_path, use_cache=True)
+
+
+def test_vocabulary_closure_is_cached(tmp_path):
+    vocabulary = _vocabulary(tmp_path)
+    assert list((tmp_path / "artifacts").glob("material-state-vocabulary-*.pkl"))
+    assert _vocabulary(tmp_path).concepts == vocabulary.concepts
+
+    assert len(vocabulary.axes) == 13 and SMS.StateAxis not in vocabulary.axes
+    assert vocabulary.width == -(-len(vocabulary) // 64)
+    assert vocabulary.axis_of(SMS["method.Corrosion"]) == SMS.MethodAxis
+    assert set(vocabulary.ancestors(SMS["method.Corrosion"], include_self=False)) == {
+        SMS["method.Degradation"],
+        SMS["method.Transformative"],
+    }
+    assert vocabulary.ancestors(SMS["origin.Virgin"]) == (SMS["origin.Virgin"],)
+
+
+def test_example_material_facet_query(tmp_path):
+    graph = loader.load_graph(ROOT / "examples" / "specimen_tensiontest_data.ttl", use_cache=False)
+    index = StateIndex.from_graph(graph, _vocabulary(tmp_path))
+    query = (SMS["form.Sheet"], SMS["grade.Automotive"], SMS["compliance.REACH"], SMS["origin.Virgin"])
+    assert index.select(*query) == [EX_ZUG.dc04]
+    assert index.select(SMS["form.Sheet"], SMS["origin.Recycled"]) == []
+    assert EX_ZUG.dc04 not in index.select(SMS["role.Specimen"])
+    assert SMS["grade.Automotive"] in index.values(EX_ZUG.dc04)
+
+
+def test_broader_roll_up_and_axis_semantics(tmp_path):
+    graph = Graph()
+    for entity, values in {
+        EX.corroded: [SMS["method.Corrosion"], SMS["form.Sheet"]],
+        EX.weathered: [SMS["method.Weathering"], SMS["form.Coil"]],
+        EX.rolled: [SMS["form.Sheet"], EX.not_a_concept],
+        EX.bare: [],
+    }.items():
+        if not values:
+            graph.add((entity, SMS.hasStateValue, SMS["form.Sheet"]))  # not an assignment
+        for value in values:
+            assignment = BNode()
+            graph.add((entity, SMS.hasStateAssignment, assignment))
+            graph.add((assignment, SMS.onAxis, SMS.MethodAxis))
+            graph.add((assignment, SMS.hasStateValue, value))
+
+    index = StateIndex.from_graph(graph, _vocabulary(tmp_path))
+    assert len(index) == 3 and index.unknown == 1
+    assert set(index.select(SMS["method.Degradation"])) == {EX.corroded, EX.weathered}
+    assert index.select(SMS["method.Degradation"], SMS["form.Sheet"]) == [EX.corroded]  # AND across axes
+    assert set(index.select(SMS["form.Sheet"], SMS["form.Coil"])) == {EX.corroded, EX.weathered, EX.rolled}  # OR
+    assert index.match().all() and index.bits.dtype == np.uint64
+    assert SMS["method.Transformative"] in index.values(EX.corroded, include_broader=True)
+    with pytest.raises(KeyError):
+        index.select(EX.not_a_concept)
+
+
+def test_facet_counts_roll_up_and_keep_own_axis_alternatives(tmp_path):
+    vocabulary = _vocabulary(tmp_path)
+    names = ("form.Sheet", "form.Coil", "grade.Automotive", "method.Corrosion", "method.Weathering")
+    ids = {name: vocabulary.index_of(SMS[name]) for name in names}
+    index = StateIndex(vocabulary)
+    index.add_codes(
+        [EX.m0, EX.m1, EX.m2, EX.m3, EX.m4],
+        [
+            [ids["form.Sheet"], ids["grade.Automotive"], ids["method.Corrosion"]],
+            [ids["form.Sheet"], ids["grade.Automotive"], ids["method.Weathering"]],
+            [ids["form.Coil"], ids["grade.Automotive"], -1],
+            [ids["form.Sheet"], -1, ids["method.Corrosion"]],
+            [-1, -1, -1],
+        ],
+    )
+    index.add([(EX.m0, SMS["method.Weathering"])])  # two values under method.Degradation: counted once
+
+    facets = index.facet_counts(SMS["grade.Automotive"])
+    assert facets.total == 3
+    assert facets.axis(SMS.FormAxis, nonzero=True) == {SMS["form.Sheet"]: 2, SMS["form.Coil"]: 1}
+    assert facets[SMS["method.Degradation"]] == 2 and facets[SMS["method.Weathering"]] == 2
+    assert facets[SMS["grade.Automotive"]] == 3
+
+    narrowed = index.facet_counts(SMS["grade.Automotive"], SMS["form.Sheet"])
+    assert narrowed.total == 2
+    assert narrowed[SMS["form.Coil"]] == 1  # own-axis constraint is left out for FormAxis
+    assert index.facet_counts(SMS["form.Sheet"], exclude_own_axis=False)[SMS["form.Coil"]] == 0
+    assert index.facet_counts().total == len(index) == 5
+    assert index.facet_counts()[SMS["method.Degradation"]] == np.count_nonzero(index.match(SMS["method.Degradation"]))
+
+
+def test_popcount_fallback_without_bitwise_count(monkeypatch):
+    words = np.random.default_rng(0).integers(0, 2**64, 1000, dtype=np.uint64)
+    expected = sum(bin(word).count("1") for word in words.tolist())
+    assert material_state._popcount(words) == expected
+    monkeypatch.delattr(np, "bitwise_count", raising=False)  # NumPy < 2.0
+    assert material_state._popcount(words) == expected
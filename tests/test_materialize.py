@@ -0,0 +1,88 @@
+from pathlib import Path
+
+import pytest
+from rdflib import Graph, Namespace
+
+from src import loader
+from src.materialize import DEFAULT_SOURCES, Materializer, RuleSet, materialize
+
+ROOT = Path(__file__).resolve().parent.parent
+MIN = Namespace("https://w3id.org/min#")
+SDATA = Namespace("https://w3id.org/sdata/core/")
+EX = Namespace("https://example.org/")
+EX_ZUG = Namespace("https://example.org/zugversuch/")
+
+
+@pytest.fixture(scope="module")
+def rules():
+    return RuleSet.from_graph(loader.load_merged(*DEFAULT_SOURCES, use_cache=False))
+
+
+def _closure(rules, triples):
+    materializer = Materializer(rules)
+    materializer.add(triples)
+    materializer.saturate()
+    return set(materializer.triples())
+
+
+def test_ruleset_compiles_min_axioms(rules):
+    ids = rules.property_ids()
+    assert ids[MIN.nexusWith] in rules.symmetric
+    assert {ids[MIN.hasComponent], ids[MIN.entails]} <= rules.transitive
+    assert ids[SDATA.hasInput] == ids[MIN.hasInput]
+    assert ids[MIN.undergoes] in rules.inverses[ids[MIN.hasInput]]
+    assert (ids[MIN.hasInput], ids[MIN.actsOn]) in rules.chain_left[ids[MIN.performs]]
+
+
+def test_materializer_applies_property_rules(rules):
+    closure = _closure(
+        rules,
+        [
+            (EX.a, MIN.hasComponent, EX.b),
+            (EX.b, SDATA.hasComponent, EX.c),
+            (EX.x, MIN.nexusWith, EX.y),
+            (EX.agent, MIN.performs, EX.process),
+            (EX.process, SDATA.hasInput, EX.coil),
+            (EX.process, MIN.hasOutput, EX.probe),
+        ],
+    )
+    assert (EX.a, MIN.hasComponent, EX.c) in closure
+    assert (EX.a, SDATA.hasComponent, EX.c) in closure
+    assert (EX.y, MIN.nexusWith, EX.x) in closure
+    assert (EX.coil, MIN.undergoes, EX.process) in closure
+    assert (EX.agent, MIN.actsOn, EX.coil) in closure
+    assert (EX.agent, MIN.produces, EX.probe) in closure
+    assert (EX.coil, MIN.affectedBy, EX.agent) in closure
+
+
+def test_materializer_is_incremental(rules):
+    materializer = Materializer(rules)
+    materializer.add([(EX.a, MIN.hasComponent, EX.b)])
+    materializer.saturate()
+    materializer.add([(EX.b, MIN.hasComponent, EX.c), (EX.c, MIN.hasComponent, EX.d)])
+    materializer.saturate()
+    closure = set(materializer.triples())
+    assert (EX.a, MIN.hasComponent, EX.d) in closure
+    assert (EX.a, MIN.hasComponent, EX.b) not in set(materializer.inferred())
+
+
+def test_materialize_example_matches_owlrl(rules):
+    owlrl = pytest.importorskip("owlrl")
+    example = loader.load_graph(ROOT / "examples" / "specimen_tensiontest_data.ttl", use_cache=False)
+
+    ours = Graph()
+    ours += example
+    assert materialize(ours, rules) > 0
+
+    reference = loader.load_merged(*DEFAULT_SOURCES, use_cache=False)
+    reference += example
+    owlrl.DeductiveClosure(owlrl.OWLRL_Semantics).expand(reference)
+
+    pids = rules.property_ids()
+    nodes = set(example.all_nodes())
+    expected = {
+        (s, p, o)
+        for s, p, o in reference
+        if p in pids and s in nodes and o in nodes
+    }
+    assert expected == {(s, p, o) for s, p, o in ours if p in pids}
@@ -0,0 +1,46 @@
+import pytest
+from rdflib import BNode, Graph, Literal, Namespace
+from rdflib.namespace import XSD
+
+from src.lineage import SDATA, LineageBuilder, LineageGraph
+from src.ntriples import TokenIds, load_paths, parse_term, read_ntriples, term_token, token_of, token_triples
+from src.sharded_validation import partition_ntriples
+
+EX = Namespace("https://example.org/")
+
+
+def test_read_ntriples_matches_rdflib():
+    graph = Graph()
+    graph.add((BNode("b1"), EX.label, Literal('say "hi"\n', lang="en")))
+    graph.add((BNode("b1"), EX.amount, Literal(3)))
+    graph.add((EX["café"], EX.ratio, Literal("0.5", datatype=XSD.decimal)))
+    lines = graph.serialize(format="nt").splitlines()
+    assert set(read_ntriples(lines)) == set(graph)
+    assert {parse_term(term_token(node)) for node in graph.subjects()} == set(graph.subjects())
+
+
+def test_malformed_lines_report_their_number(tmp_path):
+    lines = ["# header", "", f"<{EX.a}> <{EX.b}> <{EX.c}> .", f"<{EX.a}> <{EX.b}>"]
+    assert list(token_triples(lines[:3])) == [(f"<{EX.a}>", f"<{EX.b}>", f"<{EX.c}>")]
+    with pytest.raises(ValueError, match="line 4"):
+        list(read_ntriples(lines))
+    with pytest.raises(ValueError, match="line 4"):
+        LineageBuilder().add_ntriples(lines)
+    with pytest.raises(ValueError, match="line 4"):
+        partition_ntriples([lines], tmp_path, 2)
+
+
+def test_token_ids_and_load_paths(tmp_path):
+    ids = TokenIds()
+    assert [ids[token] for token in ("_:a", f"<{EX.b}>", "_:a")] == [0, 1, 0]
+    assert token_of(EX.b) == token_of(f"<{EX.b}>") == f"<{EX.b}>" and token_of(BNode("a")) == "_:a"
+
+    graph = Graph()
+    graph.add((EX.mix, EX.unused, EX.ore))
+    graph.add((EX.mix, SDATA.hasOutput, EX.batch))
+    graph.serialize(tmp_path / "flow.nt", format="nt", encoding="utf-8")
+    graph.serialize(tmp_path / "flow.ttl", format="turtle")
+    for name in ("flow.nt", "flow.ttl"):
+        lineage = load_paths(LineageBuilder(), [tmp_path / name]).build()
+        assert isinstance(lineage, LineageGraph) and lineage.edge_count == 1
+        assert lineage.node(lineage.index_of(EX.batch)) == EX.batch and lineage.index_of(EX.ore) is None
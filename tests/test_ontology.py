@@ -6,6 +6,10 @@ import pytest
 from rdflib import Graph, Namespace, RDF, RDFS, URIRef
 from rdflib.namespace import SKOS
 
+from src import loader
+from src.hierarchy import ClassHierarchy
+from src.type_index import TypeIndex
+
 SDATA = Namespace("https://w3id.org/sdata/core/")
 SMS = Namespace("https://w3id.org/sdata/material-state/")
 MIN = Namespace("https://w3id.org/min#")
@@ -17,30 +21,22 @@ OWL_DATA_PROP = URIRef("http://www.w3.org/2002/07/owl#DatatypeProperty")
 
 @pytest.fixture(scope="session")
 def core_graph():
-    g = Graph()
-    g.parse(ROOT / "sdata-core.ttl", format="turtle")
-    return g
+    return loader.load_graph(ROOT / "sdata-core.ttl")
 
 
 @pytest.fixture(scope="session")
 def min_graph():
-    g = Graph()
-    g.parse(ROOT / "min-v1.0.0.ttl", format="turtle")
-    return g
+    return loader.load_graph(ROOT / "min-v1.0.0.ttl")
 
 
 @pytest.fixture(scope="session")
 def example_graph():
-    g = Graph()
-    g.parse(ROOT / "examples" / "specimen_tensiontest_data.ttl", format="turtle")
-    return g
+    return loader.load_graph(ROOT / "examples" / "specimen_tensiontest_data.ttl")
 
 
 @pytest.fixture(scope="session")
 def material_state_graph():
-    g = Graph()
-    g.parse(ROOT / "sdata-material-state.ttl", format="turtle")
-    return g
+    return loader.load_graph(ROOT / "sdata-material-state.ttl")
 
 
 @pytest.mark.parametrize("ttl_file", sorted(ROOT.glob("**/*.ttl")))
@@ -135,23 +131,8 @@ def test_core_has_sdata_process_class(core_graph):
 
 
 def _instances_of_class_or_subclass(example_graph: Graph, class_graph: Graph, class_uri: URIRef) -> set[URIRef]:
-    candidate_classes: set[URIRef] = {class_uri}
-    queue = [class_uri]
-    while queue:
-        parent = queue.pop()
-        for child in class_graph.subjects(RDFS.subClassOf, parent):
-            if isinstance(child, URIRef) and child not in candidate_classes:
-                candidate_classes.add(child)
-                queue.append(child)
-
-    instances: set[URIRef] = set()
-    for candidate in candidate_classes:
-        instances.update(
-            instance
-            for instance in example_graph.subjects(RDF.type, candidate)
-            if isinstance(instance, URIRef)
-        )
-    return instances
+    index = TypeIndex.from_graph(example_graph, ClassHierarchy.from_graph(class_graph))
+    return {instance for instance in index.instances_of(class_uri) if isinstance(instance, URIRef)}
 
 
 def test_example_uses_min_categories(example_graph, core_graph):
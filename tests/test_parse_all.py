@@ -0,0 +1,34 @@
+from pathlib import Path
+
+from tests.parse_all import parse_files, summarize
+
+ROOT = Path(__file__).resolve().parent.parent
+FILES = [
+    ROOT / "sdata-core.ttl",
+    ROOT / "sdata-vd-interval.ttl",
+    ROOT / "examples" / "specimen_tensiontest_data.ttl",
+]
+
+
+def test_parallel_matches_sequential():
+    sequential = parse_files(FILES, jobs=1, use_cache=False)
+    parallel = parse_files(FILES, jobs=2, use_cache=False)
+    assert [r.path for r in parallel] == [str(f) for f in FILES]
+    assert [r.triples for r in parallel] == [r.triples for r in sequential]
+    assert all(r.error is None and r.triples > 0 for r in parallel)
+
+
+def test_summary_reports_throughput_and_failures(tmp_path):
+    broken = tmp_path / "broken.ttl"
+    broken.write_text("this is not turtle", encoding="utf-8")
+    results = parse_files([FILES[1], broken], jobs=1, use_cache=False)
+    summary = summarize(results, wall_seconds=1.0, jobs=1)
+
+    assert summary["files"] == 2
+    assert summary["failed"] == 1
+    assert summary["cached"] is False
+    assert summary["total_triples"] == results[0].triples
+    ok, failed = summary["results"]
+    assert ok["path"] == "sdata-vd-interval.ttl"
+    assert ok["triples_per_second"] > 0
+    assert failed["error"]
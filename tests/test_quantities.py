@@ -0,0 +1,199 @@
+import io
+from pathlib import Path
+
+import numpy as np
+import pytest
+from rdflib import BNode, Graph, Literal, Namespace, URIRef
+from rdflib.namespace import XSD
+
+from src import loader
+from src.domains.base import SDATA
+from src.quantities import (
+    QUDT_NUMERIC_VALUE,
+    QUDT_UNIT,
+    QUDT_VALUE,
+    QuantityExtractor,
+    extract_quantities,
+    skolem_iri,
+    write_quantities,
+    write_table,
+)
+
+ROOT = Path(__file__).resolve().parent.parent
+EX = Namespace("https://example.org/")
+EX_ZUG = Namespace("https://example.org/zugversuch/")
+UNIT = Namespace("http://qudt.org/vocab/unit/")
+
+
+def _aqv(graph, owner, name, dtype, value=None, text=None):
+    aqv = BNode()
+    graph.add((owner, SDATA.hasQuantity, aqv))
+    graph.add((aqv, SDATA.name, Literal(name)))
+    if dtype is not None:
+        graph.add((aqv, SDATA.dtype, Literal(dtype)))
+    if value is not None:
+        graph.add((aqv, QUDT_NUMERIC_VALUE, Literal(value)))
+    if text is not None:
+        graph.add((aqv, QUDT_VALUE, Literal(text)))
+    return aqv
+
+
+def test_tensile_results_as_columns():
+    graph = loader.load_graph(ROOT / "examples" / "specimen_tensiontest_data.ttl", use_cache=False)
+    table = extract_quantities(graph)
+    assert len(table) == 12
+    assert set(table.names) >= {"Rm", "Rp02", "AG", "A80", "n", "r", "thickness"}
+
+    owners, columns = table.pivot(["Rm", "Rp02", "AG", "A80", "n", "r"])
+    assert owners.tolist() == [EX_ZUG.ergebnis]
+    assert {name: float(column[0]) for name, column in columns.items()} == {
+        "Rm": 340.0,
+        "Rp02": 180.0,
+        "AG": 23.5,
+        "A80": 38.0,
+        "n": 0.21,
+        "r": 1.85,
+    }
+    rm = table.name == table.names.index("Rm")
+    assert table.units[table.unit[rm][0]] == UNIT.MegaPA
+    assert table.symbols[table.symbol[rm][0]] == "MPa"
+    assert table.dtype_of("Rm") == "float"
+
+
+def test_dtype_driven_columns_and_pivot():
+    graph = Graph()
+    _aqv(graph, EX.a, "cycles", "int", value=3)
+    _aqv(graph, EX.b, "cycles", "int", value=5)
+    _aqv(graph, EX.a, "passed", "bool", text="true")
+    _aqv(graph, EX.b, "passed", "bool", text="false")
+    _aqv(graph, EX.a, "tested", "timestamp", text="2026-02-27T10:00:00+01:00")
+    _aqv(graph, EX.a, "batch", "str", text="007")
+    _aqv(graph, EX.b, "width", None, value=20.5)
+    graph.add((EX.a, SDATA.hasQuantity, EX.unattached_check))  # no name: ignored by pivots
+    graph.add((BNode(), SDATA.name, Literal("orphan")))  # not attached: not a row
+
+    table = extract_quantities(graph)
+    assert len(table) == 8 and "orphan" not in [table.names[c] for c in table.name if c >= 0]
+    assert table.dtype_of("width") == "float"
+
+    owners, columns = table.pivot(["cycles", "passed", "tested", "batch", "width"])
+    order = [owners.tolist().index(owner) for owner in (EX.a, EX.b)]
+    assert columns["cycles"].dtype == np.int64 and columns["cycles"][order].tolist() == [3, 5]
+    assert columns["passed"].dtype == bool and columns["passed"][order].tolist() == [True, False]
+    assert columns["tested"][order[0]] == np.datetime64("2026-02-27T09:00:00")
+    assert np.isnat(columns["tested"][order[1]])
+    assert columns["batch"][order].tolist() == ["007", None]
+    assert np.isnan(columns["width"][order[0]]) and columns["width"][order[1]] == 20.5
+
+    _aqv(graph, EX.a, "cycles", "int", value=4)
+    with pytest.raises(ValueError, match="several"):
+        extract_quantities(graph).pivot(["cycles"])
+
+
+def test_to_arrow_keeps_codes_and_missing_cells():
+    pa = pytest.importorskip("pyarrow")
+    graph = loader.load_graph(ROOT / "examples" / "specimen_tensiontest_data.ttl", use_cache=False)
+    _aqv(graph, EX_ZUG.ergebnis, "operator", "str", text="A. Lange")
+    table = extract_quantities(graph)
+    arrow = table.to_arrow()
+
+    assert arrow.num_rows == len(table) == 13
+    assert arrow.column_names == ["owner", "name", "value", "text", "unit", "symbol", "dtype"]
+    assert pa.types.is_dictionary(arrow.schema.field("name").type)
+    rows = arrow.to_pylist()
+    rm = next(row for row in rows if row["name"] == "Rm")
+    assert (rm["owner"], rm["value"], rm["unit"], rm["symbol"], rm["dtype"]) == (
+        str(EX_ZUG.ergebnis), 340.0, str(UNIT.MegaPA), "MPa", "float"
+    )
+    operator = next(row for row in rows if row["name"] == "operator")
+    assert (operator["value"], operator["text"], operator["unit"], operator["dtype"]) == (None, "A. Lange", None, "str")
+
+
+def test_ntriples_stream_matches_graph():
+    graph = loader.load_graph(ROOT / "examples" / "specimen_tensiontest_data.ttl", use_cache=False)
+    graph.add((EX.extra, SDATA.hasQuantity, EX.note))
+    graph.add((EX.note, SDATA.name, Literal('say "hi"')))
+    graph.add((EX.note, QUDT_VALUE, Literal("line\nbreak")))
+    graph.add((EX.note, QUDT_UNIT, URIRef("http://qudt.org/vocab/unit/UNITLESS")))
+    graph.add((EX.note, SDATA.dtype, Literal("str", datatype=XSD.string)))
+
+    extractor = QuantityExtractor()
+    extractor.add_ntriples(graph.serialize(format="nt").splitlines())
+    streamed, direct = extractor.table(), extract_quantities(graph)
+
+    def rows(table):
+        return sorted(
+            (
+                str(table.owners[table.owner[i]]),
+                table.names[table.name[i]],
+                repr(table.value[i]),
+                table.text[i],
+                str(table.units[table.unit[i]]) if table.unit[i] >= 0 else None,
+                int(table.dtype[i]),
+            )
+            for i in range(len(table))
+        )
+
+    assert rows(streamed) == rows(direct)
+    assert streamed.column('say "hi"')[1].tolist() == ["line\nbreak"]
+
+
+def test_bulk_writer_round_trip():
+    graph = loader.load_graph(ROOT / "examples" / "specimen_tensiontest_data.ttl", use_cache=False)
+    table = extract_quantities(graph)
+    nt, turtle = io.StringIO(), io.StringIO()
+    assert write_table(nt, table) == write_table(turtle, table, format="turtle") == len(table)
+
+    again = io.StringIO()
+    write_table(again, table)
+    assert again.getvalue() == nt.getvalue() and "_:" not in nt.getvalue()  # skolem IRIs, no blank nodes
+    parsed = Graph().parse(data=nt.getvalue(), format="nt")
+    assert parsed.isomorphic(Graph().parse(data=turtle.getvalue(), format="turtle"))
+
+    extractor = QuantityExtractor()
+    extractor.add_ntriples(nt.getvalue().splitlines())
+    owners, columns = extractor.table().pivot(["Rm", "AG"])
+    assert owners.tolist() == [EX_ZUG.ergebnis] and columns["Rm"].tolist() == [340.0]
+
+    out = io.StringIO()
+    count = write_quantities(
+        out, [EX.a, EX.a, None], "cycles", np.array([3, 4, 5]), dtypes="int", units=None, symbols=None
+    )
+    table = extract_quantities(Graph().parse(data=out.getvalue(), format="nt"))
+    assert count == 2 and sorted(table.value.tolist()) == [3.0, 4.0]  # repeated names get distinct IRIs
+    with pytest.raises(ValueError, match="dtype"):
+        write_quantities(io.StringIO(), EX.a, "x", 1.0, dtypes="complex")
+
+
+def test_separately_written_files_merge_with_distinct_sources():
+    first, second = io.StringIO(), io.StringIO()
+    write_quantities(first, EX.a, "yield", 250.0, source="batch-1")
+    write_quantities(second, EX.a, "yield", 260.0, source="batch-2")
+    merged = Graph().parse(data=first.getvalue() + second.getvalue(), format="nt")
+    assert sorted(extract_quantities(merged).value.tolist()) == [250.0, 260.0]
+
+    same = io.StringIO()
+    write_quantities(same, EX.a, "yield", 250.0)
+    assert skolem_iri(str(EX.a), "yield") in same.getvalue()
+    assert skolem_iri(str(EX.a), "yield", source="batch-1") in first.getvalue()
+
+
+@pytest.mark.parametrize("owner", ["https://example.org/a b", "https://example.org/a>b", 'https://example.org/"'])
+def test_writer_rejects_invalid_iris(owner):
+    with pytest.raises(ValueError, match="not a valid IRI"):
+        write_quantities(io.StringIO(), owner, "x", 1.0)
+    with pytest.raises(ValueError, match="not a valid IRI"):
+        write_quantities(io.StringIO(), EX.a, "x", 1.0, units=owner, format="turtle")
+
+
+def test_non_finite_doubles_use_xsd_lexical_forms():
+    out = io.StringIO()
+    write_quantities(out, EX.a, ["hot", "cold", "void"], np.array([np.inf, -np.inf, np.nan]))
+    text = out.getvalue()
+    assert '"INF"^^' in text and '"-INF"^^' in text and '"inf"' not in text
+    values = Graph().parse(data=text, format="nt").objects(None, QUDT_NUMERIC_VALUE)
+    assert sorted(value.toPython() for value in values) == [-np.inf, np.inf]  # the NaN value is left out
+
+    graph = Graph()
+    _aqv(graph, EX.a, "level", "str", value=Literal("-INF", datatype=XSD.double))
+    assert extract_quantities(graph).column("level")[1].tolist() == ["-INF"]
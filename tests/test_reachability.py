@@ -0,0 +1,73 @@
+import random
+from pathlib import Path
+
+import pytest
+from rdflib import Graph, Namespace
+
+from src import loader, reachability
+from src.lineage import MIN, SDATA, LineageGraph
+from src.reachability import ReachabilityIndex
+
+ROOT = Path(__file__).resolve().parent.parent
+EX = Namespace("https://example.org/")
+EX_ZUG = Namespace("https://example.org/zugversuch/")
+
+
+def test_tensile_example_and_appended_steps():
+    graph = loader.load_graph(ROOT / "examples" / "specimen_tensiontest_data.ttl", use_cache=False)
+    index = ReachabilityIndex.from_graph(graph)
+    assert index.reaches(EX_ZUG.coil, EX_ZUG.ergebnis)
+    assert not index.reaches(EX_ZUG.ergebnis, EX_ZUG.coil)
+    assert not index.reaches(EX_ZUG.fertigung_data, EX_ZUG.ergebnis)
+    assert index.reaches_any([EX_ZUG.fertigung_data, EX_ZUG.coil], EX_ZUG.zugversuch)
+    assert index.reaches(EX.unknown, EX.unknown) and not index.reaches(EX.unknown, EX_ZUG.coil)
+
+    appended = Graph()
+    appended.add((EX.recycling, MIN.hasInput, EX_ZUG.probe))
+    appended.add((EX.recycling, MIN.hasOutput, EX.scrap))
+    appended.add((EX.remelt, MIN.hasInput, EX.scrap))
+    appended.add((EX.remelt, MIN.hasInput, EX.alloy))
+    appended.add((EX.ingot, SDATA.derivedFrom, EX.remelt))
+    index.add(appended)
+    assert len(index) == 6 + 5
+    assert index.reaches(EX_ZUG.coil, EX.ingot) and index.reaches(EX.alloy, EX.ingot)
+    assert not index.reaches(EX_ZUG.ergebnis, EX.ingot) and not index.reaches(EX.ingot, EX.alloy)
+
+
+def _closure(size, edges):
+    children = {node: set() for node in range(size)}
+    for source, target in edges:
+        children[source].add(target)
+    reach = []
+    for start in range(size):
+        seen, stack = {start}, [start]
+        while stack:
+            for node in children[stack.pop()] - seen:
+                seen.add(node)
+                stack.append(node)
+        reach.append(seen)
+    return reach
+
+
+@pytest.mark.parametrize("scalar_level", [0, 64])
+def test_matches_transitive_closure_with_cycles_and_appends(monkeypatch, scalar_level):
+    monkeypatch.setattr(reachability, "SCALAR_LEVEL", scalar_level)
+    for seed in range(12):
+        rng = random.Random(seed)
+        size = rng.randint(2, 60)
+        edges = {(rng.randrange(size), rng.randrange(size)) for _ in range(2 * size)}
+        if seed % 3:  # acyclic: edges only from lower to higher ids
+            edges = {(min(edge), max(edge)) for edge in edges}
+        edges = sorted((a, b) for a, b in edges if a != b)
+        base, later = edges[: len(edges) // 2], edges[len(edges) // 2 :]
+        index = ReachabilityIndex(
+            LineageGraph([f"<{EX}n{i}>" for i in range(size)], [a for a, _ in base], [b for _, b in base])
+        )
+        appended = [(rng.randrange(size + k), size + k) for k in range(4)]
+        for source, target in later + appended:
+            index.add_edge(EX[f"n{source}"], EX[f"n{target}"])
+
+        reach = _closure(size + 4, edges + appended)
+        for u in range(size + 4):
+            for v in range(size + 4):
+                assert index.reaches(EX[f"n{u}"], EX[f"n{v}"]) == (v in reach[u]), (seed, u, v)
@@ -0,0 +1,81 @@
+from pathlib import Path
+
+import pytest
+from rdflib import BNode, Dataset, Graph, Literal, Namespace, RDF, URIRef
+from rdflib.namespace import SH, XSD
+
+from src import loader
+from src.shape_compiler import compile_shapes
+from src.validation import DEFAULT_SHAPES, run_pyshacl
+
+pytest.importorskip("pyshacl")
+
+ROOT = Path(__file__).resolve().parent.parent
+MIN = Namespace("https://w3id.org/min#")
+SDATA = Namespace("https://w3id.org/sdata/core/")
+SMS = Namespace("https://w3id.org/sdata/material-state/")
+EX = Namespace("https://example.org/")
+
+
+def _key(result):
+    return (result.focus_node, result.source_shape, result.constraint_component, result.result_path, result.value)
+
+
+def _keys(results):
+    return sorted(map(_key, results), key=str)
+
+
+def _broken_data(graph):
+    assignment = BNode()
+    graph.add((EX.a, MIN.hasIdentifier, Literal("")))
+    graph.add((EX.a, MIN.hasIdentifier, assignment))
+    graph.add((EX.a, MIN.hasIdentifier, EX.x))
+    graph.add((EX.a, SDATA.hasVersion, Literal("1", lang="en")))
+    graph.add((EX.a, SDATA.hasVersion, Literal("2", datatype=XSD.integer)))
+    graph.add((EX.p, MIN.hasInput, Literal("x")))
+    graph.add((assignment, RDF.type, SMS.StateAssignment))
+    graph.add((assignment, SMS.onAxis, EX.q))
+    graph.add((assignment, SMS.onAxis, EX.r))
+    return graph
+
+
+def test_core_shapes_compile_without_fallback():
+    compiled = compile_shapes(loader.load_graph(DEFAULT_SHAPES, use_cache=False))
+    assert len(compiled.compiled) == 4
+    assert compiled.fallback == ()
+
+
+def test_compiled_results_match_pyshacl():
+    shapes = loader.load_graph(DEFAULT_SHAPES, use_cache=False)
+    compiled = compile_shapes(shapes)
+
+    example = loader.load_graph(ROOT / "examples" / "specimen_tensiontest_data.ttl", use_cache=False)
+    assert compiled.validate(example) == []
+
+    data = _broken_data(Graph())
+    results = compiled.validate(data)
+    assert len(results) == 10
+    assert _keys(results) == _keys(run_pyshacl(data, shapes))
+
+    # A named graph of a dataset is validated on its own triples, not those of the other contexts.
+    dataset = Dataset()
+    named = _broken_data(dataset.graph(URIRef("urn:g1")))
+    dataset.graph(URIRef("urn:g2")).add((EX.b, MIN.hasInput, EX.c))
+    assert len(compiled.validate(named)) == 10
+
+
+def test_unsupported_shapes_fall_back_to_pyshacl():
+    shapes = loader.load_graph(DEFAULT_SHAPES, use_cache=False)
+    prop = BNode()
+    shapes.add((EX.TypedInputShape, RDF.type, SH.NodeShape))
+    shapes.add((EX.TypedInputShape, SH.targetSubjectsOf, MIN.hasInput))
+    shapes.add((EX.TypedInputShape, SH.property, prop))
+    shapes.add((prop, SH.path, MIN.hasInput))
+    shapes.add((prop, SH["class"], MIN.Object))
+    compiled = compile_shapes(shapes)
+    assert compiled.fallback == (EX.TypedInputShape,)
+
+    data = _broken_data(Graph())
+    results = compiled.validate(data)
+    assert SH.ClassConstraintComponent in {r.constraint_component for r in results}
+    assert _keys(results) == _keys(run_pyshacl(data, shapes))
@@ -0,0 +1,58 @@
+from pathlib import Path
+
+from rdflib import Graph, Namespace
+from rdflib.namespace import RDF, SKOS
+
+from src.material_state import SMS, StateVocabulary
+from src.skos import SkosIndex
+
+ROOT = Path(__file__).resolve().parent.parent
+SR = Namespace("https://w3id.org/sdata/r-strategies/")
+EX = Namespace("https://example.org/")
+
+
+def test_index_is_cached_and_covers_both_vocabularies(tmp_path):
+    skos = SkosIndex.load(cache_dir=tmp_path, use_cache=True)
+    assert list((tmp_path / "artifacts").glob("skos-index-*.pkl"))
+    assert SkosIndex.load(cache_dir=tmp_path, use_cache=True).concepts == skos.concepts
+
+    assert SMS["method-values"] in skos.schemes and SR.RStrategyScheme in skos.schemes
+    assert len(skos.members(SR.RStrategyScheme)) == 10
+    assert SR.R0_Refuse in skos.top_concepts(SR.RStrategyScheme)
+    assert skos.collections[SR.MaterialLevel] == (SR.R8_Recycle,)
+    assert skos.in_scheme(SMS["method.Corrosion"], SMS["method-values"])
+    assert not skos.in_scheme(SMS["method.Corrosion"], SMS["origin-values"])
+    assert skos.schemes_of(SMS["origin.Virgin"]) == (SMS["origin-values"],)
+
+
+def test_closure_depth_and_labels(tmp_path):
+    skos = SkosIndex.load(cache_dir=tmp_path, use_cache=True)
+    corrosion = SMS["method.Corrosion"]
+    assert set(skos.broader(corrosion)) == {SMS["method.Degradation"], SMS["method.Transformative"]}
+    assert skos.broader(corrosion, transitive=False) == (SMS["method.Degradation"],)
+    assert corrosion in skos.narrower(SMS["method.Transformative"])
+    assert skos.is_broader(SMS["method.Transformative"], corrosion)
+    assert not skos.is_broader(corrosion, SMS["method.Transformative"])
+    assert (skos.depth(SMS["method.Transformative"]), skos.depth(corrosion)) == (0, 2)
+
+    assert skos.labels(SMS["origin.Virgin"]) == {"de": ("Primär",), "en": ("Virgin",)}
+    assert skos.label(SMS["origin.Virgin"]) == "Virgin"
+    assert skos.label(SMS["origin.Virgin"], "de") == "Primär"
+    assert skos.label(EX.Unlabelled) == "Unlabelled"
+
+
+def test_broader_cycles_and_state_vocabulary():
+    graph = Graph()
+    graph.add((EX.scheme, RDF.type, SKOS.ConceptScheme))
+    for concept in (EX.a, EX.b, EX.c):
+        graph.add((concept, SKOS.inScheme, EX.scheme))
+    graph.add((EX.a, SKOS.broader, EX.b))
+    graph.add((EX.b, SKOS.broader, EX.a))
+    graph.add((EX.b, SKOS.narrower, EX.c))
+    skos = SkosIndex.from_graph(graph)
+    assert set(skos.broader(EX.c)) == {EX.a, EX.b}
+    assert skos.depth(EX.a) == -1 and skos.depth(EX.c) == -1
+
+    vocabulary = StateVocabulary.from_skos(skos, {EX.Axis: EX.scheme})
+    assert vocabulary.concepts == (EX.a, EX.b, EX.c)
+    assert set(vocabulary.ancestors(EX.c)) == {EX.a, EX.b, EX.c}
@@ -0,0 +1,69 @@
+from pathlib import Path
+
+from rdflib import BNode, Graph, Literal, Namespace
+from rdflib.namespace import RDF, RDFS, SH, SKOS
+
+from src import loader
+from src.state_consistency import SMS, SOURCE_SHAPE, AxisValueChecker
+from src.validation import report_graph, results_from_report
+
+ROOT = Path(__file__).resolve().parent.parent
+EX = Namespace("https://example.org/")
+
+
+def _checker(tmp_path):
+    return AxisValueChecker.load(cache_dir=tmp_path, use_cache=True)
+
+
+def test_example_assignments_are_consistent(tmp_path):
+    checker = _checker(tmp_path)
+    assert list((tmp_path / "artifacts").glob("state-axis-values-*.pkl"))
+    assert len(checker.allowed) == 13
+
+    checker.add_graph(loader.load_graph(ROOT / "examples" / "specimen_tensiontest_data.ttl", use_cache=False))
+    assert checker.checked > 0
+    assert checker.results == [] and checker.unchecked == 0
+
+
+def test_streamed_violations_form_a_shacl_report(tmp_path):
+    checker = _checker(tmp_path)
+    on_axis, value = f"<{SMS.onAxis}>", f"<{SMS.hasStateValue}>"
+    checker.add_ntriples(
+        [
+            f"_:a1 {value} <{SMS['form.Sheet']}> .\n",  # value before its axis
+            f"_:a1 {on_axis} <{SMS.OriginAxis}> .\n",
+            f"_:a2 {on_axis} <{SMS.FormAxis}> .\n",
+            f"_:a2 {value} <{SMS['form.Sheet']}> .\n",
+            f"_:a3 {on_axis} <{EX.NoAxis}> .\n",
+            f"_:a3 {value} <{SMS['form.Sheet']}> .\n",
+            f"_:a4 {value} <{SMS['origin.Virgin']}> .\n",
+        ]
+    )
+    assert checker.checked == 3 and checker.unchecked == 1
+    found = {(r.focus_node, r.result_path, r.value) for r in checker.results}
+    assert found == {
+        (BNode("a1"), SMS.hasStateValue, SMS["form.Sheet"]),
+        (BNode("a3"), SMS.onAxis, EX.NoAxis),
+    }
+
+    report = report_graph(checker.results)
+    assert set(report.objects(None, SH.conforms)) == {Literal(False)}
+    assert {r.source_shape for r in results_from_report(report)} == {SOURCE_SHAPE}
+    assert {r.constraint_component for r in results_from_report(report)} == {SH.InConstraintComponent}
+
+
+def test_custom_axis_scheme():
+    graph = loader.load_graph(ROOT / "sdata-material-state.ttl", use_cache=False)
+    graph.add((EX.MoistureAxis, RDFS.subClassOf, SMS.StateAxis))
+    graph.add((EX.MoistureAxis, SMS.hasConceptScheme, EX["moisture-values"]))
+    graph.add((EX["moisture-values"], RDF.type, SKOS.ConceptScheme))
+    graph.add((EX["moisture-values"], SKOS.hasTopConcept, EX.Dry))
+    checker = AxisValueChecker.from_graph(graph)
+
+    data = Graph()
+    for name, axis, value in (("ok", EX.MoistureAxis, EX.Dry), ("bad", EX.MoistureAxis, SMS["origin.Virgin"])):
+        data.add((EX[name], RDF.type, SMS.StateAssignment))
+        data.add((EX[name], SMS.onAxis, axis))
+        data.add((EX[name], SMS.hasStateValue, value))
+    checker.add_graph(data)
+    assert [(r.focus_node, r.value) for r in checker.results] == [(EX.bad, SMS["origin.Virgin"])]
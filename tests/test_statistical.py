@@ -0,0 +1,121 @@
+import math
+import statistics
+from pathlib import Path
+
+import numpy as np
+import pytest
+from rdflib import Graph, Literal, Namespace, RDF
+from rdflib.namespace import XSD
+
+from src import loader
+from src.domains.base import SDATA
+from src.domains.interval import Interval
+from src.domains.statistical import (
+    Binomial,
+    Distribution,
+    Normal,
+    Poisson,
+    Uniform,
+    Weibull,
+    _erfc,
+    _lgamma,
+    load_distributions,
+)
+
+ROOT = Path(__file__).resolve().parent.parent
+EX = Namespace("https://example.org/")
+EX_TT = Namespace("https://example.org/tensile-test/")
+
+
+def _domain(graph, node, cls, **values):
+    graph.add((node, RDF.type, cls))
+    for name, value in values.items():
+        if isinstance(value, bool):
+            graph.add((node, SDATA[name], Literal(value, datatype=XSD.boolean)))
+        else:
+            graph.add((node, SDATA[name], Literal(value, datatype=XSD.double)))
+
+
+def test_sheet_thickness_normal_from_example():
+    graph = loader.load_graph(ROOT / "examples" / "AttributeQuantityValue_sheetthickness.ttl", use_cache=False)
+    normal = load_distributions(graph)[EX_TT.dom_thickness_normal]
+    reference = statistics.NormalDist(1.2, 0.033)
+
+    x = np.array([1.1, 1.15, 1.2, 1.3])
+    assert normal.pdf(x) == pytest.approx([reference.pdf(v) for v in x])
+    assert normal.cdf(x) == pytest.approx([reference.cdf(v) for v in x])
+    p = np.array([1e-12, 0.01, 0.5, 0.975])
+    assert normal.ppf(p) == pytest.approx([reference.inv_cdf(v) for v in p], rel=1e-12)
+
+    samples = normal.sample(1_000_000, rng=1)
+    assert samples.shape == (1_000_000,)
+    assert samples.mean() == pytest.approx(1.2, abs=1e-4)
+    assert samples.std() == pytest.approx(0.033, rel=1e-2)
+
+
+def test_truncation_styles_from_graph():
+    graph = Graph()
+    _domain(graph, EX.open_closed, SDATA.IntervalDomain, minValue=1.1, minInclusive=False, maxValue=1.3)
+    _domain(graph, EX.t, SDATA.NormalDomain, mu=1.2, sigma=0.033)
+    graph.add((EX.t, SDATA.truncatedBy, EX.open_closed))
+    _domain(graph, EX.cap, SDATA.IntervalDomain, minValue=0.0, minInclusive=False, maxValue=10.0)
+    _domain(graph, EX.defects, SDATA.PoissonDomain, **{"lambda": 3.2})
+    graph.add((EX.defects, SDATA.truncatedBy, EX.cap))
+    domains = load_distributions(graph)
+
+    truncated = domains[EX.t]
+    samples = truncated.sample(200_000, rng=0)
+    assert samples.min() > 1.1 and samples.max() <= 1.3
+    assert truncated.pdf([1.1, 1.3]).tolist()[0] == 0.0
+    assert truncated.cdf([1.0, 1.2, 1.3]) == pytest.approx([0.0, 0.5, 1.0])
+    assert truncated.ppf([0.0, 0.5, 1.0]) == pytest.approx([1.1, 1.2, 1.3])
+
+    defects = domains[EX.defects]
+    assert defects.support == (1, 10)
+    mass = np.array([3.2**k / math.factorial(k) for k in range(1, 11)])
+    assert defects.pdf(np.arange(12)) == pytest.approx(np.concatenate([[0.0], mass / mass.sum(), [0.0]]))
+    counts = defects.sample(100_000, rng=0)
+    assert counts.min() == 1 and counts.max() == 10
+
+    # Truncation far in the upper tail keeps its precision via the survival function.
+    tail = Normal(truncation=Interval(10.0, 12.0, upper_inclusive=False))
+    draws = tail.sample(10_000, rng=0)
+    assert draws.min() >= 10.0 and draws.max() < 12.0 and draws.mean() == pytest.approx(10.1, abs=0.01)
+
+    with pytest.raises(ValueError, match="no value"):
+        Poisson(rate=1.0, truncation=Interval(2.0, 3.0, lower_inclusive=False, upper_inclusive=False))
+
+
+def test_other_families():
+    uniform = Uniform(lower=0.0, upper=10.0, truncation=Interval(2.0, 4.0, upper_inclusive=False))
+    assert uniform.pdf([2.0, 3.0, 4.0]) == pytest.approx([0.5, 0.5, 0.0])
+    assert uniform.sample(10_000, rng=0).max() < 4.0
+
+    weibull = Weibull(shape=2.5, scale=10_000.0, truncation=Interval(100.0, math.inf, upper_inclusive=False))
+    assert weibull.support == (100.0, math.inf)
+    median = weibull.ppf(0.5)
+    assert weibull.cdf(median) == pytest.approx(0.5)
+    assert Weibull(shape=1.0, scale=2.0).cdf(2.0) == pytest.approx(1 - math.exp(-1))
+
+    binomial = Binomial(trials=20, probability=0.3)
+    assert binomial.pdf([6, 6.5]) == pytest.approx([math.comb(20, 6) * 0.3**6 * 0.7**14, 0.0])
+    assert binomial.cdf(20) == pytest.approx(1.0)
+    assert binomial.sample(1000, rng=0).max() <= 20
+
+    with pytest.raises(ValueError, match="sigma"):
+        Normal(sigma=0.0)
+    with pytest.raises(ValueError, match="zero probability|outside"):
+        Weibull(truncation=Interval(-2.0, -1.0))
+
+
+def test_vectorised_special_functions_match_math():
+    x = np.concatenate([np.linspace(-9.0, 26.0, 7001), [0.0, 1.0, -1.0, 8.0]])
+    expected = np.array([math.erfc(v) for v in x])
+    assert _erfc(x) == pytest.approx(expected, rel=1e-14, abs=1e-300)
+    assert _erfc(np.array([np.inf, -np.inf])).tolist() == [0.0, 2.0]
+    assert math.isnan(_erfc(np.array([np.nan]))[0])
+
+    k = np.concatenate([np.arange(1.0, 2000.0), np.linspace(0.5, 1e6, 1001)])
+    assert _lgamma(k) == pytest.approx([math.lgamma(v) for v in k], rel=1e-13, abs=1e-13)
+    with pytest.raises(TypeError):
+        Distribution()  # abstract
@@ -0,0 +1,60 @@
+from pathlib import Path
+
+import pytest
+from rdflib import BNode, Namespace, RDF
+
+from src import loader
+from src.hierarchy import ClassHierarchy
+from src.type_index import TypeIndex
+
+ROOT = Path(__file__).resolve().parent.parent
+MIN = Namespace("https://w3id.org/min#")
+SDATA = Namespace("https://w3id.org/sdata/core/")
+SMS = Namespace("https://w3id.org/sdata/material-state/")
+EX = Namespace("https://example.org/zugversuch/")
+
+
+@pytest.fixture(scope="module")
+def hierarchy():
+    return ClassHierarchy.from_graph(
+        loader.load_merged(ROOT / "min-v1.0.0.ttl", ROOT / "sdata-core.ttl", use_cache=False)
+    )
+
+
+@pytest.fixture()
+def index(hierarchy):
+    example = loader.load_graph(ROOT / "examples" / "specimen_tensiontest_data.ttl", use_cache=False)
+    return TypeIndex.from_graph(example, hierarchy)
+
+
+def test_instances_include_subclasses(index):
+    assert EX.dc04 in index.instances_of(SDATA.Material)
+    assert {EX.dc04, EX.stanze, EX.zwick} <= index.instances_of(MIN.Object)
+    assert {EX.bediener, EX.pruefer, EX.zwick} <= index.instances_of(SDATA.Agent)
+    assert {EX.probenfertigung, EX.zugversuch} == set(index.instances_of(MIN.Process))
+    assert index.is_instance(EX.zwick, MIN.Agent)
+    assert index.types_of(EX.zwick) == {SDATA.Hardware, SDATA.HardwareAgent}
+
+
+def test_incremental_add_and_remove(index):
+    before = index.count(MIN.Object)
+    index.add_triples([(EX.coil2, RDF.type, SDATA.Material), (EX.coil2, SDATA.hasMaterial, EX.dc04)])
+    assert EX.coil2 in index.instances_of(MIN.Object)
+    assert index.count(MIN.Object) == before + 1
+
+    # A second type reaching the same ancestor must not double-count nor drop early.
+    assert index.add(EX.coil2, SDATA.Hardware)
+    assert index.count(MIN.Object) == before + 1
+    assert index.remove(EX.coil2, SDATA.Material)
+    assert EX.coil2 in index.instances_of(MIN.Object)
+    assert index.remove_triples([(EX.coil2, RDF.type, SDATA.Hardware)]) == 1
+    assert EX.coil2 not in index.instances_of(MIN.Object)
+    assert EX.coil2 not in index
+
+
+def test_ignores_duplicates_and_unknown_classes(index):
+    assert not index.add(EX.dc04, SDATA.Material)
+    assert not index.add(EX.x, BNode())
+    assert index.add(EX.x, EX.LocalClass)
+    assert set(index.instances_of(EX.LocalClass)) == {EX.x}
+    assert not index.instances_of(EX.Nothing)
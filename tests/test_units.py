@@ -0,0 +1,66 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from rdflib import Namespace
+
+from src import loader
+from src.quantities import extract_quantities
+from src.units import UnitTable, convert_quantities
+
+ROOT = Path(__file__).resolve().parent.parent
+UNIT = Namespace("http://qudt.org/vocab/unit/")
+
+
+def _units(tmp_path):
+    return UnitTable.load(cache_dir=tmp_path, use_cache=True)
+
+
+def test_factor_table_is_cached_and_converts(tmp_path):
+    units = _units(tmp_path)
+    assert list((tmp_path / "artifacts").glob("qudt-units-*.pkl"))
+    assert _units(tmp_path).units == units.units
+
+    assert units.convert([1.5, 2.0], UNIT.MilliM, UNIT.M) == pytest.approx([0.0015, 0.002])
+    assert units.convert([100.0, 0.0, -40.0], "°C", "°F") == pytest.approx([212.0, 32.0, -40.0])
+    assert units.convert(23.0, "°C", UNIT.K) == pytest.approx(296.15)
+    assert units.convert(1.0, "MPa", "N/mm²") == pytest.approx(1.0)
+    assert units.compatible("%", "-") and not units.compatible("MPa", "mm")
+    with pytest.raises(ValueError, match="dimension"):
+        units.convert([1.0], "MPa", "mm")
+    with pytest.raises(KeyError):
+        units.resolve("furlong")
+
+
+def test_per_row_units_in_one_call(tmp_path):
+    units = _units(tmp_path)
+    values = np.array([250.0, 250_000.0, 36.26, 0.25, 7.0])
+    sources = ["MPa", "kPa", "ksi", UNIT.GigaPA, None]
+    converted = units.convert(values, sources, "MPa")
+    assert converted[:4] == pytest.approx([250.0, 250.0, 250.0, 250.0], rel=1e-3)
+    assert np.isnan(converted[4])
+
+    scale, shift = units.factors(["°C", "K"], "K")
+    assert scale.tolist() == [1.0, 1.0] and shift.tolist() == pytest.approx([273.15, 0.0])
+    rows = np.array([units.indices("°C"), -1])
+    scale, shift = units.row_factors(rows, "K")
+    assert scale[0] == 1.0 and shift[0] == pytest.approx(273.15) and np.isnan(scale[1])
+
+
+def test_quantity_columns_fall_back_to_unit_symbol(tmp_path):
+    graph = loader.load_graph(ROOT / "examples" / "specimen_tensiontest_data.ttl", use_cache=False)
+    table = extract_quantities(graph)
+    f_max = table.names.index("F_max")
+    assert table.unit[table.name == f_max].tolist() == [-1]  # only sdata:unitSymbol "kN"
+
+    converted = convert_quantities(
+        table,
+        {"F_max": UNIT.N, "thickness": "m", "Rm": "GPa", "temperature": "K", "AG": "-", "strain_rate": "/min"},
+        _units(tmp_path),
+    )
+    assert converted["F_max"].tolist() == pytest.approx([250_000.0])
+    assert converted["thickness"].tolist() == pytest.approx([0.001])
+    assert converted["Rm"].tolist() == pytest.approx([0.34])
+    assert converted["temperature"].tolist() == pytest.approx([296.15])
+    assert converted["AG"].tolist() == pytest.approx([0.235])
+    assert converted["strain_rate"].tolist() == pytest.approx([0.06])
@@ -0,0 +1,66 @@
+from pathlib import Path
+
+import pytest
+from rdflib import BNode, Graph, Literal, Namespace, RDF
+from rdflib.namespace import SH
+
+from src import loader
+from src.validation import DEFAULT_SHAPES, IncrementalValidator, ShapeIndex, run_pyshacl
+
+pytest.importorskip("pyshacl")
+
+ROOT = Path(__file__).resolve().parent.parent
+MIN = Namespace("https://w3id.org/min#")
+SMS = Namespace("https://w3id.org/sdata/material-state/")
+EX_ZUG = Namespace("https://example.org/zugversuch/")
+
+
+def _key(result):
+    return (result.focus_node, result.result_path, result.constraint_component, result.value)
+
+
+def _validator():
+    data = loader.load_graph(ROOT / "examples" / "specimen_tensiontest_data.ttl", use_cache=False)
+    copy = Graph()
+    copy += data
+    return IncrementalValidator(copy, loader.load_graph(DEFAULT_SHAPES, use_cache=False))
+
+
+def test_core_shapes_are_local():
+    index = ShapeIndex.from_graph(loader.load_graph(DEFAULT_SHAPES, use_cache=False))
+    assert index.local
+    assert index.target_classes == {SMS.StateAssignment}
+    assert MIN.generates in index.path_predicates
+
+
+def test_delta_rechecks_only_touched_focus_nodes():
+    validator = _validator()
+    assert validator.conforms
+
+    outputs = validator.data.objects(EX_ZUG.probenfertigung, MIN.generates)
+    removed = [(EX_ZUG.probenfertigung, MIN.generates, o) for o in outputs]
+    checked = validator.apply(added=[(EX_ZUG.dc04, MIN.hasIdentifier, Literal(""))], removed=removed)
+    assert checked == {EX_ZUG.dc04, EX_ZUG.probenfertigung}
+    assert {r.constraint_component for r in validator.results()} == {
+        SH.MinLengthConstraintComponent,
+        SH.MinCountConstraintComponent,
+    }
+
+    checked = validator.apply(added=removed)
+    assert checked == {EX_ZUG.probenfertigung}
+    assert [r.focus_node for r in validator.results()] == [EX_ZUG.dc04]
+
+
+def test_incremental_results_match_full_validation():
+    validator = _validator()
+    assignment = BNode()
+    validator.apply(
+        added=[
+            (assignment, RDF.type, SMS.StateAssignment),
+            (assignment, SMS.onAxis, Literal("not an IRI")),
+            (EX_ZUG.probe, MIN.hasIdentifier, Literal(42)),
+        ]
+    )
+    full = run_pyshacl(validator.data, validator.shapes)
+    assert sorted(map(_key, validator.results()), key=str) == sorted(map(_key, full), key=str)
+    assert len(full) == 3
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+from rdflib import Graph, Literal, Namespace
+from rdflib.namespace import RDF, XSD
+
+from src.lineage import MIN, SDATA
+from src.versions import VersionBuilder, VersionIndex
+
+EX = Namespace("https://example.org/kupfer/")
+
+
+def _passport(graph: Graph, passport, product, version: str, valid_from: str, supersedes=None) -> None:
+    graph.add((passport, RDF.type, SDATA.ProductPassport))
+    graph.add((passport, SDATA.describes, product))
+    graph.add((passport, SDATA.hasVersion, Literal(version)))
+    graph.add((passport, SDATA.validFrom, Literal(valid_from, datatype=XSD.dateTime)))
+    if supersedes is not None:
+        graph.add((passport, SDATA.supersedes, supersedes))
+
+
+def _example() -> Graph:
+    # The pattern of docs/modeling/dpp-versionierung.md plus a third version that has been revoked.
+    graph = Graph()
+    _passport(graph, EX.dpp_v1, EX.product_001, "1.0", "2026-01-01T00:00:00Z")
+    _passport(graph, EX.dpp_v2, EX.product_001, "2.0", "2026-04-01T02:00:00+02:00", EX.dpp_v1)
+    _passport(graph, EX.dpp_v3, EX.product_001, "3.0", "2026-07-01T00:00:00Z")
+    graph.add((EX.dpp_v2, SDATA.supersededBy, EX.dpp_v3))
+    graph.add((EX.dpp_v3, SDATA.revokedAt, Literal("2026-08-01T00:00:00Z", datatype=XSD.dateTime)))
+    return graph
+
+
+def test_point_in_time_and_latest():
+    index = VersionIndex.from_graph(_example())
+    assert [passport for _, passport in index.versions(EX.product_001)] == [EX.dpp_v1, EX.dpp_v2, EX.dpp_v3]
+    assert index.at(EX.product_001, "2025-12-31T23:59:59Z") is None
+    assert index.at(EX.product_001, "2026-02-15T00:00:00Z") == EX.dpp_v1
+    assert index.at(EX.product_001, "2026-04-01T00:00:00Z") == EX.dpp_v2  # +02:00 normalised to UTC
+    assert index.at(EX.product_001, np.datetime64("2026-07-15")) == EX.dpp_v3
+    assert index.at(EX.product_001, "2026-09-01T00:00:00") is None  # v3 was revoked
+    assert index.latest(EX.product_001) is None  # v3 was revoked and nothing replaced it
+    assert index.label(EX.dpp_v2) == "2.0"
+    assert index.chain(EX.dpp_v3) == [EX.dpp_v3, EX.dpp_v2, EX.dpp_v1]
+    assert not index.forks and not index.cycles and not index.undated
+    with pytest.raises(KeyError):
+        index.at(EX.product_999, "2026-01-01T00:00:00Z")
+
+
+def test_forks_cycles_and_undated_versions():
+    graph = _example()
+    _passport(graph, EX.dpp_v2b, EX.product_001, "2.0-b", "2026-05-01T00:00:00Z", EX.dpp_v1)
+    graph.add((EX.draft, SDATA.supersedes, EX.dpp_v3))  # no validFrom
+    _passport(graph, EX.epd_a, EX.product_002, "1", "2026-01-01T00:00:00Z", EX.epd_b)
+    _passport(graph, EX.epd_b, EX.product_002, "2", "2026-02-01T00:00:00Z", EX.epd_a)
+    graph.add((EX.epd_a, MIN.describes, EX.product_002))  # twin of sdata:describes, listed once
+    graph.add((EX.epd_c, SDATA.describes, EX.product_002))
+    graph.add((EX.epd_c, SDATA.validFrom, Literal("2026-02-30T00:00:00Z")))  # no such day
+    index = VersionIndex.from_graph(graph)
+
+    assert index.forks == {EX.dpp_v1: (EX.dpp_v2, EX.dpp_v2b)}
+    assert [set(cycle) for cycle in index.cycles] == [{EX.epd_a, EX.epd_b}]
+    assert index.undated == (EX.draft,)
+    assert index.chain(EX.epd_a) == [EX.epd_a, EX.epd_b]  # stops at the cycle
+    assert index.at(EX.product_001, "2026-05-02T00:00:00Z") == EX.dpp_v2b
+    assert [passport for _, passport in index.versions(EX.product_002)] == [EX.epd_a, EX.epd_b]
+    assert len(index) == 6
+    assert index.malformed == ((EX.epd_c, "2026-02-30T00:00:00Z"),)
+
+
+def test_ntriples_stream_matches_brute_force():
+    rng = np.random.default_rng(0)
+    graph = Graph()
+    for product in range(100):
+        days = np.sort(rng.choice(365, size=rng.integers(1, 8), replace=False))
+        previous = None
+        for version, day in enumerate(days.tolist()):
+            passport = EX[f"dpp_{product}_{version}"]
+            moment = str(np.datetime64("2026-01-01") + np.timedelta64(day, "D")) + "T00:00:00Z"
+            _passport(graph, passport, EX[f"product_{product}"], str(version), moment, previous)
+            previous = passport
+    builder = VersionBuilder()
+    builder.add_ntriples(graph.serialize(format="nt").splitlines())
+    index = builder.build()
+    assert len(index) == len(VersionIndex.from_graph(graph))
+
+    for product in range(100):
+        target = EX[f"product_{product}"]
+        versions = index.versions(target)
+        for day in rng.integers(-5, 370, 10).tolist():
+            when = np.datetime64("2026-01-01") + np.timedelta64(day, "D")
+            valid = [passport for start, passport in versions if start <= when]
+            assert index.at(target, when) == (valid[-1] if valid else None)
+        assert index.latest(target) == versions[-1][1]
+        assert index.chain(versions[-1][1]) == [passport for _, passport in reversed(versions)]